@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+"""Run pipeline stage benchmarks against a synthetic project and check baselines.
+
+Usage:
+    python -m benchmarks.run_benchmarks                     # compare with baselines.json
+    python -m benchmarks.run_benchmarks --update-baselines  # record new baselines
+    python -m benchmarks.run_benchmarks --only ocr,differ --routes 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.synthetic_project import SyntheticProjectConfig, generate_project
+
+from screenreview.config import get_default_config
+from screenreview.core.folder_scanner import scan_project
+from screenreview.models.screen_item import ScreenItem
+
+logger = logging.getLogger(__name__)
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINES = BENCH_DIR / "baselines.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_TOLERANCE = 0.25
+# Differences below this many seconds are treated as timer noise, never as regressions.
+NOISE_FLOOR_SECONDS = 0.005
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark when a required tool or engine is missing."""
+
+
+@dataclass
+class BenchContext:
+    """Shared, pre-computed inputs for all benchmarks."""
+
+    project_dir: Path
+    screens: list[ScreenItem]
+    settings: dict[str, Any]
+    frames: dict[str, list[Path]] = field(default_factory=dict)
+    segments: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    status: str
+    repeats: int = 0
+    items: int = 0
+    median_seconds: float | None = None
+    min_seconds: float | None = None
+    note: str = ""
+
+
+BENCHMARKS: dict[str, Callable[[BenchContext], int]] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[BenchContext], int]], Callable[[BenchContext], int]]:
+    """Register a benchmark. The function returns the number of items processed."""
+
+    def decorator(func: Callable[[BenchContext], int]) -> Callable[[BenchContext], int]:
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def _decode_frames_with_opencv(video_path: Path, output_dir: Path, every_nth: int = 5) -> list[Path]:
+    """Dump every n-th frame as PNG; used so frame-based stages run without ffmpeg."""
+    import cv2
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    capture = cv2.VideoCapture(str(video_path))
+    frames: list[Path] = []
+    index = 0
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            if index % every_nth == 0:
+                path = output_dir / f"frame_{len(frames) + 1:04d}.png"
+                cv2.imwrite(str(path), frame)
+                frames.append(path)
+            index += 1
+    finally:
+        capture.release()
+    return frames
+
+
+def prepare_context(project_dir: Path) -> BenchContext:
+    settings = get_default_config()
+    screens = scan_project(project_dir, viewport_mode="mobile") or scan_project(project_dir, viewport_mode="desktop")
+    context = BenchContext(project_dir=project_dir, screens=screens, settings=settings)
+    for screen in screens:
+        context.frames[screen.name] = _decode_frames_with_opencv(
+            screen.extraction_dir / "raw_video.avi", screen.extraction_dir / "frames"
+        )
+        segments_path = screen.extraction_dir / "transcript_segments.json"
+        context.segments[screen.name] = (
+            json.loads(segments_path.read_text(encoding="utf-8")) if segments_path.exists() else []
+        )
+    return context
+
+
+@benchmark("scan_project")
+def bench_scan_project(ctx: BenchContext) -> int:
+    return len(scan_project(ctx.project_dir, viewport_mode=ctx.screens[0].viewport))
+
+
+@benchmark("frame_extractor")
+def bench_frame_extractor(ctx: BenchContext) -> int:
+    from screenreview.pipeline.frame_extractor import FrameExtractor
+
+    if shutil.which("ffmpeg") is None:
+        raise BenchmarkSkipped("ffmpeg not found in PATH")
+    extractor = FrameExtractor(fps=2)
+    total = 0
+    for screen in ctx.screens:
+        output_dir = screen.extraction_dir / "bench_frames"
+        total += len(extractor.extract_frames(screen.extraction_dir / "raw_video.avi", output_dir))
+    return total
+
+
+@benchmark("differ")
+def bench_differ(ctx: BenchContext) -> int:
+    from screenreview.pipeline.differ import Differ
+
+    differ = Differ()
+    pairs = 0
+    for frames in ctx.frames.values():
+        for first, second in zip(frames, frames[1:]):
+            differ.compute_diff(first, second)
+            pairs += 1
+    return pairs
+
+
+@benchmark("annotation_analyzer")
+def bench_annotation_analyzer(ctx: BenchContext) -> int:
+    from screenreview.pipeline.annotation_analyzer import AnnotationAnalyzer
+
+    analyzer = AnnotationAnalyzer()
+    regions = 0
+    for screen in ctx.screens:
+        regions += len(
+            analyzer.analyze_overlay(screen.screenshot_path, screen.extraction_dir / "annotation_overlay.png")
+        )
+    return regions
+
+
+@benchmark("annotation_strokes")
+def bench_annotation_strokes(ctx: BenchContext) -> int:
+    from screenreview.models.annotation_strokes import STROKES_FILENAME
+    from screenreview.pipeline.annotation_analyzer import AnnotationAnalyzer
+
+    analyzer = AnnotationAnalyzer()
+    regions = 0
+    for screen in ctx.screens:
+        regions += len(
+            analyzer.analyze_annotations(screen.screenshot_path, screen.extraction_dir / STROKES_FILENAME)
+        )
+    return regions
+
+
+@benchmark("smart_selector")
+def bench_smart_selector(ctx: BenchContext) -> int:
+    from screenreview.pipeline.smart_selector import SmartSelector
+
+    selector = SmartSelector()
+    return sum(len(selector.select_frames(frames, ctx.settings)) for frames in ctx.frames.values())
+
+
+@benchmark("trigger_detector")
+def bench_trigger_detector(ctx: BenchContext) -> int:
+    from screenreview.pipeline.trigger_detector import TriggerDetector
+
+    detector = TriggerDetector()
+    return sum(len(detector.process_transcript_segments(segments)) for segments in ctx.segments.values())
+
+
+@benchmark("ocr")
+def bench_ocr(ctx: BenchContext) -> int:
+    from screenreview.pipeline.ocr_processor import OcrProcessor
+
+    processor = OcrProcessor()
+    if processor.ocr_engine is None:
+        raise BenchmarkSkipped("no OCR engine available")
+    return sum(len(processor.process(screen.screenshot_path)) for screen in ctx.screens)
+
+
+@benchmark("export")
+def bench_export(ctx: BenchContext) -> int:
+    from screenreview.models.extraction_result import ExtractionResult
+    from screenreview.pipeline.exporter import Exporter
+
+    exporter = Exporter()
+    for screen in ctx.screens:
+        segments = ctx.segments.get(screen.name, [])
+        extraction = ExtractionResult(
+            screen=screen,
+            video_path=screen.extraction_dir / "raw_video.avi",
+            audio_path=screen.extraction_dir / "raw_audio.wav",
+            all_frames=ctx.frames.get(screen.name, []),
+            selected_frames=ctx.frames.get(screen.name, [])[:3],
+            transcript_text=" ".join(seg["text"] for seg in segments),
+            transcript_segments=segments,
+        )
+        exporter.export(extraction, metadata={"route": screen.route}, analysis_data={})
+    return len(ctx.screens)
+
+
+def run_benchmark(name: str, ctx: BenchContext, repeats: int) -> BenchmarkResult:
+    func = BENCHMARKS[name]
+    samples: list[float] = []
+    items = 0
+    try:
+        # One untimed warm-up run absorbs lazy imports and engine initialisation.
+        func(ctx)
+        for _ in range(repeats):
+            started = time.perf_counter()
+            items = func(ctx)
+            samples.append(time.perf_counter() - started)
+    except BenchmarkSkipped as exc:
+        return BenchmarkResult(name=name, status="skipped", note=str(exc))
+    except Exception as exc:
+        logger.exception("Benchmark %s failed", name)
+        return BenchmarkResult(name=name, status="failed", note=f"{type(exc).__name__}: {exc}")
+    return BenchmarkResult(
+        name=name,
+        status="ok",
+        repeats=repeats,
+        items=items,
+        median_seconds=round(statistics.median(samples), 6),
+        min_seconds=round(min(samples), 6),
+    )
+
+
+def compare_to_baselines(
+    results: list[BenchmarkResult],
+    baselines: dict[str, Any],
+    default_tolerance: float = DEFAULT_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """Return one verdict per benchmark: ok, regression, improved, new or skipped."""
+    tolerance_default = float(baselines.get("tolerance", default_tolerance))
+    recorded = baselines.get("benchmarks", {})
+    verdicts = []
+    for result in results:
+        verdict: dict[str, Any] = {"name": result.name, "median_seconds": result.median_seconds}
+        baseline = recorded.get(result.name)
+        if result.status != "ok":
+            verdict["verdict"] = result.status
+        elif not baseline or baseline.get("median_seconds") is None:
+            verdict["verdict"] = "new"
+        else:
+            base = float(baseline["median_seconds"])
+            tolerance = float(baseline.get("tolerance", tolerance_default))
+            verdict["baseline_seconds"] = base
+            verdict["tolerance"] = tolerance
+            verdict["ratio"] = round(result.median_seconds / base, 3) if base > 0 else None
+            delta = result.median_seconds - base
+            if delta > NOISE_FLOOR_SECONDS and result.median_seconds > base * (1.0 + tolerance):
+                verdict["verdict"] = "regression"
+            elif -delta > NOISE_FLOOR_SECONDS and result.median_seconds < base * (1.0 - tolerance):
+                verdict["verdict"] = "improved"
+            else:
+                verdict["verdict"] = "ok"
+        verdicts.append(verdict)
+    return verdicts
+
+
+def _host_info() -> dict[str, Any]:
+    return {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "python_version": platform.python_version(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark screenreview pipeline stages")
+    parser.add_argument("--project-dir", type=Path, default=None, help="Use an existing project instead of generating one")
+    parser.add_argument("--routes", type=int, default=4)
+    parser.add_argument("--scale", type=float, default=1.0, help="Screenshot size multiplier")
+    parser.add_argument("--video-seconds", type=float, default=6.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", default="", help="Comma separated benchmark names")
+    parser.add_argument("--baselines", type=Path, default=DEFAULT_BASELINES)
+    parser.add_argument("--update-baselines", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=None, help="Override the relative regression threshold")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    selected = [name.strip() for name in args.only.split(",") if name.strip()] or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}. Available: {', '.join(BENCHMARKS)}")
+
+    config = SyntheticProjectConfig(
+        routes=args.routes,
+        screenshot_scale=args.scale,
+        video_seconds=args.video_seconds,
+        audio_seconds=args.video_seconds,
+    )
+    with tempfile.TemporaryDirectory(prefix="screenreview-bench-") as tmp:
+        if args.project_dir is not None:
+            # Benchmarks write frames and exports into .extraction; never touch the real project.
+            print(f"Copying {args.project_dir} to a temporary directory...")
+            project_dir = Path(tmp) / "project"
+            shutil.copytree(
+                args.project_dir, project_dir, ignore=shutil.ignore_patterns(".thumbnails", "frames", "*.part*")
+            )
+        else:
+            print(f"Generating synthetic project ({config.routes} routes)...")
+            project_dir = generate_project(Path(tmp) / "project", config)
+        ctx = prepare_context(project_dir)
+        if not ctx.screens:
+            print(f"No screens found in {project_dir}")
+            return 2
+
+        results = []
+        for name in selected:
+            result = run_benchmark(name, ctx, max(1, args.repeats))
+            results.append(result)
+            if result.status == "ok":
+                print(f"{name:<20} {result.median_seconds * 1000:>9.1f} ms  ({result.items} items)")
+            else:
+                print(f"{name:<20} {result.status.upper():>12}  {result.note}")
+
+    baselines: dict[str, Any] = {}
+    if args.baselines.exists():
+        baselines = json.loads(args.baselines.read_text(encoding="utf-8"))
+    tolerance = args.tolerance if args.tolerance is not None else DEFAULT_TOLERANCE
+    if args.tolerance is not None:
+        baselines["tolerance"] = args.tolerance
+    verdicts = compare_to_baselines(results, baselines, tolerance)
+
+    report = {
+        "host": _host_info(),
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "project": config.to_dict() if args.project_dir is None else {"project_dir": str(args.project_dir)},
+        "results": [asdict(result) for result in results],
+        "comparison": verdicts,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResults saved to: {args.output}")
+
+    if args.update_baselines:
+        recorded = baselines.get("benchmarks", {})
+        for result in results:
+            if result.status == "ok":
+                entry = recorded.setdefault(result.name, {})
+                entry["median_seconds"] = result.median_seconds
+                entry["items"] = result.items
+        baselines.update(
+            {
+                "host": _host_info(),
+                "project": report["project"],
+                "tolerance": baselines.get("tolerance", tolerance),
+                "benchmarks": recorded,
+            }
+        )
+        args.baselines.write_text(json.dumps(baselines, indent=2) + "\n", encoding="utf-8")
+        print(f"Baselines updated: {args.baselines}")
+        return 0
+
+    regressions = [v for v in verdicts if v["verdict"] == "regression"]
+    for verdict in regressions:
+        print(
+            f"REGRESSION {verdict['name']}: {verdict['median_seconds']:.4f}s vs baseline "
+            f"{verdict['baseline_seconds']:.4f}s (x{verdict['ratio']}, tolerance {verdict['tolerance']:.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Generate realistic synthetic review projects for benchmarking."""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+import wave
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+VIEWPORT_SIZES: dict[str, tuple[int, int]] = {
+    "mobile": (390, 844),
+    "desktop": (1440, 900),
+}
+
+# Spoken feedback used for transcript segments; mixes trigger words with filler.
+_FEEDBACK_LINES = [
+    "Hier ist ein Bug im Login Formular",
+    "Der Button muss entfernt werden",
+    "Das Feld soll groesser sein",
+    "Diese Farbe passt nicht zum Design",
+    "Das Menue bitte nach links verschieben",
+    "Die Ueberschrift ist ok so",
+    "Hier fehlt ein Hinweistext",
+    "Das Logo ist zu klein",
+]
+
+
+@dataclass
+class SyntheticProjectConfig:
+    """Shape of a generated project. Defaults keep a full run under a minute."""
+
+    routes: int = 4
+    viewports: list[str] = field(default_factory=lambda: ["mobile"])
+    screenshot_scale: float = 1.0
+    video_seconds: float = 6.0
+    video_fps: int = 10
+    video_size: tuple[int, int] = (640, 360)
+    audio_seconds: float = 6.0
+    audio_sample_rate: int = 16000
+    brush_strokes: int = 6
+    seed: int = 1234
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["video_size"] = list(self.video_size)
+        return data
+
+
+def render_screenshot(width: int, height: int, rng: np.random.Generator, title: str) -> np.ndarray:
+    """Draw a UI-like page: header, text rows, input fields and buttons."""
+    image = np.full((height, width, 3), 245, dtype=np.uint8)
+    header_h = max(40, height // 12)
+    cv2.rectangle(image, (0, 0), (width, header_h), (60, 64, 72), -1)
+    cv2.putText(image, title, (16, int(header_h * 0.68)), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+
+    y = header_h + 24
+    row_h = max(28, height // 24)
+    while y + row_h < height - 16:
+        kind = rng.integers(0, 4)
+        if kind == 0:
+            text = _FEEDBACK_LINES[int(rng.integers(0, len(_FEEDBACK_LINES)))]
+            cv2.putText(image, text, (16, y + row_h // 2), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (30, 30, 30), 1)
+        elif kind == 1:
+            cv2.rectangle(image, (16, y), (width - 16, y + row_h), (200, 200, 200), 1)
+            cv2.putText(image, "E-Mail", (24, y + row_h - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (120, 120, 120), 1)
+        elif kind == 2:
+            button_w = min(width - 32, 180)
+            color = tuple(int(c) for c in rng.integers(40, 200, size=3))
+            cv2.rectangle(image, (16, y), (16 + button_w, y + row_h), color, -1)
+            cv2.putText(image, "Absenden", (28, y + row_h - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.55, (255, 255, 255), 1)
+        else:
+            block_h = min(row_h * 3, height - 16 - y)
+            cv2.rectangle(image, (16, y), (width - 16, y + block_h), (220, 226, 235), -1)
+            y += block_h - row_h
+        y += row_h + 12
+    return image
+
+
+def write_synthetic_video(path: Path, config: SyntheticProjectConfig, rng: np.random.Generator) -> int:
+    """Write an MJPG AVI with a skin-coloured hand blob sweeping over a static page."""
+    width, height = config.video_size
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), float(config.video_fps), (width, height))
+    if not writer.isOpened():
+        raise RuntimeError(f"OpenCV could not open a video writer for {path}")
+
+    background = render_screenshot(width, height, rng, "Recording")
+    frames = max(1, int(config.video_seconds * config.video_fps))
+    skin = (120, 160, 215)  # BGR
+    try:
+        for index in range(frames):
+            phase = index / frames
+            frame = background.copy()
+            cx = int(width * (0.2 + 0.6 * phase))
+            cy = int(height * (0.5 + 0.25 * math.sin(phase * 2 * math.pi)))
+            # Palm, pointing finger and a little sensor noise.
+            cv2.ellipse(frame, (cx, cy + 40), (45, 60), 0, 0, 360, skin, -1)
+            cv2.rectangle(frame, (cx - 8, cy - 40), (cx + 8, cy + 10), skin, -1)
+            noise = rng.integers(0, 8, size=frame.shape, dtype=np.uint8)
+            writer.write(cv2.add(frame, noise))
+    finally:
+        writer.release()
+    return frames
+
+
+def write_synthetic_audio(path: Path, config: SyntheticProjectConfig, rng: np.random.Generator) -> int:
+    """Write 16-bit mono WAV: speech-band tone bursts over background noise."""
+    sample_rate = config.audio_sample_rate
+    samples = int(config.audio_seconds * sample_rate)
+    t = np.arange(samples, dtype=np.float32) / sample_rate
+    envelope = (np.sin(2 * np.pi * 0.5 * t) > 0).astype(np.float32)
+    tone = 0.3 * np.sin(2 * np.pi * 220.0 * t) * envelope
+    noise = rng.normal(0.0, 0.02, size=samples).astype(np.float32)
+    pcm = (np.clip(tone + noise, -1.0, 1.0) * 32767.0).astype(np.int16)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm.tobytes())
+    return samples
+
+
+def write_brush_overlay(path: Path, width: int, height: int, strokes: int, rng: np.random.Generator) -> int:
+    """Write freehand-like brush strokes as a transparent RGBA overlay and as stroke JSON next to it."""
+    from screenreview.models.annotation_strokes import STROKES_FILENAME, AnnotationStrokes, Stroke
+
+    overlay = np.zeros((height, width, 4), dtype=np.uint8)
+    vectors = AnnotationStrokes(width=width, height=height)
+    for _ in range(strokes):
+        x, y = int(rng.integers(20, width - 20)), int(rng.integers(20, height - 20))
+        points = [(x, y)]
+        for _step in range(int(rng.integers(5, 15))):
+            x = int(np.clip(x + rng.integers(-25, 26), 0, width - 1))
+            y = int(np.clip(y + rng.integers(-25, 26), 0, height - 1))
+            points.append((x, y))
+        cv2.polylines(overlay, [np.array(points, dtype=np.int32)], False, (0, 0, 255, 255), 6)
+        vectors.strokes.append(Stroke(points, width=6, color=(255, 0, 0, 255)))
+    cv2.imwrite(str(path), overlay)
+    vectors.save(path.with_name(STROKES_FILENAME))
+    return strokes
+
+
+def build_transcript_segments(seconds: float, rng: np.random.Generator) -> list[dict[str, Any]]:
+    """Return Whisper-like segments of roughly two seconds each."""
+    segments = []
+    start = 0.0
+    while start < seconds:
+        end = min(seconds, start + 2.0)
+        text = _FEEDBACK_LINES[int(rng.integers(0, len(_FEEDBACK_LINES)))]
+        segments.append({"start": round(start, 2), "end": round(end, 2), "text": text})
+        start = end
+    return segments
+
+
+def generate_project(base_dir: Path, config: SyntheticProjectConfig | None = None) -> Path:
+    """Create ``<base_dir>/routes/<slug>/<viewport>/`` screens with recordings."""
+    config = config or SyntheticProjectConfig()
+    rng = np.random.default_rng(config.seed)
+    routes_dir = base_dir / "routes"
+
+    for route_index in range(config.routes):
+        slug = f"page_{route_index:03d}"
+        for viewport in config.viewports:
+            base_w, base_h = VIEWPORT_SIZES.get(viewport, VIEWPORT_SIZES["desktop"])
+            width = max(64, int(base_w * config.screenshot_scale))
+            height = max(64, int(base_h * config.screenshot_scale))
+            screen_dir = routes_dir / slug / viewport
+            extraction_dir = screen_dir / ".extraction"
+            extraction_dir.mkdir(parents=True, exist_ok=True)
+
+            meta = {
+                "route": f"/{slug}.html",
+                "slug": slug,
+                "viewport": viewport,
+                "viewport_size": {"w": width, "h": height},
+                "timestamp_utc": "2026-01-01T00:00:00Z",
+                "git": {"branch": "bench", "commit": "0" * 40},
+                "playwright": {"browser": "chromium", "test": slug},
+            }
+            (screen_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            cv2.imwrite(str(screen_dir / "screenshot.png"), render_screenshot(width, height, rng, slug))
+            write_brush_overlay(extraction_dir / "annotation_overlay.png", width, height, config.brush_strokes, rng)
+            write_synthetic_video(extraction_dir / "raw_video.avi", config, rng)
+            write_synthetic_audio(extraction_dir / "raw_audio.wav", config, rng)
+            segments = build_transcript_segments(config.audio_seconds, rng)
+            (extraction_dir / "transcript_segments.json").write_text(
+                json.dumps(segments, indent=2), encoding="utf-8"
+            )
+
+    (base_dir / "synthetic_project.json").write_text(json.dumps(config.to_dict(), indent=2), encoding="utf-8")
+    return base_dir
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic screenreview project")
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--routes", type=int, default=4)
+    parser.add_argument("--viewports", default="mobile", help="Comma separated, e.g. mobile,desktop")
+    parser.add_argument("--scale", type=float, default=1.0, help="Screenshot size multiplier")
+    parser.add_argument("--video-seconds", type=float, default=6.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    project = generate_project(
+        args.output_dir,
+        SyntheticProjectConfig(
+            routes=args.routes,
+            viewports=[v.strip() for v in args.viewports.split(",") if v.strip()],
+            screenshot_scale=args.scale,
+            video_seconds=args.video_seconds,
+            audio_seconds=args.video_seconds,
+            seed=args.seed,
+        ),
+    )
+    print(f"Created synthetic project at: {project.absolute()}")
@@ -5,8 +5,10 @@ from __future__ import annotations
 
 import json
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import typer
 
@@ -16,35 +18,160 @@ app = typer.Typer(help="OCR processing commands for screenshots")
 logger = logging.getLogger(__name__)
 
 
+# Per-process OCR processor, created once by the pool initializer so every
+# worker loads its engine a single time instead of once per screenshot.
+_worker_processor: OcrProcessor | None = None
+
+
+def _init_ocr_worker(engine: str, languages: list[str]) -> None:
+    global _worker_processor
+    _worker_processor = OcrProcessor(engine=engine, languages=languages)
+
+
+def _ocr_worker_job(route_slug: str, viewport: str, screenshot_path: str) -> dict[str, Any]:
+    """Run OCR for one screenshot inside a worker and time it."""
+    started = time.perf_counter()
+    entry: dict[str, Any] = {
+        "route": route_slug,
+        "viewport": viewport,
+        "screenshot_path": screenshot_path,
+        "status": "processed",
+    }
+    try:
+        if _worker_processor is None:
+            raise RuntimeError("OCR worker not initialized")
+        result = _worker_processor.process_screenshot(Path(screenshot_path))
+        entry.update(result)
+    except Exception as e:
+        entry["status"] = "failed"
+        entry["error"] = str(e)
+        entry["text_count"] = 0
+        entry["texts"] = []
+    entry["seconds"] = round(time.perf_counter() - started, 4)
+    return entry
+
+
+def _run_ocr_jobs(
+    jobs: list[tuple[str, str, Path]],
+    engine: str,
+    languages: list[str],
+    workers: int,
+    on_done: Callable[[dict[str, Any]], None],
+) -> None:
+    """Run OCR jobs inline (workers == 1) or in a process pool with one engine per worker."""
+    if not jobs:
+        return
+    if workers <= 1:
+        _init_ocr_worker(engine, languages)
+        for route_slug, viewport, screenshot_path in jobs:
+            on_done(_ocr_worker_job(route_slug, viewport, str(screenshot_path)))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_ocr_worker,
+        initargs=(engine, languages),
+    ) as executor:
+        futures = [
+            executor.submit(_ocr_worker_job, route_slug, viewport, str(screenshot_path))
+            for route_slug, viewport, screenshot_path in jobs
+        ]
+        for future in as_completed(futures):
+            on_done(future.result())
+
+
 @app.command()
 def process_routes(
     routes_dir: Path = typer.Argument(..., help="Path to routes directory"),
     engine: str = typer.Option("auto", help="OCR engine: auto, easyocr"),
     languages: list[str] = typer.Option(["de", "en"], help="OCR languages"),
+    workers: int = typer.Option(1, min=1, help="Parallel worker processes (one OCR engine each)"),
+    force: bool = typer.Option(False, help="Re-run OCR even if screenshot_ocr.json is up to date"),
+    summary: Path = typer.Option(None, help="JSON summary path (default: <routes_dir>/ocr_summary.json)"),
     verbose: bool = typer.Option(False, help="Verbose output")
 ) -> None:
     """Process OCR on all screenshots in routes directory."""
     if verbose:
         logging.basicConfig(level=logging.INFO)
 
-    processor = OcrProcessor(engine=engine, languages=languages)
-
     typer.echo(f"Processing OCR on routes in: {routes_dir}")
-    typer.echo(f"Using engine: {engine}, languages: {languages}")
-
-    results = processor.process_route_screenshots(routes_dir)
+    typer.echo(f"Using engine: {engine}, languages: {languages}, workers: {workers}")
+
+    all_jobs = OcrProcessor.iter_route_screenshots(routes_dir)
+    entries: list[dict[str, Any]] = []
+    pending: list[tuple[str, str, Path]] = []
+    for route_slug, viewport, screenshot_path in all_jobs:
+        if not force and OcrProcessor.is_ocr_up_to_date(screenshot_path):
+            entry = OcrProcessor.load_saved_result(screenshot_path)
+            entry.update({"route": route_slug, "viewport": viewport, "status": "skipped", "seconds": 0.0})
+            entries.append(entry)
+        else:
+            pending.append((route_slug, viewport, screenshot_path))
+
+    if entries:
+        typer.echo(f"Skipping {len(entries)} screenshots with up-to-date OCR results")
+
+    started = time.perf_counter()
+
+    def _throughput(done: int) -> str:
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        return f"{done / elapsed:.2f} img/s"
+
+    with typer.progressbar(
+        length=len(pending),
+        label="OCR",
+        show_pos=True,
+    ) as bar:
+        processed = 0
+
+        def _on_done(entry: dict[str, Any]) -> None:
+            nonlocal processed
+            processed += 1
+            entries.append(entry)
+            bar.label = f"OCR {_throughput(processed)}"
+            bar.update(1)
+
+        _run_ocr_jobs(pending, engine, languages, workers, _on_done)
+
+    wall_seconds = time.perf_counter() - started
+    entries.sort(key=lambda item: (item["route"], item["viewport"]))
 
-    total_screenshots = 0
     total_texts = 0
-
-    for route_slug, viewports in results.items():
-        typer.echo(f"\nRoute: {route_slug}")
-        for viewport, data in viewports.items():
-            typer.echo(f"  {viewport}: {data['text_count']} texts found")
-            total_screenshots += 1
-            total_texts += data['text_count']
-
-    typer.echo(f"\nTotal: {total_screenshots} screenshots processed, {total_texts} text elements found")
+    for entry in entries:
+        if entry["status"] == "failed":
+            typer.echo(f"{entry['route']} ({entry['viewport']}): FAILED - {entry.get('error')}", err=True)
+        total_texts += int(entry.get("text_count", 0))
+
+    current_route = None
+    for entry in entries:
+        if entry["route"] != current_route:
+            current_route = entry["route"]
+            typer.echo(f"\nRoute: {current_route}")
+        typer.echo(f"  {entry['viewport']}: {entry.get('text_count', 0)} texts found ({entry['status']})")
+
+    counts = {status: sum(1 for e in entries if e["status"] == status) for status in ("processed", "skipped", "failed")}
+    report = {
+        "routes_dir": str(routes_dir),
+        "engine": engine,
+        "languages": languages,
+        "workers": workers,
+        "total_images": len(entries),
+        "processed": counts["processed"],
+        "skipped": counts["skipped"],
+        "failed": counts["failed"],
+        "total_texts": total_texts,
+        "wall_seconds": round(wall_seconds, 4),
+        "images_per_second": round(len(pending) / wall_seconds, 3) if pending and wall_seconds > 0 else 0.0,
+        "images": [{k: v for k, v in entry.items() if k != "texts"} for entry in entries],
+    }
+    summary_path = summary or routes_dir / "ocr_summary.json"
+    summary_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    typer.echo(
+        f"\nTotal: {len(entries)} screenshots ({counts['processed']} processed, "
+        f"{counts['skipped']} skipped, {counts['failed']} failed), {total_texts} text elements found"
+    )
+    typer.echo(f"Summary saved to: {summary_path}")
 
 
 @app.command()
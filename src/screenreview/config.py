@@ -14,13 +14,28 @@ from screenreview.utils.file_utils import read_json_file, write_json_file
 DEFAULT_CONFIG: dict[str, Any] = {
     "api_keys": {"openai": "USE_ENV_FILE", "replicate": "USE_ENV_FILE", "openrouter": "USE_ENV_FILE"},
     "viewport": {"mode": "mobile"},
+    # Screens decoded ahead on each side of the current one, and the memory
+    # budget of that cache (full-page 4K screenshots are large). Thumbnails
+    # are cached per project in <project>/.thumbnails as WebP (or JPEG).
+    "viewer": {
+        "prefetch_radius": 2,
+        "prefetch_cache_mb": 512,
+        "thumbnail_width": 160,
+        "thumbnail_format": "webp",
+    },
     "webcam": {"camera_index": 0, "resolution": "1080p", "microphone_index": 0, "custom_url": ""},
     "speech_to_text": {"provider": "openai_4o_transcribe", "language": "de"},
+    # method "trigger_based" grabs frames_per_trigger frames spread over
+    # trigger_window_seconds around each trigger_types event instead of
+    # sampling the whole video (falls back to time_based without triggers).
     "frame_extraction": {
         "method": "time_based",
         "interval_seconds": 2,
         "max_frames_per_screen": 20,
         "save_dir": ".extraction",
+        "trigger_window_seconds": 1.0,
+        "frames_per_trigger": 3,
+        "trigger_types": ["extract_frame"],
     },
     "smart_selector": {
         "enabled": True,
@@ -32,10 +47,42 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "ocr": {"enabled": True, "engine": "easyocr"},
     "analysis": {"provider": "replicate", "model": "llama_32_vision", "trigger": "per_screen"},
     "cost": {"budget_limit_euro": 1.0, "warning_at_euro": 0.8, "auto_stop_at_limit": True},
-    "recording": {"overwrite_recordings": True},
+    # segment_seconds > 0 writes video/audio in rolling segments (listed in
+    # recording_index.json as they close) that are joined on stop; each closed
+    # segment is transcribed and its frames extracted while recording goes on
+    # (into <extraction dir>/segments/). 0 disables.
+    # profile sets the stored video size/quality: full, balanced (1280 px),
+    # analysis (960 px) or compact (640 px); grayscale drops colour on top.
+    "recording": {
+        "overwrite_recordings": True,
+        "segment_seconds": 10,
+        "profile": "analysis",
+        "grayscale": False,
+    },
     "hotkeys": deepcopy(DEFAULT_HOTKEYS),
     "export": {"format": "markdown", "auto_export_after_analysis": True},
     "recent_projects": [],
+    # Root log level plus optional per-logger overrides, e.g.
+    # {"screenreview.pipeline.recorder": "WARNING", "screenreview.pipeline.ocr_engines": "DEBUG"}
+    "logging": {"level": "INFO", "subsystems": {}},
+    # Per-screen analysis graph: CPU slots plus per-resource-class limits
+    # ("cpu", "model", "network", "disk") for the shared pipeline queue.
+    # backend "process" runs OCR/gesture/marking stages in a process pool
+    # (process_workers 0 = one per CPU core) instead of the queue threads.
+    # deadline_seconds stops a screen's analysis after that long (0 = no limit).
+    # max_active_pipelines / max_transcriptions cap concurrent per-screen jobs
+    # (extra screens wait in line); defer_while_recording parks those resource
+    # classes while the webcam records so capture keeps its frame rate.
+    "pipeline": {
+        "max_workers": 2,
+        "resource_limits": {"model": 2},
+        "backend": "thread",
+        "process_workers": 0,
+        "deadline_seconds": 0,
+        "max_active_pipelines": 2,
+        "max_transcriptions": 2,
+        "defer_while_recording": ["cpu", "model"],
+    },
     "trigger_words": {
         "extract_frame": ["hier", "da", "dort", "schau", "guck", "dies", "jenes", "diesen", "hierbei", "betrachte", "sieh"],
         "mark_bug": ["bug", "fehler", "falsch", "kaputt", "broken", "funktioniert nicht", "geht nicht", "absturz", "problem", "fehlerhaft", "zerstört", "defekt"],
@@ -121,11 +168,73 @@ def validate_config(config: dict[str, Any]) -> None:
     interval = config.get("frame_extraction", {}).get("interval_seconds")
     if not isinstance(interval, int) or not (1 <= interval <= 3600):
         raise ConfigError("frame_extraction.interval_seconds must be an int in range 1..3600")
+    frame_cfg = config.get("frame_extraction", {})
+    if frame_cfg.get("method", "time_based") not in ("time_based", "trigger_based"):
+        raise ConfigError("frame_extraction.method must be 'time_based' or 'trigger_based'")
+    window = frame_cfg.get("trigger_window_seconds", 1.0)
+    if not isinstance(window, (int, float)) or not (0 <= window <= 10):
+        raise ConfigError("frame_extraction.trigger_window_seconds must be in range 0..10")
+    per_trigger = frame_cfg.get("frames_per_trigger", 3)
+    if not isinstance(per_trigger, int) or not (1 <= per_trigger <= 10):
+        raise ConfigError("frame_extraction.frames_per_trigger must be an int in range 1..10")
+    trigger_types = frame_cfg.get("trigger_types", ["extract_frame"])
+    if not isinstance(trigger_types, list) or any(not isinstance(item, str) for item in trigger_types):
+        raise ConfigError("frame_extraction.trigger_types must be a list of trigger types")
 
     sensitivity = config.get("gesture_detection", {}).get("sensitivity")
     if not isinstance(sensitivity, (float, int)) or not (0 <= float(sensitivity) <= 1):
         raise ConfigError("gesture_detection.sensitivity must be in range 0..1")
 
+    logging_cfg = config.get("logging", {})
+    levels = {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"}
+    if str(logging_cfg.get("level", "INFO")).upper() not in levels:
+        raise ConfigError("logging.level must be one of CRITICAL, ERROR, WARNING, INFO, DEBUG")
+    subsystems = logging_cfg.get("subsystems", {})
+    if not isinstance(subsystems, dict) or any(str(v).upper() not in levels for v in subsystems.values()):
+        raise ConfigError("logging.subsystems must map logger names to log level names")
+
+    pipeline_cfg = config.get("pipeline", {})
+    max_workers = pipeline_cfg.get("max_workers", 2)
+    if not isinstance(max_workers, int) or not (1 <= max_workers <= 32):
+        raise ConfigError("pipeline.max_workers must be an int in range 1..32")
+    limits = pipeline_cfg.get("resource_limits", {})
+    if not isinstance(limits, dict) or any(not isinstance(v, int) or v < 1 for v in limits.values()):
+        raise ConfigError("pipeline.resource_limits must map resource classes to positive ints")
+    if pipeline_cfg.get("backend", "thread") not in {"thread", "process"}:
+        raise ConfigError("pipeline.backend must be 'thread' or 'process'")
+    process_workers = pipeline_cfg.get("process_workers", 0)
+    if not isinstance(process_workers, int) or process_workers < 0:
+        raise ConfigError("pipeline.process_workers must be an int >= 0")
+    deadline = pipeline_cfg.get("deadline_seconds", 0)
+    if not isinstance(deadline, (int, float)) or deadline < 0:
+        raise ConfigError("pipeline.deadline_seconds must be a number >= 0")
+    viewer_cfg = config.get("viewer", {})
+    radius = viewer_cfg.get("prefetch_radius", 2)
+    if not isinstance(radius, int) or not (0 <= radius <= 10):
+        raise ConfigError("viewer.prefetch_radius must be an int in range 0..10")
+    cache_mb = viewer_cfg.get("prefetch_cache_mb", 512)
+    if not isinstance(cache_mb, int) or cache_mb < 0:
+        raise ConfigError("viewer.prefetch_cache_mb must be an int >= 0")
+    thumb_width = viewer_cfg.get("thumbnail_width", 160)
+    if not isinstance(thumb_width, int) or not (32 <= thumb_width <= 512):
+        raise ConfigError("viewer.thumbnail_width must be an int in range 32..512")
+    if viewer_cfg.get("thumbnail_format", "webp") not in ("webp", "jpeg"):
+        raise ConfigError("viewer.thumbnail_format must be 'webp' or 'jpeg'")
+    segment_seconds = config.get("recording", {}).get("segment_seconds", 0)
+    if not isinstance(segment_seconds, (int, float)) or not (segment_seconds == 0 or 2 <= segment_seconds <= 600):
+        raise ConfigError("recording.segment_seconds must be 0 or a number in range 2..600")
+    if config.get("recording", {}).get("profile", "analysis") not in ("full", "balanced", "analysis", "compact"):
+        raise ConfigError("recording.profile must be one of full, balanced, analysis, compact")
+    if not isinstance(config.get("recording", {}).get("grayscale", False), bool):
+        raise ConfigError("recording.grayscale must be a boolean")
+    for key in ("max_active_pipelines", "max_transcriptions"):
+        value = pipeline_cfg.get(key, 2)
+        if not isinstance(value, int) or not (1 <= value <= 16):
+            raise ConfigError(f"pipeline.{key} must be an int in range 1..16")
+    deferred = pipeline_cfg.get("defer_while_recording", [])
+    if not isinstance(deferred, list) or any(not isinstance(item, str) for item in deferred):
+        raise ConfigError("pipeline.defer_while_recording must be a list of resource classes")
+
 
 def load_config(path: str | Path | None = None) -> dict[str, Any]:
     """Load config from JSON and merge into defaults."""
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Admission control for per-screen background work (transcription, pipelines)."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+KIND_TRANSCRIPTION = "transcription"
+KIND_PIPELINE = "pipeline"
+
+
+@dataclass
+class AdmissionTicket:
+    """Work waiting for or holding a slot."""
+
+    kind: str
+    key: str
+    start: Callable[[], None]
+
+
+class AdmissionController:
+    """Bound how many jobs of each kind run at once.
+
+    ``submit`` starts the job immediately when a slot is free and otherwise
+    queues it (FIFO per kind). Submitting again for a key that is still
+    waiting replaces the queued job, so flipping quickly through screens
+    keeps one pending job per screen instead of piling them up. ``promote``
+    moves the viewed screen's waiting jobs to the front. ``release``
+    frees the slot and starts the next waiting job. ``on_change`` receives
+    ``depth()`` whenever it changes.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int],
+        on_change: Callable[[dict[str, dict[str, int]]], None] | None = None,
+    ) -> None:
+        self.limits = {kind: max(1, int(limit)) for kind, limit in limits.items()}
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        # A list, not a set: a superseded job may still be winding down while
+        # its replacement for the same key already holds a slot.
+        self._running: dict[str, list[str]] = {kind: [] for kind in self.limits}
+        self._waiting: dict[str, OrderedDict[str, AdmissionTicket]] = {
+            kind: OrderedDict() for kind in self.limits
+        }
+
+    def submit(self, kind: str, key: str, start: Callable[[], None]) -> bool:
+        """Start or queue ``start``; returns True if it started right away."""
+        if kind not in self.limits:
+            raise ValueError(f"Unknown admission kind: {kind}")
+        with self._lock:
+            waiting = self._waiting[kind]
+            waiting.pop(key, None)
+            run_now = len(self._running[kind]) < self.limits[kind]
+            if run_now:
+                self._running[kind].append(key)
+            else:
+                waiting[key] = AdmissionTicket(kind, key, start)
+            waiting_count = len(waiting)
+        if run_now:
+            self._start(kind, key, start)
+        else:
+            logger.info("Deferred %s for %s (%d waiting)", kind, key, waiting_count)
+        self._notify()
+        return run_now
+
+    def set_limits(self, limits: dict[str, int]) -> None:
+        """Change the caps; raising one admits waiting jobs, lowering one lets running jobs finish."""
+        with self._lock:
+            for kind, limit in limits.items():
+                if kind in self.limits:
+                    self.limits[kind] = max(1, int(limit))
+        for kind in self.limits:
+            self._admit(kind)
+        self._notify()
+
+    def release(self, kind: str, key: str) -> None:
+        """Mark ``key`` finished and admit the next waiting job of this kind."""
+        with self._lock:
+            running = self._running.get(kind, [])
+            if key in running:
+                running.remove(key)
+        self._admit(kind)
+        self._notify()
+
+    def cancel(self, key: str) -> int:
+        """Drop waiting jobs for ``key`` (running ones are left to their owner)."""
+        with self._lock:
+            dropped = sum(1 for waiting in self._waiting.values() if waiting.pop(key, None) is not None)
+        if dropped:
+            self._notify()
+        return dropped
+
+    def promote(self, key: str) -> int:
+        """Move waiting jobs for ``key`` to the front of their line; returns how many moved."""
+        with self._lock:
+            moved = 0
+            for waiting in self._waiting.values():
+                if key in waiting:
+                    waiting.move_to_end(key, last=False)
+                    moved += 1
+        return moved
+
+    def is_running(self, kind: str, key: str) -> bool:
+        with self._lock:
+            return key in self._running.get(kind, [])
+
+    def is_waiting(self, kind: str, key: str) -> bool:
+        with self._lock:
+            return key in self._waiting.get(kind, {})
+
+    def depth(self) -> dict[str, dict[str, int]]:
+        """Running and waiting counts per kind."""
+        with self._lock:
+            return {
+                kind: {
+                    "running": len(self._running[kind]),
+                    "waiting": len(self._waiting[kind]),
+                    "limit": limit,
+                }
+                for kind, limit in self.limits.items()
+            }
+
+    def _admit(self, kind: str) -> None:
+        while True:
+            with self._lock:
+                waiting = self._waiting.get(kind)
+                if not waiting or len(self._running[kind]) >= self.limits[kind]:
+                    return
+                _, ticket = waiting.popitem(last=False)
+                self._running[kind].append(ticket.key)
+            self._start(kind, ticket.key, ticket.start)
+
+    def _start(self, kind: str, key: str, start: Callable[[], None]) -> None:
+        try:
+            start()
+        except Exception as exc:
+            logger.error("Failed to start %s for %s: %s", kind, key, exc)
+            with self._lock:
+                if key in self._running[kind]:
+                    self._running[kind].remove(key)
+
+    def _notify(self) -> None:
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(self.depth())
+        except Exception as exc:
+            logger.warning("Admission change callback failed: %s", exc)
+
+
+def admission_limits(settings: dict[str, Any]) -> dict[str, int]:
+    """Read the per-kind concurrency caps from ``settings['pipeline']``."""
+    pipeline = settings.get("pipeline", {}) if isinstance(settings, dict) else {}
+    return {
+        KIND_TRANSCRIPTION: int(pipeline.get("max_transcriptions", 2)),
+        KIND_PIPELINE: int(pipeline.get("max_active_pipelines", 2)),
+    }
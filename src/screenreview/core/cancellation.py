@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Cooperative cancellation tokens with optional deadlines for pipeline work."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+import time
+from typing import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# How often blocking helpers re-check the token.
+POLL_INTERVAL_SECONDS = 0.1
+
+
+class TaskCancelled(RuntimeError):
+    """Raised inside a stage when its token was cancelled."""
+
+
+class DeadlineExceeded(TaskCancelled):
+    """Raised inside a stage when its token's deadline has passed."""
+
+
+class CancellationToken:
+    """Flag that running stages poll to stop early.
+
+    A token is cancelled explicitly (``cancel``) or implicitly once its
+    deadline passes. Loops call ``raise_if_cancelled`` between items; code
+    that blocks elsewhere can register an ``on_cancel`` callback instead.
+    """
+
+    def __init__(self, deadline_seconds: float | None = None) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self.reason: str | None = None
+        self.deadline: float | None = (
+            time.monotonic() + float(deadline_seconds) if deadline_seconds else None
+        )
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning("Cancellation callback failed: %s", exc)
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or self.expired
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled(self.reason or "cancelled")
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Sleep up to ``timeout`` seconds (bounded by the deadline); True if cancelled meanwhile."""
+        remaining = self.remaining()
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return self._event.wait(timeout) or self.expired
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run ``callback`` on cancellation (immediately if already cancelled); returns an unregister function."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def _unregister() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+
+                return _unregister
+        callback()
+        return lambda: None
+
+
+def check_cancelled(token: CancellationToken | None) -> None:
+    """Raise ``TaskCancelled`` if ``token`` is set; no-op for None."""
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def run_cancellable(
+    cmd: Sequence[str],
+    token: CancellationToken | None = None,
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess:
+    """``subprocess.run(cmd, capture_output=True, text=True)`` that a token can interrupt.
+
+    On cancellation or deadline the child is terminated (killed after a grace
+    period) and ``TaskCancelled``/``DeadlineExceeded`` is raised. ``timeout``
+    behaves like ``subprocess.run`` and raises ``TimeoutExpired``.
+    """
+    if token is None:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    token.raise_if_cancelled()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    started = time.monotonic()
+    try:
+        while True:
+            wait_for = POLL_INTERVAL_SECONDS
+            if timeout is not None:
+                left = timeout - (time.monotonic() - started)
+                if left <= 0:
+                    _terminate(proc)
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                wait_for = min(wait_for, left)
+            try:
+                stdout, stderr = proc.communicate(timeout=wait_for)
+                return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                pass
+            if token.cancelled:
+                _terminate(proc)
+                logger.info("Terminated %s: %s", cmd[0], token.reason or "deadline exceeded")
+                token.raise_if_cancelled()
+    except BaseException:
+        if proc.poll() is None:
+            _terminate(proc)
+        raise
+
+
+def _terminate(proc: subprocess.Popen, grace_seconds: float = 2.0) -> None:
+    proc.terminate()
+    try:
+        proc.communicate(timeout=grace_seconds)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""Pluggable execution backends for CPU-bound pipeline work (in-thread or process pool)."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, Sequence
+
+from screenreview.core.cancellation import POLL_INTERVAL_SECONDS, CancellationToken, check_cancelled
+
+logger = logging.getLogger(__name__)
+
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+BACKENDS = (BACKEND_THREAD, BACKEND_PROCESS)
+
+# Engines and other expensive objects cached per worker process (see
+# ``worker_local``). The in-thread backend runs stages on every queue thread,
+# so the cache is process-wide: one OCR reader or MediaPipe graph per process
+# instead of one per thread. ``using_worker_local`` serializes use of an
+# instance; engines are not safe to call from two threads at once.
+_worker_cache: dict[str, Any] = {}
+_worker_locks: dict[str, threading.RLock] = {}
+_worker_cache_lock = threading.Lock()
+
+# (label, factory, args): ``factory(*args)`` creates and caches an engine.
+WorkerWarmup = tuple[str, Callable[..., Any], tuple[Any, ...]]
+
+
+def _worker_lock(key: str) -> threading.RLock:
+    with _worker_cache_lock:
+        lock = _worker_locks.get(key)
+        if lock is None:
+            lock = _worker_locks[key] = threading.RLock()
+        return lock
+
+
+def worker_local(key: str, factory: Callable[[], Any]) -> Any:
+    """Return the object cached under ``key`` for this process, creating it on first use."""
+    with _worker_lock(key):
+        if key not in _worker_cache:
+            _worker_cache[key] = factory()
+        return _worker_cache[key]
+
+
+@contextmanager
+def using_worker_local(key: str, factory: Callable[[], Any]) -> Iterator[Any]:
+    """Yield the cached object for ``key`` while no other thread of this process uses it."""
+    with _worker_lock(key):
+        yield worker_local(key, factory)
+
+
+def _init_process_worker(log_level: int, warmups: Sequence[WorkerWarmup]) -> None:
+    """Pool initializer: configure logging and create engines once per process."""
+    logging.basicConfig(level=log_level, format="%(asctime)s [%(levelname)s] %(name)s[%(process)d]: %(message)s")
+    for label, factory, args in warmups:
+        try:
+            factory(*args)
+        except Exception as exc:
+            # The job itself reports the failure if it needs the engine.
+            logger.warning("Worker warmup of %s failed: %s", label, exc)
+
+
+@dataclass(frozen=True)
+class SharedArrayRef:
+    """Picklable description of a numpy array living in shared memory."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedArray:
+    """Owner side of a shared-memory copy of a numpy array.
+
+    Only the small ``ref`` is pickled to the worker, which maps the same memory
+    with ``attach_array``. The owner must keep this object alive until the
+    worker is done and then call ``close`` (or use it as a context manager).
+    """
+
+    def __init__(self, array: Any) -> None:
+        import numpy as np
+
+        source = np.ascontiguousarray(array)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, source.nbytes))
+        view = np.ndarray(source.shape, dtype=source.dtype, buffer=self._shm.buf)
+        view[...] = source
+        del view
+        self.ref = SharedArrayRef(name=self._shm.name, shape=tuple(source.shape), dtype=source.dtype.str)
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+@contextmanager
+def attach_array(item: Any) -> Iterator[Any]:
+    """Yield an ndarray for ``item``, mapping it from shared memory if it is a ``SharedArrayRef``.
+
+    The yielded view is only valid inside the ``with`` block.
+    """
+    if not isinstance(item, SharedArrayRef):
+        yield item
+        return
+    import numpy as np
+
+    shm = shared_memory.SharedMemory(name=item.name)
+    try:
+        array = np.ndarray(item.shape, dtype=np.dtype(item.dtype), buffer=shm.buf)
+        yield array
+        del array
+    finally:
+        shm.close()
+
+
+class ExecutionBackend:
+    """Runs picklable callables for pipeline stages; the default runs them in the calling thread."""
+
+    kind = BACKEND_THREAD
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(func(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def run(self, func: Callable[..., Any], *args: Any, token: CancellationToken | None = None) -> Any:
+        """Run ``func(*args)`` on the backend and wait for its result.
+
+        With a ``token`` the wait is abandoned as soon as it is cancelled; a job
+        that has not started yet is withdrawn, one already running in a worker
+        process finishes there and its result is discarded.
+        """
+        check_cancelled(token)
+        future = self.submit(func, *args)
+        if token is None:
+            return future.result()
+        while True:
+            try:
+                return future.result(timeout=POLL_INTERVAL_SECONDS)
+            except FutureTimeoutError:
+                if token.cancelled:
+                    future.cancel()
+                    token.raise_if_cancelled()
+
+    def share(self, array: Any) -> Any:
+        """Return a handle to pass to ``run`` instead of ``array``; in-thread execution passes it unchanged.
+
+        Jobs resolve handles with ``attach_array``.
+        """
+        return array
+
+    def release(self, handle: Any) -> None:
+        """Free what ``share`` allocated once the job using the handle has finished."""
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class ProcessBackend(ExecutionBackend):
+    """Run stage functions in a pool of worker processes.
+
+    Workers start with the ``spawn`` method (the default on Windows and macOS,
+    and safe next to Qt threads on Linux). ``warmups`` are ``(label, factory, args)``
+    triples called once per worker so that OCR or MediaPipe models load once
+    per process instead of once per screen. Arrays handed to ``share`` travel
+    through shared memory rather than being pickled.
+    """
+
+    kind = BACKEND_PROCESS
+
+    def __init__(self, max_workers: int | None = None, warmups: Sequence[WorkerWarmup] = ()) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process_worker,
+            initargs=(logging.getLogger().getEffectiveLevel(), tuple(warmups)),
+        )
+        self._shared: dict[str, SharedArray] = {}
+        self._shared_lock = threading.Lock()
+        logger.info("Process backend started with %d workers", self.max_workers)
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        return self._executor.submit(func, *args)
+
+    def share(self, array: Any) -> SharedArrayRef:
+        shared = SharedArray(array)
+        with self._shared_lock:
+            self._shared[shared.ref.name] = shared
+        return shared.ref
+
+    def release(self, handle: Any) -> None:
+        if not isinstance(handle, SharedArrayRef):
+            return
+        with self._shared_lock:
+            shared = self._shared.pop(handle.name, None)
+        if shared is not None:
+            shared.close()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        with self._shared_lock:
+            leftovers = list(self._shared.values())
+            self._shared.clear()
+        for shared in leftovers:
+            shared.close()
+
+
+def create_backend(settings: dict[str, Any], warmups: Sequence[WorkerWarmup] = ()) -> ExecutionBackend:
+    """Build the backend selected by ``pipeline.backend`` (``thread`` or ``process``)."""
+    pipeline_cfg = settings.get("pipeline", {})
+    kind = str(pipeline_cfg.get("backend", BACKEND_THREAD))
+    if kind == BACKEND_PROCESS:
+        workers = int(pipeline_cfg.get("process_workers", 0)) or None
+        return ProcessBackend(max_workers=workers, warmups=warmups)
+    if kind != BACKEND_THREAD:
+        raise ValueError(f"Unknown execution backend {kind!r}")
+    return ExecutionBackend()
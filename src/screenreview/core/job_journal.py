@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Append-only JSONL journal of pipeline jobs, used to resume interrupted work."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "pipeline_jobs.jsonl"
+
+EVENT_JOB_STARTED = "job_started"
+EVENT_STAGE_DONE = "stage_done"
+EVENT_JOB_FINISHED = "job_finished"
+EVENT_JOB_FAILED = "job_failed"
+
+_PATH_KEY = "$path"
+
+
+def encode_result(value: Any) -> Any:
+    """Convert a stage result to JSON; paths are tagged so they round-trip."""
+    if isinstance(value, Path):
+        return {_PATH_KEY: str(value)}
+    if isinstance(value, dict):
+        return {str(k): encode_result(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_result(v) for v in value]
+    return value
+
+
+def decode_result(value: Any) -> Any:
+    """Inverse of ``encode_result`` (tuples come back as lists)."""
+    if isinstance(value, dict):
+        if set(value) == {_PATH_KEY}:
+            return Path(value[_PATH_KEY])
+        return {k: decode_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [decode_result(v) for v in value]
+    return value
+
+
+@dataclass
+class StageRecord:
+    """A finished stage: its JSON-encoded result and the files it produced."""
+
+    result: Any = None
+    artifacts: list[str] = field(default_factory=list)
+
+    def outputs_exist(self) -> bool:
+        return all(Path(path).exists() for path in self.artifacts)
+
+
+@dataclass
+class JobRecord:
+    """State of one pipeline job, rebuilt from the journal."""
+
+    job_id: str
+    screen: str
+    extraction_dir: Path
+    video_path: Path
+    audio_path: Path
+    segments: list[dict[str, Any]] = field(default_factory=list)
+    stages: dict[str, StageRecord] = field(default_factory=dict)
+    status: str = "running"  # running | finished | failed
+    error: str | None = None
+
+    @property
+    def interrupted(self) -> bool:
+        return self.status == "running"
+
+
+class JobJournal:
+    """Durable log of pipeline jobs in ``<project>/pipeline_jobs.jsonl``.
+
+    Every event is appended as one JSON line and fsynced, so a crash loses at
+    most the stage that was running. Replaying the file yields the jobs that
+    never reached ``job_finished``/``job_failed``; their finished stages can be
+    skipped as long as the recorded artifacts still exist.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._jobs: dict[str, JobRecord] = {}
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> "JobJournal":
+        return cls(Path(project_dir) / JOURNAL_FILENAME)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line_no, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (ValueError, KeyError, TypeError) as exc:
+                    # A torn last line after a crash is expected; skip it.
+                    logger.warning("Ignoring invalid journal line %d in %s: %s", line_no, self.path, exc)
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        kind = event["event"]
+        job_id = event["job"]
+        if kind == EVENT_JOB_STARTED:
+            self._jobs[job_id] = JobRecord(
+                job_id=job_id,
+                screen=event["screen"],
+                extraction_dir=Path(event["extraction_dir"]),
+                video_path=Path(event["video_path"]),
+                audio_path=Path(event["audio_path"]),
+                segments=list(event.get("segments", [])),
+            )
+            return
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        if kind == EVENT_STAGE_DONE:
+            job.stages[event["stage"]] = StageRecord(result=event.get("result"), artifacts=list(event.get("artifacts", [])))
+        elif kind == EVENT_JOB_FINISHED:
+            job.status = "finished"
+        elif kind == EVENT_JOB_FAILED:
+            job.status = "failed"
+            job.error = event.get("error")
+
+    def _append(self, event: dict[str, Any]) -> None:
+        event.setdefault("ts", time.strftime("%Y-%m-%dT%H:%M:%S"))
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self._apply(event)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def start_job(
+        self,
+        screen: str,
+        extraction_dir: Path,
+        video_path: Path,
+        audio_path: Path,
+        segments: list[dict[str, Any]],
+    ) -> str:
+        """Record a new job and return its id."""
+        job_id = uuid.uuid4().hex[:12]
+        self._append(
+            {
+                "event": EVENT_JOB_STARTED,
+                "job": job_id,
+                "screen": screen,
+                "extraction_dir": str(extraction_dir),
+                "video_path": str(video_path),
+                "audio_path": str(audio_path),
+                "segments": segments,
+            }
+        )
+        return job_id
+
+    def record_stage(self, job_id: str, stage: str, result: Any, artifacts: Iterable[Path] = ()) -> None:
+        self._append(
+            {
+                "event": EVENT_STAGE_DONE,
+                "job": job_id,
+                "stage": stage,
+                "result": encode_result(result),
+                "artifacts": [str(path) for path in artifacts],
+            }
+        )
+
+    def finish_job(self, job_id: str) -> None:
+        self._append({"event": EVENT_JOB_FINISHED, "job": job_id})
+
+    def fail_job(self, job_id: str, error: str) -> None:
+        self._append({"event": EVENT_JOB_FAILED, "job": job_id, "error": error})
+
+    def get_job(self, job_id: str) -> JobRecord | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def completed_stage(self, job_id: str, stage: str) -> StageRecord | None:
+        """Return the stage record if it finished and all its artifacts are still on disk."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            record = job.stages.get(stage) if job else None
+        if record is None or not record.outputs_exist():
+            return None
+        return record
+
+    def interrupted_jobs(self) -> list[JobRecord]:
+        """Jobs that started but never finished or failed, newest per screen only."""
+        with self._lock:
+            latest: dict[str, JobRecord] = {}
+            for job in self._jobs.values():
+                latest[str(job.extraction_dir)] = job
+            return [job for job in latest.values() if job.interrupted]
+
+    def compact(self) -> None:
+        """Rewrite the journal keeping only events of interrupted jobs."""
+        keep = {job.job_id for job in self.interrupted_jobs()}
+        with self._lock:
+            if not self.path.exists():
+                return
+            lines = []
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                try:
+                    if json.loads(line).get("job") in keep:
+                        lines.append(line)
+                except ValueError:
+                    continue
+            self._jobs = {job_id: job for job_id, job in self._jobs.items() if job_id in keep}
+            tmp_path = self.path.with_suffix(".jsonl.tmp")
+            tmp_path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+            os.replace(tmp_path, self.path)
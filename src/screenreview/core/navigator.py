@@ -9,6 +9,7 @@ from screenreview.models.screen_item import ScreenItem
 
 
 EnqueueCallback = Callable[[ScreenItem], None]
+MoveCallback = Callable[[list[ScreenItem], int], None]
 
 
 class Navigator:
@@ -18,10 +19,19 @@ class Navigator:
         self,
         screens: list[ScreenItem],
         enqueue_callback: EnqueueCallback | None = None,
+        move_callback: MoveCallback | None = None,
     ) -> None:
         self._screens = screens
         self._index = 0
         self._enqueue_callback = enqueue_callback
+        # Called with (screens, new index) after every position change, e.g.
+        # to prefetch the neighbouring screens.
+        self._move_callback = move_callback
+
+    def _set_index(self, index: int) -> None:
+        self._index = index
+        if self._move_callback is not None:
+            self._move_callback(self._screens, index)
 
     def current(self) -> ScreenItem:
         if not self._screens:
@@ -37,7 +47,7 @@ class Navigator:
             if previous.status not in {"skipped"} and self._enqueue_callback is not None:
                 previous.status = "processing"
                 self._enqueue_callback(previous)
-            self._index += 1
+            self._set_index(self._index + 1)
         return self._screens[self._index]
 
     def skip(self) -> ScreenItem:
@@ -46,14 +56,14 @@ class Navigator:
         current = self._screens[self._index]
         current.status = "skipped"
         if self._index < len(self._screens) - 1:
-            self._index += 1
+            self._set_index(self._index + 1)
         return self._screens[self._index]
 
     def previous(self) -> ScreenItem:
         if not self._screens:
             raise IndexError("No screens available")
         if self._index > 0:
-            self._index -= 1
+            self._set_index(self._index - 1)
         return self._screens[self._index]
 
     def go_to(self, index: int) -> ScreenItem:
@@ -61,7 +71,7 @@ class Navigator:
             raise IndexError("No screens available")
         if index < 0 or index >= len(self._screens):
             raise IndexError(f"Invalid screen index: {index}")
-        self._index = index
+        self._set_index(index)
         return self._screens[self._index]
 
     def current_index(self) -> int:
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Background prefetch of neighbouring screens into a bounded LRU cache."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+from screenreview.models.screen_item import ScreenItem
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# decode(path, display_width) -> (full-size image, pre-scaled image or None, approx. bytes)
+DecodeFunc = Callable[[Path, int], "tuple[Any, Any, int]"]
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe LRU cache bounded by entry count and by total size."""
+
+    def __init__(
+        self,
+        max_entries: int = 8,
+        max_bytes: int = 0,
+        sizeof: Callable[[V], int] | None = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self._sizeof = sizeof or (lambda _value: 0)
+        self._lock = threading.Lock()
+        self._items: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def put(self, key: K, value: V) -> None:
+        size = int(self._sizeof(value))
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._items[key] = (value, size)
+            self._bytes += size
+            # Never evict the entry just stored, even if it alone exceeds max_bytes.
+            while len(self._items) > 1 and (
+                len(self._items) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._items.pop(key, None)
+            if entry is None:
+                return None
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+
+@dataclass
+class ScreenAssets:
+    """The decoded screenshot of a screen, ready before the user navigates to it."""
+
+    image: Any = None
+    display_image: Any = None
+    display_width: int = 0
+    nbytes: int = 0
+
+
+def load_screen_assets(
+    screen: ScreenItem,
+    decode: DecodeFunc | None = None,
+    display_width: int = 0,
+) -> ScreenAssets:
+    """Decode the screenshot via ``decode`` (empty assets without one or without a file)."""
+    assets = ScreenAssets()
+    if decode is not None and screen.screenshot_path.exists():
+        assets.image, assets.display_image, assets.nbytes = decode(screen.screenshot_path, display_width)
+        assets.display_width = display_width if assets.display_image is not None else 0
+    return assets
+
+
+def _cache_key(screen: ScreenItem) -> tuple[str, int]:
+    """Path plus mtime, so a re-captured screenshot is never served stale."""
+    try:
+        mtime = screen.screenshot_path.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    return str(screen.screenshot_path), mtime
+
+
+class ScreenPrefetcher:
+    """Load the screens around the navigator's position on a background thread.
+
+    ``prefetch_around`` is called whenever the navigator moves: it queues the
+    next ``radius`` screens first, then the previous ones, and drops queued
+    loads that are no longer in range. ``get`` returns cached assets without
+    blocking; ``load`` falls back to loading synchronously on a miss.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[ScreenItem], ScreenAssets],
+        radius: int = 2,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.loader = loader
+        self.radius = max(0, int(radius))
+        self.cache: LRUCache[tuple[str, int], ScreenAssets] = LRUCache(
+            max_entries=2 * self.radius + 2,
+            max_bytes=max_bytes,
+            sizeof=lambda assets: assets.nbytes,
+        )
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, int], Future] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get(self, screen: ScreenItem) -> ScreenAssets | None:
+        return self.cache.get(_cache_key(screen))
+
+    def load(self, screen: ScreenItem) -> ScreenAssets:
+        """Return cached assets, waiting for an in-flight prefetch or loading inline."""
+        key = _cache_key(screen)
+        assets = self.cache.get(key)
+        if assets is not None:
+            return assets
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None and future.cancel():
+                del self._pending[key]
+                future = None
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass
+        assets = self.loader(screen)
+        self.cache.put(key, assets)
+        return assets
+
+    def invalidate(self, screen: ScreenItem) -> None:
+        """Forget cached assets, e.g. after the screenshot was replaced in place."""
+        self.cache.pop(_cache_key(screen))
+
+    def prefetch_around(self, screens: list[ScreenItem], index: int) -> None:
+        if self.radius == 0 or not screens:
+            return
+        wanted: list[ScreenItem] = []
+        for offset in range(1, self.radius + 1):
+            if index + offset < len(screens):
+                wanted.append(screens[index + offset])
+        for offset in range(1, self.radius + 1):
+            if index - offset >= 0:
+                wanted.append(screens[index - offset])
+        wanted_keys = {_cache_key(screen): screen for screen in wanted}
+
+        with self._lock:
+            for key, future in list(self._pending.items()):
+                if key not in wanted_keys and future.cancel():
+                    del self._pending[key]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screen-prefetch")
+            for key, screen in wanted_keys.items():
+                if key in self._pending or key in self.cache:
+                    continue
+                future = self._executor.submit(self._load_into_cache, key, screen)
+                self._pending[key] = future
+
+    def _load_into_cache(self, key: tuple[str, int], screen: ScreenItem) -> ScreenAssets:
+        try:
+            assets = self.loader(screen)
+            self.cache.put(key, assets)
+            return assets
+        except Exception as exc:
+            logger.warning("Prefetch of %s failed: %s", screen.name, exc)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def wait_idle(self, timeout: float | None = None) -> None:
+        """Block until queued prefetches are done (used by tests)."""
+        with self._lock:
+            futures = list(self._pending.values())
+        wait(futures, timeout=timeout)
+
+    def clear(self) -> None:
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        self.cache.clear()
+
+    def shutdown(self) -> None:
+        self.clear()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
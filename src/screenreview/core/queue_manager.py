@@ -1,40 +1,169 @@
 # -*- coding: utf-8 -*-
-"""Background task queue with sequential per-screen pipelines."""
+"""Background task queue with per-screen pipelines (sequential chains or dependency graphs)."""
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor, wait
-from dataclasses import dataclass
-from typing import Any, Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence, Union
+
+from screenreview.core.cancellation import CancellationToken, TaskCancelled
 
 
 TaskCallable = Callable[[], Any]
+NodeCallable = Callable[[dict[str, Any]], Any]
 ProgressCallback = Callable[[str, int, int, str], None]
 CompletionCallback = Callable[[str, Any], None]
 ErrorCallback = Callable[[str, str], None]
 CostCallback = Callable[[float, Any], None]
 
+# Resource classes. Each has its own concurrency limit so that, for example, a
+# screen waiting on a transcription API never occupies a CPU slot.
+RESOURCE_CPU = "cpu"
+RESOURCE_MODEL = "model"  # local (GPU-less) model inference: OCR, MediaPipe
+RESOURCE_NETWORK = "network"
+RESOURCE_DISK = "disk"
+RESOURCE_CLASSES = (RESOURCE_CPU, RESOURCE_MODEL, RESOURCE_NETWORK, RESOURCE_DISK)
+
+# Lower value runs first.
+PRIORITY_FOREGROUND = 0
+PRIORITY_BACKGROUND = 10
+
+
+@dataclass
+class QueueStep:
+    """One step of a screen's chain and the resource class it occupies."""
+
+    name: str
+    func: TaskCallable
+    resource: str = RESOURCE_CPU
+
 
 @dataclass
+class PipelineNode:
+    """One node of a screen's dependency graph.
+
+    ``func`` is called with ``{dep_name: dep_result}`` for every name in ``deps``.
+    """
+
+    name: str
+    func: NodeCallable
+    deps: tuple[str, ...] = ()
+    resource: str = RESOURCE_CPU
+
+
+StepSpec = Union[QueueStep, tuple[str, TaskCallable], tuple[str, TaskCallable, str]]
+
+
+@dataclass(eq=False)
 class QueueTask:
-    """Sequential task chain for one screen."""
+    """Dependency graph for one screen; a chain is a graph where each node depends on the previous one."""
 
     screen_name: str
-    steps: list[tuple[str, TaskCallable]]
+    nodes: list[PipelineNode]
+    priority: int = PRIORITY_BACKGROUND
+    seq: int = 0
+    future: Future = field(default_factory=Future)
+    labels: dict[str, str] = field(default_factory=dict)
+    results: dict[str, Any] = field(default_factory=dict)
+    waiting_on: dict[str, int] = field(default_factory=dict)
+    dependents: dict[str, list[str]] = field(default_factory=dict)
+    started: bool = False
+    running: int = 0
+    completed: int = 0
+    error: BaseException | None = None
+    return_last: bool = False
+    on_progress: ProgressCallback | None = None
+    token: CancellationToken = field(default_factory=CancellationToken)
+
+    def node(self, name: str) -> PipelineNode:
+        return next(node for node in self.nodes if node.name == name)
+
+
+def _normalize_step(step: StepSpec) -> QueueStep:
+    if isinstance(step, QueueStep):
+        return step
+    if len(step) == 2:
+        name, func = step  # type: ignore[misc]
+        return QueueStep(name=name, func=func)
+    name, func, resource = step  # type: ignore[misc]
+    return QueueStep(name=name, func=func, resource=resource)
+
+
+def _chain_nodes(steps: Sequence[QueueStep]) -> list[PipelineNode]:
+    """Express a step chain as a linear graph (node names are indices, step names may repeat)."""
+    nodes: list[PipelineNode] = []
+    for index, step in enumerate(steps):
+        nodes.append(
+            PipelineNode(
+                name=str(index),
+                func=lambda _inputs, func=step.func: func(),
+                deps=(str(index - 1),) if index else (),
+                resource=step.resource,
+            )
+        )
+    return nodes
+
+
+def _check_acyclic(nodes: Sequence[PipelineNode]) -> None:
+    """Raise ValueError if the dependency graph contains a cycle."""
+    pending = {node.name: set(node.deps) for node in nodes}
+    while pending:
+        free = [name for name, deps in pending.items() if not deps]
+        if not free:
+            raise ValueError(f"Dependency cycle between nodes: {', '.join(sorted(pending))}")
+        for name in free:
+            del pending[name]
+        for deps in pending.values():
+            deps.difference_update(free)
 
 
 class QueueManager:
-    """Run one task chain per screen, parallel across screens."""
+    """Run one task graph per screen, parallel across screens and across independent nodes.
 
-    def __init__(self, max_workers: int = 2) -> None:
+    Nodes are scheduled individually: once all dependencies of a node have
+    finished it is queued in the lane of its resource class. Every lane has its
+    own concurrency limit and a priority heap, so the screen the user is looking
+    at (``promote_screen``) overtakes background screens at the next free slot.
+
+    Every pipeline carries a ``CancellationToken`` (optionally with a deadline).
+    Cancelling it drops the pipeline's queued nodes at once; nodes that are
+    already running see the token if they poll it and otherwise finish, after
+    which no dependent node starts.
+
+    ``hold_resources`` parks whole lanes (e.g. CPU and model work while the
+    webcam is recording): their nodes stay queued until ``release_resources``.
+    """
+
+    def __init__(self, max_workers: int = 2, resource_limits: dict[str, int] | None = None) -> None:
         self.max_workers = int(max_workers)
-        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="screenreview")
+        self.resource_limits: dict[str, int] = {
+            RESOURCE_CPU: self.max_workers,
+            RESOURCE_MODEL: 1,
+            RESOURCE_NETWORK: 4,
+            RESOURCE_DISK: 2,
+        }
+        for resource, limit in (resource_limits or {}).items():
+            self.resource_limits[resource] = max(1, int(limit))
+        # One thread per slot: a dispatched node never waits inside the executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(self.resource_limits.values()), thread_name_prefix="screenreview"
+        )
         self._futures: list[Future] = []
+        self._tasks: list[QueueTask] = []
         self._lock = threading.Lock()
+        self._ready: dict[str, list[tuple[int, int, int, QueueTask, PipelineNode]]] = {
+            r: [] for r in self.resource_limits
+        }
+        self._running: dict[str, int] = {r: 0 for r in self.resource_limits}
+        self._held: set[str] = set()
+        self._seq = itertools.count()
+        self._node_seq = itertools.count()
         self._active = 0
         self._peak_active = 0
-        self._cancelled = False
         self._queued_count = 0
 
         self.progress_updated: ProgressCallback | None = None
@@ -45,55 +174,303 @@ class QueueManager:
     def add_task(
         self,
         screen_name: str,
-        steps: list[tuple[str, TaskCallable]],
+        steps: Sequence[StepSpec],
+        priority: int = PRIORITY_BACKGROUND,
+        token: CancellationToken | None = None,
+        deadline_seconds: float | None = None,
     ) -> Future:
-        """Add a sequential task chain for one screen."""
-        task = QueueTask(screen_name=screen_name, steps=steps)
+        """Add a sequential task chain for one screen.
+
+        Steps are ``(name, func)`` (CPU class), ``(name, func, resource)`` or
+        ``QueueStep`` objects. The returned future resolves to the last step's result.
+        """
+        normalized = [_normalize_step(step) for step in steps]
+        task = self._build_task(screen_name, _chain_nodes(normalized), priority, token, deadline_seconds)
+        task.labels = {str(index): step.name for index, step in enumerate(normalized)}
+        task.return_last = True
+        return self._submit(task)
+
+    def add_graph(
+        self,
+        screen_name: str,
+        nodes: Sequence[PipelineNode],
+        priority: int = PRIORITY_BACKGROUND,
+        on_progress: ProgressCallback | None = None,
+        token: CancellationToken | None = None,
+        deadline_seconds: float | None = None,
+    ) -> Future:
+        """Add a dependency graph for one screen.
+
+        Nodes whose dependencies are satisfied run concurrently, limited only by
+        their resource classes. The returned future resolves to
+        ``{node_name: result}``. When a node fails its dependents are skipped and
+        the future raises that error once the nodes still running have finished.
+        ``on_progress`` receives the same arguments as ``progress_updated``.
+        Pass ``token`` to let node functions poll the same token the queue
+        checks; otherwise one is created with ``deadline_seconds``.
+        """
+        names = [node.name for node in nodes]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate node names in graph for {screen_name!r}")
+        for node in nodes:
+            unknown = [dep for dep in node.deps if dep not in names]
+            if unknown:
+                raise ValueError(f"Node {node.name!r} depends on unknown node(s): {', '.join(unknown)}")
+        _check_acyclic(nodes)
+        task = self._build_task(screen_name, list(nodes), priority, token, deadline_seconds)
+        task.on_progress = on_progress
+        return self._submit(task)
+
+    def _build_task(
+        self,
+        screen_name: str,
+        nodes: list[PipelineNode],
+        priority: int,
+        token: CancellationToken | None,
+        deadline_seconds: float | None,
+    ) -> QueueTask:
+        for node in nodes:
+            if node.resource not in self.resource_limits:
+                raise ValueError(f"Unknown resource class {node.resource!r} for step {node.name!r}")
+        task = QueueTask(
+            screen_name=screen_name,
+            nodes=nodes,
+            priority=int(priority),
+            seq=next(self._seq),
+            token=token or CancellationToken(deadline_seconds),
+        )
+        for node in nodes:
+            task.waiting_on[node.name] = len(node.deps)
+            for dep in node.deps:
+                task.dependents.setdefault(dep, []).append(node.name)
+        return task
+
+    def _submit(self, task: QueueTask) -> Future:
         with self._lock:
             self._queued_count += 1
-        future = self._executor.submit(self._run_task_chain, task)
+            self._futures.append(task.future)
+            self._tasks.append(task)
+            for node in task.nodes:
+                if not node.deps:
+                    self._push_ready(task, node)
+        if not task.nodes:
+            if task.future.set_running_or_notify_cancel():
+                self._finish_task(task)
+            return task.future
+        self._dispatch()
+        return task.future
+
+    def promote_screen(self, screen_name: str, priority: int = PRIORITY_FOREGROUND) -> int:
+        """Change the priority of all unfinished pipelines for a screen; returns how many changed."""
+        changed = 0
+        with self._lock:
+            for task in self._tasks:
+                if task.screen_name == screen_name and not task.future.done():
+                    task.priority = int(priority)
+                    changed += 1
+            if changed:
+                for resource, heap in self._ready.items():
+                    self._ready[resource] = [(t.priority, t.seq, n_seq, t, n) for _, _, n_seq, t, n in heap]
+                    heapq.heapify(self._ready[resource])
+        return changed
+
+    def resource_stats(self) -> dict[str, dict[str, int]]:
+        """Return running/queued/limit per resource class."""
+        with self._lock:
+            return {
+                resource: {
+                    "running": self._running[resource],
+                    "queued": len(self._ready[resource]),
+                    "limit": limit,
+                }
+                for resource, limit in self.resource_limits.items()
+            }
+
+    def hold_resources(self, resources: Iterable[str]) -> None:
+        """Stop starting nodes of these resource classes; running nodes continue."""
+        with self._lock:
+            self._held.update(r for r in resources if r in self.resource_limits)
+
+    def release_resources(self) -> None:
+        """Resume all held resource classes."""
+        with self._lock:
+            self._held.clear()
+        self._dispatch()
+
+    def queue_depth(self) -> dict[str, Any]:
+        """Summary for the UI: unfinished pipelines, running/queued nodes and held classes."""
+        with self._lock:
+            return {
+                "pipelines": len(self._tasks),
+                "running_nodes": self._active,
+                "queued_nodes": sum(len(heap) for heap in self._ready.values()),
+                "held": sorted(self._held),
+            }
+
+    def _push_ready(self, task: QueueTask, node: PipelineNode) -> None:
+        heapq.heappush(self._ready[node.resource], (task.priority, task.seq, next(self._node_seq), task, node))
+
+    def _dispatch(self) -> None:
+        """Start as many ready nodes as the per-class limits allow."""
+        launch: list[tuple[QueueTask, PipelineNode]] = []
+        to_finish: list[QueueTask] = []
         with self._lock:
-            self._futures.append(future)
-        return future
+            for resource, heap in self._ready.items():
+                if resource in self._held:
+                    continue
+                while heap and self._running[resource] < self.resource_limits[resource]:
+                    _, _, _, task, node = heapq.heappop(heap)
+                    if task.error is not None:
+                        continue
+                    if task.token.cancelled:
+                        if self._abort_task(task) and task not in to_finish:
+                            to_finish.append(task)
+                        continue
+                    if not task.started:
+                        if not task.future.set_running_or_notify_cancel():
+                            self._drop_task(task)
+                            continue
+                        task.started = True
+                    self._running[resource] += 1
+                    task.running += 1
+                    self._active += 1
+                    self._peak_active = max(self._peak_active, self._active)
+                    launch.append((task, node))
+        for task in to_finish:
+            self._finish_task(task)
+        for task, node in launch:
+            try:
+                self._executor.submit(self._run_node, task, node)
+            except RuntimeError as exc:
+                # The executor was shut down: fail the graph instead of leaving its future pending.
+                self._reject_node(task, node, exc)
 
-    def _run_task_chain(self, task: QueueTask) -> Any:
+    def _reject_node(self, task: QueueTask, node: PipelineNode, error: BaseException) -> None:
         with self._lock:
-            self._active += 1
-            self._peak_active = max(self._peak_active, self._active)
+            self._running[node.resource] -= 1
+            self._active = max(0, self._active - 1)
+            task.running -= 1
+            if task.error is None:
+                task.error = error
+            finished = task.running == 0 and not task.future.done()
+        if finished:
+            self._finish_task(task)
+
+    def _abort_task(self, task: QueueTask) -> bool:
+        """Fail a cancelled task; returns True if it must be finished now. Caller holds the lock."""
+        if not task.started:
+            if not task.future.done() and task.future.cancel():
+                task.future.set_running_or_notify_cancel()
+            self._drop_task(task)
+            return False
+        if task.error is None:
+            try:
+                task.token.raise_if_cancelled()
+            except TaskCancelled as exc:
+                task.error = exc
+        return task.running == 0 and not task.future.done()
+
+    def _report_progress(self, task: QueueTask, done: int, message: str) -> None:
+        for callback in (self.progress_updated, task.on_progress):
+            if callback is not None:
+                callback(task.screen_name, done, len(task.nodes), message)
+
+    def _run_node(self, task: QueueTask, node: PipelineNode) -> None:
+        label = task.labels.get(node.name, node.name)
+        error: BaseException | None = None
         try:
-            last_result: Any = None
-            total_steps = len(task.steps)
-            for index, (step_name, func) in enumerate(task.steps, start=1):
-                if self._cancelled:
-                    raise RuntimeError("Queue cancelled")
-                if self.progress_updated is not None:
-                    self.progress_updated(task.screen_name, index - 1, total_steps, f"Starting {step_name}")
-                last_result = func()
-                if isinstance(last_result, dict) and "cost_total" in last_result and self.cost_updated is not None:
-                    self.cost_updated(float(last_result["cost_total"]), last_result.get("cost_entry"))
-                if self.progress_updated is not None:
-                    self.progress_updated(task.screen_name, index, total_steps, f"Finished {step_name}")
-            if self.task_completed is not None:
-                self.task_completed(task.screen_name, last_result)
-            return last_result
+            task.token.raise_if_cancelled()
+            self._report_progress(task, task.completed, f"Starting {label}")
+            result = node.func({dep: task.results[dep] for dep in node.deps})
+            if isinstance(result, dict) and "cost_total" in result and self.cost_updated is not None:
+                self.cost_updated(float(result["cost_total"]), result.get("cost_entry"))
         except Exception as exc:
-            if self.task_failed is not None:
-                self.task_failed(task.screen_name, str(exc))
-            raise
-        finally:
-            with self._lock:
-                self._active = max(0, self._active - 1)
-                self._queued_count = max(0, self._queued_count - 1)
+            error = exc
+
+        with self._lock:
+            self._running[node.resource] -= 1
+            self._active = max(0, self._active - 1)
+            task.running -= 1
+            if error is None:
+                task.results[node.name] = result
+                task.completed += 1
+                if task.error is None:
+                    for name in task.dependents.get(node.name, []):
+                        task.waiting_on[name] -= 1
+                        if task.waiting_on[name] == 0:
+                            self._push_ready(task, task.node(name))
+            elif task.error is None:
+                task.error = error
+            if task.error is None and task.token.cancelled:
+                self._abort_task(task)
+            done = task.completed
+            finished = task.running == 0 and (task.error is not None or done >= len(task.nodes))
+        if error is None:
+            self._report_progress(task, done, f"Finished {label}")
+        if finished:
+            self._finish_task(task)
+        self._dispatch()
+
+    def _finish_task(self, task: QueueTask) -> None:
+        error = task.error
+        if task.return_last:
+            result: Any = task.results.get(task.nodes[-1].name) if task.nodes else None
+        else:
+            result = dict(task.results)
+        if error is None:
+            if self.task_completed is not None:
+                self.task_completed(task.screen_name, result)
+        elif self.task_failed is not None:
+            self.task_failed(task.screen_name, str(error))
+        with self._lock:
+            self._drop_task(task)
+        if error is None:
+            task.future.set_result(result)
+        else:
+            task.future.set_exception(error)
+
+    def _drop_task(self, task: QueueTask) -> None:
+        """Forget a finished or cancelled task; the caller holds the lock."""
+        if task in self._tasks:
+            self._tasks.remove(task)
+            self._queued_count = max(0, self._queued_count - 1)
+
+    def cancel_screen(self, screen_name: str, reason: str = "superseded") -> int:
+        """Cancel all unfinished pipelines of a screen, e.g. after it was re-recorded.
+
+        Queued nodes are dropped immediately; the tokens tell running nodes to
+        stop. Returns the number of pipelines cancelled.
+        """
+        return self._cancel_where(lambda task: task.screen_name == screen_name, reason)
 
     def cancel_pending_tasks(self) -> int:
-        """Cancel futures that have not started yet."""
-        self._cancelled = True
-        cancelled = 0
+        """Cancel every unfinished pipeline; returns how many had not started yet.
+
+        Only pipelines present now are affected; tasks added later run normally.
+        """
         with self._lock:
-            for future in self._futures:
-                if future.cancel():
-                    cancelled += 1
-        return cancelled
+            pending = sum(1 for task in self._tasks if not task.started and not task.future.done())
+        self._cancel_where(lambda task: True, "queue cancelled")
+        return pending
+
+    def _cancel_where(self, predicate: Callable[[QueueTask], bool], reason: str) -> int:
+        with self._lock:
+            targets = [task for task in self._tasks if predicate(task) and not task.future.done()]
+        # Cancel outside the lock: token callbacks may terminate subprocesses.
+        for task in targets:
+            task.token.cancel(reason)
+        to_finish = []
+        with self._lock:
+            for task in targets:
+                if self._abort_task(task):
+                    to_finish.append(task)
+            for resource, heap in self._ready.items():
+                kept = [entry for entry in heap if entry[3] not in targets]
+                heapq.heapify(kept)
+                self._ready[resource] = kept
+        for task in to_finish:
+            self._finish_task(task)
+        return len(targets)
 
     def wait_for_all(self, timeout: float | None = None) -> None:
         futures = self._snapshot_futures()
@@ -113,9 +490,10 @@ class QueueManager:
             return self._peak_active
 
     def shutdown(self, wait_for_tasks: bool = True) -> None:
+        if wait_for_tasks:
+            self.wait_for_all()
         self._executor.shutdown(wait=wait_for_tasks, cancel_futures=False)
 
     def _snapshot_futures(self) -> list[Future]:
         with self._lock:
             return list(self._futures)
-
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Project-level cache of small screenshot thumbnails, generated in the background."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIRNAME = ".thumbnails"
+THUMBNAIL_FORMATS = ("webp", "jpeg")
+# Worker threads run at this niceness so thumbnails never compete with
+# recording, transcription or the GUI thread for CPU time.
+WORKER_NICENESS = 10
+
+ThumbnailCallback = Callable[[Path, Path], None]
+
+
+def thumbnail_key(source: Path) -> str | None:
+    """Stable key from path, mtime and size; None if ``source`` is missing."""
+    try:
+        stat = Path(source).stat()
+    except OSError:
+        return None
+    raw = f"{Path(source).resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _lower_thread_priority() -> None:
+    # On Linux setpriority() with a thread id only affects that thread.
+    if not hasattr(os, "setpriority") or not hasattr(threading, "get_native_id"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), WORKER_NICENESS)
+    except OSError as exc:
+        logger.debug("Could not lower thumbnail worker priority: %s", exc)
+
+
+def _resolve_format(fmt: str) -> str:
+    from PIL import Image
+
+    # Register Pillow's format plugins here, on the constructing (GUI) thread:
+    # their lazy first-use import from a worker thread has crashed the
+    # interpreter while Qt objects were being torn down.
+    Image.init()
+    fmt = fmt.lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt not in THUMBNAIL_FORMATS:
+        raise ValueError(f"Unsupported thumbnail format: {fmt}")
+    if fmt == "webp":
+        from PIL import features
+
+        if not features.check("webp"):
+            logger.info("Pillow has no WebP support, writing JPEG thumbnails instead")
+            return "jpeg"
+    return fmt
+
+
+class ThumbnailCache:
+    """Small WebP/JPEG previews of ``screenshot.png`` files.
+
+    Files are named after ``thumbnail_key``, so a re-captured screenshot
+    simply gets a new thumbnail and stale ones are never served. Full-page
+    screenshots are cropped to their top ``width * max_aspect`` pixels
+    after scaling, which is the part a preview can show anyway.
+    ``request`` generates missing thumbnails on a small pool of
+    low-priority threads and reports each finished one to its callback
+    (called from the worker thread, so it must not touch Qt objects).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        width: int = 160,
+        fmt: str = "webp",
+        quality: int = 75,
+        max_aspect: float = 2.0,
+        workers: int = 1,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.width = max(16, int(width))
+        self.fmt = _resolve_format(fmt)
+        self.quality = int(quality)
+        self.max_aspect = float(max_aspect)
+        self.workers = max(1, int(workers))
+        self._lock = threading.Lock()
+        self._pending: dict[str, Future] = {}
+        self._callbacks: dict[str, list[ThumbnailCallback]] = {}
+        # Jobs submitted and not yet finished reporting (see is_idle).
+        self._active = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def for_project(cls, project_dir: Path, **kwargs: Any) -> "ThumbnailCache":
+        return cls(Path(project_dir) / THUMBNAIL_DIRNAME, **kwargs)
+
+    @property
+    def suffix(self) -> str:
+        return ".webp" if self.fmt == "webp" else ".jpg"
+
+    def path_for(self, source: Path) -> Path | None:
+        key = thumbnail_key(source)
+        if key is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}{self.suffix}"
+
+    def cached(self, source: Path) -> Path | None:
+        """Thumbnail path if it has been generated already, else None (never blocks)."""
+        path = self.path_for(source)
+        return path if path is not None and path.exists() else None
+
+    def generate(self, source: Path) -> Path | None:
+        """Create the thumbnail for ``source`` now and return its path."""
+        target = self.path_for(source)
+        if target is None:
+            return None
+        if target.exists():
+            return target
+        from PIL import Image
+
+        with Image.open(source) as image:
+            image = image.convert("RGB")
+            height = max(1, round(image.height * self.width / max(1, image.width)))
+            image = image.resize((self.width, height), Image.Resampling.BILINEAR, reducing_gap=2.0)
+            max_height = int(self.width * self.max_aspect)
+            if height > max_height:
+                image = image.crop((0, 0, self.width, max_height))
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(target.name + ".tmp")
+            image.save(tmp_path, format=self.fmt.upper(), quality=self.quality)
+        os.replace(tmp_path, target)
+        return target
+
+    def request(self, source: Path, callback: ThumbnailCallback | None = None) -> Future | None:
+        """Queue generation of a missing thumbnail; returns None if it already exists."""
+        key = thumbnail_key(source)
+        if key is None:
+            return None
+        existing = self.cached(source)
+        if existing is not None:
+            if callback is not None:
+                callback(Path(source), existing)
+            return None
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="thumbnails",
+                        initializer=_lower_thread_priority,
+                    )
+                future = self._executor.submit(self._generate_pending, key, Path(source))
+                self._pending[key] = future
+                self._active += 1
+            if callback is not None:
+                self._callbacks.setdefault(key, []).append(callback)
+        return future
+
+    def _generate_pending(self, key: str, source: Path) -> Path | None:
+        path: Path | None = None
+        try:
+            path = self.generate(source)
+        except Exception as exc:
+            logger.warning("Thumbnail for %s failed: %s", source, exc)
+        with self._lock:
+            self._pending.pop(key, None)
+            callbacks = self._callbacks.pop(key, [])
+        try:
+            for callback in callbacks if path is not None else []:
+                try:
+                    callback(source, path)
+                except Exception as exc:
+                    logger.warning("Thumbnail callback failed for %s: %s", source, exc)
+        finally:
+            with self._lock:
+                self._active -= 1
+        return path
+
+    def is_idle(self) -> bool:
+        """True once every requested thumbnail is written and reported."""
+        with self._lock:
+            return self._active == 0
+
+    def wait_idle(self, timeout: float | None = None) -> None:
+        """Block until queued thumbnails are done (used by tests)."""
+        with self._lock:
+            futures = list(self._pending.values())
+        wait(futures, timeout=timeout)
+
+    def cancel_pending(self) -> None:
+        with self._lock:
+            for future in self._pending.values():
+                if future.cancel():
+                    self._active -= 1
+            self._pending.clear()
+            self._callbacks.clear()
+
+    def shutdown(self) -> None:
+        self.cancel_pending()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
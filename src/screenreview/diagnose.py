@@ -6,6 +6,11 @@ import os
 import shutil
 import json
 import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import time
 from pathlib import Path
 from typing import Any
 
@@ -84,12 +89,283 @@ def run_diagnostics() -> dict[str, Any]:
 
     return report
 
-def main():
+PROFILE_IMPORT_MODULES = [
+    "PyQt6.QtWidgets",
+    "numpy",
+    "cv2",
+    "PIL.Image",
+    "sounddevice",
+    "pytesseract",
+    "easyocr",
+    "paddleocr",
+    "mediapipe",
+    "screenreview.pipeline.recorder",
+    "screenreview.gui.main_window",
+]
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "sys.stdout.write(repr(time.perf_counter() - t))\n"
+)
+
+
+def profile_import_times(modules: list[str], timeout: float = 120.0) -> dict[str, Any]:
+    """Measure cold import time per module, each in a fresh interpreter."""
+    from screenreview.utils.lazy_imports import is_module_available
+
+    env = dict(os.environ)
+    src_dir = str(Path(__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH", "")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    results: dict[str, Any] = {}
+    for module in modules:
+        if not is_module_available(module):
+            results[module] = {"available": False, "seconds": None}
+            continue
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-c", _IMPORT_PROBE.format(module=module)],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=env,
+            )
+        except subprocess.TimeoutExpired:
+            results[module] = {"available": True, "seconds": None, "error": "timeout"}
+            continue
+        if proc.returncode != 0:
+            error = (proc.stderr.strip().splitlines() or ["import failed"])[-1]
+            results[module] = {"available": True, "seconds": None, "error": error}
+            continue
+        results[module] = {"available": True, "seconds": round(float(proc.stdout.strip()), 4)}
+    return results
+
+
+def profile_engine_init(languages: list[str]) -> dict[str, Any]:
+    """Measure construction time of the OCR engines and the MediaPipe landmarker."""
+    from screenreview.pipeline.gesture_detector import GestureDetector
+    from screenreview.pipeline.ocr_engines import EasyOcrEngine, TesseractOcrEngine
+
+    results: dict[str, Any] = {}
+    for name, factory in (
+        ("tesseract", lambda: TesseractOcrEngine(languages)),
+        ("easyocr", lambda: EasyOcrEngine(languages)),
+    ):
+        started = time.perf_counter()
+        try:
+            engine = factory()
+            available = bool(engine.is_available)
+            error = None
+        except Exception as exc:
+            available = False
+            error = str(exc)
+        results[name] = {
+            "available": available,
+            "seconds": round(time.perf_counter() - started, 4),
+            "error": error,
+        }
+
+    started = time.perf_counter()
+    detector = GestureDetector()
+    results["mediapipe_landmarker"] = {
+        "available": detector._landmarker is not None,
+        "seconds": round(time.perf_counter() - started, 4),
+        "error": None,
+    }
+    return results
+
+
+def profile_camera(camera_source: int | str) -> dict[str, Any]:
+    """Measure camera open latency and time to the first decoded frame."""
+    from screenreview.pipeline import recorder
+
+    result: dict[str, Any] = {
+        "source": camera_source,
+        "opened": False,
+        "open_seconds": None,
+        "first_frame_seconds": None,
+        "frame_shape": None,
+    }
+    if not recorder.cv2:
+        result["error"] = "opencv not installed"
+        return result
+
+    started = time.perf_counter()
+    capture = recorder._open_camera(camera_source)
+    result["open_seconds"] = round(time.perf_counter() - started, 4)
+    if capture is None or not capture.isOpened():
+        result["error"] = "camera could not be opened"
+        return result
+    result["opened"] = True
+    try:
+        started = time.perf_counter()
+        deadline = started + 5.0
+        while time.perf_counter() < deadline:
+            ok, frame = capture.read()
+            if ok and frame is not None:
+                result["first_frame_seconds"] = round(time.perf_counter() - started, 4)
+                result["frame_shape"] = list(frame.shape)
+                break
+        else:
+            result["error"] = "no frame within 5 s"
+    finally:
+        capture.release()
+    return result
+
+
+def profile_process_spawn(executables: list[str], repeats: int = 3, timeout: float = 30.0) -> dict[str, Any]:
+    """Measure how long it takes to spawn and exit ``<tool> -version``."""
+    results: dict[str, Any] = {}
+    for name in executables:
+        path = shutil.which(name) or shutil.which(f"{name}.exe")
+        if not path:
+            results[name] = {"found": False, "median_seconds": None}
+            continue
+        samples: list[float] = []
+        try:
+            for _ in range(repeats):
+                started = time.perf_counter()
+                subprocess.run([path, "-version"], capture_output=True, timeout=timeout)
+                samples.append(time.perf_counter() - started)
+        except subprocess.TimeoutExpired:
+            results[name] = {"found": True, "path": path, "median_seconds": None, "error": "timeout"}
+            continue
+        except OSError as exc:
+            results[name] = {"found": True, "path": path, "median_seconds": None, "error": str(exc)}
+            continue
+        results[name] = {
+            "found": True,
+            "path": path,
+            "median_seconds": round(statistics.median(samples), 4),
+            "samples": [round(sample, 4) for sample in samples],
+        }
+    return results
+
+
+def profile_disk_throughput(target_dir: Path, size_mb: int = 64, chunk_mb: int = 4) -> dict[str, Any]:
+    """Write a scratch file into ``target_dir`` with fsync and report MB/s."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    scratch = target_dir / ".diagnose_throughput.tmp"
+    chunk = os.urandom(chunk_mb * 1024 * 1024)
+    chunks = max(1, size_mb // chunk_mb)
+    started = time.perf_counter()
+    try:
+        with scratch.open("wb") as handle:
+            for _ in range(chunks):
+                handle.write(chunk)
+            handle.flush()
+            os.fsync(handle.fileno())
+        elapsed = time.perf_counter() - started
+    finally:
+        scratch.unlink(missing_ok=True)
+    written_mb = chunks * chunk_mb
+    return {
+        "path": str(target_dir),
+        "written_mb": written_mb,
+        "seconds": round(elapsed, 4),
+        "mb_per_second": round(written_mb / elapsed, 2) if elapsed > 0 else None,
+    }
+
+
+def _default_extraction_dir(settings: dict[str, Any]) -> Path:
+    """Return the first screen's .extraction folder of the default project, if any."""
+    project_dir = settings.get("default_project_dir")
+    if project_dir and Path(project_dir).exists():
+        try:
+            from screenreview.core.folder_scanner import scan_project
+
+            viewport_mode = str(settings.get("viewport", {}).get("mode", "mobile"))
+            screens = scan_project(Path(project_dir), viewport_mode)
+            if screens:
+                return screens[0].extraction_dir
+        except Exception:
+            pass
+    return Path("logs") / "profile_scratch" / ".extraction"
+
+
+def run_profile(
+    extraction_dir: Path | None = None,
+    camera_source: int | str | None = None,
+    skip_camera: bool = False,
+    modules: list[str] | None = None,
+) -> dict[str, Any]:
+    """Collect startup, engine, capture and I/O timings for this workstation."""
+    settings = load_config()
+    webcam = settings.get("webcam", {})
+    if camera_source is None:
+        camera_source = webcam.get("custom_url") or int(webcam.get("camera_index", 0))
+    languages = list(settings.get("ocr", {}).get("languages", ["de", "en"]))
+
+    report: dict[str, Any] = {
+        "host": {
+            "hostname": platform.node(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python_version": platform.python_version(),
+        },
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "imports": profile_import_times(modules or PROFILE_IMPORT_MODULES),
+        "engines": profile_engine_init(languages),
+        "camera": {"skipped": True} if skip_camera else profile_camera(camera_source),
+        "spawn": profile_process_spawn(["ffmpeg", "ffprobe"]),
+        "disk": profile_disk_throughput(extraction_dir or _default_extraction_dir(settings)),
+    }
+    return report
+
+
+def _print_profile_summary(report: dict[str, Any]) -> None:
+    print("-" * 40)
+    for module, entry in report["imports"].items():
+        seconds = entry.get("seconds")
+        label = f"{seconds * 1000:.0f} ms" if seconds is not None else entry.get("error", "not installed")
+        print(f"import {module}: {label}")
+    for name, entry in report["engines"].items():
+        state = "ok" if entry["available"] else "unavailable"
+        print(f"init {name}: {entry['seconds'] * 1000:.0f} ms ({state})")
+    camera = report["camera"]
+    if not camera.get("skipped"):
+        print(f"camera open: {camera.get('open_seconds')} s, first frame: {camera.get('first_frame_seconds')} s")
+    for name, entry in report["spawn"].items():
+        print(f"spawn {name}: {entry['median_seconds']} s" if entry["found"] else f"spawn {name}: NOT FOUND")
+    print(f"disk write: {report['disk']['mb_per_second']} MB/s ({report['disk']['path']})")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Multimedia Feedback Coding diagnostics")
+    parser.add_argument("--profile", action="store_true", help="Measure import, engine, camera, spawn and disk timings")
+    parser.add_argument("--output", type=Path, default=None, help="Report path (defaults to logs/)")
+    parser.add_argument("--extraction-dir", type=Path, default=None, help="Folder used for the disk throughput test")
+    parser.add_argument("--camera", default=None, help="Camera index or stream URL for the latency test")
+    parser.add_argument("--skip-camera", action="store_true", help="Do not open the camera in profile mode")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        print("Profiling Multimedia Feedback Coding startup and I/O...")
+        camera: int | str | None = args.camera
+        if isinstance(camera, str) and camera.isdigit():
+            camera = int(camera)
+        report = run_profile(
+            extraction_dir=args.extraction_dir,
+            camera_source=camera,
+            skip_camera=args.skip_camera,
+        )
+        report_path = args.output or Path("logs/profile_report.json")
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nProfile Report saved to: {report_path.absolute()}")
+        _print_profile_summary(report)
+        sys.exit(0)
+
     print("Running Multimedia Feedback Coding Diagnostics...")
     report = run_diagnostics()
     
     # Save report for AI agents
-    report_path = Path("logs/diagnostic_report.json")
+    report_path = args.output or Path("logs/diagnostic_report.json")
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
     
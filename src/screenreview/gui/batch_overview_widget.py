@@ -1,19 +1,33 @@
 # -*- coding: utf-8 -*-
-"""Compact tile overview of all screens (no screenshots)."""
+"""Compact tile overview of all screens, with optional cached thumbnails."""
 
 from __future__ import annotations
 
 import os
 from pathlib import Path
-from PyQt6.QtCore import Qt, pyqtSignal, QUrl
-from PyQt6.QtGui import QDesktopServices
+from typing import Any
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QRectF,
+    QSize,
+    QSortFilterProxyModel,
+    Qt,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QDesktopServices, QFont, QPainter, QPen, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
     QFrame,
-    QGridLayout,
+    QHBoxLayout,
     QLabel,
-    QPushButton,
-    QScrollArea,
-    QSizePolicy,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
@@ -48,141 +62,326 @@ STATUS_ABBREV = {
     "skipped": "–",
 }
 
+STATUS_FILTERS = ["all", "pending", "recording", "processing", "done", "error", "skipped"]
+
+STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+SCREEN_ROLE = Qt.ItemDataRole.UserRole + 2
+ROW_ROLE = Qt.ItemDataRole.UserRole + 3
+
+TILE_HEIGHT = 22
+PREVIEW_TILE_HEIGHT = 64
+PREVIEW_WIDTH = 40
+TILE_SPACING = 3
+COLUMNS = 2
+
+
+def resolve_status(screen: ScreenItem) -> str:
+    """Status shown for a screen: errors win, an existing transcript means done."""
+    status = screen.status
+    if screen.error:
+        return "error"
+    # Check if transcript file exists for this specific screen/viewport
+    try:
+        if screen.transcript_path.exists():
+            return "done"
+        if status == "done":  # If status says done but file missing, reset to pending
+            return "pending"
+    except Exception:
+        pass
+    return status
+
+
+def _open_folder(folder: Path) -> None:
+    if os.name == 'nt':
+        os.startfile(str(folder))
+    else:
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder)))
 
-class _TileButton(QPushButton):
-    """Compact tile showing only the screen name and status — no screenshot."""
 
-    def __init__(self, index: int, screen: ScreenItem, parent: QWidget | None = None) -> None:
+class ScreenListModel(QAbstractListModel):
+    """List model over the project's screens.
+
+    Resolved statuses are cached per row (they touch the file system) and
+    only recomputed for rows passed to ``refresh_screen``/``refresh_row``.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self.index = index
-        self.screen = screen
-        self.setCheckable(True)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setObjectName("batchTile")
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.setFixedHeight(22)
-        self._refresh_label()
-
-    def mousePressEvent(self, event) -> None:
-        if event.button() == Qt.MouseButton.RightButton:
-            # Open file explorer in the screen's extraction directory
-            folder = str(self.screen.extraction_dir)
-            if os.name == 'nt':
-                os.startfile(folder)
-            else:
-                QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
-        else:
-            super().mousePressEvent(event)
+        self._screens: list[ScreenItem] = []
+        self._rows: dict[int, int] = {}
+        self._status_cache: dict[int, str] = {}
+        self._thumbnails: dict[int, str] = {}
 
-    def mouseDoubleClickEvent(self, event) -> None:
-        """Open file explorer in the screen's extraction directory on double-click."""
-        folder = str(self.screen.extraction_dir)
-        if os.name == 'nt':
-            os.startfile(folder)
-        else:
-            QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
-        super().mouseDoubleClickEvent(event)
-
-    def _refresh_label(self) -> None:
-        # Determine status based on file existence and error state
-        status = self.screen.status
-        if self.screen.error:
-            status = "error"
+    def set_screens(self, screens: list[ScreenItem]) -> None:
+        self.beginResetModel()
+        self._screens = list(screens)
+        self._rows = {id(screen): row for row, screen in enumerate(self._screens)}
+        self._status_cache.clear()
+        self._thumbnails.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._screens)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._screens)):
+            return None
+        row = index.row()
+        screen = self._screens[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            name = screen.route or screen.name
+            # Truncate long names
+            display = name if len(name) <= 18 else name[:16] + "…"
+            return f"{STATUS_ABBREV.get(self.status(row), '?')} {row + 1}: {display}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{screen.route or screen.name} ({screen.viewport}) – {self.status(row)}"
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.thumbnail(row)
+        if role == STATUS_ROLE:
+            return self.status(row)
+        if role == SCREEN_ROLE:
+            return screen
+        if role == ROW_ROLE:
+            return row
+        return None
+
+    def status(self, row: int) -> str:
+        status = self._status_cache.get(row)
+        if status is None:
+            status = self._status_cache[row] = resolve_status(self._screens[row])
+        return status
+
+    def thumbnail(self, row: int) -> QPixmap | None:
+        """Decoded thumbnail (via the global QPixmapCache) or None if not generated yet."""
+        path = self._thumbnails.get(row)
+        if path is None:
+            return None
+        pixmap = QPixmapCache.find(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                return None
+            QPixmapCache.insert(path, pixmap)
+        return pixmap
+
+    def set_thumbnail(self, screen: ScreenItem, path: str) -> None:
+        row = self._rows.get(id(screen))
+        if row is None:
+            return
+        self._thumbnails[row] = path
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def screen(self, row: int) -> ScreenItem | None:
+        return self._screens[row] if 0 <= row < len(self._screens) else None
+
+    def refresh_row(self, row: int) -> None:
+        """Re-resolve one row's status and repaint just that row."""
+        if not (0 <= row < len(self._screens)):
+            return
+        self._status_cache.pop(row, None)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def refresh_screen(self, screen: ScreenItem) -> None:
+        row = self._rows.get(id(screen))
+        if row is not None:
+            self.refresh_row(row)
+
+
+class StatusFilterProxy(QSortFilterProxyModel):
+    """Show only screens with one status; rows stay in project order."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._status: str | None = None
+
+    def set_status_filter(self, status: str | None) -> None:
+        self._status = None if status in (None, "", "all") else status
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._status is None:
+            return True
+        model = self.sourceModel()
+        return model.data(model.index(source_row, 0, source_parent), STATUS_ROLE) == self._status
+
+
+class ScreenTileDelegate(QStyledItemDelegate):
+    """Paint a compact status-coloured tile; only visible rows are ever painted."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.show_previews = False
+
+    def tile_height(self) -> int:
+        return PREVIEW_TILE_HEIGHT if self.show_previews else TILE_HEIGHT
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        status = index.data(STATUS_ROLE) or "pending"
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        if selected:
+            background, border, text_color = "#eef4ff", "#2563eb", "#1d4ed8"
+        elif hovered:
+            background, border, text_color = "#f8fbff", "#93c5fd", STATUS_COLOR.get(status, "#6b7280")
         else:
-            # Check if transcript file exists for this specific screen/viewport
-            try:
-                if self.screen.transcript_path.exists():
-                    status = "done"
-                elif status == "done": # If status says done but file missing, reset to pending
-                    status = "pending"
-            except Exception:
-                pass
-
-        abbrev = STATUS_ABBREV.get(status, "?")
-        name = self.screen.route or self.screen.name
-        # Truncate long names
-        display = name if len(name) <= 18 else name[:16] + "…"
-        self.setText(f"{abbrev} {self.index + 1}: {display}")
-        
-        color = STATUS_COLOR.get(status, "#6b7280")
-        bg_color = STATUS_BG_COLOR.get(status, "white")
-        
-        self.setStyleSheet(
-            f"""
-            QPushButton[objectName="batchTile"] {{
-                background: {bg_color};
-                border: 1px solid #d0d7e2;
-                border-radius: 3px;
-                padding: 1px 4px;
-                font-size: 10px;
-                text-align: left;
-                color: {color};
-            }}
-            QPushButton[objectName="batchTile"]:checked {{
-                border: 1px solid #2563eb;
-                background: #eef4ff;
-                color: #1d4ed8;
-                font-weight: 600;
-            }}
-            QPushButton[objectName="batchTile"]:hover {{
-                border-color: #93c5fd;
-                background: #f8fbff;
-            }}
-            """
+            background = STATUS_BG_COLOR.get(status, "white")
+            border, text_color = "#d0d7e2", STATUS_COLOR.get(status, "#6b7280")
+
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(rect, 3, 3)
+
+        font = QFont(option.font)
+        font.setPixelSize(10)
+        font.setBold(selected)
+        painter.setFont(font)
+        painter.setPen(QColor(text_color))
+        text_rect = option.rect.adjusted(5, 0, -4, 0)
+        if self.show_previews:
+            preview_rect = option.rect.adjusted(3, 3, 0, -3)
+            preview_rect.setWidth(PREVIEW_WIDTH)
+            pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+            if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+                # Thumbnails are page tops; show the top slice that fits the tile.
+                source_height = min(pixmap.height(), round(pixmap.width() * preview_rect.height() / PREVIEW_WIDTH))
+                painter.drawPixmap(preview_rect, pixmap, pixmap.rect().adjusted(0, 0, 0, source_height - pixmap.height()))
+            else:
+                painter.fillRect(preview_rect, QColor("#eceff3"))
+            text_rect.setLeft(preview_rect.right() + 6)
+        text = painter.fontMetrics().elidedText(
+            str(index.data(Qt.ItemDataRole.DisplayRole) or ""), Qt.TextElideMode.ElideRight, text_rect.width()
         )
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(120, self.tile_height())
 
 
 class BatchOverviewWidget(QWidget):
-    """Compact scrollable tile list for quick navigation. No screenshots — names only."""
+    """Compact scrollable tile list for quick navigation.
+
+    Backed by a list model and a painting delegate, so thousands of screens
+    cost one row of data each instead of one widget each. Screenshots are
+    never decoded here; "Previews" shows the cached thumbnails instead.
+    """
 
     screen_selected = pyqtSignal(int)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._tiles: list[_TileButton] = []
+        self._current_row = -1
 
         self.title_label = QLabel("Batch Overview")
         self.title_label.setObjectName("sectionTitle")
 
-        self.grid_host = QWidget()
-        self.grid = QGridLayout(self.grid_host)
-        self.grid.setContentsMargins(0, 0, 0, 0)
-        self.grid.setSpacing(3)
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems([status.capitalize() for status in STATUS_FILTERS])
+        self.filter_combo.setToolTip("Show only screens with this status.")
+        self.filter_combo.currentIndexChanged.connect(
+            lambda i: self.set_status_filter(STATUS_FILTERS[i] if 0 <= i < len(STATUS_FILTERS) else "all")
+        )
+
+        self.preview_check = QCheckBox("Previews")
+        self.preview_check.setToolTip("Show cached thumbnails of the screenshots.")
+        self.preview_check.toggled.connect(self.set_show_previews)
 
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.scroll.setWidget(self.grid_host)
+        self.model = ScreenListModel(self)
+        self.proxy = StatusFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.view = QListView()
+        self.view.setModel(self.proxy)
+        self.delegate = ScreenTileDelegate(self.view)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setFrameShape(QFrame.Shape.NoFrame)
+        self.view.setViewMode(QListView.ViewMode.ListMode)
+        self.view.setFlow(QListView.Flow.LeftToRight)
+        self.view.setWrapping(True)
+        self.view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.view.setUniformItemSizes(True)
+        self.view.setSpacing(0)
+        self.view.setMouseTracking(True)
+        self.view.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.view.clicked.connect(self._on_clicked)
+        # Right click or double click opens the screen's extraction directory
+        self.view.doubleClicked.connect(self._open_folder_at)
+        self.view.customContextMenuRequested.connect(
+            lambda pos: self._open_folder_at(self.view.indexAt(pos))
+        )
+
+        title_row = QHBoxLayout()
+        title_row.setContentsMargins(0, 0, 0, 0)
+        title_row.addWidget(self.title_label)
+        title_row.addStretch(1)
+        title_row.addWidget(self.preview_check)
+        title_row.addWidget(self.filter_combo)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
-        layout.addWidget(self.title_label)
-        layout.addWidget(self.scroll, 1)
+        layout.addLayout(title_row)
+        layout.addWidget(self.view, 1)
 
     def set_screens(self, screens: list[ScreenItem], current_index: int = 0) -> None:
-        """Rebuild compact tiles (no screenshots)."""
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-        self._tiles.clear()
-
-        columns = 2
-        for index, screen in enumerate(screens):
-            tile = _TileButton(index=index, screen=screen)
-            tile.clicked.connect(lambda checked=False, i=index: self.screen_selected.emit(i))
-            self._tiles.append(tile)
-            row = index // columns
-            col = index % columns
-            self.grid.addWidget(tile, row, col)
-
+        """Replace the model contents (no widgets are created per screen)."""
+        self._current_row = -1
+        self.model.set_screens(screens)
         self.set_current_index(current_index)
 
+    def set_status_filter(self, status: str) -> None:
+        self.proxy.set_status_filter(status)
+        self._select_row(self._current_row)
+
+    def refresh_screen(self, screen: ScreenItem) -> None:
+        """Repaint one screen after its status changed."""
+        self.model.refresh_screen(screen)
+
+    def set_thumbnail(self, screen: ScreenItem, path: str) -> None:
+        self.model.set_thumbnail(screen, path)
+
+    def set_show_previews(self, enabled: bool) -> None:
+        self.delegate.show_previews = bool(enabled)
+        self._update_grid()
+        self._select_row(self._current_row)
+
     def set_current_index(self, index: int) -> None:
         """Highlight the active tile and scroll it into view."""
-        for tile in self._tiles:
-            tile.setChecked(tile.index == index)
-            if tile.index == index:
-                self.scroll.ensureWidgetVisible(tile)
+        previous, self._current_row = self._current_row, index
+        # Navigation changes the status of the screen that was left.
+        self.model.refresh_row(previous)
+        self.model.refresh_row(index)
+        self._select_row(index)
+
+    def _select_row(self, row: int) -> None:
+        proxy_index = self.proxy.mapFromSource(self.model.index(row)) if row >= 0 else QModelIndex()
+        if proxy_index.isValid():
+            self.view.setCurrentIndex(proxy_index)
+            self.view.scrollTo(proxy_index)
+        else:
+            self.view.clearSelection()
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_grid()
+
+    def _update_grid(self) -> None:
+        width = max(60, (self.view.viewport().width() - 1) // COLUMNS)
+        self.view.setGridSize(QSize(width, self.delegate.tile_height() + TILE_SPACING))
+
+    def _on_clicked(self, proxy_index: QModelIndex) -> None:
+        row = proxy_index.data(ROW_ROLE)
+        if row is not None:
+            self.screen_selected.emit(int(row))
+
+    def _open_folder_at(self, proxy_index: QModelIndex) -> None:
+        screen = proxy_index.data(SCREEN_ROLE) if proxy_index.isValid() else None
+        if screen is not None:
+            _open_folder(screen.extraction_dir)
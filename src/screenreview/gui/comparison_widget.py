@@ -3,7 +3,13 @@
 
 from __future__ import annotations
 
-from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
+from pathlib import Path
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+PREVIEW_SIZE = (72, 96)
 
 
 class ComparisonWidget(QWidget):
@@ -18,6 +24,13 @@ class ComparisonWidget(QWidget):
         self.diff_label = QLabel("Change: 0.00%")
         for label in (self.before_label, self.after_label, self.diff_label):
             label.setObjectName("mutedText")
+        self.before_preview = self._make_preview()
+        self.after_preview = self._make_preview()
+        preview_row = QHBoxLayout()
+        preview_row.setSpacing(6)
+        preview_row.addWidget(self.before_preview)
+        preview_row.addWidget(self.after_preview)
+        preview_row.addStretch(1)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -26,8 +39,17 @@ class ComparisonWidget(QWidget):
         layout.addWidget(self.before_label)
         layout.addWidget(self.after_label)
         layout.addWidget(self.diff_label)
+        layout.addLayout(preview_row)
         layout.addStretch(1)
 
+    @staticmethod
+    def _make_preview() -> QLabel:
+        label = QLabel()
+        label.setFixedSize(*PREVIEW_SIZE)
+        label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
+        label.hide()
+        return label
+
     def set_comparison(self, before_name: str | None, after_name: str | None, diff_ratio: float | None) -> None:
         self.before_label.setText(f"Before: {before_name or '-'}")
         self.after_label.setText(f"After: {after_name or '-'}")
@@ -36,3 +58,16 @@ class ComparisonWidget(QWidget):
         else:
             self.diff_label.setText(f"Change: {diff_ratio * 100:.2f}%")
 
+
+    def set_previews(self, before_thumbnail: Path | None, after_thumbnail: Path | None) -> None:
+        """Show cached thumbnails of both screens; a missing one hides its slot."""
+        for label, path in ((self.before_preview, before_thumbnail), (self.after_preview, after_thumbnail)):
+            pixmap = QPixmap(str(path)) if path is not None else QPixmap()
+            if pixmap.isNull():
+                label.clear()
+                label.hide()
+                continue
+            width, height = PREVIEW_SIZE
+            scaled = pixmap.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+            label.setPixmap(scaled.copy(0, 0, width, min(height, scaled.height())))
+            label.show()
@@ -5,20 +5,39 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
 
+from screenreview.core.admission import (
+    KIND_PIPELINE,
+    KIND_TRANSCRIPTION,
+    AdmissionController,
+    admission_limits,
+)
 from screenreview.core.folder_scanner import scan_project, resolve_routes_root
+from screenreview.core.job_journal import JobJournal
 from screenreview.core.navigator import Navigator
+from screenreview.core.prefetch import ScreenAssets, ScreenPrefetcher, load_screen_assets
+from screenreview.core.queue_manager import PRIORITY_BACKGROUND, PRIORITY_FOREGROUND
+from screenreview.core.thumbnails import ThumbnailCache
 from screenreview.models.screen_item import ScreenItem
-from screenreview.pipeline.recorder import Recorder
+from screenreview.pipeline.recorder import DEFAULT_RECORDING_PROFILE, Recorder, resolve_recording_profile
+from screenreview.pipeline.recording_segments import RecordingSegment, recover_recording
+from screenreview.pipeline.segment_analysis import clear_segment_outputs
 from screenreview.pipeline.transcriber import Transcriber
 from screenreview.pipeline.exporter import Exporter
 from screenreview.pipeline.differ import Differ
 from screenreview.utils.cost_calculator import CostCalculator
-from screenreview.gui.workers import TranscriptionWorker, PipelineWorker
+from screenreview.gui.viewer_widget import decode_screenshot
+from screenreview.gui.workers import (
+    TranscriptionWorker,
+    PipelineWorker,
+    get_pipeline_queue,
+    submit_segment_analysis,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +51,11 @@ class AppController(QObject):
     screen_changed = pyqtSignal(ScreenItem, int, int)
     recording_status_changed = pyqtSignal(bool, bool, float)
     pipeline_progress = pyqtSignal(int, int, str)
+    pipeline_metrics = pyqtSignal(dict)
     pipeline_finished = pyqtSignal(ScreenItem)
+    screen_status_changed = pyqtSignal(ScreenItem)
+    thumbnail_ready = pyqtSignal(ScreenItem, str)
+    queue_depth_changed = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     cost_updated = pyqtSignal(float, float, float)
 
@@ -42,9 +65,36 @@ class AppController(QObject):
         self.project_dir: Path | None = None
         self.screens: list[ScreenItem] = []
         self.navigator: Navigator | None = None
+        self.journal: JobJournal | None = None
+        self._project_metrics: Any = None
         self.recorder = Recorder()
+        self._apply_recording_settings()
+        # Segments closed while recording, handed over by the capture/audio threads;
+        # the GUI thread queues their frame extraction and transcription.
+        self._recording_screen: ScreenItem | None = None
+        self._segments_closed: deque[RecordingSegment] = deque()
+        self._segment_timer = QTimer(self)
+        self._segment_timer.setInterval(200)
+        self._segment_timer.timeout.connect(self._drain_segments)
+        self.recorder.on_segment_complete = self._on_segment_complete
         self.cost_tracker = CostCalculator()
         self.differ = Differ()
+        # Neighbouring screens are decoded in the background so switching is instant.
+        viewer_cfg = self.settings.get("viewer", {})
+        self.display_width = 0
+        self.prefetcher = ScreenPrefetcher(
+            self._load_screen_assets,
+            radius=int(viewer_cfg.get("prefetch_radius", 2)),
+            max_bytes=int(viewer_cfg.get("prefetch_cache_mb", 512)) * 1024 * 1024,
+        )
+        # Small previews for overview/comparison/navigation, created per project.
+        self.thumbnails: ThumbnailCache | None = None
+        # Worker threads only append here; the GUI thread drains and emits
+        # thumbnail_ready, so no Qt object is touched off the GUI thread.
+        self._thumbnails_done: deque[tuple[ScreenItem, str]] = deque()
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setInterval(200)
+        self._thumbnail_timer.timeout.connect(self._drain_thumbnails)
         
         # Core Services
         from screenreview.integrations.openai_client import OpenAIClient
@@ -54,31 +104,196 @@ class AppController(QObject):
         
         # Thread Management
         self._active_threads: list[QThread] = []
+        # Running pipeline per screen (keyed by extraction dir) and a counter of
+        # recordings, so that work for a superseded recording can be dropped.
+        self._pipeline_workers: dict[str, PipelineWorker] = {}
+        self._recording_generation: dict[str, int] = {}
+        # Caps concurrent transcriptions/pipelines; further screens wait in line.
+        self.admission = AdmissionController(
+            admission_limits(self.settings), on_change=lambda *_args: self._emit_queue_depth()
+        )
+        self._deferring = False
+        # Screen whose queued pipeline stages run ahead of the others'.
+        self._foreground_screen: str | None = None
+
+    def apply_settings(self, settings: dict[str, Any]) -> None:
+        """Adopt settings accepted in the dialog: concurrency caps and recording options."""
+        self.settings = settings
+        self.admission.set_limits(admission_limits(settings))
+        if not self.recorder.is_recording():
+            self._apply_recording_settings()
 
     def _cleanup_threads(self) -> None:
         """Remove finished threads from the active list."""
         self._active_threads = [t for t in self._active_threads if t.isRunning()]
 
+    def queue_depth(self) -> dict[str, Any]:
+        """Running/waiting background jobs per kind and whether analysis is deferred."""
+        depth: dict[str, Any] = dict(self.admission.depth())
+        depth["deferred"] = self._deferring
+        return depth
+
+    def _emit_queue_depth(self) -> None:
+        self.queue_depth_changed.emit(self.queue_depth())
+
+    def _defer_background_work(self, defer: bool) -> None:
+        """Park CPU/model pipeline stages while recording so capture keeps its frame rate."""
+        deferred = list(self.settings.get("pipeline", {}).get("defer_while_recording", []))
+        queue = get_pipeline_queue(self.settings)
+        if defer and deferred:
+            queue.hold_resources(deferred)
+            self._deferring = True
+        else:
+            queue.release_resources()
+            self._deferring = False
+        self._emit_queue_depth()
+
+    def _load_screen_assets(self, screen: ScreenItem) -> ScreenAssets:
+        return load_screen_assets(screen, decode=decode_screenshot, display_width=self.display_width)
+
+    def screen_assets(self, screen: ScreenItem) -> ScreenAssets | None:
+        """Prefetched screenshot of ``screen``, or None if it is not cached yet.
+
+        Never blocks: on a miss the viewer decodes the screenshot in its own pool.
+        """
+        return self.prefetcher.get(screen)
+
+    def thumbnail_for(self, screen: ScreenItem | None) -> Path | None:
+        """Cached thumbnail of ``screen`` or None while it is still being generated."""
+        if screen is None or self.thumbnails is None:
+            return None
+        return self.thumbnails.cached(screen.screenshot_path)
+
+    def _start_thumbnails(self, project_dir: Path) -> None:
+        self.shutdown_thumbnails()
+        viewer_cfg = self.settings.get("viewer", {})
+        try:
+            self.thumbnails = ThumbnailCache.for_project(
+                project_dir,
+                width=int(viewer_cfg.get("thumbnail_width", 160)),
+                fmt=str(viewer_cfg.get("thumbnail_format", "webp")),
+            )
+        except (ImportError, ValueError) as exc:
+            logger.warning("Thumbnails disabled: %s", exc)
+            return
+        done = self._thumbnails_done
+        for screen in self.screens:
+            self.thumbnails.request(
+                screen.screenshot_path,
+                lambda _source, path, screen=screen: done.append((screen, str(path))),
+            )
+        self._thumbnail_timer.start()
+
+    def _drain_thumbnails(self) -> None:
+        while self._thumbnails_done:
+            screen, path = self._thumbnails_done.popleft()
+            self.thumbnail_ready.emit(screen, path)
+        if self.thumbnails is None or self.thumbnails.is_idle():
+            self._thumbnail_timer.stop()
+
+    def shutdown_thumbnails(self) -> None:
+        self._thumbnail_timer.stop()
+        if self.thumbnails is not None:
+            self.thumbnails.shutdown()
+            self.thumbnails = None
+        self._thumbnails_done.clear()
+
     def load_project(self, project_dir: Path) -> None:
         """Scan project directory and initialize navigation."""
         old_idx = self.navigator.current_index() if self.navigator else 0
+        # Settings changes reload the same project; only a newly opened one gets
+        # fresh metrics and a journal and has interrupted recordings/jobs recovered.
+        first_open = project_dir != self.project_dir
+        if first_open:
+            self._project_metrics = None
+            self.journal = JobJournal.for_project(project_dir)
         self.project_dir = project_dir
         viewport_mode = self.settings.get("viewport", {}).get("mode", "mobile")
         self.screens = scan_project(project_dir, viewport_mode=viewport_mode)
-        self.navigator = Navigator(self.screens)
+        self.prefetcher.clear()
+        self.navigator = Navigator(self.screens, move_callback=self.prefetcher.prefetch_around)
         if 0 <= old_idx < len(self.screens):
             self.navigator.go_to(old_idx)
         logger.info("Project loaded from %s. Total screens: %d", project_dir, len(self.screens))
+        if first_open:
+            self._recover_interrupted_recordings()
         self.project_loaded.emit(self.screens)
+        self._start_thumbnails(project_dir)
         self.refresh_current_screen()
+        if first_open:
+            self.resume_interrupted_jobs()
+
+    def _recover_interrupted_recordings(self) -> int:
+        """Rebuild raw files of recordings cut off before stop from their segments."""
+        # The take being recorded or joined has an unfinalized index too; leave it to the recorder.
+        active_dir = self.recorder.output_dir() if self.recorder.is_recording() else None
+        recovered = 0
+        for screen in self.screens:
+            if active_dir is not None and Path(screen.extraction_dir) == Path(active_dir):
+                continue
+            if self.recorder.is_joining(screen.extraction_dir):
+                continue
+            try:
+                if recover_recording(screen.extraction_dir, fps=Recorder._TARGET_FPS):
+                    recovered += 1
+            except OSError as exc:
+                logger.warning("Could not recover recording in %s: %s", screen.extraction_dir, exc)
+        if recovered:
+            logger.info("Recovered %d interrupted recording(s) from segments", recovered)
+        return recovered
+
+    def resume_interrupted_jobs(self) -> int:
+        """Restart pipeline jobs that were cut off by a crash or quit; returns how many."""
+        if self.journal is None:
+            return 0
+        try:
+            self.journal.compact()
+        except OSError as exc:
+            logger.warning("Could not compact pipeline job journal: %s", exc)
+        screens_by_dir = {str(screen.extraction_dir): screen for screen in self.screens}
+        # Jobs of this session are "running" in the journal too; never start them twice.
+        live_jobs = {worker.job_id for worker in self._pipeline_workers.values()}
+        resumed = 0
+        for job in self.journal.interrupted_jobs():
+            screen = screens_by_dir.get(str(job.extraction_dir))
+            if screen is None:
+                logger.info("Skipping journaled job %s: screen %s is not part of this project", job.job_id, job.screen)
+                continue
+            key = str(job.extraction_dir)
+            if (
+                job.job_id in live_jobs
+                or key in self._pipeline_workers
+                or self.admission.is_running(KIND_PIPELINE, key)
+                or self.admission.is_waiting(KIND_PIPELINE, key)
+            ):
+                logger.info("Skipping journaled job %s: %s is already being analyzed", job.job_id, screen.name)
+                continue
+            logger.info(
+                "Resuming interrupted pipeline for %s (%d stage(s) already done)", screen.name, len(job.stages)
+            )
+            screen.status = "processing"
+            self.screen_status_changed.emit(screen)
+            self._start_pipeline(screen, job.video_path, job.audio_path, job.segments, job_id=job.job_id)
+            resumed += 1
+        return resumed
 
     def refresh_current_screen(self) -> None:
         if self.navigator:
             idx = self.navigator.current_index()
             screen = self.navigator.current()
             self.screen_changed.emit(screen, idx, len(self.screens))
+            self._bring_to_foreground(screen)
             self._update_costs(screen)
 
+    def _bring_to_foreground(self, screen: ScreenItem) -> None:
+        """Let the viewed screen's waiting analysis jump ahead of other screens'."""
+        queue = get_pipeline_queue(self.settings)
+        if self._foreground_screen not in (None, screen.name):
+            queue.promote_screen(self._foreground_screen, PRIORITY_BACKGROUND)
+        queue.promote_screen(screen.name)
+        self.admission.promote(str(screen.extraction_dir))
+        self._foreground_screen = screen.name
+
     def go_next(self, save_drawing_callback=None) -> None:
         if not self.navigator: return
         
@@ -120,19 +335,45 @@ class AppController(QObject):
         self.navigator.go_to(index)
         self.refresh_current_screen()
 
+    def _apply_recording_settings(self) -> None:
+        """Push segment length and recording profile from the settings into the recorder."""
+        recording_cfg = self.settings.get("recording", {})
+        self.recorder.segment_seconds = max(0.0, float(recording_cfg.get("segment_seconds", 0)))
+        try:
+            self.recorder.profile = resolve_recording_profile(
+                str(recording_cfg.get("profile", DEFAULT_RECORDING_PROFILE)),
+                grayscale=bool(recording_cfg.get("grayscale", False)),
+            )
+        except ValueError as exc:
+            logger.warning("%s; keeping %s", exc, self.recorder.profile.name)
+
     def start_recording(self) -> None:
         if not self.navigator: return
         screen = self.navigator.current()
+        self._supersede_screen_work(screen)
+        self._defer_background_work(True)
+        self._apply_recording_settings()
         
         webcam = self.settings.get("webcam", {})
-        self.recorder.set_output_dir(screen.extraction_dir)
-        self.recorder.start(
-            camera_index=int(webcam.get("camera_index", 0)),
-            mic_index=int(webcam.get("microphone_index", 0)),
-            resolution=str(webcam.get("resolution", "1080p")),
-            custom_url=str(webcam.get("custom_url", "")),
-        )
+        try:
+            self.recorder.set_output_dir(screen.extraction_dir)
+            clear_segment_outputs(screen.extraction_dir)
+            self._recording_screen = screen
+            self.recorder.start(
+                camera_index=int(webcam.get("camera_index", 0)),
+                mic_index=int(webcam.get("microphone_index", 0)),
+                resolution=str(webcam.get("resolution", "1080p")),
+                custom_url=str(webcam.get("custom_url", "")),
+            )
+        except Exception:
+            # stop_recording is never reached for a recording that did not start.
+            self._recording_screen = None
+            self._defer_background_work(False)
+            raise
+        if self.recorder.segment_seconds > 0:
+            self._segment_timer.start()
         screen.status = "recording"
+        self.screen_status_changed.emit(screen)
         logger.info("Recording started for screen: %s (Cam: %s, Mic: %s, Res: %s)", 
                     screen.name, webcam.get("camera_index"), webcam.get("microphone_index"), 
                     webcam.get("resolution"))
@@ -141,13 +382,47 @@ class AppController(QObject):
     def stop_recording(self) -> None:
         if not self.recorder.is_recording(): return
         screen = self.navigator.current()
-        video_path, audio_path = self.recorder.stop()
+        # Joining the segments can take long without FFmpeg; transcription waits for it.
+        video_path, audio_path = self.recorder.stop(join_in_background=True)
+        self._drain_segments()
         duration = self.recorder.get_duration()
         screen.status = "processing"
+        self.screen_status_changed.emit(screen)
+        self._defer_background_work(False)
         
         self.recording_status_changed.emit(False, False, duration)
         self._start_transcription(screen, video_path, audio_path, duration)
 
+    def _on_segment_complete(self, segment: RecordingSegment) -> None:
+        """Recorder callback (capture/audio thread): hand the segment to the GUI thread."""
+        # The parts closed by stop are covered by the analysis of the joined take.
+        if self.recorder.is_recording():
+            self._segments_closed.append(segment)
+
+    def _drain_segments(self) -> None:
+        """Queue frame extraction/transcription of segments closed while recording."""
+        screen = self._recording_screen
+        while self._segments_closed:
+            segment = self._segments_closed.popleft()
+            if screen is None:
+                continue
+            priority = PRIORITY_FOREGROUND if screen.name == self._foreground_screen else PRIORITY_BACKGROUND
+            submit_segment_analysis(self.settings, self.transcriber, screen, segment, priority=priority)
+            logger.debug("Queued analysis of %s segment %s of %s", segment.kind, segment.index, screen.name)
+        if not self.recorder.is_recording():
+            self._segment_timer.stop()
+            self._recording_screen = None
+
+    def _supersede_screen_work(self, screen: ScreenItem) -> None:
+        """Drop transcription results and cancel analysis that belong to an older recording."""
+        key = str(screen.extraction_dir)
+        self._recording_generation[key] = self._recording_generation.get(key, 0) + 1
+        self.admission.cancel(key)
+        worker = self._pipeline_workers.pop(key, None)
+        if worker is not None:
+            logger.info("Cancelling analysis of %s: superseded by a new recording", screen.name)
+            worker.cancel("superseded by a new recording")
+
     def toggle_pause(self) -> None:
         if not self.recorder.is_recording(): return
         if self.recorder.is_paused():
@@ -157,24 +432,36 @@ class AppController(QObject):
         self.recording_status_changed.emit(True, self.recorder.is_paused(), self.recorder.get_duration())
 
     def _start_transcription(self, screen: ScreenItem, video_path: Path, audio_path: Path, duration: float) -> None:
+        key = str(screen.extraction_dir)
+        self.admission.submit(
+            KIND_TRANSCRIPTION, key, lambda: self._run_transcription(screen, video_path, audio_path, duration)
+        )
+
+    def _run_transcription(self, screen: ScreenItem, video_path: Path, audio_path: Path, duration: float) -> None:
         self._cleanup_threads()
         provider = str(self.settings.get("speech_to_text", {}).get("provider", "openai_4o_transcribe"))
         language = str(self.settings.get("speech_to_text", {}).get("language", "de"))
         
         self.pipeline_progress.emit(0, 9, "Transcribing audio...")
+        generation = self._recording_generation.get(str(screen.extraction_dir), 0)
         
         # Use child of self to ensure it's not garbage collected too early
         thread = QThread(self)
-        worker = TranscriptionWorker(self.transcriber, audio_path, provider, language)
+        output_dir = audio_path.parent
+        worker = TranscriptionWorker(
+            self.transcriber, audio_path, provider, language,
+            wait_for_audio=lambda: self.recorder.wait_for_join(output_dir),
+        )
         worker.moveToThread(thread)
         
         thread.started.connect(worker.run)
-        worker.finished.connect(lambda segments: self._on_transcription_finished(screen, video_path, audio_path, duration, segments))
-        worker.error.connect(lambda err: self._on_transcription_finished(screen, video_path, audio_path, duration, [{"start": 0.0, "end": duration, "text": f"(API Error: {err})"}]))
+        worker.finished.connect(lambda segments: self._on_transcription_finished(screen, video_path, audio_path, duration, segments, generation))
+        worker.error.connect(lambda err: self._on_transcription_finished(screen, video_path, audio_path, duration, [{"start": 0.0, "end": duration, "text": f"(API Error: {err})"}], generation))
         
         worker.finished.connect(thread.quit)
         worker.error.connect(thread.quit)
         thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(lambda: self.admission.release(KIND_TRANSCRIPTION, str(screen.extraction_dir)))
         
         # Clean up the thread only when it's really done
         thread.finished.connect(thread.deleteLater)
@@ -182,7 +469,7 @@ class AppController(QObject):
         self._active_threads.append(thread)
         thread.start()
 
-    def _on_transcription_finished(self, screen: ScreenItem, video_path: Path, audio_path: Path, duration: float, segments: list[dict[str, Any]]) -> None:
+    def _on_transcription_finished(self, screen: ScreenItem, video_path: Path, audio_path: Path, duration: float, segments: list[dict[str, Any]], generation: int = 0) -> None:
         self._cleanup_threads()
         # Update cost
         provider = str(self.settings.get("speech_to_text", {}).get("provider", "gpt-4o-mini-transcribe"))
@@ -191,26 +478,88 @@ class AppController(QObject):
         logger.debug("Transcription segments received for %s: %d items", screen.name, len(segments))
         self._update_costs(screen)
 
-        # Start Pipeline
+        if generation != self._recording_generation.get(str(screen.extraction_dir), 0):
+            logger.info("Discarding transcript of %s: the screen was re-recorded meanwhile", screen.name)
+            return
+        self._start_pipeline(screen, video_path, audio_path, segments)
+
+    def _start_pipeline(
+        self,
+        screen: ScreenItem,
+        video_path: Path,
+        audio_path: Path,
+        segments: list[dict[str, Any]],
+        job_id: str | None = None,
+    ) -> None:
+        key = str(screen.extraction_dir)
+        self.admission.submit(
+            KIND_PIPELINE, key, lambda: self._run_pipeline(screen, video_path, audio_path, segments, job_id)
+        )
+
+    def _run_pipeline(
+        self,
+        screen: ScreenItem,
+        video_path: Path,
+        audio_path: Path,
+        segments: list[dict[str, Any]],
+        job_id: str | None = None,
+    ) -> None:
+        key = str(screen.extraction_dir)
+        previous = self._pipeline_workers.pop(key, None)
+        if previous is not None:
+            previous.cancel("superseded by a newer analysis")
+
         thread = QThread(self)
-        worker = PipelineWorker(screen, video_path, audio_path, segments, self.settings, self.transcriber, self.exporter)
+        priority = PRIORITY_FOREGROUND if screen.name == self._foreground_screen else PRIORITY_BACKGROUND
+        worker = PipelineWorker(
+            screen, video_path, audio_path, segments, self.settings, self.transcriber, self.exporter,
+            journal=self.journal, job_id=job_id, priority=priority,
+        )
         worker.moveToThread(thread)
-        
+        self._pipeline_workers[key] = worker
+
+        def _forget() -> None:
+            if self._pipeline_workers.get(key) is worker:
+                del self._pipeline_workers[key]
+
         thread.started.connect(worker.run)
         worker.progress.connect(self.pipeline_progress.emit)
+        worker.metrics.connect(lambda screen_metrics: self._on_pipeline_metrics(screen_metrics, key))
         worker.finished.connect(self._on_pipeline_finished)
         worker.error.connect(self.error_occurred.emit)
+        for signal in (worker.finished, worker.error, worker.cancelled):
+            signal.connect(lambda *_args: _forget())
         
         worker.finished.connect(thread.quit)
         worker.error.connect(thread.quit)
+        worker.cancelled.connect(thread.quit)
         thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(lambda: self.admission.release(KIND_PIPELINE, key))
         thread.finished.connect(thread.deleteLater)
         
         self._active_threads.append(thread)
         thread.start()
 
+    def _on_pipeline_metrics(self, screen_metrics: dict[str, Any], key: str) -> None:
+        """Merge one screen's stage metrics into the project totals and forward them to the GUI."""
+        from screenreview.pipeline.metrics import ProjectMetrics
+
+        project_metrics: dict[str, Any] = {}
+        if self.project_dir is not None:
+            if self._project_metrics is None:
+                # Read the other screens' metrics.json once per project; later jobs merge in memory.
+                self._project_metrics = ProjectMetrics.from_extraction_dirs(s.extraction_dir for s in self.screens)
+            self._project_metrics.update(key, screen_metrics)
+            try:
+                project_metrics = self._project_metrics.write(self.project_dir)
+            except OSError as exc:
+                logger.warning("Could not write project pipeline metrics: %s", exc)
+                project_metrics = self._project_metrics.summary()
+        self.pipeline_metrics.emit({"screen": screen_metrics, "project": project_metrics})
+
     def _on_pipeline_finished(self, screen: ScreenItem) -> None:
         screen.status = "pending"
+        self.screen_status_changed.emit(screen)
         self.pipeline_finished.emit(screen)
         self.refresh_current_screen()
 
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import html
+from pathlib import Path
+
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QHBoxLayout, QPushButton, QWidget
 
@@ -45,6 +48,11 @@ class ControlsWidget(QWidget):
             "Go to previous screen. If recording is active, it is stopped and saved first."
         )
 
+        self._base_tooltips = {
+            self.back_button: self.back_button.toolTip(),
+            self.next_button: self.next_button.toolTip(),
+        }
+
         layout.addWidget(self.back_button)
         layout.addWidget(self.skip_button)
         layout.addWidget(self.next_button)
@@ -68,6 +76,14 @@ class ControlsWidget(QWidget):
         self.back_button.setEnabled(can_go_back)
         self.next_button.setEnabled(can_go_next)
 
+    def set_neighbour_previews(self, previous_thumbnail: Path | None, next_thumbnail: Path | None) -> None:
+        """Show the neighbouring screens' cached thumbnails in the Back/Next tooltips."""
+        for button, path in ((self.back_button, previous_thumbnail), (self.next_button, next_thumbnail)):
+            tooltip = self._base_tooltips[button]
+            if path is not None:
+                tooltip = f"{html.escape(tooltip)}<br><img src=\"{html.escape(str(path))}\">"
+            button.setToolTip(tooltip)
+
     def set_recording_state(
         self,
         is_recording: bool,
@@ -42,7 +42,9 @@ from screenreview.gui.smart_hint_widget import SmartHintWidget
 from screenreview.gui.transcript_live_widget import TranscriptLiveWidget
 from screenreview.gui.viewer_widget import ViewerWidget
 from screenreview.gui.controller import AppController
+from screenreview.models.annotation_strokes import LEGACY_OVERLAY_FILENAME, STROKES_FILENAME
 from screenreview.models.screen_item import ScreenItem
+from screenreview.utils.logger import apply_logging_settings
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +102,11 @@ class MainWindow(QMainWindow):
         self.controller.screen_changed.connect(self._on_screen_changed)
         self.controller.recording_status_changed.connect(self._on_recording_status_changed)
         self.controller.pipeline_progress.connect(self._on_pipeline_progress)
+        self.controller.pipeline_metrics.connect(self.progress_widget.set_metrics)
+        self.controller.queue_depth_changed.connect(self.progress_widget.set_queue_depth)
         self.controller.pipeline_finished.connect(self._on_pipeline_finished)
+        self.controller.screen_status_changed.connect(self.batch_overview_widget.refresh_screen)
+        self.controller.thumbnail_ready.connect(self._on_thumbnail_ready)
         self.controller.error_occurred.connect(self._on_error)
         self.controller.cost_updated.connect(self.cost_widget.set_costs)
 
@@ -300,8 +306,14 @@ class MainWindow(QMainWindow):
         if not screen.extraction_dir.exists():
             from screenreview.utils.extraction_init import ExtractionInitializer
             ExtractionInitializer.ensure_structure(screen.extraction_dir)
-        path = screen.extraction_dir / "annotation_overlay.png"
-        self.viewer_widget.save_drawing(path)
+        annotations = self.viewer_widget.annotations()
+        if annotations is None:
+            return
+        path = screen.extraction_dir / STROKES_FILENAME
+        # An empty drawing is written only to supersede an earlier one.
+        if annotations.is_empty() and not path.exists() and not (screen.extraction_dir / LEGACY_OVERLAY_FILENAME).exists():
+            return
+        annotations.save(path)
 
     # --- Signal Handlers (View Updates) ---
 
@@ -311,17 +323,22 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"Loaded {len(screens)} screens.")
 
     def _on_screen_changed(self, screen: ScreenItem, index: int, total: int) -> None:
-        self.viewer_widget.set_image(screen.screenshot_path)
-        overlay = screen.extraction_dir / "annotation_overlay.png"
-        if overlay.exists(): self.viewer_widget.load_drawing(overlay)
+        # Neighbours are pre-scaled for the width the viewer shows right now.
+        self.controller.display_width = self.viewer_widget.display_width()
+        self.viewer_widget.set_image(screen.screenshot_path, self.controller.screen_assets(screen))
+        strokes = screen.extraction_dir / STROKES_FILENAME
+        overlay = screen.extraction_dir / LEGACY_OVERLAY_FILENAME
+        if strokes.exists(): self.viewer_widget.load_annotations(strokes)
+        elif overlay.exists(): self.viewer_widget.load_drawing(overlay)
         else: self.viewer_widget.clear_drawing()
             
         self.metadata_widget.set_screen(screen)
         self.route_label.setText(f"Route: {screen.route or '-'}")
         self.status_label.setText(f"Screen {index+1} of {total} | {screen.status.upper()}")
         self.controls_widget.set_navigation_state(index > 0, index < total - 1)
-        self.batch_overview_widget.set_screens(self.controller.screens, current_index=index)
+        self.batch_overview_widget.set_current_index(index)
         self._refresh_hints(screen, index)
+        self._refresh_previews(index)
 
     def _on_recording_status_changed(self, is_rec: bool, is_paused: bool, duration: float) -> None:
         if is_rec and not self._recording_ui_timer.isActive():
@@ -343,6 +360,14 @@ class MainWindow(QMainWindow):
         self.progress_widget.set_progress(9, 9, "Analysis complete.")
         self.controller.refresh_current_screen()
 
+    def _on_thumbnail_ready(self, screen: ScreenItem, path: str) -> None:
+        self.batch_overview_widget.set_thumbnail(screen, path)
+        if self.controller.navigator is None:
+            return
+        index = self.controller.navigator.current_index()
+        if any(0 <= i < len(self.controller.screens) and self.controller.screens[i] is screen for i in (index - 1, index, index + 1)):
+            self._refresh_previews(index)
+
     def _on_error(self, msg: str) -> None:
         QMessageBox.warning(self, "Error", msg)
 
@@ -367,6 +392,15 @@ class MainWindow(QMainWindow):
             except: pass
         else: self.comparison_widget.set_comparison(None, screen.name, None)
 
+    def _refresh_previews(self, index: int) -> None:
+        screens = self.controller.screens
+        previous, current, following = (
+            self.controller.thumbnail_for(screens[i]) if 0 <= i < len(screens) else None
+            for i in (index - 1, index, index + 1)
+        )
+        self.comparison_widget.set_previews(previous, current)
+        self.controls_widget.set_neighbour_previews(previous, following)
+
     def toggle_fullscreen_mode(self) -> None:
         """
         Robust window state toggle.
@@ -425,7 +459,8 @@ class MainWindow(QMainWindow):
     def _open_settings_dialog(self) -> None:
         d = SettingsDialog(self.settings, self, project_dir=self.controller.project_dir)
         if d.exec():
-            self.settings = d.get_settings(); save_config(self.settings); self.controller.settings = self.settings
+            self.settings = d.get_settings(); save_config(self.settings); self.controller.apply_settings(self.settings)
+            apply_logging_settings(self.settings.get("logging"))
             if self.controller.project_dir: self.controller.load_project(self.controller.project_dir)
 
     def _open_preflight_dialog(self) -> None:
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from PyQt6.QtWidgets import QLabel, QProgressBar, QVBoxLayout, QWidget
 
 
@@ -19,6 +21,12 @@ class ProgressWidget(QWidget):
         self.progress_bar.setFixedHeight(10)  # Halbieren der Höhe
         self.status_label = QLabel("Idle")
         self.status_label.setObjectName("mutedText")
+        self.metrics_label = QLabel("")
+        self.metrics_label.setObjectName("mutedText")
+        self.metrics_label.setVisible(False)
+        self.queue_label = QLabel("")
+        self.queue_label.setObjectName("mutedText")
+        self.queue_label.setVisible(False)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -26,6 +34,8 @@ class ProgressWidget(QWidget):
         layout.addWidget(self.title_label)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.status_label)
+        layout.addWidget(self.metrics_label)
+        layout.addWidget(self.queue_label)
 
     def set_progress(self, step: int, total_steps: int, message: str) -> None:
         total_steps = max(1, int(total_steps))
@@ -34,3 +44,56 @@ class ProgressWidget(QWidget):
         self.progress_bar.setValue(percent)
         self.status_label.setText(message)
 
+    def set_queue_depth(self, depth: dict[str, Any]) -> None:
+        """Show how many screens are being processed and how many wait for a slot."""
+        kinds = [value for value in depth.values() if isinstance(value, dict)]
+        running = sum(int(kind.get("running", 0)) for kind in kinds)
+        waiting = sum(int(kind.get("waiting", 0)) for kind in kinds)
+        if not running and not waiting:
+            self.queue_label.setVisible(False)
+            return
+        text = f"Queue: {running} running · {waiting} waiting"
+        if depth.get("deferred"):
+            text += " (analysis paused while recording)"
+        self.queue_label.setText(text)
+        self.queue_label.setToolTip(
+            "\n".join(
+                f"{name}: {value.get('running', 0)}/{value.get('limit', 0)} running, {value.get('waiting', 0)} waiting"
+                for name, value in depth.items()
+                if isinstance(value, dict)
+            )
+        )
+        self.queue_label.setVisible(True)
+
+    def set_metrics(self, metrics: dict[str, Any]) -> None:
+        """Show the last run's duration and bottleneck, with per-stage details as tooltip."""
+        screen = metrics.get("screen") or {}
+        project = metrics.get("project") or {}
+        stages = screen.get("stages") or []
+        if not stages:
+            self.metrics_label.setVisible(False)
+            return
+
+        slowest = max(stages, key=lambda stage: stage.get("wall_seconds", 0.0))
+        # Stages overlap, so the elapsed critical path is the screen's real latency.
+        elapsed = screen.get("elapsed_seconds", screen.get("total_wall_seconds", 0.0))
+        text = (
+            f"Last run {elapsed:.1f}s "
+            f"(stages {screen.get('total_wall_seconds', 0.0):.1f}s) · "
+            f"bottleneck: {slowest['name']} ({slowest.get('wall_seconds', 0.0):.1f}s)"
+        )
+        if project.get("bottleneck") and int(project.get("screens", 0)) > 1:
+            text += f" · project ({project['screens']} screens): {project['bottleneck']}"
+        self.metrics_label.setText(text)
+
+        lines = ["Stage        wall     cpu    items   bytes"]
+        for stage in stages:
+            lines.append(
+                f"{stage['name']:<12} {stage.get('wall_seconds', 0.0):>6.2f}s "
+                f"{stage.get('cpu_seconds', 0.0):>6.2f}s {stage.get('items', 0):>6} "
+                f"{stage.get('bytes_written', 0):>8}"
+            )
+        if screen.get("peak_rss_mb") is not None:
+            lines.append(f"Peak RSS: {screen['peak_rss_mb']:.0f} MiB")
+        self.metrics_label.setToolTip("<pre>" + "\n".join(lines) + "</pre>")
+        self.metrics_label.setVisible(True)
@@ -39,7 +39,13 @@ from screenreview.integrations.openrouter_client import OpenRouterClient
 from screenreview.integrations.replicate_client import ReplicateClient
 from screenreview.gui.help_system import HelpSystem
 from screenreview.gui.preflight_dialog import PreflightDialog
-from screenreview.pipeline.recorder import AudioLevelMonitor, CameraPreviewMonitor, Recorder
+from screenreview.pipeline.recorder import (
+    DEFAULT_RECORDING_PROFILE,
+    RECORDING_PROFILES,
+    AudioLevelMonitor,
+    CameraPreviewMonitor,
+    Recorder,
+)
 
 try:  # Optional runtime feature (device labels in webcam/audio tab)
     from PyQt6.QtMultimedia import QMediaDevices
@@ -315,6 +321,7 @@ class SettingsDialog(QDialog):
         self._camera_preview_pixmap: QPixmap | None = None
         self._resolution_info_label: QLabel | None = None
         self._camera_preview_monitor = CameraPreviewMonitor()
+        self._camera_preview_generation = 0
         self._audio_level_monitor = AudioLevelMonitor()
         self._camera_resolution_cache: dict[str, list[str]] = {}
         self._camera_resolution_probe_active = False
@@ -464,6 +471,8 @@ class SettingsDialog(QDialog):
         self._settings["speech_to_text"]["language"] = self._line("stt_language").text()
         self._settings["frame_extraction"]["interval_seconds"] = self._spin("frame_interval").value()
         self._settings["frame_extraction"]["max_frames_per_screen"] = self._spin("frame_max").value()
+        self._settings["frame_extraction"]["method"] = self._combo("frame_method").currentText()
+        self._settings["frame_extraction"]["frames_per_trigger"] = self._spin("frames_per_trigger").value()
         self._settings["smart_selector"]["enabled"] = self._check("smart_enabled").isChecked()
         self._settings["gesture_detection"]["enabled"] = self._check("gesture_enabled").isChecked()
         self._settings["gesture_detection"]["sensitivity"] = self._dspin("gesture_sensitivity").value()
@@ -475,8 +484,11 @@ class SettingsDialog(QDialog):
         self._settings["cost"]["warning_at_euro"] = self._dspin("budget_warning").value()
         self._settings["cost"]["auto_stop_at_limit"] = self._check("budget_autostop").isChecked()
         self._settings["recording"]["overwrite_recordings"] = self._check("recording_overwrite").isChecked()
+        self._settings["recording"]["profile"] = self._combo("recording_profile").currentText()
+        self._settings["recording"]["grayscale"] = self._check("recording_grayscale").isChecked()
         self._settings["export"]["auto_export_after_analysis"] = self._check("export_auto").isChecked()
         self._settings["export"]["format"] = self._combo("export_format").currentText()
+        self._settings.setdefault("logging", {})["level"] = self._combo("log_level").currentText()
 
         hotkeys_editor = self._plain("hotkeys_editor").toPlainText().strip().splitlines()
         for line in hotkeys_editor:
@@ -575,7 +587,7 @@ class SettingsDialog(QDialog):
         tab = QWidget(); form = QFormLayout(tab); form.addRow("Provider", self._register_combo("stt_provider", ["gpt-4o-mini-transcribe", "openai_4o_transcribe", "whisper_replicate", "whisper_local"], str(self._settings.get("speech_to_text", {}).get("provider", "gpt-4o-mini-transcribe")))); form.addRow("Language", self._register_line("stt_language", self._settings["speech_to_text"]["language"])); return tab
 
     def _build_frame_tab(self) -> QWidget:
-        tab = QWidget(); form = QFormLayout(tab); form.addRow("Interval (sec)", self._register_spin("frame_interval", self._settings["frame_extraction"]["interval_seconds"], 1, 3600)); form.addRow("Max Frames", self._register_spin("frame_max", self._settings["frame_extraction"]["max_frames_per_screen"], 1, 500)); form.addRow("Smart Selector", self._register_check("smart_enabled", self._settings["smart_selector"]["enabled"])); return tab
+        tab = QWidget(); form = QFormLayout(tab); form.addRow("Interval (sec)", self._register_spin("frame_interval", self._settings["frame_extraction"]["interval_seconds"], 1, 3600)); form.addRow("Max Frames", self._register_spin("frame_max", self._settings["frame_extraction"]["max_frames_per_screen"], 1, 500)); form.addRow("Method", self._register_combo("frame_method", ["time_based", "trigger_based"], self._settings["frame_extraction"].get("method", "time_based"))); form.addRow("Frames per Trigger", self._register_spin("frames_per_trigger", self._settings["frame_extraction"].get("frames_per_trigger", 3), 1, 10)); form.addRow("Smart Selector", self._register_check("smart_enabled", self._settings["smart_selector"]["enabled"])); return tab
 
     def _build_gesture_tab(self) -> QWidget:
         tab = QWidget(); form = QFormLayout(tab); form.addRow("Gesture Detection", self._register_check("gesture_enabled", self._settings["gesture_detection"]["enabled"])); form.addRow("Gesture Sensitivity", self._register_dspin("gesture_sensitivity", float(self._settings["gesture_detection"]["sensitivity"]), 0.0, 1.0, 0.05)); return tab
@@ -593,7 +605,7 @@ class SettingsDialog(QDialog):
         tab = QWidget(); layout = QVBoxLayout(tab); layout.addWidget(QLabel("action: shortcut")); editor = QPlainTextEdit(); editor.setPlainText("\n".join(f"{k}: {v}" for k, v in self._settings["hotkeys"].items())); self._fields["hotkeys_editor"] = editor; layout.addWidget(editor, 1); return tab
 
     def _build_export_tab(self) -> QWidget:
-        tab = QWidget(); form = QFormLayout(tab); form.addRow("Overwrite old recordings", self._register_check("recording_overwrite", self._settings.get("recording", {}).get("overwrite_recordings", True))); form.addRow(QFrame()); form.addRow("Format", self._register_combo("export_format", ["markdown"], self._settings["export"]["format"])); form.addRow("Auto Export", self._register_check("export_auto", self._settings["export"]["auto_export_after_analysis"])); return tab
+        tab = QWidget(); form = QFormLayout(tab); form.addRow("Overwrite old recordings", self._register_check("recording_overwrite", self._settings.get("recording", {}).get("overwrite_recordings", True))); form.addRow("Recording profile", self._register_combo("recording_profile", list(RECORDING_PROFILES), self._settings.get("recording", {}).get("profile", DEFAULT_RECORDING_PROFILE))); form.addRow("Record in grayscale", self._register_check("recording_grayscale", self._settings.get("recording", {}).get("grayscale", False))); form.addRow(QFrame()); form.addRow("Format", self._register_combo("export_format", ["markdown"], self._settings["export"]["format"])); form.addRow("Auto Export", self._register_check("export_auto", self._settings["export"]["auto_export_after_analysis"])); form.addRow(QFrame()); form.addRow("Log Level", self._register_combo("log_level", ["WARNING", "INFO", "DEBUG"], str(self._settings.get("logging", {}).get("level", "INFO")).upper())); return tab
 
     def _register_line(self, key: str, value: str, password: bool = False) -> QLineEdit:
         w = QLineEdit(value); 
@@ -801,9 +813,10 @@ class SettingsDialog(QDialog):
     def _restart_audio_monitor(self) -> None: self._audio_level_monitor.start(int(self._spin("mic_index").value()))
 
     def _refresh_live_device_feedback(self) -> None:
-        f = self._camera_preview_monitor.get_last_frame()
-        if f is not None: self._set_camera_preview_from_frame(f)
-        elif self._camera_preview_label and self._camera_preview_pixmap is None:
+        # Pin the monitor's latest downscaled frame and convert it in place; unchanged frames are skipped.
+        with self._camera_preview_monitor.frame_slot.read(since=self._camera_preview_generation) as (generation, f):
+            if f is not None and self._set_camera_preview_from_frame(f): self._camera_preview_generation = generation
+        if f is None and self._camera_preview_label and self._camera_preview_pixmap is None:
             err = self._camera_preview_monitor.get_last_error()
             if err: self._camera_preview_label.setText(f"Camera Preview\n{err}")
         level = self._audio_level_monitor.get_level()
@@ -820,8 +833,9 @@ class SettingsDialog(QDialog):
     def _set_camera_preview_from_frame(self, frame: object) -> bool:
         if self._camera_preview_label is None or frame is None or not hasattr(frame, "shape"): return False
         try:
-            rgb = frame[:, :, ::-1] # type: ignore
-            image = QImage(rgb.data, int(rgb.shape[1]), int(rgb.shape[0]), int(rgb.strides[0]), QImage.Format.Format_RGB888).copy()
+            if not frame.flags["C_CONTIGUOUS"]: frame = frame.copy()  # type: ignore  # FrameSlot buffers always are
+            # Wrap the BGR buffer as-is; fromImage() makes the only copy.
+            image = QImage(frame.data, int(frame.shape[1]), int(frame.shape[0]), int(frame.strides[0]), QImage.Format.Format_BGR888)
             pixmap = QPixmap.fromImage(image); self._camera_preview_pixmap = pixmap
             scaled = pixmap.scaled(self._camera_preview_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self._camera_preview_label.setText(""); self._camera_preview_label.setPixmap(scaled); return True
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QSize
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QMouseEvent
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QPoint, QRect, QRectF, QRunnable, QSize, QThreadPool, QTimer
+from PyQt6.QtGui import QPixmap, QImage, QImageReader, QPainter, QPaintEvent, QPen, QColor, QMouseEvent
 from PyQt6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -17,9 +20,92 @@ from PyQt6.QtWidgets import (
     QPushButton,
 )
 
+from screenreview.models.annotation_strokes import AnnotationStrokes, Stroke
+
+if TYPE_CHECKING:
+    from screenreview.core.prefetch import ScreenAssets
+
+
+def decode_screenshot(path: Path, display_width: int) -> tuple[QImage, QImage | None, int]:
+    """Decode a screenshot and pre-scale it to ``display_width``; safe off the GUI thread.
+
+    Returns the full-size image, the scaled one (None if no width is known or
+    the image is already narrower) and the approximate memory both occupy.
+    """
+    image = QImage(str(path))
+    if image.isNull():
+        return image, None, 0
+    scaled = None
+    if 0 < display_width < image.width():
+        scaled = image.scaledToWidth(display_width, Qt.TransformationMode.SmoothTransformation)
+    nbytes = image.sizeInBytes() + (scaled.sizeInBytes() if scaled is not None else 0)
+    return image, scaled, nbytes
+
+
+class _ImageJobSignals(QObject):
+    # generation, display width, decoded full image (None if it was given), smooth-scaled image
+    done = pyqtSignal(int, int, object, object)
+
+
+class _ImageJob(QRunnable):
+    """Decode a screenshot (when only the path is known) and smooth-scale it off the GUI thread."""
+
+    def __init__(
+        self,
+        signals: _ImageJobSignals,
+        generation: int,
+        width: int,
+        path: Path | None = None,
+        image: QImage | None = None,
+    ) -> None:
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._width = width
+        self._path = path
+        self._image = image
+
+    def run(self) -> None:
+        decoded = None
+        image = self._image
+        if image is None:
+            decoded = image = QImage(str(self._path))
+        scaled = None
+        if not image.isNull() and self._width > 0:
+            scaled = image.scaledToWidth(self._width, Qt.TransformationMode.SmoothTransformation)
+        self._signals.done.emit(self._generation, self._width, decoded, scaled)
+
+
+class _UndoStep:
+    """Pixels of the annotation buffer as they were before one stroke or clear.
+
+    Only the ``UNDO_TILE``-sized blocks that the step touched are kept, so an
+    undo level costs memory proportional to the drawn area, not the page.
+    """
+
+    def __init__(self, strokes: list[Stroke], raster: str | None) -> None:
+        self.patches: dict[tuple[int, int], QImage] = {}
+        # Stroke list and raster reference to restore alongside the pixels.
+        self.strokes = strokes
+        self.raster = raster
+
+    def nbytes(self) -> int:
+        return sum(patch.sizeInBytes() for patch in self.patches.values())
+
 
 class DrawingLabel(QLabel):
-    """A label that supports drawing yellow annotations on an internal buffer."""
+    """A label that supports drawing yellow annotations on an internal buffer.
+
+    The screenshot and the annotation buffer are composited in display-sized
+    tiles that are built only when visible and then cached; a brush segment
+    invalidates just the tiles under its bounding box. The screenshot pixmap
+    may be pre-scaled to the display size or be the original, in which case
+    each tile scales its own region.
+    """
+
+    TILE_SIZE = 256
+    MAX_CACHED_TILES = 192
+    UNDO_TILE = 64
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -31,13 +117,25 @@ class DrawingLabel(QLabel):
         
         # Buffer for the original resolution drawing
         self._original_buffer = QImage()
-        # Undo history (list of QImages)
-        self._undo_stack: list[QImage] = []
-        self._max_undo = 3
+        # Undo history: per stroke/clear, the buffer blocks it overwrote
+        self._undo_stack: list[_UndoStep] = []
+        self._max_undo = 20
+        self._current_step: _UndoStep | None = None
+        # Set on mouse press; the undo step is only created once the stroke draws.
+        self._step_pending = False
+        # Bounding box of everything drawn or loaded, so clearing saves only that
+        self._drawn_bounds = QRect()
+        # Vector form of the drawing (what gets saved); ``_raster`` names a
+        # legacy overlay PNG that is still part of it.
+        self._strokes: list[Stroke] = []
+        self._active_stroke: Stroke | None = None
+        self._raster: str | None = None
         # Pixmap of the screenshot
         self._screenshot_pixmap = QPixmap()
         # Current scale factor (display size / original size)
         self._scale_factor = 1.0
+        self._display_size = QSize()
+        self._tiles: OrderedDict[tuple[int, int], QPixmap] = OrderedDict()
 
     def set_drawing_enabled(self, enabled: bool) -> None:
         self._drawing_enabled = enabled
@@ -49,14 +147,32 @@ class DrawingLabel(QLabel):
     def set_pen_width(self, width: int) -> None:
         self._pen_width = width
 
-    def set_screenshot(self, pixmap: QPixmap, scale_factor: float) -> None:
+    def set_screenshot(self, pixmap: QPixmap, scale_factor: float, original_size: QSize | None = None) -> None:
         """Update the background screenshot and the expected buffer size."""
         self._screenshot_pixmap = pixmap
         self._scale_factor = scale_factor
         
-        # Initialize or resize drawing buffer if needed
-        if not pixmap.isNull():
-            orig_size = QSize(int(pixmap.width() / scale_factor), int(pixmap.height() / scale_factor))
+        if original_size is None and not pixmap.isNull():
+            original_size = QSize(round(pixmap.width() / scale_factor), round(pixmap.height() / scale_factor))
+        if original_size is not None:
+            self.prepare_canvas(original_size)
+        if pixmap.isNull() or original_size is None:
+            self._display_size = QSize()
+        else:
+            self._display_size = QSize(
+                max(1, round(original_size.width() * scale_factor)),
+                max(1, round(original_size.height() * scale_factor)),
+            )
+        
+        self._update_display()
+
+    def display_size(self) -> QSize:
+        """Size of the rendered screenshot in widget pixels (invalid if none is shown)."""
+        return QSize(self._display_size)
+
+    def prepare_canvas(self, orig_size: QSize) -> None:
+        """Make sure the drawing buffer has the screenshot's original size."""
+        if orig_size.isValid() and not orig_size.isEmpty():
             if self._original_buffer.isNull() or self._original_buffer.size() != orig_size:
                 # Create a new transparent buffer
                 new_buffer = QImage(orig_size, QImage.Format.Format_ARGB32)
@@ -69,35 +185,131 @@ class DrawingLabel(QLabel):
                     painter.end()
                 
                 self._original_buffer = new_buffer
-        
-        self._update_display()
+                self.reset_history()
 
-    def clear_drawing(self) -> None:
+    def clear_drawing(self, record_undo: bool = True) -> None:
         if not self._original_buffer.isNull():
-            self._undo_stack.append(self._original_buffer.copy())
-            if len(self._undo_stack) > self._max_undo:
-                self._undo_stack.pop(0)
+            if record_undo and not self._drawn_bounds.isEmpty():
+                self._begin_step()
+                self._snapshot(self._drawn_bounds)
+                self._current_step = None
             self._original_buffer.fill(Qt.GlobalColor.transparent)
+            self._drawn_bounds = QRect()
+            self._strokes = []
+            self._active_stroke = None
+            self._raster = None
             self._update_display()
 
+    def annotations(self) -> AnnotationStrokes | None:
+        """The drawing as stroke vectors (None without a canvas)."""
+        if self._original_buffer.isNull():
+            return None
+        return AnnotationStrokes(
+            width=self._original_buffer.width(),
+            height=self._original_buffer.height(),
+            strokes=[Stroke(list(s.points), s.width, s.color) for s in self._strokes if len(s.points) > 1],
+            raster=self._raster,
+        )
+
+    def set_annotations(self, annotations: AnnotationStrokes, raster_image: QImage | None = None) -> None:
+        """Replace the drawing by rendering ``annotations`` (and an optional legacy raster)."""
+        if self._original_buffer.isNull():
+            return
+        self._original_buffer.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._original_buffer)
+        bounds = QRect()
+        if raster_image is not None and not raster_image.isNull():
+            painter.drawImage(0, 0, raster_image)
+            bounds = raster_image.rect()
+        for stroke in annotations.strokes:
+            pen = QPen(QColor(*stroke.color), stroke.width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+            painter.setPen(pen)
+            # Segment by segment, exactly as the strokes were drawn live.
+            for (x1, y1), (x2, y2) in zip(stroke.points, stroke.points[1:]):
+                painter.drawLine(x1, y1, x2, y2)
+            x_min, y_min, x_max, y_max = stroke.bounds()
+            bounds = bounds.united(QRect(QPoint(x_min, y_min), QPoint(x_max, y_max)))
+        painter.end()
+        self.reset_history(bounds.intersected(self._original_buffer.rect()))
+        self._strokes = [Stroke(list(s.points), s.width, s.color) for s in annotations.strokes]
+        self._raster = annotations.raster
+        self._update_display()
+
+    def set_raster_source(self, name: str | None) -> None:
+        """Record that the buffer holds a legacy overlay PNG called ``name``."""
+        self._raster = name
+        self._strokes = []
+
+    def reset_history(self, drawn_bounds: QRect | None = None) -> None:
+        """Forget undo steps, e.g. when another screen's drawing is loaded."""
+        self._undo_stack.clear()
+        self._current_step = None
+        self._step_pending = False
+        self._drawn_bounds = QRect(drawn_bounds) if drawn_bounds is not None else QRect()
+
     def get_drawing_buffer(self) -> QImage:
         return self._original_buffer
 
+    def undo_memory_bytes(self) -> int:
+        return sum(step.nbytes() for step in self._undo_stack)
+
     def undo(self) -> None:
         if not self._undo_stack:
             return
-        self._original_buffer = self._undo_stack.pop()
-        self._update_display()
+        step = self._undo_stack.pop()
+        if step is self._current_step:
+            self._current_step = None
+        self._strokes = step.strokes
+        self._raster = step.raster
+        self._active_stroke = None
+        if not step.patches:
+            return
+        restored = QRect()
+        painter = QPainter(self._original_buffer)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        for (x, y), patch in step.patches.items():
+            painter.drawImage(x, y, patch)
+            restored = restored.united(QRect(x, y, patch.width(), patch.height()))
+        painter.end()
+        self._invalidate_region(self._to_display_rect(restored))
+
+    def _begin_step(self) -> None:
+        self._current_step = _UndoStep(list(self._strokes), self._raster)
+        self._undo_stack.append(self._current_step)
+        if len(self._undo_stack) > self._max_undo:
+            self._undo_stack.pop(0)
+
+    def _snapshot(self, rect: QRect) -> None:
+        """Save the untouched blocks under ``rect`` (buffer coordinates) into the current step."""
+        if self._current_step is None:
+            return
+        rect = rect.intersected(self._original_buffer.rect())
+        if rect.isEmpty():
+            return
+        size = self.UNDO_TILE
+        patches = self._current_step.patches
+        for by in range(rect.top() // size, rect.bottom() // size + 1):
+            for bx in range(rect.left() // size, rect.right() // size + 1):
+                key = (bx * size, by * size)
+                if key not in patches:
+                    block = QRect(key[0], key[1], size, size).intersected(self._original_buffer.rect())
+                    patches[key] = self._original_buffer.copy(block)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if self._drawing_enabled and event.button() == Qt.MouseButton.LeftButton:
-            # Save state for undo BEFORE drawing starts
-            if not self._original_buffer.isNull():
-                self._undo_stack.append(self._original_buffer.copy())
-                if len(self._undo_stack) > self._max_undo:
-                    self._undo_stack.pop(0)
+            # One undo step per stroke, begun at its first segment so a plain
+            # click does not use up a level; blocks are saved as the stroke reaches them
+            self._step_pending = not self._original_buffer.isNull()
+            self._active_stroke = None
             self._last_point = event.pos()
 
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._current_step = None
+            self._step_pending = False
+            self._active_stroke = None
+        super().mouseReleaseEvent(event)
+
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._drawing_enabled and (event.buttons() & Qt.MouseButton.LeftButton):
             self._draw_line(self._last_point, event.pos())
@@ -111,34 +323,94 @@ class DrawingLabel(QLabel):
         start_orig = QPoint(int(start_pos.x() / self._scale_factor), int(start_pos.y() / self._scale_factor))
         end_orig = QPoint(int(end_pos.x() / self._scale_factor), int(end_pos.y() / self._scale_factor))
 
+        pad = self._pen_width // 2 + 2
+        dirty = QRect(start_orig, end_orig).normalized().adjusted(-pad, -pad, pad, pad)
+        if self._step_pending:
+            self._step_pending = False
+            self._begin_step()
+        self._snapshot(dirty)
+
         painter = QPainter(self._original_buffer)
         pen = QPen(self._pen_color, self._pen_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
         painter.setPen(pen)
         painter.drawLine(start_orig, end_orig)
         painter.end()
         
-        self._update_display()
+        self._drawn_bounds = self._drawn_bounds.united(dirty.intersected(self._original_buffer.rect()))
+        if self._active_stroke is None:
+            color = self._pen_color
+            self._active_stroke = Stroke(
+                [(start_orig.x(), start_orig.y())],
+                self._pen_width,
+                (color.red(), color.green(), color.blue(), color.alpha()),
+            )
+            self._strokes.append(self._active_stroke)
+        self._active_stroke.points.append((end_orig.x(), end_orig.y()))
+        self._invalidate_region(self._to_display_rect(dirty))
+
+    def _to_display_rect(self, original_rect: QRect) -> QRect:
+        s = self._scale_factor
+        return QRectF(
+            original_rect.x() * s, original_rect.y() * s, original_rect.width() * s, original_rect.height() * s
+        ).toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def _invalidate_region(self, rect: QRect) -> None:
+        """Drop cached tiles under ``rect`` (widget coordinates) and repaint only that area."""
+        size = self.TILE_SIZE
+        for key in [k for k in self._tiles if QRect(k[0] * size, k[1] * size, size, size).intersects(rect)]:
+            del self._tiles[key]
+        self.update(rect)
 
     def _update_display(self) -> None:
-        if self._screenshot_pixmap.isNull():
+        """Re-composite everything, e.g. after the screenshot or the whole buffer changed."""
+        self._tiles.clear()
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # type: ignore[override]
+        if self._screenshot_pixmap.isNull() or not self._display_size.isValid():
+            super().paintEvent(event)
             return
+        visible = event.rect().intersected(QRect(QPoint(0, 0), self._display_size))
+        if visible.isEmpty():
+            return
+        size = self.TILE_SIZE
+        painter = QPainter(self)
+        for ty in range(visible.top() // size, visible.bottom() // size + 1):
+            for tx in range(visible.left() // size, visible.right() // size + 1):
+                painter.drawPixmap(tx * size, ty * size, self._tile(tx, ty))
+        painter.end()
 
-        # Composite the buffer onto the screenshot
-        display_pixmap = self._screenshot_pixmap.copy()
-        
+    def _tile(self, tx: int, ty: int) -> QPixmap:
+        key = (tx, ty)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        size = self.TILE_SIZE
+        rect = QRect(tx * size, ty * size, size, size).intersected(QRect(QPoint(0, 0), self._display_size))
+        tile = QPixmap(rect.size())
+        tile.fill(Qt.GlobalColor.transparent)
+        target = QRectF(0, 0, rect.width(), rect.height())
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(target, self._screenshot_pixmap, self._source_rect(rect, self._screenshot_pixmap.size()))
         if not self._original_buffer.isNull():
-            # Scale the buffer to display size
-            scaled_buffer = self._original_buffer.scaled(
-                self._screenshot_pixmap.size(), 
-                Qt.AspectRatioMode.IgnoreAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            painter = QPainter(display_pixmap)
-            painter.drawImage(0, 0, scaled_buffer)
-            painter.end()
-            
-        self.setPixmap(display_pixmap)
+            painter.drawImage(target, self._original_buffer, self._source_rect(rect, self._original_buffer.size()))
+        painter.end()
+
+        self._tiles[key] = tile
+        while len(self._tiles) > self.MAX_CACHED_TILES:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _source_rect(self, display_rect: QRect, source_size: QSize) -> QRectF:
+        """Map a display-space rectangle into a source image of ``source_size``."""
+        sx = source_size.width() / self._display_size.width()
+        sy = source_size.height() / self._display_size.height()
+        return QRectF(
+            display_rect.x() * sx, display_rect.y() * sy, display_rect.width() * sx, display_rect.height() * sy
+        )
 
 
 class ViewerWidget(QWidget):
@@ -148,12 +420,29 @@ class ViewerWidget(QWidget):
     brush_active_changed = pyqtSignal(bool)
 
     MIN_DISPLAY_WIDTH = 0
+    # Smooth-scaled variants kept per image, keyed by display width (zoom level).
+    SCALE_CACHE_SIZE = 4
+    # Resizes and zoom changes within this window produce one smooth rescale.
+    SMOOTH_DELAY_MS = 120
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._image_path: Path | None = None
         self._scale_percent = 100
         self._original_pixmap = QPixmap()
+        self._original_image = QImage()
+        self._scaled_cache: OrderedDict[int, QPixmap] = OrderedDict()
+        self._pending_widths: set[int] = set()
+        # Bumped per set_image so results for a previous screenshot are dropped.
+        self._generation = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._job_signals = _ImageJobSignals(self)
+        self._job_signals.done.connect(self._on_image_job_done)
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._request_smooth_scale)
 
         self.title_label = QLabel("Screenshot")
         self.title_label.setObjectName("sectionTitle")
@@ -245,7 +534,8 @@ class ViewerWidget(QWidget):
     def load_drawing(self, input_path: Path) -> bool:
         """Load a transparent drawing buffer into the current view."""
         if not input_path.exists():
-            self.image_label.clear_drawing()
+            self.image_label.clear_drawing(record_undo=False)
+            self.image_label.reset_history()
             return False
             
         img = QImage(str(input_path))
@@ -263,39 +553,76 @@ class ViewerWidget(QWidget):
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
         painter.drawImage(0, 0, img)
         painter.end()
+        self.image_label.reset_history(img.rect().intersected(target_buffer.rect()))
+        self.image_label.set_raster_source(input_path.name)
         self.image_label._update_display()
         return True
 
-    def set_image(self, path: Path | None) -> None:
-        """Load and display an image from disk."""
+    def load_annotations(self, input_path: Path) -> bool:
+        """Render saved stroke annotations (``annotation_strokes.json``) into the current view."""
+        annotations = AnnotationStrokes.load(input_path)
+        if annotations is None or self.image_label.get_drawing_buffer().isNull():
+            self.clear_drawing()
+            return False
+        raster = None
+        if annotations.raster and (input_path.parent / annotations.raster).exists():
+            raster = QImage(str(input_path.parent / annotations.raster))
+        self.image_label.set_annotations(annotations, raster)
+        return True
+
+    def annotations(self) -> AnnotationStrokes | None:
+        return self.image_label.annotations()
+
+    def set_image(self, path: Path | None, assets: "ScreenAssets | None" = None) -> None:
+        """Display an image; decoding and smooth scaling run on a worker thread.
+
+        Prefetched ``assets`` are shown at once. Otherwise the drawing canvas is
+        sized from the image header and the screenshot appears when decoded.
+        """
         self._image_path = path
+        self._generation += 1
+        self._scaled_cache.clear()
+        self._pending_widths.clear()
+        self._smooth_timer.stop()
+        self._original_image = QImage()
+        self._original_pixmap = QPixmap()
         if path is None or not path.exists():
-            self._original_pixmap = QPixmap()
-            self.image_label.set_screenshot(QPixmap(), 1.0)
-            self.image_label.setText("No screenshot loaded")
-            self.image_label.adjustSize()
+            self._show_message("No screenshot loaded")
             return
 
-        pixmap = QPixmap(str(path))
-        if pixmap.isNull():
-            self._original_pixmap = QPixmap()
-            self.image_label.set_screenshot(QPixmap(), 1.0)
-            self.image_label.setText("Failed to load screenshot")
-            self.image_label.adjustSize()
+        if assets is not None and assets.image is not None and not assets.image.isNull():
+            self._original_image = assets.image
+            self._original_pixmap = QPixmap.fromImage(assets.image)
+            if assets.display_image is not None and assets.display_width > 0:
+                self._cache_scaled(assets.display_width, QPixmap.fromImage(assets.display_image))
+            self._refresh_display()
             return
 
-        self._original_pixmap = pixmap
-        self._refresh_display()
+        size = QImageReader(str(path)).size()
+        if not size.isValid():
+            self._show_message("Failed to load screenshot")
+            return
+        self._show_message("Loading screenshot…", size)
+        width = self.display_width()
+        self._pending_widths.add(width)
+        self._pool.start(_ImageJob(self._job_signals, self._generation, width, path=path))
+
+    def _show_message(self, text: str, canvas_size: QSize | None = None) -> None:
+        self.image_label.set_screenshot(QPixmap(), 1.0, canvas_size)
+        self.image_label.setText(text)
+        self.image_label.adjustSize()
 
     def save_drawing(self, output_path: Path) -> bool:
-        """Save the current drawing buffer as a transparent PNG."""
+        """Render the current drawing to a transparent PNG (on demand; screens persist strokes)."""
         buffer = self.image_label.get_drawing_buffer()
         if buffer.isNull():
             return False
         return buffer.save(str(output_path), "PNG")
 
     def clear_drawing(self) -> None:
-        self.image_label.clear_drawing()
+        """Start the current screen with an empty drawing and no undo history."""
+        self.image_label.clear_drawing(record_undo=False)
+        self.image_label.reset_history()
 
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
@@ -330,26 +657,71 @@ class ViewerWidget(QWidget):
     def _on_clear_clicked(self) -> None:
         self.image_label.clear_drawing()
 
+    def display_width(self) -> int:
+        """Width the screenshot is scaled to at the current viewer size and zoom."""
+        target_width = max(1, self.scroll_area.viewport().size().width() - 16)
+        return max(self.MIN_DISPLAY_WIDTH, int(target_width * (self._scale_percent / 100.0)))
+
     def _refresh_display(self) -> None:
         if self._original_pixmap.isNull():
             return
 
         target_size = self.scroll_area.viewport().size()
-        target_width = max(1, target_size.width() - 16)
-        scaled_target_width = int(target_width * (self._scale_percent / 100.0))
-        display_width = max(self.MIN_DISPLAY_WIDTH, scaled_target_width)
+        display_width = self.display_width()
 
+        cached = self._scaled_cache.get(display_width)
+        if cached is not None:
+            self._scaled_cache.move_to_end(display_width)
+            self._show_scaled(cached)
+            return
         if display_width > 0:
-            scaled = self._original_pixmap.scaledToWidth(display_width, Qt.TransformationMode.SmoothTransformation)
+            # Preview straight away: the label scales only the visible tiles,
+            # preferably from a cached variant that is at least as large. The
+            # smooth full-size variant replaces it once the worker is done.
+            larger = [w for w in self._scaled_cache if w >= display_width]
+            source = self._scaled_cache[min(larger)] if larger else self._original_pixmap
+            self._show_scaled(source, display_width / self._original_pixmap.width())
+            self._smooth_timer.start()
         else:
-            scaled = self._original_pixmap.scaled(
+            fitted = self._original_pixmap.size().scaled(
                 max(1, self.MIN_DISPLAY_WIDTH),
                 max(1, target_size.height() - 16),
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
             )
-        
-        scale_factor = scaled.width() / self._original_pixmap.width()
-        self.image_label.set_screenshot(scaled, scale_factor)
-        self.image_label.resize(scaled.size())
+            self._show_scaled(self._original_pixmap, fitted.width() / self._original_pixmap.width())
+
+    def _show_scaled(self, pixmap: QPixmap, scale_factor: float | None = None) -> None:
+        if scale_factor is None:
+            scale_factor = pixmap.width() / self._original_pixmap.width()
+        self.image_label.set_screenshot(pixmap, scale_factor, self._original_pixmap.size())
+        self.image_label.resize(self.image_label.display_size())
         self.image_label.setText("")
+
+    def _cache_scaled(self, width: int, pixmap: QPixmap) -> None:
+        self._scaled_cache[width] = pixmap
+        self._scaled_cache.move_to_end(width)
+        while len(self._scaled_cache) > self.SCALE_CACHE_SIZE:
+            self._scaled_cache.popitem(last=False)
+
+    def _request_smooth_scale(self) -> None:
+        width = self.display_width()
+        if self._original_image.isNull() or width <= 0:
+            return
+        if width in self._scaled_cache or width in self._pending_widths:
+            return
+        self._pending_widths.add(width)
+        self._pool.start(_ImageJob(self._job_signals, self._generation, width, image=self._original_image))
+
+    def _on_image_job_done(self, generation: int, width: int, decoded: QImage | None, scaled: QImage | None) -> None:
+        if generation != self._generation:
+            return
+        self._pending_widths.discard(width)
+        if decoded is not None:
+            if decoded.isNull():
+                self._show_message("Failed to load screenshot")
+                return
+            self._original_image = decoded
+            self._original_pixmap = QPixmap.fromImage(decoded)
+        if scaled is not None:
+            self._cache_scaled(width, QPixmap.fromImage(scaled))
+        self._refresh_display()
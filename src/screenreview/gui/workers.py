@@ -4,38 +4,167 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import CancelledError, Future
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from screenreview.core.cancellation import CancellationToken, TaskCancelled
+from screenreview.core.execution_backend import ExecutionBackend, create_backend
+from screenreview.core.job_journal import JobJournal, decode_result
+from screenreview.core.queue_manager import (
+    PRIORITY_BACKGROUND,
+    RESOURCE_CPU,
+    RESOURCE_DISK,
+    RESOURCE_MODEL,
+    RESOURCE_NETWORK,
+    PipelineNode,
+    QueueManager,
+)
+from screenreview.models.annotation_strokes import LEGACY_OVERLAY_FILENAME, STROKES_FILENAME
 from screenreview.models.extraction_result import ExtractionResult
 from screenreview.models.screen_item import ScreenItem
-from screenreview.pipeline.annotation_analyzer import AnnotationAnalyzer
-from screenreview.pipeline.exporter import Exporter
-from screenreview.pipeline.frame_extractor import FrameExtractor
-from screenreview.pipeline.gesture_detector import GestureDetector
-from screenreview.pipeline.ocr_processor import OcrProcessor
-from screenreview.pipeline.smart_selector import SmartSelector
-from screenreview.pipeline.transcriber import Transcriber
+from screenreview.pipeline.recording_segments import KIND_VIDEO, RecordingSegment
+
+if TYPE_CHECKING:
+    from screenreview.pipeline.exporter import Exporter
+    from screenreview.pipeline.transcriber import Transcriber
 
 logger = logging.getLogger(__name__)
 
+# Progress texts for the nodes of the per-screen analysis graph.
+PIPELINE_STAGE_LABELS: dict[str, str] = {
+    "structure": "Initializing structure...",
+    "frames": "Extracting frames...",
+    "gestures": "Detecting gestures...",
+    "markings": "Analyzing manual markings...",
+    "ocr": "Running OCR analysis...",
+    "smart_select": "Selecting smart frames...",
+    "triggers": "Detecting trigger words...",
+    "annotations": "Compiling annotations...",
+    "export": "Exporting results...",
+}
+
+_pipeline_queue: QueueManager | None = None
+_pipeline_queue_config: tuple[int, tuple[tuple[str, int], ...]] | None = None
+_pipeline_queue_lock = threading.Lock()
+_pipeline_backend: ExecutionBackend | None = None
+_pipeline_backend_config: tuple[str, int] | None = None
+
+
+def get_pipeline_queue(settings: dict[str, Any]) -> QueueManager:
+    """Return the queue shared by all pipeline workers, rebuilt when its settings change."""
+    global _pipeline_queue, _pipeline_queue_config
+    pipeline_cfg = settings.get("pipeline", {})
+    max_workers = int(pipeline_cfg.get("max_workers", 2))
+    limits = {str(k): int(v) for k, v in pipeline_cfg.get("resource_limits", {"model": 2}).items()}
+    key = (max_workers, tuple(sorted(limits.items())))
+    with _pipeline_queue_lock:
+        if _pipeline_queue is None or _pipeline_queue_config != key:
+            held: list[str] = []
+            if _pipeline_queue is not None:
+                # Lanes parked for a recording move to the new queue; the old one
+                # must run its graphs to the end or the drain below never returns.
+                held = _pipeline_queue.queue_depth()["held"]
+                _pipeline_queue.release_resources()
+                # Let the old queue drain its graphs before its executor closes.
+                threading.Thread(
+                    target=_pipeline_queue.shutdown, name="screenreview-queue-drain", daemon=True
+                ).start()
+            _pipeline_queue = QueueManager(max_workers=max_workers, resource_limits=limits)
+            _pipeline_queue.hold_resources(held)
+            _pipeline_queue_config = key
+        return _pipeline_queue
+
+
+def get_pipeline_backend(settings: dict[str, Any]) -> ExecutionBackend:
+    """Return the backend for CPU-bound stages (``pipeline.backend``), rebuilt when it changes."""
+    from screenreview.pipeline import stage_tasks
+
+    global _pipeline_backend, _pipeline_backend_config
+    pipeline_cfg = settings.get("pipeline", {})
+    key = (str(pipeline_cfg.get("backend", "thread")), int(pipeline_cfg.get("process_workers", 0)))
+    with _pipeline_queue_lock:
+        if _pipeline_backend is None or _pipeline_backend_config != key:
+            if _pipeline_backend is not None:
+                _pipeline_backend.shutdown(wait=False)
+            _pipeline_backend = create_backend(
+                settings,
+                warmups=[
+                    ("OCR engine", stage_tasks.create_ocr_processor, ()),
+                    ("gesture detector", stage_tasks.create_gesture_detector, ()),
+                ],
+            )
+            _pipeline_backend_config = key
+        return _pipeline_backend
+
+
+def shutdown_pipeline_executors() -> None:
+    """Stop the shared queue and backend (called when the application quits)."""
+    global _pipeline_queue, _pipeline_backend
+    with _pipeline_queue_lock:
+        if _pipeline_queue is not None:
+            _pipeline_queue.shutdown(wait_for_tasks=False)
+        if _pipeline_backend is not None:
+            _pipeline_backend.shutdown(wait=False)
+        _pipeline_queue = None
+        _pipeline_backend = None
+
+
+def submit_segment_analysis(
+    settings: dict[str, Any],
+    transcriber: Transcriber,
+    screen: ScreenItem,
+    segment: RecordingSegment,
+    priority: int = PRIORITY_BACKGROUND,
+) -> Future:
+    """Queue frame extraction (video) or transcription (audio) of one closed recording segment."""
+    from screenreview.pipeline import segment_analysis
+
+    output_dir = screen.extraction_dir
+    if segment.kind == KIND_VIDEO:
+        node = PipelineNode(
+            "frames", lambda _inputs: segment_analysis.extract_segment_frames(output_dir, segment), resource=RESOURCE_CPU
+        )
+    else:
+        stt_cfg = settings.get("speech_to_text", {})
+        provider = str(stt_cfg.get("provider", "openai_4o_transcribe"))
+        language = str(stt_cfg.get("language", "de"))
+        node = PipelineNode(
+            "transcript",
+            lambda _inputs: segment_analysis.transcribe_segment(transcriber, output_dir, segment, provider, language),
+            resource=RESOURCE_NETWORK,
+        )
+    return get_pipeline_queue(settings).add_graph(screen.name, [node], priority=priority)
+
 
 class TranscriptionWorker(QObject):
     """Asynchronous worker for STT via API."""
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
-    def __init__(self, transcriber: Transcriber, audio_path: Path, provider: str, language: str) -> None:
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        audio_path: Path,
+        provider: str,
+        language: str,
+        wait_for_audio: Callable[[], Any] | None = None,
+    ) -> None:
         super().__init__()
         self.transcriber = transcriber
         self.audio_path = audio_path
         self.provider = provider
         self.language = language
+        # Blocks until the recording's segments are joined into ``audio_path``.
+        self.wait_for_audio = wait_for_audio
 
     def run(self) -> None:
         try:
+            if self.wait_for_audio is not None:
+                self.wait_for_audio()
             logger.info("TranscriptionWorker: Starting STT (%s, %s)", self.provider, self.language)
             result = self.transcriber.transcribe(self.audio_path, provider=self.provider, language=self.language)
             segments = result.get("segments", [])
@@ -49,12 +178,32 @@ class TranscriptionWorker(QObject):
 
 class PipelineWorker(QObject):
     """
-    Asynchronous worker for the full analysis pipeline 
-    (Frames -> Gestures -> OCR -> Annotations -> Export).
+    Asynchronous worker for the full analysis pipeline.
+
+    The stages form a dependency graph that runs on the shared pipeline queue:
+    frame extraction/gestures, brush markings, full-screenshot OCR and trigger
+    detection are independent, so a screen takes as long as its critical path
+    (usually frames -> gestures -> annotations -> export) rather than the sum
+    of all stages. Gesture detection, OCR and marking analysis run on the
+    configured execution backend, optionally a process pool.
+
+    With a ``journal`` every finished stage is recorded together with its
+    artifacts. Passing the ``job_id`` of an interrupted job resumes it: stages
+    whose recorded outputs still exist return their journaled result instead
+    of running again.
+
+    ``cancel`` (or the ``pipeline.deadline_seconds`` setting) stops the run:
+    queued stages are dropped, FFmpeg is terminated and frame loops exit
+    early. A cancelled run emits ``cancelled`` instead of ``error``.
+
+    ``priority`` orders the stages against other screens' on the shared queue;
+    the controller submits the viewed screen with ``PRIORITY_FOREGROUND``.
     """
     progress = pyqtSignal(int, int, str)
+    metrics = pyqtSignal(dict)
     finished = pyqtSignal(ScreenItem)
     error = pyqtSignal(str)
+    cancelled = pyqtSignal(str)
 
     def __init__(
         self,
@@ -65,6 +214,9 @@ class PipelineWorker(QObject):
         settings: dict[str, Any],
         transcriber: Transcriber,
         exporter: Exporter,
+        journal: JobJournal | None = None,
+        job_id: str | None = None,
+        priority: int = PRIORITY_BACKGROUND,
     ) -> None:
         super().__init__()
         self.screen = screen
@@ -74,109 +226,261 @@ class PipelineWorker(QObject):
         self.settings = settings
         self.transcriber = transcriber
         self.exporter = exporter
+        self.journal = journal
+        self.job_id = job_id
+        self.priority = priority
+        deadline = float(settings.get("pipeline", {}).get("deadline_seconds", 0) or 0)
+        self.token = CancellationToken(deadline_seconds=deadline or None)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Stop this run from any thread."""
+        self.token.cancel(reason)
 
     def run(self) -> None:
         try:
-            from screenreview.utils.extraction_init import ExtractionInitializer
-            import cv2
-            
-            # 1. Structure
-            self.progress.emit(1, 9, "Initializing structure...")
-            ExtractionInitializer.ensure_structure(self.screen.extraction_dir)
-            ExtractionInitializer.repair_structure(self.screen.extraction_dir)
-
-            # 2. Frames
-            self.progress.emit(2, 9, "Extracting frames...")
-            frame_extractor = FrameExtractor(fps=1)
-            frames_dir = self.screen.extraction_dir / "frames"
-            all_frames = frame_extractor.extract_frames(self.video_path, frames_dir)
-
-            # 3. Gestures
-            self.progress.emit(3, 9, "Detecting gestures...")
-            gesture_detector = GestureDetector()
-            gesture_positions = []
-            gesture_regions = []
-            for i, frame_path in enumerate(all_frames[:3]):
-                frame = cv2.imread(str(frame_path))
-                if frame is not None:
-                    is_gesture, gx, gy = gesture_detector.detect_gesture_in_frame(frame)
-                    if is_gesture and gx is not None and gy is not None:
-                        gesture_positions.append({"x": gx, "y": gy})
-                        gesture_regions.append({"x": gx, "y": gy, "frame_index": i})
-
-            # 4. Brush Markings
-            self.progress.emit(4, 9, "Analyzing manual markings...")
-            marking_annotations = []
-            overlay_path = self.screen.extraction_dir / "annotation_overlay.png"
-            if overlay_path.exists():
-                analyzer = AnnotationAnalyzer()
-                ocr_p = OcrProcessor()
-                markings = analyzer.analyze_overlay(self.screen.screenshot_path, overlay_path)
-                for idx, m in enumerate(markings, start=1):
-                    crop_path = analyzer.get_crop_path(self.screen.screenshot_path, m, self.screen.extraction_dir / "marked_regions", idx)
-                    if crop_path:
-                        marked_ocr = ocr_p.process(crop_path)
-                        text = " ".join([r.get("text", "") for r in marked_ocr]).strip()
-                        marking_annotations.append({
-                            "index": 100 + idx,
-                            "timestamp": 0.0,
-                            "position": {
-                                "x": (m["bbox"]["top_left"]["x"] + m["bbox"]["bottom_right"]["x"]) // 2,
-                                "y": (m["bbox"]["top_left"]["y"] + m["bbox"]["bottom_right"]["y"]) // 2
-                            },
-                            "ocr_text": text or "N/A",
-                            "spoken_text": "(Direct manual marking)",
-                            "trigger_type": "text",
-                            "region_image": f"marked_regions/marked_region_{idx:03d}.png"
-                        })
-
-            # 5. Full Screenshot OCR
-            self.progress.emit(5, 9, "Running OCR analysis...")
-            ocr_processor = OcrProcessor()
-            full_screenshot_ocr = ocr_processor.process(self.screen.screenshot_path)
-
-            # 6. Smart Select
-            self.progress.emit(6, 9, "Selecting smart frames...")
-            smart_selector = SmartSelector()
-            selected_frames = smart_selector.select_frames(all_frames, self.settings)
-
-            # 7. Triggers
-            self.progress.emit(7, 9, "Detecting trigger words...")
-            trigger_events = self.transcriber.detect_trigger_words(self.segments, self.settings.get("trigger_words", {}))
-
-            # 8. Annotations
-            self.progress.emit(8, 9, "Compiling annotations...")
-            gesture_events = [{"timestamp": i * 1.0, "screenshot_position": pos} for i, pos in enumerate(gesture_positions)]
-            annotations = ocr_processor.process_gesture_annotations(self.screen.extraction_dir.parent, gesture_events, self.segments)
-            annotations.extend(marking_annotations)
-
-            # 9. Export
-            self.progress.emit(9, 9, "Exporting results...")
-            extraction = ExtractionResult(
-                screen=self.screen,
-                video_path=self.video_path,
-                audio_path=self.audio_path,
-                all_frames=all_frames,
-                selected_frames=selected_frames,
-                gesture_positions=gesture_positions,
-                gesture_regions=gesture_regions,
-                ocr_results=full_screenshot_ocr,
-                transcript_text=" ".join(str(seg.get("text", "")) for seg in self.segments).strip(),
-                transcript_segments=self.segments,
-                trigger_events=trigger_events,
-                annotations=annotations,
+            # Heavy pipeline modules (numpy, PIL, cv2, OCR engines) are imported
+            # here so that opening the main window does not pay for them.
+            from screenreview.pipeline.metrics import MetricsRecorder
+
+            metrics = MetricsRecorder(self.screen.name, output_dir=self.screen.extraction_dir)
+            nodes = self.build_graph(metrics)
+            if self.journal is not None:
+                if self.job_id is None:
+                    self.job_id = self.journal.start_job(
+                        self.screen.name, self.screen.extraction_dir, self.video_path, self.audio_path, self.segments
+                    )
+                nodes = [self._journaled(node, self.journal, self.job_id) for node in nodes]
+            future = get_pipeline_queue(self.settings).add_graph(
+                self.screen.name, nodes, priority=self.priority, on_progress=self._on_node_progress, token=self.token
             )
-            
-            # Read metadata
-            import json
-            metadata = {}
-            if self.screen.metadata_path.exists():
-                try: metadata = json.loads(self.screen.metadata_path.read_text(encoding="utf-8"))
-                except: pass
-            
-            self.exporter.export(extraction, metadata=metadata, analysis_data={})
+            try:
+                future.result()
+            except Exception as exc:
+                # A future cancelled before any stage started raises CancelledError.
+                error = TaskCancelled(self.token.reason or "cancelled") if isinstance(exc, CancelledError) else exc
+                # Cancelled runs are not resumed either: they were superseded or timed out.
+                if self.journal is not None and self.job_id is not None:
+                    self.journal.fail_job(self.job_id, str(error))
+                if error is exc:
+                    raise
+                raise error from None
+            if self.journal is not None and self.job_id is not None:
+                self.journal.finish_job(self.job_id)
+
+            try:
+                metrics.save()
+            except OSError as exc:
+                logger.warning("PipelineWorker: Could not write metrics.json: %s", exc)
+            self.metrics.emit(metrics.to_dict())
             self.finished.emit(self.screen)
 
+        except TaskCancelled as e:
+            logger.info("PipelineWorker: Analysis of %s stopped: %s", self.screen.name, e)
+            self.cancelled.emit(str(e))
         except Exception as e:
             logger.exception("PipelineWorker: Analysis failed")
             self.error.emit(str(e))
+
+    def _on_node_progress(self, _screen_name: str, done: int, total: int, message: str) -> None:
+        action, _, name = message.partition(" ")
+        if action == "Starting":
+            self.progress.emit(done + 1, total, PIPELINE_STAGE_LABELS.get(name, name))
+
+    def _journaled(self, node: PipelineNode, journal: JobJournal, job_id: str) -> PipelineNode:
+        """Wrap a node so that it is skipped if the journal already holds its outputs."""
+
+        def run(inputs: dict[str, Any]) -> Any:
+            record = journal.completed_stage(job_id, node.name)
+            if record is not None:
+                logger.info("PipelineWorker: Resuming %s, skipping finished stage %s", self.screen.name, node.name)
+                return decode_result(record.result)
+            result = node.func(inputs)
+            journal.record_stage(job_id, node.name, result, self._stage_artifacts(node.name, result))
+            return result
+
+        return PipelineNode(node.name, run, deps=node.deps, resource=node.resource)
+
+    def _stage_artifacts(self, stage: str, result: Any) -> list[Path]:
+        """Files a finished stage must have left behind for it to be skipped on resume."""
+        extraction_dir = self.screen.extraction_dir
+        if stage == "structure":
+            return [extraction_dir]
+        if stage == "frames":
+            return [Path(path) for path in result]
+        if stage == "markings":
+            return [extraction_dir / item["region_image"] for item in result if item.get("region_image")]
+        if stage == "annotations":
+            return [extraction_dir / "gesture_annotations.json"]
+        return []
+
+    def build_graph(self, metrics: Any) -> list[PipelineNode]:
+        """Return the analysis stages of this screen as dependency graph nodes."""
+        from screenreview.pipeline import stage_tasks
+        from screenreview.pipeline.frame_extractor import DEFAULT_TRIGGER_TYPES, FrameExtractor, trigger_frame_times
+        from screenreview.pipeline.smart_selector import SmartSelector
+        from screenreview.utils.extraction_init import ExtractionInitializer
+        import cv2
+
+        extraction_dir = self.screen.extraction_dir
+        backend = get_pipeline_backend(self.settings)
+
+        # 1. Structure
+        def structure(_inputs: dict[str, Any]) -> None:
+            with metrics.stage("structure"):
+                ExtractionInitializer.ensure_structure(extraction_dir)
+                ExtractionInitializer.repair_structure(extraction_dir)
+
+        # 2. Frames (only around trigger words in trigger_based mode)
+        frame_cfg = self.settings.get("frame_extraction", {})
+        trigger_based = frame_cfg.get("method") == "trigger_based"
+
+        def frames(inputs: dict[str, Any]) -> list[Path]:
+            with metrics.stage("frames") as stage:
+                frame_extractor = FrameExtractor(fps=1)
+                target_times = trigger_frame_times(
+                    inputs.get("triggers") or [],
+                    window_seconds=float(frame_cfg.get("trigger_window_seconds", 1.0)),
+                    frames_per_trigger=int(frame_cfg.get("frames_per_trigger", 3)),
+                    trigger_types=tuple(frame_cfg.get("trigger_types", DEFAULT_TRIGGER_TYPES)),
+                    max_frames=int(frame_cfg.get("max_frames_per_screen", 20)),
+                ) if trigger_based else []
+                if target_times:
+                    all_frames = frame_extractor.extract_frames_at(
+                        self.video_path, extraction_dir / "frames", target_times, token=self.token
+                    )
+                else:
+                    all_frames = frame_extractor.extract_frames(self.video_path, extraction_dir / "frames", token=self.token)
+                stage.items = len(all_frames)
+            return all_frames
+
+        # 3. Gestures
+        def gestures(inputs: dict[str, Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+            with metrics.stage("gestures") as stage:
+                decoded = []
+                for frame_path in inputs["frames"][:3]:
+                    self.token.raise_if_cancelled()
+                    decoded.append(cv2.imread(str(frame_path)))
+                stage.items = len(decoded)
+                shared = [backend.share(frame) if frame is not None else None for frame in decoded]
+                try:
+                    return backend.run(stage_tasks.detect_gestures, shared, token=self.token)
+                finally:
+                    for handle in shared:
+                        backend.release(handle)
+
+        # 4. Brush Markings
+        def markings(_inputs: dict[str, Any]) -> list[dict[str, Any]]:
+            marking_annotations: list[dict[str, Any]] = []
+            # Stroke vectors if the screen has them, else a legacy overlay PNG.
+            annotations_path = extraction_dir / STROKES_FILENAME
+            if not annotations_path.exists():
+                annotations_path = extraction_dir / LEGACY_OVERLAY_FILENAME
+            with metrics.stage("markings") as stage:
+                if annotations_path.exists():
+                    stage.items, marking_annotations = backend.run(
+                        stage_tasks.analyze_markings,
+                        self.screen.screenshot_path,
+                        annotations_path,
+                        extraction_dir / "marked_regions",
+                        token=self.token,
+                    )
+            return marking_annotations
+
+        # 5. Full Screenshot OCR
+        def ocr(_inputs: dict[str, Any]) -> list[dict[str, Any]]:
+            with metrics.stage("ocr") as stage:
+                full_screenshot_ocr = backend.run(
+                    stage_tasks.run_screenshot_ocr, self.screen.screenshot_path, token=self.token
+                )
+                stage.items = len(full_screenshot_ocr)
+            return full_screenshot_ocr
+
+        # 6. Smart Select
+        def smart_select(inputs: dict[str, Any]) -> list[Path]:
+            with metrics.stage("smart_select") as stage:
+                smart_selector = SmartSelector()
+                selected_frames = smart_selector.select_frames(inputs["frames"], self.settings)
+                stage.items = len(selected_frames)
+            return selected_frames
+
+        # 7. Triggers
+        def triggers(_inputs: dict[str, Any]) -> list[dict[str, Any]]:
+            with metrics.stage("triggers") as stage:
+                trigger_events = self.transcriber.detect_trigger_words(self.segments, self.settings.get("trigger_words", {}))
+                stage.items = len(trigger_events)
+            return trigger_events
+
+        # 8. Annotations
+        def annotations(inputs: dict[str, Any]) -> list[dict[str, Any]]:
+            gesture_positions, gesture_regions = inputs["gestures"]
+            with metrics.stage("annotations") as stage:
+                frame_times = FrameExtractor.frame_times(inputs["frames"])
+                gesture_events = [
+                    {
+                        "timestamp": frame_times[region["frame_index"]] if region["frame_index"] < len(frame_times) else 0.0,
+                        "screenshot_position": pos,
+                    }
+                    for pos, region in zip(gesture_positions, gesture_regions)
+                ]
+                compiled = backend.run(
+                    stage_tasks.compile_gesture_annotations,
+                    extraction_dir.parent,
+                    gesture_events,
+                    self.segments,
+                    token=self.token,
+                )
+                compiled.extend(inputs["markings"])
+                stage.items = len(compiled)
+            return compiled
+
+        # 9. Export
+        def export(inputs: dict[str, Any]) -> None:
+            gesture_positions, gesture_regions = inputs["gestures"]
+            full_screenshot_ocr = inputs["ocr"]
+            with metrics.stage("export") as stage:
+                extraction = ExtractionResult(
+                    screen=self.screen,
+                    video_path=self.video_path,
+                    audio_path=self.audio_path,
+                    all_frames=inputs["frames"],
+                    selected_frames=inputs["smart_select"],
+                    gesture_positions=gesture_positions,
+                    gesture_regions=gesture_regions,
+                    ocr_results=full_screenshot_ocr,
+                    transcript_text=" ".join(str(seg.get("text", "")) for seg in self.segments).strip(),
+                    transcript_segments=self.segments,
+                    trigger_events=inputs["triggers"],
+                    annotations=inputs["annotations"],
+                )
+
+                # Read metadata
+                import json
+                metadata = {}
+                if self.screen.metadata_path.exists():
+                    try: metadata = json.loads(self.screen.metadata_path.read_text(encoding="utf-8"))
+                    except: pass
+
+                self.exporter.export(extraction, metadata=metadata, analysis_data={})
+                stage.items = 1
+
+        return [
+            PipelineNode("structure", structure, resource=RESOURCE_DISK),
+            PipelineNode(
+                "frames",
+                frames,
+                deps=("structure", "triggers") if trigger_based else ("structure",),
+                resource=RESOURCE_CPU,
+            ),
+            PipelineNode("gestures", gestures, deps=("frames",), resource=RESOURCE_MODEL),
+            PipelineNode("markings", markings, deps=("structure",), resource=RESOURCE_MODEL),
+            PipelineNode("ocr", ocr, deps=("structure",), resource=RESOURCE_MODEL),
+            PipelineNode("smart_select", smart_select, deps=("frames",), resource=RESOURCE_CPU),
+            PipelineNode("triggers", triggers, resource=RESOURCE_CPU),
+            PipelineNode("annotations", annotations, deps=("frames", "gestures", "markings"), resource=RESOURCE_CPU),
+            PipelineNode(
+                "export",
+                export,
+                deps=("frames", "gestures", "ocr", "smart_select", "triggers", "annotations"),
+                resource=RESOURCE_DISK,
+            ),
+        ]
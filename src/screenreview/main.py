@@ -17,9 +17,8 @@ from PyQt6.QtWidgets import QApplication, QMessageBox
 
 from screenreview.config import load_config
 from screenreview.core.precheck import analyze_missing_screen_files, format_missing_file_report
-from screenreview.gui.main_window import MainWindow
+from screenreview.utils.lazy_imports import StartupTimer
 from screenreview.utils.logger import setup_session_logging
-from screenreview.pipeline.ocr_engines import OcrEngineFactory
 import traceback
 
 def global_exception_handler(exc_type, exc_value, exc_traceback):
@@ -43,21 +42,29 @@ def global_exception_handler(exc_type, exc_value, exc_traceback):
 sys.excepthook = global_exception_handler
 
 class _OcrProbeThread(QThread):
-    """Background thread to pre-load heavy OCR libraries."""
+    """Background thread to probe OCR engines without blocking the GUI."""
     def run(self):
         try:
+            from screenreview.pipeline.ocr_engines import OcrEngineFactory
+
             OcrEngineFactory.get_available_engines()
         except Exception: pass
 
 
 def main() -> int:
     """Start the GUI application."""
-    session_log_path = setup_session_logging(Path.cwd(), "multimedia-feedback-coding")
+    startup_timer = StartupTimer()
+    settings = load_config()
+    startup_timer.mark("config")
+    session_log_path = setup_session_logging(
+        Path.cwd(), "multimedia-feedback-coding", settings.get("logging")
+    )
     logger = logging.getLogger(__name__)
+    startup_timer.mark("logging")
     app = QApplication(sys.argv)
+    startup_timer.mark("qapplication")
     if session_log_path is not None:
         logger.info("Session log file: %s", session_log_path)
-    settings = load_config()
     startup_project_dir: Path | None = None
     
     # Check for command-line argument first
@@ -84,15 +91,21 @@ def main() -> int:
                 "Pre-Start File Report",
                 format_missing_file_report(report),
             )
+    startup_timer.mark("precheck")
 
     # Start background OCR probe to avoid delay in settings
     probe_thread = _OcrProbeThread()
     probe_thread.start()
 
+    from screenreview.gui.main_window import MainWindow
+
+    startup_timer.mark("import_main_window")
     window = MainWindow(settings=settings)
+    startup_timer.mark("main_window_init")
     
     if startup_project_dir is not None:
         window.load_project(startup_project_dir)
+        startup_timer.mark("load_project")
     
     # Wayland/WSLg Stability: Deeply delayed window mapping and maximization.
     # We delay show() itself to let the QApplication fully settle, 
@@ -115,10 +128,23 @@ def main() -> int:
         QTimer.singleShot(1600, window.raise_)
         QTimer.singleShot(1600, window.activateWindow)
 
+        startup_timer.mark("window_shown")
+        try:
+            startup_timer.write_report(Path.cwd() / "logs" / "startup_timing.json")
+        except OSError as exc:
+            logger.warning("Could not write startup timing report: %s", exc)
+
     QTimer.singleShot(100, perform_launch)
     
     # Keep probe_thread alive during startup
     app.aboutToQuit.connect(probe_thread.wait)
+    from screenreview.gui.workers import shutdown_pipeline_executors
+
+    # Let a stopped take finish joining its segments (otherwise it is recovered on the next open).
+    app.aboutToQuit.connect(window.controller.recorder.wait_for_join)
+    app.aboutToQuit.connect(shutdown_pipeline_executors)
+    app.aboutToQuit.connect(window.controller.prefetcher.shutdown)
+    app.aboutToQuit.connect(window.controller.shutdown_thumbnails)
     
     return app.exec()
 
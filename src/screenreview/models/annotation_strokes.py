@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Brush annotations stored as stroke vectors instead of a full-size overlay image."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STROKES_FILENAME = "annotation_strokes.json"
+LEGACY_OVERLAY_FILENAME = "annotation_overlay.png"
+FORMAT_VERSION = 1
+
+DEFAULT_STROKE_COLOR = (255, 255, 0, 80)
+
+
+@dataclass
+class Stroke:
+    """One brush stroke: a polyline in screenshot pixels drawn with a round pen."""
+
+    points: list[tuple[int, int]]
+    width: int = 20
+    color: tuple[int, int, int, int] = DEFAULT_STROKE_COLOR
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """(x_min, y_min, x_max, y_max) of the painted area, pen width included."""
+        xs = [x for x, _ in self.points]
+        ys = [y for _, y in self.points]
+        half = (self.width + 1) // 2
+        return min(xs) - half, min(ys) - half, max(xs) + half, max(ys) + half
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"points": [list(point) for point in self.points], "width": self.width, "color": list(self.color)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Stroke":
+        return cls(
+            points=[(int(x), int(y)) for x, y in data.get("points", [])],
+            width=int(data.get("width", 20)),
+            color=tuple(int(c) for c in data.get("color", DEFAULT_STROKE_COLOR)),  # type: ignore[arg-type]
+        )
+
+
+@dataclass
+class AnnotationStrokes:
+    """All annotations of one screen, persisted as ``annotation_strokes.json``.
+
+    ``raster`` names a legacy overlay PNG (relative to the JSON file) whose
+    pixels are still part of the drawing, for screens annotated before the
+    vector format existed.
+    """
+
+    width: int
+    height: int
+    strokes: list[Stroke] = field(default_factory=list)
+    raster: str | None = None
+
+    def is_empty(self) -> bool:
+        return not self.strokes and not self.raster
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "version": FORMAT_VERSION,
+            "width": self.width,
+            "height": self.height,
+            "strokes": [stroke.to_dict() for stroke in self.strokes if stroke.points],
+        }
+        if self.raster:
+            data["raster"] = self.raster
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AnnotationStrokes":
+        return cls(
+            width=int(data["width"]),
+            height=int(data["height"]),
+            strokes=[Stroke.from_dict(item) for item in data.get("strokes", [])],
+            raster=data.get("raster") or None,
+        )
+
+    def save(self, path: Path) -> Path:
+        """Write atomically so a crash never leaves a half-written file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "AnnotationStrokes | None":
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable annotation strokes %s: %s", path, exc)
+            return None
@@ -7,15 +7,94 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from PIL import Image
+from PIL import Image, ImageDraw
 import numpy as np
 
+from screenreview.models.annotation_strokes import AnnotationStrokes
+
 logger = logging.getLogger(__name__)
 
+# Markings closer than this (in both axes) are treated as one region.
+CLUSTER_DISTANCE = 50
+REGION_PADDING = 15
+
+
+def _region(x_min: int, y_min: int, x_max: int, y_max: int) -> dict[str, Any]:
+    return {
+        "bbox": {
+            "top_left": {"x": int(x_min), "y": int(y_min)},
+            "bottom_right": {"x": int(x_max), "y": int(y_max)},
+        },
+        "type": "brush_marking",
+    }
+
 
 class AnnotationAnalyzer:
     """Extract bounding boxes and content from annotation overlays."""
 
+    def analyze_annotations(self, image_path: Path, annotations_path: Path) -> list[dict[str, Any]]:
+        """Analyze ``annotation_strokes.json`` or, for older screens, an overlay PNG."""
+        if annotations_path.suffix.lower() != ".json":
+            return self.analyze_overlay(image_path, annotations_path)
+        strokes = AnnotationStrokes.load(annotations_path)
+        if strokes is None or not image_path.exists():
+            return []
+        regions = self.analyze_strokes(strokes)
+        if strokes.raster:
+            regions.extend(self.analyze_overlay(image_path, annotations_path.parent / strokes.raster))
+        return regions
+
+    def analyze_strokes(self, strokes: AnnotationStrokes) -> list[dict[str, Any]]:
+        """Cluster stroke bounding boxes into marked regions without rasterizing anything."""
+        boxes = [list(stroke.bounds()) for stroke in strokes.strokes if stroke.points]
+        # Merge boxes until no two are within CLUSTER_DISTANCE of each other.
+        merged = True
+        while merged and len(boxes) > 1:
+            merged = False
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    a, b = boxes[i], boxes[j]
+                    gap_x = max(a[0], b[0]) - min(a[2], b[2])
+                    gap_y = max(a[1], b[1]) - min(a[3], b[3])
+                    if gap_x < CLUSTER_DISTANCE and gap_y < CLUSTER_DISTANCE:
+                        boxes[i] = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                        del boxes[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        regions = []
+        for x_min, y_min, x_max, y_max in sorted(boxes, key=lambda box: (box[1], box[0])):
+            regions.append(
+                _region(
+                    max(0, x_min - REGION_PADDING),
+                    max(0, y_min - REGION_PADDING),
+                    min(strokes.width, x_max + REGION_PADDING),
+                    min(strokes.height, y_max + REGION_PADDING),
+                )
+            )
+        logger.info("AnnotationAnalyzer: Found %d markings in %d strokes", len(regions), len(strokes.strokes))
+        return regions
+
+    def render_overlay(self, strokes: AnnotationStrokes, output_path: Path, base_dir: Path | None = None) -> Path:
+        """Rasterize strokes into a transparent overlay PNG, only when an image is needed."""
+        overlay = Image.new("RGBA", (strokes.width, strokes.height), (0, 0, 0, 0))
+        if strokes.raster and base_dir is not None and (base_dir / strokes.raster).exists():
+            overlay = Image.open(base_dir / strokes.raster).convert("RGBA").resize(overlay.size)
+        for stroke in strokes.strokes:
+            layer = Image.new("RGBA", overlay.size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(layer)
+            if len(stroke.points) > 1:
+                draw.line(stroke.points, fill=stroke.color, width=stroke.width, joint="curve")
+            radius = stroke.width / 2
+            for x, y in (stroke.points[0], stroke.points[-1]):
+                draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=stroke.color)
+            overlay = Image.alpha_composite(overlay, layer)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        overlay.save(output_path)
+        return output_path
+
     def analyze_overlay(self, image_path: Path, overlay_path: Path) -> list[dict[str, Any]]:
         """Find marked regions in the overlay and crop corresponding parts of the image."""
         if not overlay_path.exists() or not image_path.exists():
@@ -58,7 +137,7 @@ class AnnotationAnalyzer:
                         # Optimization: check last added ones
                         for cluster_coord in current_cluster[-50:]:
                             cc_y, cc_x = cluster_coord
-                            if abs(c_y - cc_y) < 50 and abs(c_x - cc_x) < 50:
+                            if abs(c_y - cc_y) < CLUSTER_DISTANCE and abs(c_x - cc_x) < CLUSTER_DISTANCE:
                                 is_close = True
                                 break
                         
@@ -75,19 +154,13 @@ class AnnotationAnalyzer:
                 y_min, x_min = cluster_arr.min(axis=0)
                 y_max, x_max = cluster_arr.max(axis=0)
                 
-                padding = 15
+                padding = REGION_PADDING
                 x_min = max(0, x_min - padding)
                 y_min = max(0, y_min - padding)
                 x_max = min(ov_data.shape[1], x_max + padding)
                 y_max = min(ov_data.shape[0], y_max + padding)
 
-                regions.append({
-                    "bbox": {
-                        "top_left": {"x": int(x_min), "y": int(y_min)},
-                        "bottom_right": {"x": int(x_max), "y": int(y_max)},
-                    },
-                    "type": "brush_marking",
-                })
+                regions.append(_region(x_min, y_min, x_max, y_max))
             
             logger.info("AnnotationAnalyzer: Found %d markings", len(regions))
             return regions
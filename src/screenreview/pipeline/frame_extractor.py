@@ -9,8 +9,61 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from screenreview.core.cancellation import CancellationToken, TaskCancelled, run_cancellable
+from screenreview.pipeline.video_timeline import DEFAULT_FPS, VideoTimeline
+from screenreview.utils.lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+
 logger = logging.getLogger(__name__)
 
+# Written next to the extracted frames: {"frame_0001.png": seconds, ...}
+FRAME_TIMES_FILENAME = "frame_times.json"
+# Temporary filtergraph for index-based selection; one term per frame would
+# overflow the command line (32K on Windows) for longer recordings.
+SELECT_SCRIPT_FILENAME = ".select_frames.txt"
+DEFAULT_TRIGGER_TYPES = ("extract_frame",)
+
+
+def trigger_frame_times(
+    trigger_events: list[dict[str, Any]],
+    window_seconds: float = 1.0,
+    frames_per_trigger: int = 3,
+    trigger_types: tuple[str, ...] | list[str] = DEFAULT_TRIGGER_TYPES,
+    max_frames: int | None = None,
+) -> list[float]:
+    """Times to grab around each trigger event, spread evenly over ``window_seconds``.
+
+    Uses the event's estimated ``word_time`` when present, else the segment
+    start in ``time``. Returns sorted, de-duplicated times >= 0. ``max_frames``
+    is shared across triggers: every trigger gets its centre frame first, then
+    the offsets closest to the centre are added round-robin, so a late trigger
+    is never starved by early ones. With more triggers than ``max_frames`` an
+    evenly spaced subset of them keeps its centre frame.
+    """
+    count = max(1, int(frames_per_trigger))
+    if count == 1 or window_seconds <= 0:
+        offsets = [0.0]
+    else:
+        step = window_seconds / (count - 1)
+        offsets = [-window_seconds / 2 + i * step for i in range(count)]
+    offsets.sort(key=abs)
+    centers = sorted(
+        float(event.get("word_time", event.get("time", 0.0)))
+        for event in trigger_events
+        if event.get("type") in trigger_types
+    )
+    if max_frames and len(centers) > max_frames:
+        step = len(centers) / max_frames
+        centers = [centers[int(i * step)] for i in range(max_frames)]
+    times: set[float] = set()
+    for offset in offsets:
+        for center in centers:
+            if max_frames and len(times) >= max_frames:
+                return sorted(times)
+            times.add(round(max(0.0, center + offset), 3))
+    return sorted(times)
+
 
 class FrameExtractor:
     """Extract frames from video files using FFmpeg."""
@@ -18,9 +71,26 @@ class FrameExtractor:
     def __init__(self, fps: float = 1.0) -> None:
         self.fps = fps  # Frames per second to extract
 
+    @staticmethod
+    def frame_times(frame_paths: list[Path], fps: float = 1.0) -> list[float]:
+        """Recording time of each extracted frame, from ``frame_times.json`` or ``index / fps``."""
+        known: dict[str, float] = {}
+        if frame_paths:
+            times_path = Path(frame_paths[0]).parent / FRAME_TIMES_FILENAME
+            if times_path.exists():
+                try:
+                    known = {str(k): float(v) for k, v in json.loads(times_path.read_text(encoding="utf-8")).items()}
+                except (OSError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning(f"Ignoring unreadable {times_path}: {e}")
+        return [known.get(Path(path).name, i / fps if fps > 0 else float(i)) for i, path in enumerate(frame_paths)]
+
     def extract_frames(self, video_path: Path, output_dir: Path,
-                      prefix: str = "frame_", start_time: float = 0.0) -> list[Path]:
-        """Extract frames from video at specified intervals."""
+                      prefix: str = "frame_", start_time: float = 0.0,
+                      token: CancellationToken | None = None) -> list[Path]:
+        """Extract frames from video at specified intervals.
+
+        Cancelling ``token`` terminates FFmpeg and raises ``TaskCancelled``.
+        """
         logger.info(f"[B1] Starting frame extraction for video: {video_path}")
         logger.debug(f"[B1] Output directory: {output_dir}")
         logger.debug(f"[B1] Prefix: {prefix}, start_time: {start_time}")
@@ -39,14 +109,28 @@ class FrameExtractor:
         logger.debug(f"[B1] Creating output directory: {output_dir}")
         output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"[B1] Output directory created/verified: {output_dir}")
+        (output_dir / FRAME_TIMES_FILENAME).unlink(missing_ok=True)
 
         # FFmpeg command to extract frames
         output_pattern = output_dir / f"{prefix}%04d.png"
 
+        # The container claims a constant frame rate, but the recorder drops and
+        # delays frames, so with capture timestamps pick the frames by index.
+        timeline = VideoTimeline.for_video(video_path)
+        frame_indices = timeline.sample_frames(1.0 / self.fps) if timeline.has_timestamps and self.fps > 0 else []
+        select_script = output_dir / SELECT_SCRIPT_FILENAME
+        if frame_indices:
+            selection = "+".join(f"eq(n\\,{index})" for index in frame_indices)
+            select_script.write_text(f"select='{selection}'", encoding="utf-8")
+            video_filter = ["-filter_script:v", str(select_script), "-vsync", "0"]
+            logger.debug(f"[B1] Selecting {len(frame_indices)} frames by capture timestamp")
+        else:
+            video_filter = ["-vf", f"fps={self.fps}"]  # Extract at specified FPS
+
         cmd = [
             "ffmpeg",
             "-i", str(video_path),  # Input video
-            "-vf", f"fps={self.fps}",  # Extract at specified FPS
+            *video_filter,
             "-start_number", "1",  # Start numbering from 1
             "-q:v", "2",  # Quality setting (2 = high quality)
             "-y",  # Overwrite output files
@@ -57,12 +141,7 @@ class FrameExtractor:
         logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            result = run_cancellable(cmd, token=token, timeout=300)  # 5 minute timeout
 
             if result.returncode != 0:
                 logger.error(f"FFmpeg failed: {result.stderr}")
@@ -75,6 +154,13 @@ class FrameExtractor:
             for frame_file in sorted(output_dir.glob(f"{prefix}*.png")):
                 extracted_frames.append(frame_file)
 
+            if frame_indices:
+                times = {
+                    path.name: round(timeline.time_of(index), 4)
+                    for path, index in zip(extracted_frames, frame_indices)
+                }
+                (output_dir / FRAME_TIMES_FILENAME).write_text(json.dumps(times, indent=2), encoding="utf-8")
+
             logger.info(f"Extracted {len(extracted_frames)} frames")
             return extracted_frames
 
@@ -84,9 +170,94 @@ class FrameExtractor:
         except subprocess.TimeoutExpired:
             logger.error("FFmpeg extraction timed out (>5 minutes)")
             return []
+        except TaskCancelled:
+            logger.info(f"[B1] Frame extraction cancelled for {video_path}")
+            raise
         except Exception as e:
             logger.error(f"Frame extraction failed: {e}")
             return []
+        finally:
+            select_script.unlink(missing_ok=True)
+
+    def extract_frames_at(self, video_path: Path, output_dir: Path, times: list[float],
+                          prefix: str = "frame_",
+                          token: CancellationToken | None = None) -> list[Path]:
+        """Extract only the frames captured closest to ``times`` (seconds).
+
+        Seeks straight to each frame instead of decoding the whole video, so
+        the work scales with the number of requested frames. Times are mapped
+        through the capture timestamps when the recording has them.
+        """
+        logger.info(f"[B1] Extracting {len(times)} targeted frames from {video_path}")
+        if not video_path.exists():
+            logger.error(f"[B1] Video file does not exist: {video_path}")
+            raise FileNotFoundError(video_path)
+        if video_path.stat().st_size < 1024 or not times:
+            return []
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for stale in output_dir.glob(f"{prefix}*.png"):
+            stale.unlink(missing_ok=True)
+        (output_dir / FRAME_TIMES_FILENAME).unlink(missing_ok=True)
+
+        capture = cv2.VideoCapture(str(video_path)) if cv2 else None
+        try:
+            if capture is not None and not capture.isOpened():
+                capture.release()
+                capture = None
+            container_fps = float(capture.get(cv2.CAP_PROP_FPS)) if capture is not None else 0.0
+            container_fps = container_fps if container_fps > 0 else DEFAULT_FPS
+            timeline = VideoTimeline.for_video(video_path, nominal_fps=container_fps)
+            indices = sorted({timeline.frame_at(t) for t in times})
+            frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) if capture is not None else 0
+            if frame_count > 0:
+                indices = sorted({min(index, frame_count - 1) for index in indices})
+
+            extracted: list[Path] = []
+            frame_times: dict[str, float] = {}
+            for index in indices:
+                if token is not None:
+                    token.raise_if_cancelled()
+                target = output_dir / f"{prefix}{len(extracted) + 1:04d}.png"
+                if capture is not None:
+                    ok = self._grab_frame_opencv(capture, index, target)
+                else:
+                    ok = self._grab_frame_ffmpeg(video_path, index / container_fps, target, token)
+                if ok:
+                    extracted.append(target)
+                    frame_times[target.name] = round(timeline.time_of(index), 4)
+        finally:
+            if capture is not None:
+                capture.release()
+
+        if extracted:
+            (output_dir / FRAME_TIMES_FILENAME).write_text(json.dumps(frame_times, indent=2), encoding="utf-8")
+        logger.info(f"Extracted {len(extracted)} targeted frames")
+        return extracted
+
+    @staticmethod
+    def _grab_frame_opencv(capture: Any, index: int, target: Path) -> bool:
+        capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ok, frame = capture.read()
+        if not ok or frame is None:
+            logger.warning(f"[B1] Could not decode frame {index}")
+            return False
+        return bool(cv2.imwrite(str(target), frame))
+
+    @staticmethod
+    def _grab_frame_ffmpeg(video_path: Path, seconds: float, target: Path,
+                           token: CancellationToken | None) -> bool:
+        # -ss before -i seeks in the input, so only frames from the nearest keyframe are decoded.
+        cmd = ["ffmpeg", "-ss", f"{seconds:.3f}", "-i", str(video_path), "-frames:v", "1", "-q:v", "2", "-y", str(target)]
+        try:
+            result = run_cancellable(cmd, token=token, timeout=60)
+        except FileNotFoundError as e:
+            logger.error(f"FFmpeg not found: {e}. Please install FFmpeg and add to PATH.")
+            return False
+        except subprocess.TimeoutExpired:
+            logger.error(f"FFmpeg seek to {seconds:.2f}s timed out")
+            return False
+        return result.returncode == 0 and target.exists()
 
     def get_video_info(self, video_path: Path) -> dict[str, Any]:
         """Get video information using FFmpeg."""
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Triple-buffered hand-off of the latest camera frame from capture to preview."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from screenreview.utils.lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_MAX_WIDTH = 640
+
+
+class FrameSlot:
+    """Latest-frame slot shared by one capture thread and any number of readers.
+
+    ``publish`` downscales the frame once (to at most ``max_width``) straight
+    into one of three preallocated buffers and bumps a generation counter;
+    the camera frame itself is never kept. A buffer is only rewritten when it
+    is neither the latest one nor pinned by a reader, so ``read`` can hand
+    out read-only views without copying. Readers pass the generation they
+    already showed to skip unchanged frames.
+    """
+
+    BUFFERS = 3
+
+    def __init__(self, max_width: int = PREVIEW_MAX_WIDTH) -> None:
+        self.max_width = max(1, int(max_width))
+        self._lock = threading.Lock()
+        self._buffers: list[Any] = [None] * self.BUFFERS
+        self._pins = [0] * self.BUFFERS
+        self._latest = -1
+        self._writing = -1
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def publish(self, frame: Any) -> int:
+        """Store a downscaled version of ``frame``; returns its generation (0 if dropped)."""
+        if not hasattr(frame, "shape") or len(frame.shape) < 2:
+            return 0
+        height, width = int(frame.shape[0]), int(frame.shape[1])
+        if width > self.max_width:
+            size = (self.max_width, max(1, round(height * self.max_width / width)))
+        else:
+            size = (width, height)
+        with self._lock:
+            index = next(
+                (
+                    i
+                    for i in range(self.BUFFERS)
+                    if i not in (self._latest, self._writing) and self._pins[i] == 0
+                ),
+                -1,
+            )
+            if index < 0:
+                # Every other buffer is pinned by a slow reader: drop this frame.
+                return 0
+            self._writing = index
+        shape = (size[1], size[0]) + tuple(frame.shape[2:])
+        buffer = self._buffers[index]
+        if buffer is None or buffer.shape != shape or buffer.dtype != frame.dtype:
+            buffer = np.empty(shape, dtype=frame.dtype)
+        if size == (width, height):
+            np.copyto(buffer, frame)
+        else:
+            cv2.resize(frame, size, dst=buffer, interpolation=cv2.INTER_AREA)
+        with self._lock:
+            self._buffers[index] = buffer
+            self._writing = -1
+            self._latest = index
+            self._generation += 1
+            return self._generation
+
+    @contextmanager
+    def read(self, since: int = 0) -> Iterator[tuple[int, Any]]:
+        """Pin the latest frame and yield ``(generation, read-only view)``.
+
+        Yields ``(generation, None)`` if nothing newer than ``since`` exists.
+        The view must not be used after the ``with`` block.
+        """
+        with self._lock:
+            index = self._latest
+            generation = self._generation
+            if index < 0 or generation <= since:
+                index = -1
+            else:
+                self._pins[index] += 1
+                view = self._buffers[index].view()
+        if index < 0:
+            yield generation, None
+            return
+        view.flags.writeable = False
+        try:
+            yield generation, view
+        finally:
+            with self._lock:
+                self._pins[index] -= 1
+
+    def latest_copy(self) -> Any:
+        """Independent copy of the latest (already downscaled) frame, or None."""
+        with self.read() as (_, frame):
+            return None if frame is None else frame.copy()
+
+    def clear(self) -> None:
+        """Forget the latest frame; generations keep counting up."""
+        with self._lock:
+            self._latest = -1
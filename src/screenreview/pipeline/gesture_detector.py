@@ -4,8 +4,11 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Any
 
+from screenreview.pipeline.video_timeline import VideoTimeline
+
 logger = logging.getLogger(__name__)
 
 
@@ -182,6 +185,8 @@ class GestureDetector:
             fps = cap.get(cv2.CAP_PROP_FPS)
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
             logger.info(f"[B3] Video opened: {total_frames} frames at {fps} FPS")
+            # Capture timestamps keep gesture times on the audio clock despite dropped frames.
+            timeline = VideoTimeline.for_video(Path(video_path), nominal_fps=fps)
 
             gesture_events = []
             frame_index = 0
@@ -203,7 +208,7 @@ class GestureDetector:
                         screenshot_height
                     )
 
-                    timestamp = frame_index / fps if fps > 0 else frame_index
+                    timestamp = timeline.time_of(frame_index)
 
                     gesture_events.append({
                         "timestamp": round(timestamp, 2),
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""Per-stage pipeline metrics (wall/CPU time, peak RSS, items, bytes written)."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from screenreview.utils.file_utils import read_json_file, write_json_file
+
+try:  # Not available on Windows
+    import resource
+except ImportError:  # pragma: no cover - platform dependent
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILENAME = "metrics.json"
+PROJECT_METRICS_FILENAME = "pipeline_metrics.json"
+
+
+def _windows_peak_rss_bytes() -> int | None:
+    """Peak working set via psutil, else ``GetProcessMemoryInfo`` (no ``resource`` on Windows)."""
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().peak_wset)
+    except (ImportError, AttributeError, OSError):
+        pass
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.WinDLL("kernel32")
+        psapi = ctypes.WinDLL("psapi")
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return int(counters.PeakWorkingSetSize)
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def peak_rss_mb() -> float | None:
+    """Return the peak resident set size of this process in MiB, if known."""
+    if resource is None:
+        peak_bytes = _windows_peak_rss_bytes()
+        return round(peak_bytes / (1024 * 1024), 1) if peak_bytes is not None else None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def tree_size(path: Path) -> int:
+    """Return the total size in bytes of all files below ``path``."""
+    if not path.exists():
+        return 0
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+@dataclass
+class StageMetrics:
+    """Measurements for one pipeline stage of one screen."""
+
+    name: str
+    started_offset: float = 0.0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_mb: float | None = None
+    items: int = 0
+    bytes_written: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["started_offset"] = round(self.started_offset, 4)
+        data["wall_seconds"] = round(self.wall_seconds, 4)
+        data["cpu_seconds"] = round(self.cpu_seconds, 4)
+        return data
+
+
+class MetricsRecorder:
+    """Collect stage metrics for one screen and persist them to ``.extraction``.
+
+    CPU time is measured with ``time.thread_time`` so that concurrently running
+    screens do not inflate each other's numbers; native libraries that spawn
+    their own threads (OCR backends) are therefore only partially accounted,
+    and stages handed to the process backend report only the parent's share.
+    Bytes written are the net growth of the output directory during the stage,
+    measured against the size seen when the previous stage ended, so the
+    directory is walked once per stage; when stages of one screen run
+    concurrently, files written by a parallel stage may be attributed to
+    whichever stage finishes later.
+
+    ``elapsed_seconds`` is the wall time from the first stage start to the last
+    stage end, i.e. the critical path when stages overlap, whereas
+    ``total_wall_seconds`` remains the sum of all stage times.
+    """
+
+    def __init__(self, screen_name: str, output_dir: Path | None = None) -> None:
+        self.screen_name = screen_name
+        self.output_dir = output_dir
+        self.stages: list[StageMetrics] = []
+        self._started = time.time()
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        # Output directory size after the most recent stage (None until first measured).
+        self._last_size: int | None = None
+
+    def _size_baseline(self) -> int:
+        with self._lock:
+            if self._last_size is None:
+                self._last_size = tree_size(self.output_dir) if self.output_dir else 0
+            return self._last_size
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """Measure the enclosed block; callers may set ``items`` on the yielded object.
+
+        Safe to use from several threads at once.
+        """
+        entry = StageMetrics(name=name)
+        bytes_before = self._size_baseline() if self.output_dir else 0
+        wall_start = time.perf_counter()
+        entry.started_offset = wall_start - self._origin
+        cpu_start = time.thread_time()
+        try:
+            yield entry
+        finally:
+            entry.wall_seconds = time.perf_counter() - wall_start
+            entry.cpu_seconds = time.thread_time() - cpu_start
+            entry.peak_rss_mb = peak_rss_mb()
+            size_after = tree_size(self.output_dir) if self.output_dir else 0
+            if self.output_dir:
+                entry.bytes_written = max(0, size_after - bytes_before)
+            with self._lock:
+                self._last_size = size_after
+                self.stages.append(entry)
+                self.stages.sort(key=lambda s: s.started_offset)
+            logger.debug(
+                "Stage %s for %s: %.3fs wall, %.3fs cpu, %d items, %d bytes",
+                name,
+                self.screen_name,
+                entry.wall_seconds,
+                entry.cpu_seconds,
+                entry.items,
+                entry.bytes_written,
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            recorded = list(self.stages)
+        stages = [stage.to_dict() for stage in recorded]
+        bottleneck = max(recorded, key=lambda s: s.wall_seconds, default=None)
+        rss_values = [s.peak_rss_mb for s in recorded if s.peak_rss_mb is not None]
+        if recorded:
+            first_start = min(s.started_offset for s in recorded)
+            last_end = max(s.started_offset + s.wall_seconds for s in recorded)
+            elapsed = last_end - first_start
+        else:
+            elapsed = 0.0
+        return {
+            "screen": self.screen_name,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self._started)),
+            "total_wall_seconds": round(sum(s.wall_seconds for s in recorded), 4),
+            "elapsed_seconds": round(elapsed, 4),
+            "total_cpu_seconds": round(sum(s.cpu_seconds for s in recorded), 4),
+            "peak_rss_mb": max(rss_values) if rss_values else None,
+            "total_bytes_written": sum(s.bytes_written for s in recorded),
+            "bottleneck": bottleneck.name if bottleneck else None,
+            "stages": stages,
+        }
+
+    def save(self, extraction_dir: Path | None = None) -> Path:
+        """Write ``metrics.json`` into the extraction directory."""
+        target_dir = extraction_dir or self.output_dir
+        if target_dir is None:
+            raise ValueError("No extraction directory given for metrics")
+        return write_json_file(Path(target_dir) / METRICS_FILENAME, self.to_dict())
+
+
+def load_metrics(extraction_dir: Path) -> dict[str, Any] | None:
+    """Load a screen's ``metrics.json`` or return None if it is missing or invalid."""
+    path = Path(extraction_dir) / METRICS_FILENAME
+    if not path.exists():
+        return None
+    try:
+        return read_json_file(path)
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable metrics file: %s", path)
+        return None
+
+
+class ProjectMetrics:
+    """Per-stage totals over a project's screens, updated one screen at a time.
+
+    ``update`` replaces a screen's previous contribution instead of
+    re-reading every ``metrics.json``, so a finished job costs the same
+    regardless of project size.
+    """
+
+    def __init__(self) -> None:
+        self._screens: dict[str, dict[str, Any]] = {}
+        self._stages: dict[str, dict[str, Any]] = {}
+        # Sorted stage wall times, for max_wall_seconds after a screen is replaced.
+        self._walls: dict[str, list[float]] = {}
+        self._total_wall = 0.0
+
+    @classmethod
+    def from_extraction_dirs(cls, extraction_dirs: Iterable[Path]) -> "ProjectMetrics":
+        project = cls()
+        for extraction_dir in extraction_dirs:
+            metrics = load_metrics(extraction_dir)
+            if metrics is not None:
+                project.update(str(extraction_dir), metrics)
+        return project
+
+    def update(self, key: str, metrics: dict[str, Any]) -> None:
+        """Set the metrics of screen ``key`` (e.g. its extraction dir), replacing older ones."""
+        previous = self._screens.pop(key, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        self._screens[key] = metrics
+        self._apply(metrics, 1)
+
+    def _apply(self, metrics: dict[str, Any], sign: int) -> None:
+        self._total_wall += sign * float(metrics.get("total_wall_seconds", 0.0))
+        for stage in metrics.get("stages", []):
+            name = stage["name"]
+            agg = self._stages.setdefault(
+                name,
+                {"runs": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "items": 0, "bytes_written": 0},
+            )
+            walls = self._walls.setdefault(name, [])
+            wall = float(stage.get("wall_seconds", 0.0))
+            agg["runs"] += sign
+            agg["wall_seconds"] += sign * wall
+            agg["cpu_seconds"] += sign * float(stage.get("cpu_seconds", 0.0))
+            agg["items"] += sign * int(stage.get("items", 0))
+            agg["bytes_written"] += sign * int(stage.get("bytes_written", 0))
+            if sign > 0:
+                bisect.insort(walls, wall)
+            else:
+                index = bisect.bisect_left(walls, wall)
+                if index < len(walls) and walls[index] == wall:
+                    walls.pop(index)
+            if agg["runs"] <= 0:
+                del self._stages[name]
+                del self._walls[name]
+
+    def summary(self) -> dict[str, Any]:
+        stages: dict[str, dict[str, Any]] = {}
+        for name, agg in self._stages.items():
+            wall = max(0.0, agg["wall_seconds"])
+            stages[name] = {
+                "runs": agg["runs"],
+                "wall_seconds": round(wall, 4),
+                "cpu_seconds": round(max(0.0, agg["cpu_seconds"]), 4),
+                "max_wall_seconds": round(self._walls[name][-1] if self._walls[name] else 0.0, 4),
+                "items": agg["items"],
+                "bytes_written": agg["bytes_written"],
+                "mean_wall_seconds": round(wall / agg["runs"], 4),
+                "share": round(wall / self._total_wall, 4) if self._total_wall > 0 else 0.0,
+            }
+        bottleneck = max(stages, key=lambda name: stages[name]["wall_seconds"], default=None)
+        return {
+            "screens": len(self._screens),
+            "total_wall_seconds": round(max(0.0, self._total_wall), 4),
+            "bottleneck": bottleneck,
+            "stages": stages,
+        }
+
+    def write(self, project_dir: Path) -> dict[str, Any]:
+        """Write ``pipeline_metrics.json`` and return the summary."""
+        summary = self.summary()
+        write_json_file(Path(project_dir) / PROJECT_METRICS_FILENAME, summary)
+        return summary
+
+
+def aggregate_metrics(screen_metrics: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Combine per-screen metrics into per-stage totals for the whole project."""
+    project = ProjectMetrics()
+    for index, metrics in enumerate(screen_metrics):
+        project.update(str(index), metrics)
+    return project.summary()
+
+
+def write_project_metrics(project_dir: Path, extraction_dirs: Iterable[Path]) -> dict[str, Any]:
+    """Aggregate all available screen metrics and write ``pipeline_metrics.json``."""
+    return ProjectMetrics.from_extraction_dirs(extraction_dirs).write(project_dir)
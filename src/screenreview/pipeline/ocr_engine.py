@@ -9,14 +9,14 @@ from pathlib import Path
 from typing import Any
 
 from screenreview.utils.file_utils import write_json_file
+from screenreview.utils.lazy_imports import lazy_import
 
 logger = logging.getLogger(__name__)
 
-try:
-    import easyocr
-    EASYOCR_AVAILABLE = True
-except ImportError:
-    EASYOCR_AVAILABLE = False
+# Deferred: the real import (torch and friends) happens when a Reader is built.
+easyocr = lazy_import("easyocr")
+EASYOCR_AVAILABLE = easyocr is not None
+if not EASYOCR_AVAILABLE:
     logger.warning("EasyOCR not available. Install with: pip install easyocr")
 
 
@@ -38,7 +38,7 @@ class OcrEngine:
                 self._easy_ocr = easyocr.Reader(self.languages)
                 logger.info("EasyOCR initialized successfully")
             except Exception as e:
-                logger.warning(f"Failed to initialize EasyOCR: {e}")
+                logger.warning("Failed to initialize EasyOCR: %s", e)
                 self._easy_ocr = None
 
     def extract_text(self, image: Any) -> list[dict[str, Any]]:
@@ -102,13 +102,13 @@ class OcrEngine:
                     bbox_int = [int(coord) for coord in bbox[0] + bbox[2]]  # top-left and bottom-right
                     entries.append(self._make_entry(text, bbox_int, float(confidence)))
                 if entries:
-                    logger.debug(f"EasyOCR found {len(entries)} text regions in {image_path.name}")
+                    logger.debug("EasyOCR found %s text regions in %s", len(entries), image_path.name)
                     return entries
             except Exception as e:
-                logger.warning(f"EasyOCR failed for {image_path}: {e}")
+                logger.warning("EasyOCR failed for %s: %s", image_path, e)
 
         # Fallback: no OCR results
-        logger.info(f"No OCR results for {image_path.name} - EasyOCR not available or failed")
+        logger.info("No OCR results for %s - EasyOCR not available or failed", image_path.name)
         return []
 
     def _normalize_entry(self, entry: Any, default_index: int) -> dict[str, Any]:
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from screenreview.utils.lazy_imports import is_module_available
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,9 +84,9 @@ class EasyOcrEngine(BaseOcrEngine):
             import easyocr
             self._reader = easyocr.Reader(self.languages, gpu=False)
             self.is_available = True
-            logger.info(f"✓ EasyOCR initialized with languages: {self.languages}")
+            logger.info("✓ EasyOCR initialized with languages: %s", self.languages)
         except (ImportError, OSError, Exception) as e:
-            logger.warning(f"EasyOCR not available: {e}")
+            logger.warning("EasyOCR not available: %s", e)
             self._reader = None
             self.is_available = False
 
@@ -95,11 +97,11 @@ class EasyOcrEngine(BaseOcrEngine):
             return []
 
         if not image_path.exists():
-            logger.warning(f"Image not found: {image_path}")
+            logger.warning("Image not found: %s", image_path)
             return []
 
         try:
-            logger.debug(f"Extracting text from {image_path.name} using EasyOCR...")
+            logger.debug("Extracting text from %s using EasyOCR...", image_path.name)
             results = self._reader.readtext(str(image_path))
             
             entries = []
@@ -112,10 +114,10 @@ class EasyOcrEngine(BaseOcrEngine):
                 
                 entries.append(self._make_entry(text, bbox_int, float(confidence)))
             
-            logger.debug(f"EasyOCR found {len(entries)} text regions in {image_path.name}")
+            logger.debug("EasyOCR found %s text regions in %s", len(entries), image_path.name)
             return entries
         except Exception as e:
-            logger.error(f"EasyOCR extraction failed: {e}")
+            logger.error("EasyOCR extraction failed: %s", e)
             return []
 
 
@@ -138,9 +140,9 @@ class PaddleOcrEngine(BaseOcrEngine):
             
             self._ocr = PaddleOCR(use_angle_cls=True, lang=supported_langs if supported_langs else ["en"])
             self.is_available = True
-            logger.info(f"✓ PaddleOCR initialized with languages: {supported_langs}")
+            logger.info("✓ PaddleOCR initialized with languages: %s", supported_langs)
         except (ImportError, Exception) as e:
-            logger.warning(f"PaddleOCR not available: {e}")
+            logger.warning("PaddleOCR not available: %s", e)
             self._ocr = None
             self.is_available = False
 
@@ -151,11 +153,11 @@ class PaddleOcrEngine(BaseOcrEngine):
             return []
 
         if not image_path.exists():
-            logger.warning(f"Image not found: {image_path}")
+            logger.warning("Image not found: %s", image_path)
             return []
 
         try:
-            logger.debug(f"Extracting text from {image_path.name} using PaddleOCR...")
+            logger.debug("Extracting text from %s using PaddleOCR...", image_path.name)
             results = self._ocr.ocr(str(image_path), cls=True)
             
             entries = []
@@ -171,10 +173,10 @@ class PaddleOcrEngine(BaseOcrEngine):
                     
                     entries.append(self._make_entry(text, bbox_int, float(confidence)))
             
-            logger.debug(f"PaddleOCR found {len(entries)} text regions in {image_path.name}")
+            logger.debug("PaddleOCR found %s text regions in %s", len(entries), image_path.name)
             return entries
         except Exception as e:
-            logger.error(f"PaddleOCR extraction failed: {e}")
+            logger.error("PaddleOCR extraction failed: %s", e)
             return []
 
 
@@ -202,9 +204,9 @@ class TesseractOcrEngine(BaseOcrEngine):
             # Test if tesseract binary is available
             self._pytesseract.get_tesseract_version()
             self.is_available = True
-            logger.info(f"✓ Tesseract OCR initialized with languages: {self.tesseract_langs}")
+            logger.info("✓ Tesseract OCR initialized with languages: %s", self.tesseract_langs)
         except Exception as e:
-            logger.warning(f"Tesseract OCR not available: {e}. Install with: pip install pytesseract")
+            logger.warning("Tesseract OCR not available: %s. Install with: pip install pytesseract", e)
             self._pytesseract = None
             self.is_available = False
 
@@ -215,11 +217,11 @@ class TesseractOcrEngine(BaseOcrEngine):
             return []
 
         if not image_path.exists():
-            logger.warning(f"Image not found: {image_path}")
+            logger.warning("Image not found: %s", image_path)
             return []
 
         try:
-            logger.debug(f"Extracting text from {image_path.name} using Tesseract...")
+            logger.debug("Extracting text from %s using Tesseract...", image_path.name)
             image = self._image_lib.open(image_path)
             
             # Get detailed OCR data with bounding boxes
@@ -244,10 +246,10 @@ class TesseractOcrEngine(BaseOcrEngine):
                     
                     entries.append(self._make_entry(text, [x1, y1, x2, y2], confidence))
             
-            logger.debug(f"Tesseract found {len(entries)} text regions in {image_path.name}")
+            logger.debug("Tesseract found %s text regions in %s", len(entries), image_path.name)
             return entries
         except Exception as e:
-            logger.error(f"Tesseract extraction failed: {e}")
+            logger.error("Tesseract extraction failed: %s", e)
             return []
 
 
@@ -277,21 +279,13 @@ class OcrEngineFactory:
             if OcrEngineFactory._available_cache is not None:
                 return OcrEngineFactory._available_cache
                 
-            available = []
-            logger.info("Probing available OCR engines (this may take a few seconds on first run)...")
-            
-            try:
-                import easyocr  # noqa: F401
-                available.append("easyocr")
-            except (ImportError, OSError, Exception) as e:
-                logger.debug(f"EasyOCR not available: {type(e).__name__}: {e}")
-            
-            try:
-                from paddleocr import PaddleOCR  # noqa: F401
-                available.append("paddleocr")
-            except (ImportError, OSError, Exception) as e:
-                logger.debug(f"PaddleOCR not available: {type(e).__name__}: {e}")
-            
+            # find_spec only locates the packages; importing easyocr/paddleocr
+            # pulls in torch/paddle and can take several seconds.
+            available = [
+                name for name in ("easyocr", "paddleocr") if is_module_available(name)
+            ]
+            logger.debug("Available OCR engines (spec probe): %s", available)
+
             OcrEngineFactory._available_cache = available
             return available
         finally:
@@ -336,11 +330,11 @@ class OcrEngineFactory:
             for engine_type in [TesseractOcrEngine, EasyOcrEngine, PaddleOcrEngine]:
                 engine = engine_type(languages)
                 if engine.is_available:
-                    logger.info(f"Using {engine.get_name()} for OCR")
+                    logger.info("Using %s for OCR", engine.get_name())
                     return engine
             
             logger.error("No OCR engine available. Install one: pip install pytesseract")
             return None
         
-        logger.error(f"Unknown OCR engine: {engine_name}")
+        logger.error("Unknown OCR engine: %s", engine_name)
         return None
@@ -24,73 +24,108 @@ class OcrProcessor:
         self.ocr_engine = OcrEngineFactory.create_engine(engine_name=engine, languages=self.languages)
         
         if self.ocr_engine is None:
-            logger.warning(f"OCR engine '{engine}' not available - OCR processing will be disabled")
+            logger.warning("OCR engine '%s' not available - OCR processing will be disabled", engine)
         else:
-            logger.info(f"✓ OCR processor initialized with engine: {engine}")
-
-    def process_route_screenshots(self, routes_dir: Path) -> dict[str, Any]:
-        """Process all screenshots in a routes directory."""
-        logger.info(f"[B4] Starting OCR processing for routes directory: {routes_dir}")
-        results = {}
+            logger.info("✓ OCR processor initialized with engine: %s", engine)
 
+    @staticmethod
+    def iter_route_screenshots(routes_dir: Path) -> list[tuple[str, str, Path]]:
+        """List (route_slug, viewport, screenshot_path) for every screenshot in a routes directory."""
+        jobs: list[tuple[str, str, Path]] = []
         for route_dir in sorted(routes_dir.iterdir()):
             if not route_dir.is_dir():
                 continue
-
-            route_slug = route_dir.name
-            logger.debug(f"[B4] Processing route: {route_slug}")
-            results[route_slug] = {}
-
             for viewport in ['mobile', 'desktop']:
-                viewport_dir = route_dir / viewport
-                screenshot_path = viewport_dir / "screenshot.png"
-
+                screenshot_path = route_dir / viewport / "screenshot.png"
                 if not screenshot_path.exists():
-                    logger.debug(f"[B4] No screenshot found: {screenshot_path}")
+                    logger.debug("[B4] No screenshot found: %s", screenshot_path)
                     continue
+                jobs.append((route_dir.name, viewport, screenshot_path))
+        return jobs
+
+    @staticmethod
+    def ocr_output_path(screenshot_path: Path) -> Path:
+        """Return the screenshot_ocr.json path belonging to a screenshot."""
+        return screenshot_path.parent / ".extraction" / "screenshot_ocr.json"
+
+    @staticmethod
+    def is_ocr_up_to_date(screenshot_path: Path) -> bool:
+        """True if screenshot_ocr.json exists and is not older than the screenshot."""
+        ocr_path = OcrProcessor.ocr_output_path(screenshot_path)
+        try:
+            return ocr_path.stat().st_mtime >= screenshot_path.stat().st_mtime
+        except OSError:
+            return False
+
+    @staticmethod
+    def load_saved_result(screenshot_path: Path) -> dict[str, Any]:
+        """Build a result entry from an existing screenshot_ocr.json without running OCR."""
+        ocr_path = OcrProcessor.ocr_output_path(screenshot_path)
+        try:
+            ocr_data = json.loads(ocr_path.read_text(encoding="utf-8"))
+        except Exception:
+            ocr_data = []
+        return {
+            "screenshot_path": str(screenshot_path),
+            "ocr_path": str(ocr_path),
+            "text_count": len(ocr_data),
+            "texts": [item.get("text", "") for item in ocr_data],
+        }
+
+    def process_screenshot(self, screenshot_path: Path) -> dict[str, Any]:
+        """Run OCR on one full screenshot and write .extraction/screenshot_ocr.json."""
+        if self.ocr_engine is None:
+            raise RuntimeError(f"OCR engine '{self.engine_name}' not available")
 
-                logger.info(f"[B4] Processing OCR: {route_slug} ({viewport}) - {screenshot_path}")
-
-                # Validate screenshot file
-                file_size = screenshot_path.stat().st_size
-                logger.debug(f"[B4] Screenshot file size: {file_size} bytes")
-
-                # Process full screenshot
-                logger.debug(f"[B4] Extracting text from screenshot...")
-                ocr_results = self.ocr_engine.extract_text(screenshot_path)
-                logger.debug(f"[B4] Raw OCR results: {len(ocr_results)} detections")
-
-                # Save results
-                extraction_dir = viewport_dir / ".extraction"
-                logger.debug(f"[B4] Creating extraction directory: {extraction_dir}")
-                extraction_dir.mkdir(exist_ok=True)
-
-                ocr_data = []
-                for entry in ocr_results:
-                    ocr_data.append({
-                        "text": entry["text"],
-                        "bbox": {
-                            "top_left": {"x": entry["bbox"][0], "y": entry["bbox"][1]},
-                            "bottom_right": {"x": entry["bbox"][2], "y": entry["bbox"][3]}
-                        },
-                        "confidence": round(entry["confidence"], 3)
-                    })
-
-                ocr_path = extraction_dir / "screenshot_ocr.json"
-                logger.debug(f"[B4] Writing OCR results to: {ocr_path}")
-                ocr_path.write_text(
-                    json.dumps(ocr_data, indent=2, ensure_ascii=False),
-                    encoding="utf-8"
-                )
-
-                results[route_slug][viewport] = {
-                    "screenshot_path": str(screenshot_path),
-                    "ocr_path": str(ocr_path),
-                    "text_count": len(ocr_data),
-                    "texts": [item["text"] for item in ocr_data]
-                }
-
-                logger.info(f"[B4] ✓ {len(ocr_data)} text elements found and saved")
+        logger.debug("[B4] Screenshot file size: %s bytes", screenshot_path.stat().st_size)
+        ocr_results = self.ocr_engine.extract_text(screenshot_path)
+        logger.debug("[B4] Raw OCR results: %d detections", len(ocr_results))
+
+        ocr_data = []
+        for entry in ocr_results:
+            ocr_data.append({
+                "text": entry["text"],
+                "bbox": {
+                    "top_left": {"x": entry["bbox"][0], "y": entry["bbox"][1]},
+                    "bottom_right": {"x": entry["bbox"][2], "y": entry["bbox"][3]}
+                },
+                "confidence": round(entry["confidence"], 3)
+            })
+
+        ocr_path = self.ocr_output_path(screenshot_path)
+        ocr_path.parent.mkdir(exist_ok=True)
+        logger.debug("[B4] Writing OCR results to: %s", ocr_path)
+        ocr_path.write_text(
+            json.dumps(ocr_data, indent=2, ensure_ascii=False),
+            encoding="utf-8"
+        )
+
+        return {
+            "screenshot_path": str(screenshot_path),
+            "ocr_path": str(ocr_path),
+            "text_count": len(ocr_data),
+            "texts": [item["text"] for item in ocr_data]
+        }
+
+    def process_route_screenshots(self, routes_dir: Path, skip_up_to_date: bool = False) -> dict[str, Any]:
+        """Process all screenshots in a routes directory.
+
+        With ``skip_up_to_date`` screenshots whose screenshot_ocr.json is newer than the
+        PNG are not processed again; their saved results are returned instead.
+        """
+        logger.info("[B4] Starting OCR processing for routes directory: %s", routes_dir)
+        results: dict[str, Any] = {}
+
+        for route_slug, viewport, screenshot_path in self.iter_route_screenshots(routes_dir):
+            route_results = results.setdefault(route_slug, {})
+            if skip_up_to_date and self.is_ocr_up_to_date(screenshot_path):
+                logger.info("[B4] OCR up to date, skipping: %s (%s)", route_slug, viewport)
+                route_results[viewport] = self.load_saved_result(screenshot_path)
+                continue
+
+            logger.info("[B4] Processing OCR: %s (%s) - %s", route_slug, viewport, screenshot_path)
+            route_results[viewport] = self.process_screenshot(screenshot_path)
+            logger.info("[B4] ✓ %s text elements found and saved", route_results[viewport]['text_count'])
 
         return results
 
@@ -101,11 +136,11 @@ class OcrProcessor:
         """
         image_path = Path(image_path) if not isinstance(image_path, Path) else image_path
         if not image_path.exists():
-            logger.warning(f"Image file does not exist: {image_path}")
+            logger.warning("Image file does not exist: %s", image_path)
             return []
         
         if self.ocr_engine is None:
-            logger.debug(f"OCR engine not available, skipping: {image_path}")
+            logger.debug("OCR engine not available, skipping: %s", image_path)
             return []
         
         temp_path = None
@@ -127,10 +162,10 @@ class OcrProcessor:
                     },
                     "confidence": round(entry["confidence"], 3)
                 })
-            logger.debug(f"OCR processed {image_path}: {len(processed)} text elements found")
+            logger.debug("OCR processed %s: %s text elements found", image_path, len(processed))
             return processed
         except Exception as e:
-            logger.warning(f"OCR processing failed for {image_path}: {e}")
+            logger.warning("OCR processing failed for %s: %s", image_path, e)
             return []
 
     def process_gesture_region(self, screenshot_path: Path, gesture_x: int, gesture_y: int,
@@ -163,7 +198,7 @@ class OcrProcessor:
 
         # Ensure valid crop dimensions
         if right <= left or bottom <= top:
-            logger.warning(f"Invalid crop dimensions for gesture at ({gesture_x}, {gesture_y}) in {screenshot.width}x{screenshot.height} image")
+            logger.warning("Invalid crop dimensions for gesture at (%s, %s) in %sx%s image", gesture_x, gesture_y, screenshot.width, screenshot.height)
             return []
 
         # Crop region
@@ -211,7 +246,7 @@ class OcrProcessor:
         try:
             ocr_data = json.loads(ocr_path.read_text(encoding="utf-8"))
         except Exception as e:
-            logger.warning(f"Failed to load OCR data: {e}")
+            logger.warning("Failed to load OCR data: %s", e)
             return "(OCR data corrupted)"
 
         if not ocr_data:
@@ -293,7 +328,7 @@ class OcrProcessor:
                     if isinstance(pixel, tuple):
                         color_hex = '#{:02x}{:02x}{:02x}'.format(pixel[0], pixel[1], pixel[2])
             except Exception as e:
-                logger.warning(f"Color analysis failed: {e}")
+                logger.warning("Color analysis failed: %s", e)
 
             annotation = {
                 "index": i + 1,
@@ -317,15 +352,27 @@ class OcrProcessor:
 
         return annotations
 
-    def _find_matching_transcript(self, timestamp: float, transcript_segments: list[dict[str, Any]]) -> str:
-        """Find transcript segment that matches the timestamp."""
+    def _find_matching_transcript(
+        self, timestamp: float, transcript_segments: list[dict[str, Any]], tolerance: float = 1.0
+    ) -> str:
+        """Find the transcript segment spoken at ``timestamp``.
+
+        Gesture timestamps come from the recording's capture timeline (see
+        ``VideoTimeline``), so a segment containing the timestamp wins;
+        otherwise the nearest segment within ``tolerance`` seconds is used.
+        """
+        best_text = ""
+        best_distance = tolerance
         for segment in transcript_segments:
             start = float(segment.get("start", 0))
             end = float(segment.get("end", 0))
-            # Tolerance of 1 second for better matching
-            if (start - 1.0) <= timestamp <= (end + 1.0):
+            if start <= timestamp <= end:
                 return str(segment.get("text", ""))
-        return ""
+            distance = start - timestamp if timestamp < start else timestamp - end
+            if distance <= best_distance:
+                best_text = str(segment.get("text", ""))
+                best_distance = distance
+        return best_text
 
     def _preprocess_for_ocr(self, image_path: Path) -> Path:
         """Optimize image for better OCR results (contrast/thresholding)."""
@@ -363,5 +410,5 @@ class OcrProcessor:
             
             return Path(temp_file)
         except Exception as e:
-            logger.debug(f"OCR preprocessing failed: {e}")
+            logger.debug("OCR preprocessing failed: %s", e)
             return image_path
@@ -7,25 +7,31 @@ import logging
 import threading
 import time
 import wave
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any
-
+from typing import Any, Callable
+
+from screenreview.pipeline.frame_slot import FrameSlot
+from screenreview.pipeline.recording_segments import (
+    KIND_AUDIO,
+    KIND_VIDEO,
+    RecordingIndex,
+    RecordingSegment,
+    finalize_recording,
+    remove_segments,
+    segment_filename,
+)
+from screenreview.pipeline.video_timeline import timestamps_path, write_frame_times
 from screenreview.utils.file_utils import ensure_dir
+from screenreview.utils.lazy_imports import lazy_import
 
-try:  # Optional runtime dependency for webcam capture + preview
-    import cv2  # type: ignore[import-not-found]
-except Exception:  # pragma: no cover - depends on local environment
-    cv2 = None  # type: ignore[assignment]
-
-try:  # Optional runtime dependency used by sounddevice callbacks
-    import numpy as np  # type: ignore[import-not-found]
-except Exception:  # pragma: no cover - depends on local environment
-    np = None  # type: ignore[assignment]
-
-try:  # Optional runtime dependency for microphone capture/monitoring
-    import sounddevice as sd  # type: ignore[import-not-found]
-except Exception:  # pragma: no cover - depends on local environment
-    sd = None  # type: ignore[assignment]
+# Optional runtime dependencies for webcam capture/preview (cv2), sounddevice
+# callbacks (numpy) and microphone capture/monitoring (sounddevice). They are
+# only located here; the actual import happens on first use so that the GUI can
+# open without loading OpenCV or PortAudio.
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+sd = lazy_import("sounddevice")
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +96,65 @@ def _match_resolution_label(width: int, height: int) -> str:
     return f"{width}x{height}"
 
 
+def _fourcc_name(code: float) -> str:
+    value = int(code)
+    if value <= 0:
+        return "?"
+    return "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00") or "?"
+
+
+def _request_compressed_format(capture: Any) -> None:
+    """Ask a local USB camera for MJPG before setting the size.
+
+    Uncompressed YUYV at 1080p exceeds USB 2.0 bandwidth and is capped at
+    5-10 fps by most webcams. Drivers that cannot do MJPG ignore the request.
+    """
+    try:
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    except Exception as exc:
+        logger.debug("Camera rejected MJPG FOURCC request: %s", exc)
+
+
+def _fallback_sizes(width: int, height: int) -> list[tuple[int, int]]:
+    """Smaller presets to try when the requested size cannot sustain the frame rate."""
+    smaller = {size for size in RESOLUTION_PRESETS.values() if size[0] * size[1] < width * height}
+    return sorted(smaller, key=lambda size: size[0] * size[1], reverse=True)
+
+
+@dataclass
+class CaptureMode:
+    """What the camera actually delivers after negotiation."""
+
+    fourcc: str
+    width: int
+    height: int
+    measured_fps: float
+    requested: tuple[int, int]
+
+    def describe(self) -> str:
+        text = f"Capture mode: {self.fourcc} {self.width}x{self.height} @ {self.measured_fps:.1f} fps measured"
+        if (self.width, self.height) != self.requested:
+            text += f" (requested {self.requested[0]}x{self.requested[1]})"
+        return text
+
+
+@dataclass
+class _FinishedTake:
+    """What finishing a stopped recording needs, detached from the recorder's live state."""
+
+    output_dir: Path
+    video_path: Path
+    audio_path: Path
+    segmented: bool
+    video_frames: int
+    audio_frames: int
+    duration: float
+    backend_mode: str
+    profile_name: str
+    # The take's own notes list; a new take starts a fresh one.
+    notes: list[str]
+
+
 class CameraPreviewMonitor:
     """Continuous webcam preview monitor for settings diagnostics."""
 
@@ -101,7 +166,8 @@ class CameraPreviewMonitor:
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
-        self._last_frame: Any = None
+        # Downscaled once per frame; the GUI reads views of it without copying.
+        self.frame_slot = FrameSlot()
         self._last_error = ""
         self._running = False
 
@@ -114,7 +180,7 @@ class CameraPreviewMonitor:
         self._camera_index = int(camera_index)
         self._custom_url = str(custom_url or "").strip()
         self._resolution = str(resolution or "1080p")
-        if cv2 is None:
+        if not cv2:
             logger.error("OpenCV is not installed. CameraPreviewMonitor cannot start.")
             self._last_error = "OpenCV is not installed."
             return
@@ -123,6 +189,7 @@ class CameraPreviewMonitor:
         self._running = True
         self._last_error = ""
         self._capture = None
+        self.frame_slot.clear()
         logger.debug("Starting CameraPreviewMonitor background thread.")
         self._thread = threading.Thread(
             target=self._loop,
@@ -153,14 +220,8 @@ class CameraPreviewMonitor:
         return bool(self._running)
 
     def get_last_frame(self) -> Any:
-        with self._lock:
-            frame = self._last_frame
-            if frame is None:
-                return None
-            try:
-                return frame.copy()
-            except Exception:
-                return frame
+        """Copy of the latest downscaled frame; prefer ``frame_slot.read()`` for display."""
+        return self.frame_slot.latest_copy()
 
     def get_last_error(self) -> str:
         with self._lock:
@@ -190,6 +251,8 @@ class CameraPreviewMonitor:
             width, height = _resolution_size(self._resolution)
             logger.debug("Setting camera properties: width=%s, height=%s, fps=20", width, height)
             try:
+                if not self._custom_url:
+                    _request_compressed_format(capture)
                 capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
                 capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
                 capture.set(cv2.CAP_PROP_FPS, 20)
@@ -212,8 +275,8 @@ class CameraPreviewMonitor:
                     self._last_error = str(exc)
                 break
             if ok and frame is not None:
+                self.frame_slot.publish(frame)
                 with self._lock:
-                    self._last_frame = frame.copy() if hasattr(frame, "copy") else frame
                     self._last_error = ""
             else:
                 with self._lock:
@@ -244,7 +307,7 @@ class AudioLevelMonitor:
         logger.info("AudioLevelMonitor.start requested for mic_index=%s", mic_index)
         self.stop()
         self._mic_index = int(mic_index)
-        if sd is None or np is None:
+        if not sd or not np:
             logger.error("sounddevice/numpy not installed. AudioLevelMonitor cannot start.")
             self._last_error = "sounddevice/numpy not installed."
             return
@@ -319,15 +382,92 @@ class AudioLevelMonitor:
             return str(self._last_error)
 
 
+@dataclass(frozen=True)
+class RecordingProfile:
+    """How camera frames are reduced before they are written to ``raw_video.avi``.
+
+    Downstream stages (frame extraction, gestures, OCR of frames) work on
+    far smaller images than a 1080p webcam delivers, so downscaling at
+    capture time saves most of the disk traffic without losing anything
+    the analysis uses.
+    """
+
+    name: str
+    max_width: int  # 0 keeps the camera resolution
+    quality: int  # encoder quality 1..100, applied where the codec supports it (MJPG)
+    grayscale: bool = False
+
+    def output_size(self, width: int, height: int) -> tuple[int, int]:
+        if self.max_width <= 0 or width <= self.max_width:
+            return width, height
+        scaled_height = max(2, round(height * self.max_width / width))
+        # Even sizes keep every AVI codec happy.
+        return self.max_width - self.max_width % 2, scaled_height - scaled_height % 2
+
+    def describe(self) -> str:
+        size = f"max width {self.max_width}" if self.max_width > 0 else "camera resolution"
+        colour = ", grayscale" if self.grayscale else ""
+        return f"Recording profile: {self.name} ({size}, quality {self.quality}{colour})"
+
+
+RECORDING_PROFILES: dict[str, RecordingProfile] = {
+    "full": RecordingProfile("full", max_width=0, quality=95),
+    "balanced": RecordingProfile("balanced", max_width=1280, quality=85),
+    "analysis": RecordingProfile("analysis", max_width=960, quality=75),
+    "compact": RecordingProfile("compact", max_width=640, quality=60),
+}
+DEFAULT_RECORDING_PROFILE = "analysis"
+
+
+def resolve_recording_profile(name: str | RecordingProfile, grayscale: bool | None = None) -> RecordingProfile:
+    """Look up a profile by name, optionally forcing grayscale on or off."""
+    if isinstance(name, RecordingProfile):
+        profile = name
+    else:
+        if name not in RECORDING_PROFILES:
+            raise ValueError(f"Unknown recording profile: {name}")
+        profile = RECORDING_PROFILES[name]
+    if grayscale is not None and grayscale != profile.grayscale:
+        profile = replace(profile, grayscale=bool(grayscale))
+    return profile
+
+
 class Recorder:
     """Recorder API used by the GUI.
 
     The recorder prefers live hardware capture (OpenCV + sounddevice) and falls back to
     placeholder files when optional dependencies or devices are unavailable.
+
+    With ``segment_seconds > 0`` each stream is written as a series of
+    ``raw_<kind>.partNNNN`` files listed in ``recording_index.json`` as they
+    are closed, so a crash loses at most the open segment. Closed segments
+    are reported through ``on_segment_complete``, which the app uses to
+    extract frames and transcribe them while recording continues. ``stop``
+    joins them into ``raw_video.avi``/``raw_audio.wav``, optionally on a
+    background thread.
     """
 
-    def __init__(self, output_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        output_dir: Path | None = None,
+        segment_seconds: float = 0.0,
+        profile: str | RecordingProfile = DEFAULT_RECORDING_PROFILE,
+    ) -> None:
         self._output_dir = output_dir
+        self.profile = resolve_recording_profile(profile)
+        # Average bitrate of the last finished recording (0 until measured).
+        self._video_bitrate_kbps = 0.0
+        self.segment_seconds = max(0.0, float(segment_seconds))
+        # Called with each closed RecordingSegment (from the capture/audio thread).
+        self.on_segment_complete: Callable[[RecordingSegment], None] | None = None
+        self._index: RecordingIndex | None = None
+        self._segment_lock = threading.Lock()
+        self._segment_number = {KIND_VIDEO: 0, KIND_AUDIO: 0}
+        self._segment_frames = {KIND_VIDEO: 0, KIND_AUDIO: 0}
+        self._segment_start_frames = {KIND_VIDEO: 0, KIND_AUDIO: 0}
+        # Segment joins of stopped takes still running in the background, per output dir.
+        self._joins: dict[Path, threading.Thread] = {}
+        self._joins_lock = threading.Lock()
         self._recording = False
         self._paused = False
         self._started_at = 0.0
@@ -348,12 +488,23 @@ class Recorder:
         self._video_thread: threading.Thread | None = None
         self._capture: Any = None
         self._writer: Any = None
-        self._last_preview_frame: Any = None
+        self._capture_mode: CaptureMode | None = None
+        # Modes that reached the target rate, per (source, requested size): later
+        # takes reuse them instead of negotiating again.
+        self._negotiated_modes: dict[tuple[Any, int, int], tuple[CaptureMode, tuple[int, int]]] = {}
+        self.preview_slot = FrameSlot()
         self._video_frames_written = 0
+        # Media time (seconds, pauses excluded) at which each written frame was captured.
+        self._frame_times: list[float] = []
         self._video_opened = False
 
         self._audio_stream: Any = None
         self._audio_wave: wave.Wave_write | None = None
+        # Guards the open WAV and its sample count between the audio callback and
+        # the segment thread, which swaps in the next part when the callback flags it.
+        self._audio_lock = threading.Lock()
+        self._audio_rollover = threading.Event()
+        self._audio_segment_thread: threading.Thread | None = None
         self._audio_frames_written = 0
         self._audio_sample_rate = 16000
         self._audio_channels = 1
@@ -361,15 +512,102 @@ class Recorder:
     def set_output_dir(self, output_dir: Path) -> None:
         self._output_dir = output_dir
 
+    def output_dir(self) -> Path | None:
+        return self._output_dir
+
+    def completed_segments(self, kind: str | None = None) -> list[RecordingSegment]:
+        """Segments closed so far in the current recording (empty when not segmented)."""
+        with self._segment_lock:
+            if self._index is None:
+                return []
+            return [s for s in self._index.segments if kind is None or s.kind == kind]
+
+    def _stream_path(self, kind: str) -> Path | None:
+        """File the stream is currently written to."""
+        base = self._video_path if kind == KIND_VIDEO else self._audio_path
+        if base is None or self._index is None:
+            return base
+        return base.with_name(segment_filename(kind, self._segment_number[kind]))
+
+    def _segment_full(self, kind: str, media_time: float = 0.0) -> bool:
+        """True once the open segment of ``kind`` spans ``segment_seconds``.
+
+        Video goes by the capture time of its frames (``media_time`` is the
+        next frame's): cameras often deliver fewer frames than requested.
+        """
+        if self._index is None or self._segment_frames[kind] <= 0:
+            return False
+        frames = self._segment_frames[kind]
+        if kind == KIND_VIDEO:
+            return media_time - self._segment_span(kind, frames, media_time)[0] >= self.segment_seconds
+        return frames >= self.segment_seconds * self._audio_sample_rate
+
+    def _segment_span(self, kind: str, frames: int, end_seconds: float | None = None) -> tuple[float, float]:
+        """Start and duration in seconds of the open segment of ``kind``.
+
+        A video segment ends at ``end_seconds`` (the capture time of the frame
+        opening the next one) or one frame interval after its last frame.
+        """
+        first = self._segment_start_frames[kind]
+        if kind == KIND_VIDEO and first < len(self._frame_times):
+            start = self._frame_times[first]
+            end = self._frame_times[-1] + self._FRAME_INTERVAL if end_seconds is None else end_seconds
+            return start, max(0.0, end - start)
+        rate = self._TARGET_FPS if kind == KIND_VIDEO else float(self._audio_sample_rate)
+        return first / rate, frames / rate
+
+    def _close_segment(
+        self, kind: str, end_seconds: float | None = None, frames: int | None = None
+    ) -> RecordingSegment | None:
+        """Record the just-closed file of ``kind`` in the index and move on to the next number.
+
+        Pass ``frames`` when the caller already took the segment's count
+        (and reset the counter) together with switching files.
+        """
+        with self._segment_lock:
+            if frames is None:
+                frames, self._segment_frames[kind] = self._segment_frames[kind], 0
+            if self._index is None or frames <= 0 or self._output_dir is None:
+                return None
+            start_seconds, duration_seconds = self._segment_span(kind, frames, end_seconds)
+            segment = RecordingSegment(
+                kind=kind,
+                index=self._segment_number[kind],
+                file=segment_filename(kind, self._segment_number[kind]),
+                start_seconds=start_seconds,
+                duration_seconds=duration_seconds,
+                frames=frames,
+            )
+            self._index.add(segment)
+            try:
+                self._index.save(self._output_dir)
+            except OSError as exc:
+                logger.error("Could not write recording index: %s", exc)
+            self._segment_number[kind] += 1
+            self._segment_start_frames[kind] += frames
+        if self.on_segment_complete is not None:
+            try:
+                self.on_segment_complete(segment)
+            except Exception as exc:
+                logger.warning("Segment callback failed: %s", exc)
+        return segment
+
+    def _open_wave(self, path: Path) -> wave.Wave_write:
+        wav_file = wave.open(str(path), "wb")
+        wav_file.setnchannels(self._audio_channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(self._audio_sample_rate)
+        return wav_file
+
     @classmethod
     def capture_capabilities(cls) -> dict[str, Any]:
         """Return capability flags for diagnostics and UI messaging."""
         return {
-            "opencv_available": cv2 is not None,
-            "numpy_available": np is not None,
-            "sounddevice_available": sd is not None,
-            "live_video_supported": cv2 is not None,
-            "live_audio_supported": sd is not None and np is not None,
+            "opencv_available": bool(cv2),
+            "numpy_available": bool(np),
+            "sounddevice_available": bool(sd),
+            "live_video_supported": bool(cv2),
+            "live_audio_supported": bool(sd) and bool(np),
         }
 
     @classmethod
@@ -383,7 +621,7 @@ class Recorder:
         """Capture one webcam frame for preview diagnostics."""
         source: int | str = str(custom_url).strip() if custom_url else int(camera_index)
         logger.info("Recorder.capture_single_frame called for source=%s, resolution=%s", source, resolution)
-        if cv2 is None:
+        if not cv2:
             logger.error("cv2 is missing, cannot capture frame.")
             return {"ok": False, "message": "OpenCV is not installed.", "frame": None}
         width, height = _resolution_size(resolution)
@@ -465,7 +703,7 @@ class Recorder:
     ) -> dict[str, Any]:
         """Record a short microphone sample and return a normalized level."""
         logger.info("Recorder.sample_audio_input_level called for mic_index=%s, duration=%s", mic_index, duration_seconds)
-        if sd is None or np is None:
+        if not sd or not np:
             logger.error("Missing sounddevice or numpy, cannot sample audio.")
             return {
                 "ok": False,
@@ -560,7 +798,7 @@ class Recorder:
         logger.info("Recorder.probe_camera_resolution_options called for %s", source)
         
         labels_to_probe = candidate_labels or ["480p", "720p", "1080p", "1440p", "4k"]
-        if cv2 is None:
+        if not cv2:
             logger.error("OpenCV is missing for resolution probe")
             return {
                 "ok": False,
@@ -652,6 +890,8 @@ class Recorder:
             logger.error("Recorder output_dir is None.")
             raise ValueError("Recorder output_dir is not set")
         ensure_dir(self._output_dir)
+        # Re-recording the same screen: its previous take must be joined before the parts go.
+        self.wait_for_join(self._output_dir)
         # Use AVI container universally — mp4v in OpenCV on Windows often produces
         # broken/unplayable files. XVID/MJPG in AVI works reliably on all platforms.
         self._video_path = self._output_dir / "raw_video.avi"
@@ -670,15 +910,96 @@ class Recorder:
         self._backend_mode = "placeholder"
         self._backend_notes = []
         self._video_frames_written = 0
+        self._video_bitrate_kbps = 0.0
+        self._frame_times = []
+        timestamps_path(self._video_path).unlink(missing_ok=True)
         self._audio_frames_written = 0
         self._video_opened = False
-        self._last_preview_frame = None
+        self._capture_mode = None
+        self.preview_slot.clear()
         self._stop_event.clear()
+        self._audio_rollover.clear()
+        self._start_segments()
 
         logger.debug("Starting live backends...")
         self._start_live_backends()
         logger.info("Recorder started with backend_mode=%s", self._backend_mode)
 
+    def _media_time(self, monotonic_time: float) -> float:
+        """Recording time of a ``time.monotonic()`` instant, pauses excluded."""
+        return max(0.0, monotonic_time - self._started_at - self._paused_total)
+
+    def _save_frame_times(self) -> None:
+        """Write the capture time of every frame next to ``raw_video.avi``."""
+        if self._video_path is None or not self._frame_times:
+            return
+        try:
+            write_frame_times(self._video_path, list(self._frame_times), nominal_fps=self._TARGET_FPS)
+        except OSError as exc:
+            logger.error("Could not write frame timestamps: %s", exc)
+
+    def _start_segments(self) -> None:
+        with self._segment_lock:
+            self._index = None
+            for counters in (self._segment_number, self._segment_frames, self._segment_start_frames):
+                counters.update({KIND_VIDEO: 0, KIND_AUDIO: 0})
+            if self.segment_seconds <= 0 or self._output_dir is None:
+                return
+            remove_segments(self._output_dir)
+            # The raw files are only rebuilt at stop; drop the previous take's.
+            for path in (self._video_path, self._audio_path):
+                if path is not None:
+                    path.unlink(missing_ok=True)
+            self._index = RecordingIndex(segment_seconds=self.segment_seconds)
+            try:
+                self._index.save(self._output_dir)
+            except OSError as exc:
+                logger.error("Could not write recording index, recording unsegmented: %s", exc)
+                self._index = None
+
+    def _finish_take(self, take: _FinishedTake) -> None:
+        """Join the segments of a stopped take, measure its bitrate and fill in missing files."""
+        if take.segmented:
+            index = finalize_recording(take.output_dir, take.video_path, take.audio_path, fps=self._TARGET_FPS)
+            if index is not None and not index.finalized:
+                take.notes.append("Joining recording segments failed; segments kept for recovery.")
+        self._measure_bitrate(take)
+        self._ensure_output_files(take)
+
+    def _run_join(self, take: _FinishedTake) -> None:
+        try:
+            self._finish_take(take)
+        except Exception as exc:  # pragma: no cover - filesystem/codec path
+            logger.exception("Finishing the recording in %s failed", take.output_dir)
+            take.notes.append(f"Finishing the recording failed: {exc}")
+        finally:
+            with self._joins_lock:
+                if self._joins.get(take.output_dir) is threading.current_thread():
+                    del self._joins[take.output_dir]
+
+    def wait_for_join(self, output_dir: Path | None = None, timeout: float | None = None) -> bool:
+        """Wait until the background join of ``output_dir`` (or of every take) is done.
+
+        Returns False if it is still running after ``timeout``.
+        """
+        with self._joins_lock:
+            if output_dir is None:
+                threads = list(self._joins.values())
+            else:
+                thread = self._joins.get(Path(output_dir))
+                threads = [thread] if thread is not None else []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                return False
+        return True
+
+    def is_joining(self, output_dir: Path) -> bool:
+        """True while a stopped take in ``output_dir`` is still being joined."""
+        with self._joins_lock:
+            return Path(output_dir) in self._joins
+
     def pause(self) -> None:
         if self._recording and not self._paused:
             self._paused = True
@@ -690,7 +1011,13 @@ class Recorder:
             self._paused_total += time.monotonic() - self._paused_at
             self._paused_at = 0.0
 
-    def stop(self) -> tuple[Path, Path]:
+    def stop(self, join_in_background: bool = False) -> tuple[Path, Path]:
+        """Stop capturing and return the raw video/audio paths.
+
+        Joining a segmented take re-encodes without FFmpeg and can take long;
+        with ``join_in_background`` it runs on a thread and the files are
+        complete once ``wait_for_join`` returns for the output directory.
+        """
         if not self._recording or self._output_dir is None or self._video_path is None or self._audio_path is None:
             raise RuntimeError("Recorder is not active")
         if self._paused:
@@ -699,8 +1026,34 @@ class Recorder:
         self._recording = False
         self._stop_event.set()
         self._stop_live_backends()
-        self._ensure_output_files()
+        segmented = self._index is not None
+        if segmented:
+            self._close_segment(KIND_VIDEO)
+            self._close_segment(KIND_AUDIO)
+        self._save_frame_times()
+        take = _FinishedTake(
+            output_dir=Path(self._output_dir),
+            video_path=self._video_path,
+            audio_path=self._audio_path,
+            segmented=segmented,
+            video_frames=self._video_frames_written,
+            audio_frames=self._audio_frames_written,
+            duration=self._frame_times[-1] + self._FRAME_INTERVAL if self._frame_times else self._last_duration,
+            backend_mode=self._backend_mode,
+            profile_name=self.profile.name,
+            notes=self._backend_notes,
+        )
+        self._video_bitrate_kbps = 0.0
         self._audio_level = 0.0
+        if join_in_background and segmented:
+            thread = threading.Thread(
+                target=self._run_join, args=(take,), name="screenreview-recording-join", daemon=True
+            )
+            with self._joins_lock:
+                self._joins[take.output_dir] = thread
+            thread.start()
+        else:
+            self._finish_take(take)
         return self._video_path, self._audio_path
 
     def is_recording(self) -> bool:
@@ -716,17 +1069,11 @@ class Recorder:
         return max(0.0, now - self._started_at - self._paused_total)
 
     def get_preview_frame(self) -> Any:
-        """Return the latest preview frame if live video capture is active."""
-        with self._state_lock:
-            if self._last_preview_frame is None:
-                return None
-            frame = self._last_preview_frame
-            try:
-                if hasattr(frame, "copy"):
-                    return frame.copy()
-            except Exception:
-                pass
-            return frame
+        """Return a copy of the latest downscaled preview frame if live video capture is active.
+
+        Display code should read ``preview_slot`` directly to avoid the copy.
+        """
+        return self.preview_slot.latest_copy()
 
     def get_audio_level(self) -> float:
         """Return normalized current microphone level (0..1)."""
@@ -763,8 +1110,8 @@ class Recorder:
             t_video.start()
             t_audio.start()
             
-            # Wait for both to finish (with safety timeout)
-            t_video.join(timeout=5.0)
+            # Wait for both to finish (with safety timeout); mode negotiation has its own budget.
+            t_video.join(timeout=5.0 + self._NEGOTIATION_SECONDS)
             t_audio.join(timeout=5.0)
             
             video_started = results["video"]
@@ -795,7 +1142,7 @@ class Recorder:
         """Open the camera, pre-warm it, then launch the capture loop thread."""
         source: int | str = self._custom_url if self._custom_url else self._camera_index
         logger.info("Starting live video backend for source=%s", source)
-        if cv2 is None:
+        if not cv2:
             logger.error("OpenCV not installed.")
             self._backend_notes.append("OpenCV not installed (video capture unavailable).")
             return False
@@ -815,34 +1162,7 @@ class Recorder:
                     pass
                 return False
 
-            # Request resolution — DShow/MSMF may ignore and return nearest supported.
-            logger.debug("Requesting camera size %sx%s @ 20fps", width, height)
-            try:
-                capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-                capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-                capture.set(cv2.CAP_PROP_FPS, 20)
-            except Exception as e:
-                logger.warning("Failed to set camera properties for recording: %s", e)
-
-            # Pre-warm: discard the first few frames (cameras often return black/noise
-            # frames on Windows until the sensor stabilises after opening).
-            logger.debug("Pre-warming camera (discarding first frames)...")
-            warmup_ok = False
-            prewarm_deadline = time.monotonic() + 1.0  # max 1s warmup (reduced from 3s)
-            prewarm_frames = 0
-            while time.monotonic() < prewarm_deadline and not self._stop_event.is_set():
-                ok, frame = capture.read()
-                if ok and frame is not None:
-                    prewarm_frames += 1
-                    if prewarm_frames >= 2: # Reduced from 5 to speed up start
-                        warmup_ok = True
-                        logger.debug("Camera pre-warm complete after %s frames", prewarm_frames)
-                        break
-                else:
-                    time.sleep(0.05)
-
-            if not warmup_ok:
-                logger.warning("Camera pre-warm timed out (got %s frames); proceeding anyway", prewarm_frames)
+            mode = self._negotiate_capture_mode(capture, width, height, local=not self._custom_url, source=source)
 
             if self._stop_event.is_set():
                 logger.info("Recording stopped during camera warm-up; aborting video backend.")
@@ -852,10 +1172,10 @@ class Recorder:
                     pass
                 return False
 
-            # Detect what resolution the camera actually delivered.
-            actual_w = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
-            actual_h = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            actual_w, actual_h = mode.width, mode.height
             logger.info("Camera opened: requested=%sx%s actual=%sx%s", width, height, actual_w, actual_h)
+            self._capture_mode = mode
+            self._backend_notes.append(mode.describe())
 
             self._capture = capture
             self._video_opened = True
@@ -883,7 +1203,7 @@ class Recorder:
 
     def _start_live_audio_backend(self) -> bool:
         logger.info("Starting live audio backend for mic_index=%s", self._mic_index)
-        if sd is None or np is None:
+        if not sd or not np:
             logger.error("Missing sounddevice or numpy.")
             self._backend_notes.append("sounddevice/numpy not installed (audio capture unavailable).")
             return False
@@ -892,12 +1212,9 @@ class Recorder:
         try:
             self._audio_sample_rate = 16000
             self._audio_channels = 1
-            logger.debug("Opening wave file %s", self._audio_path)
-            wav_file = wave.open(str(self._audio_path), "wb")
-            wav_file.setnchannels(self._audio_channels)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(self._audio_sample_rate)
-            self._audio_wave = wav_file
+            audio_target = self._stream_path(KIND_AUDIO) or self._audio_path
+            logger.debug("Opening wave file %s", audio_target)
+            self._audio_wave = self._open_wave(audio_target)
 
             def _callback(indata, frames, time_info, status) -> None:  # pragma: no cover - callback
                 del frames, time_info
@@ -916,9 +1233,7 @@ class Recorder:
                     pcm = (pcm * 32767.0).astype(np.int16)
                     with self._state_lock:
                         self._audio_level = normalized
-                    if self._audio_wave:
-                        self._audio_wave.writeframes(pcm.tobytes())
-                        self._audio_frames_written += len(pcm)
+                    self._write_audio(pcm)
                 except Exception as exc:
                     logger.debug("Audio callback suppression/error during shutdown: %s", exc)
 
@@ -932,6 +1247,8 @@ class Recorder:
             )
             logger.debug("Starting audio stream...")
             self._audio_stream.start()
+            if self._index is not None:
+                self._start_audio_segment_thread()
             logger.info("Live audio capture started completely.")
             self._backend_notes.append(f"Live audio capture started (mic={self._mic_index}).")
             return True
@@ -953,8 +1270,163 @@ class Recorder:
             self._audio_wave = None
             return False
 
+    def _write_audio(self, pcm: Any) -> None:
+        """Append samples from the audio callback; a full segment is only flagged here.
+
+        Closing the WAV and rewriting the index is blocking file I/O that would
+        make PortAudio drop buffers, so the segment thread does it.
+        """
+        with self._audio_lock:
+            if self._audio_wave is None:
+                return
+            self._audio_wave.writeframes(pcm.tobytes())
+            self._audio_frames_written += len(pcm)
+            self._segment_frames[KIND_AUDIO] += len(pcm)
+            full = self._segment_full(KIND_AUDIO)
+        if full:
+            self._audio_rollover.set()
+
+    def _start_audio_segment_thread(self) -> None:
+        self._audio_segment_thread = threading.Thread(
+            target=self._audio_segment_loop, name="screenreview-audio-segments", daemon=True
+        )
+        self._audio_segment_thread.start()
+
+    def _audio_segment_loop(self) -> None:
+        while not self._stop_event.is_set():
+            if self._audio_rollover.wait(0.2):
+                self._audio_rollover.clear()
+                self._roll_audio_segment()
+
+    def _roll_audio_segment(self) -> None:
+        """Continue the audio in the next part file and record the full one in the index."""
+        if self._audio_path is None:
+            return
+        next_path = self._audio_path.with_name(segment_filename(KIND_AUDIO, self._segment_number[KIND_AUDIO] + 1))
+        try:
+            next_wave = self._open_wave(next_path)
+        except OSError as exc:
+            logger.error("Could not open the next audio segment, continuing in the current one: %s", exc)
+            return
+        with self._audio_lock:
+            full_wave, self._audio_wave = self._audio_wave, next_wave
+            frames, self._segment_frames[KIND_AUDIO] = self._segment_frames[KIND_AUDIO], 0
+        if full_wave is not None:
+            full_wave.close()
+        self._close_segment(KIND_AUDIO, frames=frames)
+
     _TARGET_FPS = 20.0
     _FRAME_INTERVAL = 1.0 / _TARGET_FPS
+    # A mode is kept if it delivers at least this share of _TARGET_FPS.
+    _MIN_FPS_RATIO = 0.8
+    _FPS_MEASURE_SECONDS = 0.6
+    # Upper bound for trying candidate sizes, so 4K requests do not stall the start.
+    _NEGOTIATION_SECONDS = 3.0
+    # A smaller size must be at least this much faster to be worth probing further.
+    _MIN_FPS_GAIN = 1.15
+
+    def _apply_capture_size(self, capture: Any, width: int, height: int, local: bool) -> None:
+        # Request format/resolution — DShow/MSMF may ignore and return nearest supported.
+        logger.debug("Requesting camera size %sx%s @ %sfps", width, height, self._TARGET_FPS)
+        try:
+            if local:
+                _request_compressed_format(capture)
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            capture.set(cv2.CAP_PROP_FPS, self._TARGET_FPS)
+        except Exception as e:
+            logger.warning("Failed to set camera properties for recording: %s", e)
+
+    def _measure_capture_fps(self, capture: Any, budget: float | None = None, measure: bool = True) -> float:
+        """Pre-warm the camera, then time how fast it really delivers frames.
+
+        The first frames are discarded (cameras often return black/noise
+        frames on Windows until the sensor stabilises after opening). With
+        ``measure=False`` only the warm-up runs and 0.0 is returned.
+        """
+        seconds = 1.0 + (self._FPS_MEASURE_SECONDS if measure else 0.0)
+        deadline = time.monotonic() + (min(seconds, budget) if budget is not None else seconds)
+        warmup_frames = 0
+        stamps: list[float] = []
+        while time.monotonic() < deadline and not self._stop_event.is_set():
+            ok, frame = capture.read()
+            if not ok or frame is None:
+                time.sleep(0.05)
+                continue
+            if warmup_frames < 2:
+                warmup_frames += 1
+                continue
+            if not measure:
+                break
+            stamps.append(time.monotonic())
+            if stamps[-1] - stamps[0] >= self._FPS_MEASURE_SECONDS:
+                break
+        if warmup_frames < 2:
+            logger.warning("Camera pre-warm timed out (got %s frames); proceeding anyway", warmup_frames)
+        if len(stamps) < 2 or stamps[-1] <= stamps[0]:
+            return 0.0
+        return (len(stamps) - 1) / (stamps[-1] - stamps[0])
+
+    def _negotiate_capture_mode(
+        self, capture: Any, width: int, height: int, local: bool = True, source: Any = None
+    ) -> CaptureMode:
+        """Find the largest mode up to the requested size that sustains _TARGET_FPS.
+
+        Local cameras are asked for MJPG first. Each candidate size is
+        pre-warmed and its delivered frame rate measured; if it falls short,
+        the next smaller preset is tried. Network streams are only measured.
+        If no candidate is fast enough, the fastest one is kept. Probing stops
+        after _NEGOTIATION_SECONDS, or once a smaller size is not clearly
+        faster (the rate is then limited by exposure, not by bandwidth).
+        A mode found for ``source`` is reused on the next start after a warm-up.
+        """
+        cache_key = (source, width, height)
+        cached = self._negotiated_modes.get(cache_key) if source is not None else None
+        if cached is not None:
+            mode, (candidate_w, candidate_h) = cached
+            self._apply_capture_size(capture, candidate_w, candidate_h, local)
+            self._measure_capture_fps(capture, measure=False)
+            return mode
+
+        candidates = [(width, height)] + (_fallback_sizes(width, height) if local else [])
+        deadline = time.monotonic() + self._NEGOTIATION_SECONDS
+        best: CaptureMode | None = None
+        best_candidate = candidates[0]
+        previous_fps: float | None = None
+        for candidate_w, candidate_h in candidates:
+            if self._stop_event.is_set():
+                break
+            remaining = deadline - time.monotonic()
+            if best is not None and remaining < self._FPS_MEASURE_SECONDS:
+                logger.info("Camera negotiation budget used up; keeping the fastest mode so far")
+                break
+            self._apply_capture_size(capture, candidate_w, candidate_h, local)
+            fps = self._measure_capture_fps(capture, budget=max(remaining, self._FPS_MEASURE_SECONDS))
+            mode = CaptureMode(
+                fourcc=_fourcc_name(capture.get(cv2.CAP_PROP_FOURCC)),
+                width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)) or candidate_w,
+                height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) or candidate_h,
+                measured_fps=fps,
+                requested=(width, height),
+            )
+            logger.info("Camera mode %s %sx%s delivers %.1f fps", mode.fourcc, mode.width, mode.height, fps)
+            # A smaller size must be clearly faster to replace a larger one.
+            if best is None or fps > best.measured_fps * self._MIN_FPS_GAIN:
+                best, best_candidate = mode, (candidate_w, candidate_h)
+            if fps >= self._TARGET_FPS * self._MIN_FPS_RATIO:
+                if source is not None:
+                    self._negotiated_modes[cache_key] = (mode, (candidate_w, candidate_h))
+                return mode
+            if previous_fps is not None and fps < previous_fps * self._MIN_FPS_GAIN:
+                logger.info("Smaller capture size did not raise the frame rate; stopping negotiation")
+                break
+            previous_fps = fps
+        if best is None:
+            return CaptureMode("?", width, height, 0.0, (width, height))
+        if best_candidate != (candidate_w, candidate_h):
+            # The camera is still set to the last (slower) candidate.
+            self._apply_capture_size(capture, *best_candidate, local)
+        return best
 
     def _video_capture_loop(self) -> None:
         """Capture frames from the webcam and write them to the video file.
@@ -993,27 +1465,73 @@ class Recorder:
                 time.sleep(0.03)
                 continue
 
+            captured_at = time.monotonic()
             consecutive_failures = 0
-            next_write_at = time.monotonic() + self._FRAME_INTERVAL
+            next_write_at = captured_at + self._FRAME_INTERVAL
 
-            with self._state_lock:
-                self._last_preview_frame = frame.copy() if hasattr(frame, "copy") else frame
+            frame = self._prepare_frame(frame)
+            self.preview_slot.publish(frame)
 
             if self._paused:
                 continue
 
-            self._ensure_video_writer(frame)
-            if self._writer is not None:
-                try:
-                    self._writer.write(frame)
-                    self._video_frames_written += 1
-                except Exception as exc:  # pragma: no cover - hardware/runtime path
-                    logger.exception("Video writer failed")
-                    self._backend_notes.append(f"Video writer error: {exc}")
-                    break
+            try:
+                self._write_frame(frame, self._media_time(captured_at))
+            except Exception as exc:  # pragma: no cover - hardware/runtime path
+                logger.exception("Video writer failed")
+                self._backend_notes.append(f"Video writer error: {exc}")
+                break
 
         logger.info("Video capture loop exited. Frames written: %s", self._video_frames_written)
 
+    def _write_frame(self, frame: Any, media_time: float) -> None:
+        """Write one captured frame, first closing the open segment if it is full."""
+        if self._segment_full(KIND_VIDEO, media_time):
+            # This frame opens the next segment, so the closed one ends where it starts.
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                writer.release()
+            self._close_segment(KIND_VIDEO, end_seconds=media_time)
+            # Keeps the timestamps of closed segments for crash recovery.
+            self._save_frame_times()
+        if self.profile.grayscale:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self._ensure_video_writer(frame)
+        if self._writer is None:
+            return
+        self._writer.write(frame)
+        self._video_frames_written += 1
+        self._frame_times.append(media_time)
+        self._segment_frames[KIND_VIDEO] += 1
+
+    def _prepare_frame(self, frame: Any) -> Any:
+        """Downscale a camera frame to the profile's analysis resolution."""
+        if not hasattr(frame, "shape"):
+            return frame
+        height, width = int(frame.shape[0]), int(frame.shape[1])
+        size = self.profile.output_size(width, height)
+        if size == (width, height):
+            return frame
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def _measure_bitrate(self, take: _FinishedTake) -> None:
+        """Average video bitrate from the written file size and the capture timeline."""
+        if take.video_frames <= 0 or take.duration <= 0 or not take.video_path.exists():
+            return
+        size_bytes = take.video_path.stat().st_size
+        kbps = size_bytes * 8 / take.duration / 1000
+        self._video_bitrate_kbps = kbps
+        logger.info("Video bitrate %.0f kbit/s (%s, %d bytes in %.1fs)",
+                    kbps, take.profile_name, size_bytes, take.duration)
+        take.notes.append(
+            f"Video bitrate: {kbps / 1000:.2f} Mbit/s "
+            f"({kbps * 60 / 8 / 1000:.1f} MB/min, profile {take.profile_name})"
+        )
+
+    def get_video_bitrate_kbps(self) -> float:
+        """Measured average bitrate of the last recording's video (0 if none was written)."""
+        return self._video_bitrate_kbps
+
     def _ensure_video_writer(self, frame: Any) -> None:
         """Create the VideoWriter on the first valid frame.
 
@@ -1024,7 +1542,7 @@ class Recorder:
         We write .avi throughout to avoid the mp4/H.264 codec issues on
         Windows OpenCV builds that don't include the H.264 encoder.
         """
-        if self._writer is not None or self._video_path is None or cv2 is None:
+        if self._writer is not None or self._video_path is None or not cv2:
             return
         if not hasattr(frame, "shape"):
             return
@@ -1034,28 +1552,37 @@ class Recorder:
         except Exception:
             return
         fps = self._TARGET_FPS
+        is_color = len(frame.shape) > 2
         # Always use .avi extension — the path was set to .avi in start()
+        target = self._stream_path(KIND_VIDEO) or self._video_path
         candidates = ["XVID", "MJPG", "mp4v"]
         for codec_name in candidates:
             writer = None
             try:
                 fourcc = cv2.VideoWriter_fourcc(*codec_name)
                 writer = cv2.VideoWriter(
-                    str(self._video_path),
+                    str(target),
                     fourcc,
                     fps,
                     (width, height),
+                    is_color,
                 )
             except Exception as exc:
                 logger.warning("VideoWriter codec %s raised: %s", codec_name, exc)
                 writer = None
             if writer is not None and writer.isOpened():
+                # Only honoured by some encoders (OpenCV's MJPG); others keep their default.
+                quality_set = bool(writer.set(cv2.VIDEOWRITER_PROP_QUALITY, self.profile.quality))
                 self._writer = writer
                 logger.info("VideoWriter opened with codec=%s size=%sx%s fps=%s path=%s",
-                            codec_name, width, height, fps, self._video_path)
-                self._backend_notes.append(
-                    f"Video writer: codec={codec_name} {width}x{height}@{fps:.0f}fps -> {self._video_path.name}"
-                )
+                            codec_name, width, height, fps, target)
+                if self._segment_number[KIND_VIDEO] == 0:
+                    self._backend_notes.append(
+                        f"Video writer: codec={codec_name} {width}x{height}@{fps:.0f}fps -> {self._video_path.name}"
+                    )
+                    self._backend_notes.append(
+                        self.profile.describe() + ("" if quality_set else f"; {codec_name} ignores quality")
+                    )
                 return
             try:
                 if writer is not None:
@@ -1109,6 +1636,12 @@ class Recorder:
                 pass
             self._audio_stream = None
 
+        # A rollover in progress must finish before the open part is closed below.
+        segment_thread = self._audio_segment_thread
+        self._audio_segment_thread = None
+        if segment_thread is not None:
+            segment_thread.join(timeout=5.0)
+
         if self._audio_wave is not None:
             try:
                 self._audio_wave.close()
@@ -1116,24 +1649,22 @@ class Recorder:
                 pass
             self._audio_wave = None
 
-    def _ensure_output_files(self) -> None:
-        if self._video_path is None or self._audio_path is None:
-            return
-        if not self._video_path.exists() or self._video_path.stat().st_size == 0:
-            self._write_placeholder_video(self._video_path)
-            if self._backend_mode != "placeholder":
-                self._backend_notes.append("Video output missing; placeholder video written.")
-
-        if not self._audio_path.exists():
-            self._write_placeholder_audio(self._audio_path)
-            if self._backend_mode != "placeholder":
-                self._backend_notes.append("Audio output missing; placeholder audio written.")
+    def _ensure_output_files(self, take: _FinishedTake) -> None:
+        if not take.video_path.exists() or take.video_path.stat().st_size == 0:
+            self._write_placeholder_video(take.video_path)
+            if take.backend_mode != "placeholder":
+                take.notes.append("Video output missing; placeholder video written.")
+
+        if not take.audio_path.exists():
+            self._write_placeholder_audio(take.audio_path)
+            if take.backend_mode != "placeholder":
+                take.notes.append("Audio output missing; placeholder audio written.")
             return
-        if self._audio_frames_written <= 0:
+        if take.audio_frames <= 0:
             # Replace a header-only/empty wav with short silence.
-            self._write_placeholder_audio(self._audio_path)
-            if self._backend_mode != "placeholder":
-                self._backend_notes.append("No audio samples captured; placeholder audio written.")
+            self._write_placeholder_audio(take.audio_path)
+            if take.backend_mode != "placeholder":
+                take.notes.append("No audio samples captured; placeholder audio written.")
 
     def _write_placeholder_video(self, path: Path) -> None:
         # Write a minimal valid AVI RIFF header stub so files aren't totally empty.
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""Segmented recording files, their index, and finalization into raw_video/raw_audio."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import wave
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from screenreview.utils.lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "recording_index.json"
+FORMAT_VERSION = 1
+KIND_VIDEO = "video"
+KIND_AUDIO = "audio"
+_SUFFIXES = {KIND_VIDEO: ".avi", KIND_AUDIO: ".wav"}
+
+
+def segment_filename(kind: str, index: int) -> str:
+    """``raw_video.part0003.avi`` / ``raw_audio.part0003.wav``."""
+    return f"raw_{kind}.part{index:04d}{_SUFFIXES[kind]}"
+
+
+@dataclass
+class RecordingSegment:
+    """One closed chunk of one stream. Only complete segments are listed in the index."""
+
+    kind: str
+    index: int
+    file: str
+    start_seconds: float
+    duration_seconds: float
+    frames: int
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RecordingSegment":
+        return cls(
+            kind=str(data["kind"]),
+            index=int(data["index"]),
+            file=str(data["file"]),
+            start_seconds=float(data.get("start_seconds", 0.0)),
+            duration_seconds=float(data.get("duration_seconds", 0.0)),
+            frames=int(data.get("frames", 0)),
+        )
+
+
+@dataclass
+class RecordingIndex:
+    """``recording_index.json``: the completed segments of a recording, in order.
+
+    The file is rewritten atomically whenever a segment is closed, so after
+    a crash it lists everything except the segment that was being written.
+    """
+
+    segment_seconds: float
+    segments: list[RecordingSegment] = field(default_factory=list)
+    finalized: bool = False
+
+    def add(self, segment: RecordingSegment) -> None:
+        self.segments.append(segment)
+
+    def of_kind(self, kind: str) -> list[RecordingSegment]:
+        return sorted((s for s in self.segments if s.kind == kind), key=lambda s: s.index)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": FORMAT_VERSION,
+            "segment_seconds": self.segment_seconds,
+            "finalized": self.finalized,
+            "segments": [asdict(segment) for segment in self.segments],
+        }
+
+    def save(self, directory: Path) -> Path:
+        path = Path(directory) / INDEX_FILENAME
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, directory: Path) -> "RecordingIndex | None":
+        path = Path(directory) / INDEX_FILENAME
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(
+                segment_seconds=float(data.get("segment_seconds", 0.0)),
+                segments=[RecordingSegment.from_dict(item) for item in data.get("segments", [])],
+                finalized=bool(data.get("finalized", False)),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable recording index %s: %s", path, exc)
+            return None
+
+
+def remove_segments(directory: Path) -> None:
+    """Delete segment files and the index of a previous recording."""
+    directory = Path(directory)
+    for kind in (KIND_VIDEO, KIND_AUDIO):
+        for path in directory.glob(f"raw_{kind}.part*{_SUFFIXES[kind]}"):
+            path.unlink(missing_ok=True)
+    (directory / INDEX_FILENAME).unlink(missing_ok=True)
+
+
+def concat_wav(parts: list[Path], output: Path) -> int:
+    """Append PCM WAV parts into ``output``; returns the number of frames written."""
+    total = 0
+    with wave.open(str(output), "wb") as out:
+        params_set = False
+        for part in parts:
+            with wave.open(str(part), "rb") as src:
+                if not params_set:
+                    out.setnchannels(src.getnchannels())
+                    out.setsampwidth(src.getsampwidth())
+                    out.setframerate(src.getframerate())
+                    params_set = True
+                frames = src.readframes(src.getnframes())
+                out.writeframes(frames)
+                total += src.getnframes()
+        if not params_set:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(16000)
+    return total
+
+
+def _concat_video_ffmpeg(ffmpeg: str, parts: list[Path], output: Path) -> bool:
+    list_file = output.with_name(output.name + ".concat.txt")
+    list_file.write_text("".join(f"file '{part.resolve().as_posix()}'\n" for part in parts), encoding="utf-8")
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-v", "error", "-f", "concat", "-safe", "0", "-i", str(list_file), "-c", "copy", "-y", str(output)],
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.warning("FFmpeg concat failed: %s", exc)
+        return False
+    finally:
+        list_file.unlink(missing_ok=True)
+    if result.returncode != 0:
+        logger.warning("FFmpeg concat failed: %s", result.stderr.strip())
+        return False
+    return True
+
+
+def _concat_video_opencv(parts: list[Path], output: Path, fps: float) -> bool:
+    writer = None
+    try:
+        for part in parts:
+            capture = cv2.VideoCapture(str(part))
+            try:
+                while True:
+                    ok, frame = capture.read()
+                    if not ok or frame is None:
+                        break
+                    if writer is None:
+                        height, width = frame.shape[:2]
+                        writer = cv2.VideoWriter(str(output), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+                        if not writer.isOpened():
+                            return False
+                    writer.write(frame)
+            finally:
+                capture.release()
+    finally:
+        if writer is not None:
+            writer.release()
+    return writer is not None
+
+
+def concat_video(parts: list[Path], output: Path, fps: float = 20.0) -> bool:
+    """Join AVI parts into ``output``.
+
+    Uses FFmpeg's concat demuxer (stream copy, no re-encode) when available,
+    otherwise re-encodes frame by frame with OpenCV.
+    """
+    if not parts:
+        return False
+    if len(parts) == 1:
+        shutil.copyfile(parts[0], output)
+        return True
+    ffmpeg = shutil.which("ffmpeg") or shutil.which("ffmpeg.exe")
+    if ffmpeg and _concat_video_ffmpeg(ffmpeg, parts, output):
+        return True
+    if not cv2:
+        logger.error("Cannot join video segments: neither FFmpeg nor OpenCV is available")
+        return False
+    return _concat_video_opencv(parts, output, fps)
+
+
+def finalize_recording(
+    directory: Path,
+    video_path: Path,
+    audio_path: Path,
+    fps: float = 20.0,
+    keep_segments: bool = False,
+) -> RecordingIndex | None:
+    """Join the indexed segments into ``video_path``/``audio_path`` and mark the index finalized.
+
+    Streams without segments are left alone (the recorder writes placeholders).
+    Segment files are removed after a successful join unless ``keep_segments``.
+    """
+    directory = Path(directory)
+    index = RecordingIndex.load(directory)
+    if index is None or index.finalized:
+        return index
+    joined: list[Path] = []
+    ok = True
+    video_parts = [directory / s.file for s in index.of_kind(KIND_VIDEO) if (directory / s.file).exists()]
+    if video_parts:
+        if concat_video(video_parts, video_path, fps):
+            joined.extend(video_parts)
+        else:
+            ok = False
+    audio_parts = [directory / s.file for s in index.of_kind(KIND_AUDIO) if (directory / s.file).exists()]
+    if audio_parts:
+        try:
+            concat_wav(audio_parts, audio_path)
+            joined.extend(audio_parts)
+        except (OSError, wave.Error, EOFError) as exc:
+            logger.error("Joining audio segments in %s failed: %s", directory, exc)
+            ok = False
+    if not ok:
+        return index
+    index.finalized = True
+    index.save(directory)
+    if not keep_segments:
+        for part in joined:
+            part.unlink(missing_ok=True)
+    logger.info(
+        "Finalized recording in %s from %d video and %d audio segment(s)",
+        directory, len(video_parts), len(audio_parts),
+    )
+    return index
+
+
+def recover_recording(directory: Path, fps: float = 20.0) -> bool:
+    """Finalize a recording that was interrupted (e.g. by a crash) before ``stop``.
+
+    Returns True if raw files were rebuilt from the completed segments.
+    """
+    directory = Path(directory)
+    index = RecordingIndex.load(directory)
+    if index is None or index.finalized or not index.segments:
+        return False
+    logger.warning("Recovering interrupted recording in %s (%d segment(s))", directory, len(index.segments))
+    result = finalize_recording(directory, directory / "raw_video.avi", directory / "raw_audio.wav", fps)
+    return bool(result and result.finalized)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Frame extraction and transcription of recording segments closed while recording continues."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from screenreview.core.cancellation import CancellationToken
+from screenreview.pipeline.recording_segments import RecordingSegment
+from screenreview.utils.file_utils import write_json_file
+
+if TYPE_CHECKING:
+    from screenreview.pipeline.transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+# extraction_dir/segments/raw_video.part0003/frames/, .../raw_audio.part0003/transcript.json
+SEGMENTS_DIRNAME = "segments"
+TRANSCRIPT_FILENAME = "transcript.json"
+
+
+def segment_output_dir(output_dir: Path, segment: RecordingSegment) -> Path:
+    """Directory for the results of one segment."""
+    return Path(output_dir) / SEGMENTS_DIRNAME / Path(segment.file).stem
+
+
+def clear_segment_outputs(output_dir: Path) -> None:
+    """Drop the segment results of a previous take."""
+    shutil.rmtree(Path(output_dir) / SEGMENTS_DIRNAME, ignore_errors=True)
+
+
+def _segment_file(output_dir: Path, segment: RecordingSegment) -> Path | None:
+    path = Path(output_dir) / segment.file
+    if not path.exists():
+        # Joined into raw_video/raw_audio after stop; the full analysis covers it.
+        logger.info("Segment %s was joined before it could be analysed", segment.file)
+        return None
+    return path
+
+
+def extract_segment_frames(
+    output_dir: Path, segment: RecordingSegment, fps: float = 1.0, token: CancellationToken | None = None
+) -> list[Path]:
+    """Extract frames of a closed video segment into its segment directory."""
+    from screenreview.pipeline.frame_extractor import FrameExtractor
+
+    path = _segment_file(output_dir, segment)
+    if path is None:
+        return []
+    return FrameExtractor(fps=fps).extract_frames(path, segment_output_dir(output_dir, segment) / "frames", token=token)
+
+
+def transcribe_segment(
+    transcriber: Transcriber, output_dir: Path, segment: RecordingSegment, provider: str, language: str
+) -> list[dict[str, Any]]:
+    """Transcribe a closed audio segment; times are shifted to the whole recording."""
+    path = _segment_file(output_dir, segment)
+    if path is None:
+        return []
+    result = transcriber.transcribe(path, provider=provider, language=language)
+    items = [
+        dict(item, start=float(item.get("start", 0.0)) + segment.start_seconds,
+             end=float(item.get("end", 0.0)) + segment.start_seconds)
+        for item in result.get("segments", [])
+    ]
+    write_json_file(
+        segment_output_dir(output_dir, segment) / TRANSCRIPT_FILENAME,
+        {"file": segment.file, "start_seconds": segment.start_seconds, "segments": items},
+    )
+    return items
@@ -24,7 +24,7 @@ class SmartSelector:
         frame_times: list[float] | None = None,
         trigger_events: list[dict[str, Any]] | None = None,
     ) -> list[Path]:
-        logger.info(f"[B2] Starting smart frame selection for {len(frame_paths)} frames")
+        logger.info("[B2] Starting smart frame selection for %s frames", len(frame_paths))
 
         if not frame_paths:
             logger.debug("[B2] No frames provided, returning empty list")
@@ -34,11 +34,11 @@ class SmartSelector:
         frame_cfg = settings.get("frame_extraction", {})
         enabled = bool(smart_cfg.get("enabled", True))
 
-        logger.debug(f"[B2] Smart selector enabled: {enabled}")
+        logger.debug("[B2] Smart selector enabled: %s", enabled)
         if not enabled:
             max_frames = int(frame_cfg.get("max_frames_per_screen", len(frame_paths)))
             result = frame_paths[:max_frames]
-            logger.info(f"[B2] Smart selector disabled, returning first {len(result)} frames")
+            logger.info("[B2] Smart selector disabled, returning first %s frames", len(result))
             return result
 
         gesture_flags = gesture_flags or [False] * len(frame_paths)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Picklable pipeline stage functions that can run on any execution backend."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Sequence
+
+from screenreview.core.execution_backend import attach_array, using_worker_local, worker_local
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OCR_LANGUAGES = ["de", "en"]
+
+
+def _ocr_engine(engine: str, languages: Sequence[str] | None) -> tuple[str, Any]:
+    from screenreview.pipeline.ocr_processor import OcrProcessor
+
+    langs = list(languages or DEFAULT_OCR_LANGUAGES)
+    return f"ocr:{engine}:{','.join(langs)}", lambda: OcrProcessor(engine=engine, languages=langs)
+
+
+def _ocr_processor(engine: str, languages: Sequence[str] | None) -> Any:
+    """Context manager yielding this process's OCR engine for exclusive use."""
+    return using_worker_local(*_ocr_engine(engine, languages))
+
+
+def _gesture_detector() -> Any:
+    """Context manager yielding this process's gesture detector for exclusive use."""
+    from screenreview.pipeline.gesture_detector import GestureDetector
+
+    return using_worker_local("gesture_detector", GestureDetector)
+
+
+def create_ocr_processor(engine: str = "auto", languages: Sequence[str] | None = None) -> Any:
+    """Warmup factory for process workers: load the OCR engine before the first job."""
+    return worker_local(*_ocr_engine(engine, languages))
+
+
+def create_gesture_detector() -> Any:
+    """Warmup factory for process workers: load MediaPipe before the first job."""
+    from screenreview.pipeline.gesture_detector import GestureDetector
+
+    return worker_local("gesture_detector", GestureDetector)
+
+
+def detect_gestures(frames: Sequence[Any]) -> tuple[list[dict[str, int]], list[dict[str, int]]]:
+    """Detect pointing gestures in decoded frames (ndarrays or ``SharedArrayRef``s)."""
+    positions: list[dict[str, int]] = []
+    regions: list[dict[str, int]] = []
+    with _gesture_detector() as detector:
+        for index, item in enumerate(frames):
+            if item is None:
+                continue
+            with attach_array(item) as frame:
+                is_gesture, gx, gy = detector.detect_gesture_in_frame(frame)
+            if is_gesture and gx is not None and gy is not None:
+                positions.append({"x": gx, "y": gy})
+                regions.append({"x": gx, "y": gy, "frame_index": index})
+    return positions, regions
+
+
+def run_screenshot_ocr(
+    screenshot_path: Path, engine: str = "auto", languages: Sequence[str] | None = None
+) -> list[dict[str, Any]]:
+    """OCR the full screenshot with this worker's engine."""
+    with _ocr_processor(engine, languages) as ocr:
+        return ocr.process(screenshot_path)
+
+
+def analyze_markings(
+    screenshot_path: Path,
+    annotations_path: Path,
+    regions_dir: Path,
+    engine: str = "auto",
+    languages: Sequence[str] | None = None,
+) -> tuple[int, list[dict[str, Any]]]:
+    """Find brush markings, crop and OCR them; returns (marking count, annotations).
+
+    ``annotations_path`` is the screen's stroke JSON or a legacy overlay PNG.
+    """
+    from screenreview.pipeline.annotation_analyzer import AnnotationAnalyzer
+
+    analyzer = AnnotationAnalyzer()
+    markings = analyzer.analyze_annotations(screenshot_path, annotations_path)
+    annotations = []
+    for idx, m in enumerate(markings, start=1):
+        crop_path = analyzer.get_crop_path(screenshot_path, m, regions_dir, idx)
+        if crop_path:
+            with _ocr_processor(engine, languages) as ocr:
+                marked_ocr = ocr.process(crop_path)
+            text = " ".join([r.get("text", "") for r in marked_ocr]).strip()
+            annotations.append({
+                "index": 100 + idx,
+                "timestamp": 0.0,
+                "position": {
+                    "x": (m["bbox"]["top_left"]["x"] + m["bbox"]["bottom_right"]["x"]) // 2,
+                    "y": (m["bbox"]["top_left"]["y"] + m["bbox"]["bottom_right"]["y"]) // 2
+                },
+                "ocr_text": text or "N/A",
+                "spoken_text": "(Direct manual marking)",
+                "trigger_type": "text",
+                "region_image": f"marked_regions/marked_region_{idx:03d}.png"
+            })
+    return len(markings), annotations
+
+
+def compile_gesture_annotations(
+    screen_dir: Path,
+    gesture_events: list[dict[str, Any]],
+    transcript_segments: list[dict[str, Any]],
+    engine: str = "auto",
+    languages: Sequence[str] | None = None,
+) -> list[dict[str, Any]]:
+    """OCR the gesture regions and match them with the transcript."""
+    with _ocr_processor(engine, languages) as ocr:
+        return ocr.process_gesture_annotations(screen_dir, gesture_events, transcript_segments)
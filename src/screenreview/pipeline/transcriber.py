@@ -114,10 +114,16 @@ class Transcriber:
                 event_type = category_to_type.get(category, category)
                 for word in words:
                     pattern = r"\b" + re.escape(str(word).casefold()) + r"\b"
-                    if re.search(pattern, lower_text):
+                    match = re.search(pattern, lower_text)
+                    if match:
+                        start = float(segment.get("start", 0.0))
+                        end = max(start, float(segment.get("end", start)))
+                        # Segments carry no word timings; assume an even speaking rate.
+                        word_time = start + (end - start) * match.start() / max(1, len(lower_text))
                         events.append(
                             {
-                                "time": float(segment.get("start", 0.0)),
+                                "time": start,
+                                "word_time": round(word_time, 3),
                                 "type": event_type,
                                 "word": word,
                                 "segment_text": raw_text,
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Per-frame capture timestamps of a recorded video (the ``.timestamps.json`` sidecar)."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+DEFAULT_FPS = 20.0
+
+
+def timestamps_path(video_path: Path) -> Path:
+    """``raw_video.avi`` -> ``raw_video.timestamps.json``."""
+    video_path = Path(video_path)
+    return video_path.with_name(f"{video_path.stem}.timestamps.json")
+
+
+def write_frame_times(video_path: Path, times: Sequence[float], nominal_fps: float = DEFAULT_FPS) -> Path:
+    """Atomically write the sidecar for ``video_path``.
+
+    ``times`` holds one entry per written frame: seconds since the recording
+    started, pauses excluded, i.e. the same clock the audio track runs on.
+    """
+    path = timestamps_path(video_path)
+    payload = {
+        "version": FORMAT_VERSION,
+        "clock": "monotonic",
+        "nominal_fps": float(nominal_fps),
+        "timestamps": [round(float(t), 4) for t in times],
+    }
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+class VideoTimeline:
+    """Maps frame indices of a recording to media time and back.
+
+    Uses the capture timestamps when the sidecar exists; otherwise assumes
+    the container's constant frame rate, which drifts whenever the camera
+    delivered fewer frames than requested.
+    """
+
+    def __init__(self, timestamps: Sequence[float] | None = None, nominal_fps: float = DEFAULT_FPS) -> None:
+        self.timestamps = [float(t) for t in timestamps or []]
+        self.nominal_fps = float(nominal_fps) if nominal_fps and nominal_fps > 0 else DEFAULT_FPS
+
+    @classmethod
+    def for_video(cls, video_path: Path, nominal_fps: float = DEFAULT_FPS) -> "VideoTimeline":
+        """Timeline from the video's sidecar, or a constant-rate one if it is missing or unreadable."""
+        path = timestamps_path(video_path)
+        if not path.exists():
+            return cls(nominal_fps=nominal_fps)
+        try:
+            data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+            return cls(data.get("timestamps", []), float(data.get("nominal_fps") or nominal_fps or DEFAULT_FPS))
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("Ignoring unreadable frame timestamps %s: %s", path, exc)
+            return cls(nominal_fps=nominal_fps)
+
+    @property
+    def has_timestamps(self) -> bool:
+        return bool(self.timestamps)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def duration(self) -> float:
+        """Media time of the last frame plus one nominal frame interval."""
+        if not self.timestamps:
+            return 0.0
+        return self.timestamps[-1] + 1.0 / self.nominal_fps
+
+    @property
+    def measured_fps(self) -> float:
+        """Average rate the frames were actually captured at."""
+        if len(self.timestamps) < 2 or self.timestamps[-1] <= self.timestamps[0]:
+            return self.nominal_fps
+        return (len(self.timestamps) - 1) / (self.timestamps[-1] - self.timestamps[0])
+
+    def time_of(self, frame_index: int) -> float:
+        """Media time in seconds of frame ``frame_index``."""
+        frame_index = max(0, int(frame_index))
+        if frame_index < len(self.timestamps):
+            return self.timestamps[frame_index]
+        if self.timestamps:
+            # Past the sidecar (e.g. a frame written after the last save): extrapolate.
+            return self.timestamps[-1] + (frame_index - len(self.timestamps) + 1) / self.nominal_fps
+        return frame_index / self.nominal_fps
+
+    def frame_at(self, seconds: float) -> int:
+        """Index of the frame captured closest to ``seconds``."""
+        if not self.timestamps:
+            return max(0, round(seconds * self.nominal_fps))
+        pos = bisect.bisect_left(self.timestamps, seconds)
+        if pos <= 0:
+            return 0
+        if pos >= len(self.timestamps):
+            return len(self.timestamps) - 1
+        before, after = self.timestamps[pos - 1], self.timestamps[pos]
+        return pos - 1 if seconds - before <= after - seconds else pos
+
+    def sample_frames(self, interval: float) -> list[int]:
+        """Frames closest to 0, ``interval``, 2*``interval``, ... across the recording."""
+        if not self.timestamps or interval <= 0:
+            return []
+        frames: list[int] = []
+        t = 0.0
+        end = self.timestamps[-1]
+        while t <= end + 1e-9:
+            index = self.frame_at(t)
+            if not frames or frames[-1] != index:
+                frames.append(index)
+            t += interval
+        return frames
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Lazy import helpers and startup timing for heavy optional dependencies."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any
+
+from screenreview.utils.file_utils import write_json_file
+
+logger = logging.getLogger(__name__)
+
+_AVAILABILITY_CACHE: dict[str, bool] = {}
+_IMPORT_TIMINGS: dict[str, float] = {}
+_IMPORT_LOCK = threading.RLock()
+
+
+def is_module_available(name: str) -> bool:
+    """Return True if a module can be found, without importing it."""
+    cached = _AVAILABILITY_CACHE.get(name)
+    if cached is not None:
+        return cached
+    try:
+        available = importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError, AttributeError):
+        # Missing parent package or a half-initialised module in sys.modules.
+        available = False
+    _AVAILABILITY_CACHE[name] = available
+    return available
+
+
+def timed_import(name: str) -> types.ModuleType:
+    """Import a module and record how long the first import took."""
+    with _IMPORT_LOCK:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        if name not in _IMPORT_TIMINGS:
+            elapsed = time.perf_counter() - started
+            _IMPORT_TIMINGS[name] = elapsed
+            logger.debug("Deferred import of %s took %.1f ms", name, elapsed * 1000)
+        return module
+
+
+def get_import_timings() -> dict[str, float]:
+    """Return recorded deferred import durations in seconds."""
+    return dict(_IMPORT_TIMINGS)
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that performs the real import on first attribute access.
+
+    A package can be installed and still fail to import (e.g. OpenCV without
+    libGL). The proxy is falsy once that happened, so ``if not cv2:`` guards
+    degrade the same way as for a package that is not installed at all.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_error"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            error = self.__dict__["_lazy_error"]
+            if error is not None:
+                raise ImportError(f"{self.__name__} failed to import: {error}") from error
+            try:
+                module = timed_import(self.__name__)
+            except (ImportError, OSError) as exc:
+                # OSError: e.g. sounddevice when the PortAudio library is missing.
+                logger.warning("Optional dependency %s is installed but failed to import: %s", self.__name__, exc)
+                self.__dict__["_lazy_error"] = exc
+                raise ImportError(f"{self.__name__} failed to import: {exc}") from exc
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    @property
+    def is_usable(self) -> bool:
+        """Import now if needed; False if the import fails."""
+        try:
+            self._load()
+        except ImportError:
+            return False
+        return True
+
+    def __bool__(self) -> bool:
+        return self.is_usable
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule | None:
+    """Return a deferred module proxy, or None if the module is not installed.
+
+    Test availability with ``if not module:``; a proxy whose import fails is falsy.
+    """
+    if not is_module_available(name):
+        return None
+    return LazyModule(name)
+
+
+class StartupTimer:
+    """Collect named startup phases and write them as a timing report."""
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._last = self._started
+        self._phases: list[dict[str, Any]] = []
+
+    def mark(self, phase: str) -> float:
+        """Close the current phase under the given name and return its duration."""
+        now = time.perf_counter()
+        duration = now - self._last
+        self._last = now
+        self._phases.append(
+            {
+                "phase": phase,
+                "seconds": round(duration, 4),
+                "elapsed_seconds": round(now - self._started, 4),
+            }
+        )
+        return duration
+
+    @property
+    def total_seconds(self) -> float:
+        return self._last - self._started
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_seconds": round(self.total_seconds, 4),
+            "phases": list(self._phases),
+            "deferred_imports": {
+                name: round(seconds, 4) for name, seconds in get_import_timings().items()
+            },
+        }
+
+    def write_report(self, path: Path) -> Path:
+        """Write the timing report as JSON and log a one-line summary."""
+        write_json_file(path, self.to_dict())
+        logger.info(
+            "Startup took %.0f ms (%s)",
+            self.total_seconds * 1000,
+            ", ".join(f"{p['phase']}={p['seconds'] * 1000:.0f}ms" for p in self._phases),
+        )
+        return path
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
-"""Simple logger factory for file + console logging."""
+"""Logger factory and asynchronous (queue-based) session logging."""
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Any
 
 
 def get_logger(name: str, log_file: str | Path | None = None) -> logging.Logger:
@@ -39,27 +44,99 @@ def _env_bool(name: str, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def setup_session_logging(base_dir: str | Path, app_name: str) -> Path | None:
-    """Configure root logging for the app. Always uses DEBUG level for detailed trace."""
+LOG_LEVEL_NAMES = ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+
+_listener: QueueListener | None = None
+_subsystem_loggers: set[str] = set()
+
+# Argument types that cannot change after the log call; records carrying only
+# these are queued unformatted and rendered on the listener thread.
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None), Path)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock ``prepare`` formats every record in the calling thread, which is
+    exactly the cost we want to keep out of capture and OCR loops. Records are
+    only rendered early when their arguments could mutate before the listener
+    gets to them, or when they carry a traceback that must be captured now.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        args = record.args
+        if args and not (
+            isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if record.stack_info is not None:
+            record.stack_info = str(record.stack_info)
+        return record
+
+
+def parse_log_level(value: Any, default: int = logging.INFO) -> int:
+    """Translate a level name such as ``"debug"`` (or a number) into a logging level."""
+    if isinstance(value, int):
+        return value
+    name = str(value or "").strip().upper()
+    if name in LOG_LEVEL_NAMES:
+        return int(logging.getLevelName(name))
+    return default
+
+
+def apply_logging_settings(logging_settings: dict[str, Any] | None) -> int:
+    """Apply root and per-subsystem levels; safe to call again after settings change."""
+    logging_settings = logging_settings or {}
+    env_level = os.getenv("SCREENREVIEW_LOG_LEVEL")
+    level = parse_log_level(env_level or logging_settings.get("level", "INFO"))
+    logging.getLogger().setLevel(level)
+
+    subsystems = logging_settings.get("subsystems", {}) or {}
+    for name in _subsystem_loggers - set(subsystems):
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    for name, subsystem_level in subsystems.items():
+        logging.getLogger(name).setLevel(parse_log_level(subsystem_level, default=level))
+    _subsystem_loggers.clear()
+    _subsystem_loggers.update(subsystems)
+    return level
+
+
+def setup_session_logging(
+    base_dir: str | Path,
+    app_name: str,
+    logging_settings: dict[str, Any] | None = None,
+) -> Path | None:
+    """Configure root logging for the app.
+
+    Log calls only enqueue the record; a ``QueueListener`` thread formats it and
+    writes to the console and the per-session log file. The level comes from the
+    ``logging`` settings section (``SCREENREVIEW_LOG_LEVEL`` overrides it).
+    """
+    global _listener
+
     root = logging.getLogger()
     if getattr(root, "_screenreview_logging_configured", False):
+        apply_logging_settings(logging_settings)
         return getattr(root, "_screenreview_session_log", None)
 
-    # Always force DEBUG level as requested by the user for detailed troubleshooting
-    level = logging.DEBUG
-    root.setLevel(level)
-    
+    level = apply_logging_settings(logging_settings)
+
     # Detailed formatter including thread name for better debugging of async tasks
     formatter = logging.Formatter(
         "%(asctime)s [%(threadName)s] %(name)s - %(levelname)s - %(message)s", 
         datefmt="%Y-%m-%dT%H:%M:%S"
     )
 
+    handlers: list[logging.Handler] = []
     if not any(isinstance(handler, logging.StreamHandler) for handler in root.handlers):
         stream_handler = logging.StreamHandler()
-        stream_handler.setLevel(level)
         stream_handler.setFormatter(formatter)
-        root.addHandler(stream_handler)
+        handlers.append(stream_handler)
 
     logs_dir = Path(base_dir) / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
@@ -67,18 +144,34 @@ def setup_session_logging(base_dir: str | Path, app_name: str) -> Path | None:
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     
     # Create a session log for every run to ensure traceability
-    session_log_path = logs_dir / f"{safe_app_name}-{timestamp}.log"
+    session_log_path: Path | None = logs_dir / f"{safe_app_name}-{timestamp}.log"
     try:
         file_handler = logging.FileHandler(session_log_path, encoding="utf-8")
-        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
-        root.info("=== Application Starting in DEBUG mode ===")
-        root.info("Session log file established: %s", session_log_path)
-        root.info("System info: OS=%s", os.name)
+        handlers.append(file_handler)
     except Exception as e:
         root.error("Failed to establish session log file: %s", e)
+        session_log_path = None
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    atexit.register(stop_session_logging)
+
+    root.info("=== Application Starting (log level %s) ===", logging.getLevelName(level))
+    if session_log_path is not None:
+        root.info("Session log file established: %s", session_log_path)
+    root.info("System info: OS=%s", os.name)
 
     root._screenreview_logging_configured = True  # type: ignore[attr-defined]
     root._screenreview_session_log = session_log_path  # type: ignore[attr-defined]
     return session_log_path
+
+
+def stop_session_logging() -> None:
+    """Flush queued records and stop the background listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Tests for admission control of per-screen background work."""
+
+from __future__ import annotations
+
+import pytest
+
+from screenreview.core.admission import AdmissionController, admission_limits
+
+
+def test_jobs_beyond_limit_wait_until_a_slot_is_released() -> None:
+    started: list[str] = []
+    depths: list[dict] = []
+    admission = AdmissionController({"pipeline": 2}, on_change=depths.append)
+
+    for key in ("a", "b", "c", "d"):
+        admission.submit("pipeline", key, lambda key=key: started.append(key))
+    assert started == ["a", "b"]
+    assert admission.depth()["pipeline"] == {"running": 2, "waiting": 2, "limit": 2}
+
+    admission.release("pipeline", "a")
+    assert started == ["a", "b", "c"]
+    assert depths[-1]["pipeline"]["waiting"] == 1
+
+
+def test_resubmitting_a_waiting_key_replaces_it() -> None:
+    started: list[str] = []
+    admission = AdmissionController({"pipeline": 1})
+    admission.submit("pipeline", "busy", lambda: started.append("busy"))
+    admission.submit("pipeline", "home", lambda: started.append("home-old"))
+    admission.submit("pipeline", "home", lambda: started.append("home-new"))
+    assert admission.depth()["pipeline"]["waiting"] == 1
+
+    admission.release("pipeline", "busy")
+    assert started == ["busy", "home-new"]
+
+
+def test_promoted_key_is_admitted_first() -> None:
+    started: list[str] = []
+    admission = AdmissionController({"pipeline": 1})
+    for key in ("busy", "older", "viewed"):
+        admission.submit("pipeline", key, lambda key=key: started.append(key))
+
+    assert admission.promote("viewed") == 1
+    assert admission.promote("missing") == 0
+    admission.release("pipeline", "busy")
+    assert started == ["busy", "viewed"]
+
+
+def test_raising_a_limit_admits_waiting_jobs() -> None:
+    started: list[str] = []
+    admission = AdmissionController({"pipeline": 1})
+    for key in ("a", "b", "c"):
+        admission.submit("pipeline", key, lambda key=key: started.append(key))
+
+    admission.set_limits({"pipeline": 3, "unknown": 5})
+
+    assert started == ["a", "b", "c"]
+    assert admission.depth()["pipeline"] == {"running": 3, "waiting": 0, "limit": 3}
+
+
+def test_cancel_drops_waiting_job_and_failed_start_frees_slot() -> None:
+    started: list[str] = []
+    admission = AdmissionController({"transcription": 1})
+
+    def _broken() -> None:
+        raise RuntimeError("no thread")
+
+    admission.submit("transcription", "broken", _broken)
+    assert admission.depth()["transcription"]["running"] == 0
+    admission.submit("transcription", "a", lambda: started.append("a"))
+    admission.submit("transcription", "b", lambda: started.append("b"))
+    assert admission.cancel("b") == 1
+    admission.release("transcription", "a")
+    assert started == ["a"]
+
+
+def test_limits_from_settings_and_unknown_kind() -> None:
+    limits = admission_limits({"pipeline": {"max_active_pipelines": 3}})
+    assert limits == {"transcription": 2, "pipeline": 3}
+    with pytest.raises(ValueError):
+        AdmissionController(limits).submit("export", "a", lambda: None)
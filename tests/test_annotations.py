@@ -8,7 +8,14 @@ from pathlib import Path
 from PyQt6.QtCore import Qt, QPoint, QEvent, QPointF
 from PyQt6.QtGui import QImage, QMouseEvent
 from screenreview.gui.viewer_widget import ViewerWidget
+from screenreview.models.annotation_strokes import (
+    LEGACY_OVERLAY_FILENAME,
+    STROKES_FILENAME,
+    AnnotationStrokes,
+    Stroke,
+)
 from screenreview.models.screen_item import ScreenItem
+from screenreview.pipeline.annotation_analyzer import AnnotationAnalyzer
 
 def test_viewer_widget_drawing_and_saving(tmp_path: Path, qt_app) -> None:
     viewer = ViewerWidget()
@@ -86,11 +93,73 @@ def test_main_window_saves_annotations_on_navigation(tmp_path: Path, qt_app, def
     window._save_drawing(screen)
     qt_app.processEvents()
     
-    overlay_path = screen.extraction_dir / "annotation_overlay.png"
-    assert overlay_path.exists()
+    strokes_path = screen.extraction_dir / STROKES_FILENAME
+    assert strokes_path.exists()
+    assert not (screen.extraction_dir / LEGACY_OVERLAY_FILENAME).exists()
+    saved = AnnotationStrokes.load(strokes_path)
+    assert saved is not None and len(saved.strokes) == 1
+    assert (saved.width, saved.height) == (100, 100)
     
     # Navigate should call save_drawing_callback
     window.controller.go_next(save_drawing_callback=window._save_drawing)
     assert window.controller.navigator.current().name == "login"
     
     window.close()
+
+
+def test_strokes_round_trip_through_viewer(tmp_path: Path, qt_app) -> None:
+    img = QImage(400, 300, QImage.Format.Format_RGB32)
+    img.fill(Qt.GlobalColor.white)
+    img_path = tmp_path / "base.png"
+    img.save(str(img_path))
+
+    viewer = ViewerWidget()
+    viewer.resize(800, 600)
+    viewer.set_image(img_path)
+    label = viewer.image_label
+    label.set_pen_width(10)
+    label._draw_line(QPoint(20, 20), QPoint(40, 30))
+    label._draw_line(QPoint(40, 30), QPoint(60, 30))
+    annotations = viewer.annotations()
+    assert annotations is not None and len(annotations.strokes) == 1
+    path = annotations.save(tmp_path / STROKES_FILENAME)
+
+    other = ViewerWidget()
+    other.resize(800, 600)
+    other.set_image(img_path)
+    assert other.load_annotations(path)
+    reloaded = other.image_label.get_drawing_buffer()
+    assert reloaded.pixel(50, 30) == label.get_drawing_buffer().pixel(50, 30) != 0
+    other.image_label.undo()  # loading starts a fresh history
+    assert other.annotations().strokes == annotations.strokes
+
+
+def test_analyze_strokes_matches_overlay_analysis(tmp_path: Path) -> None:
+    screenshot = tmp_path / "screenshot.png"
+    from PIL import Image
+
+    Image.new("RGB", (800, 1200), "white").save(screenshot)
+    strokes = AnnotationStrokes(
+        width=800,
+        height=1200,
+        strokes=[
+            Stroke([(100, 100), (160, 120)], width=10),
+            Stroke([(180, 110), (200, 140)], width=10),  # close to the first: same region
+            Stroke([(500, 900), (520, 1190)], width=20),
+        ],
+    )
+    analyzer = AnnotationAnalyzer()
+    regions = analyzer.analyze_strokes(strokes)
+    assert len(regions) == 2
+    assert regions[0]["bbox"]["top_left"] == {"x": 80, "y": 80}
+    assert regions[1]["bbox"]["bottom_right"]["y"] == 1200  # clipped to the screenshot
+
+    json_path = strokes.save(tmp_path / STROKES_FILENAME)
+    overlay = analyzer.render_overlay(strokes, tmp_path / LEGACY_OVERLAY_FILENAME)
+    from_png = analyzer.analyze_overlay(screenshot, overlay)
+    from_json = analyzer.analyze_annotations(screenshot, json_path)
+    assert len(from_png) == len(from_json) == 2
+    for png_region, json_region in zip(from_png, from_json):
+        for corner in ("top_left", "bottom_right"):
+            for axis in ("x", "y"):
+                assert abs(png_region["bbox"][corner][axis] - json_region["bbox"][corner][axis]) <= 2
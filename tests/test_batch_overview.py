@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Tests for the model/view batch overview."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from screenreview.gui.batch_overview_widget import STATUS_ROLE, BatchOverviewWidget
+from screenreview.models.screen_item import ScreenItem
+
+
+def _screen(tmp_path: Path, index: int) -> ScreenItem:
+    root = tmp_path / f"page_{index}"
+    (root / ".extraction").mkdir(parents=True)
+    return ScreenItem(
+        name=f"page_{index}",
+        route=f"/p{index}",
+        viewport="mobile",
+        viewport_size={"w": 390, "h": 844},
+        timestamp_utc="",
+        git_branch="",
+        git_commit="",
+        browser="",
+        screenshot_path=root / "screenshot.png",
+        transcript_path=root / "transcript.md",
+        metadata_path=root / "meta.json",
+        extraction_dir=root / ".extraction",
+    )
+
+
+def test_many_screens_create_no_child_widgets_per_screen(qt_app, tmp_path: Path) -> None:
+    screens = [_screen(tmp_path, i) for i in range(2000)]
+    widget = BatchOverviewWidget()
+    before = len(widget.findChildren(object))
+    widget.set_screens(screens, current_index=1500)
+
+    assert widget.model.rowCount() == 2000
+    assert len(widget.findChildren(object)) == before
+    assert widget.view.currentIndex().row() == 1500
+
+
+def test_refresh_screen_updates_only_that_row(qt_app, tmp_path: Path) -> None:
+    screens = [_screen(tmp_path, i) for i in range(5)]
+    widget = BatchOverviewWidget()
+    widget.set_screens(screens)
+    changed: list[tuple[int, int]] = []
+    widget.model.dataChanged.connect(lambda top, bottom, *_args: changed.append((top.row(), bottom.row())))
+
+    assert widget.model.index(3).data(STATUS_ROLE) == "pending"
+    screens[3].status = "recording"
+    # Statuses are cached until the row is refreshed.
+    assert widget.model.index(3).data(STATUS_ROLE) == "pending"
+    widget.refresh_screen(screens[3])
+
+    assert changed == [(3, 3)]
+    assert widget.model.index(3).data(STATUS_ROLE) == "recording"
+    assert widget.model.index(3).data().startswith("● 4:")
+
+
+def test_status_filter_hides_rows_and_keeps_source_index(qt_app, tmp_path: Path) -> None:
+    screens = [_screen(tmp_path, i) for i in range(6)]
+    screens[2].transcript_path.write_text("done", encoding="utf-8")
+    screens[4].error = "boom"
+    widget = BatchOverviewWidget()
+    widget.set_screens(screens)
+    selected: list[int] = []
+    widget.screen_selected.connect(selected.append)
+
+    widget.set_status_filter("done")
+    assert widget.proxy.rowCount() == 1
+    widget._on_clicked(widget.proxy.index(0, 0))
+    assert selected == [2]
+
+    widget.set_status_filter("error")
+    assert widget.proxy.rowCount() == 1
+    widget.set_status_filter("all")
+    assert widget.proxy.rowCount() == 6
+
+
+def test_thumbnail_is_served_as_decoration_once_generated(qt_app, tmp_path: Path) -> None:
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QColor, QImage
+
+    screens = [_screen(tmp_path, i) for i in range(3)]
+    thumb = tmp_path / "thumb.png"
+    image = QImage(40, 80, QImage.Format.Format_RGB32)
+    image.fill(QColor("green"))
+    image.save(str(thumb))
+    widget = BatchOverviewWidget()
+    widget.set_screens(screens)
+
+    assert widget.model.index(1).data(Qt.ItemDataRole.DecorationRole) is None
+    widget.set_thumbnail(screens[1], str(thumb))
+    pixmap = widget.model.index(1).data(Qt.ItemDataRole.DecorationRole)
+    assert pixmap is not None and pixmap.width() == 40
+
+    widget.set_show_previews(True)
+    assert widget.view.gridSize().height() > 40
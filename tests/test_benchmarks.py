@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Tests for the benchmark suite helpers (generator and baseline comparison)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from benchmarks.run_benchmarks import BenchmarkResult, compare_to_baselines  # noqa: E402
+from benchmarks.synthetic_project import SyntheticProjectConfig, generate_project  # noqa: E402
+from screenreview.core.folder_scanner import scan_project  # noqa: E402
+
+
+def test_generate_project_is_scannable(tmp_path: Path) -> None:
+    config = SyntheticProjectConfig(routes=2, screenshot_scale=0.5, video_seconds=1.0, audio_seconds=1.0)
+    project_dir = generate_project(tmp_path / "project", config)
+
+    screens = scan_project(project_dir, viewport_mode="mobile")
+    assert len(screens) == 2
+    extraction_dir = screens[0].extraction_dir
+    assert (extraction_dir / "raw_video.avi").stat().st_size > 1024
+    assert (extraction_dir / "raw_audio.wav").exists()
+    assert (extraction_dir / "annotation_overlay.png").exists()
+    assert (extraction_dir / "annotation_strokes.json").exists()
+    assert json.loads((extraction_dir / "transcript_segments.json").read_text(encoding="utf-8"))
+
+
+def test_compare_to_baselines_flags_regressions() -> None:
+    baselines = {
+        "tolerance": 0.25,
+        "benchmarks": {
+            "differ": {"median_seconds": 0.1},
+            "ocr": {"median_seconds": 1.0, "tolerance": 0.5},
+            "export": {"median_seconds": 0.001},
+        },
+    }
+    results = [
+        BenchmarkResult(name="differ", status="ok", median_seconds=0.2),
+        BenchmarkResult(name="ocr", status="ok", median_seconds=1.4),
+        BenchmarkResult(name="export", status="ok", median_seconds=0.003),
+        BenchmarkResult(name="scan_project", status="ok", median_seconds=0.01),
+        BenchmarkResult(name="frame_extractor", status="skipped", note="ffmpeg not found"),
+    ]
+
+    verdicts = {v["name"]: v["verdict"] for v in compare_to_baselines(results, baselines)}
+
+    assert verdicts == {
+        "differ": "regression",
+        "ocr": "ok",
+        "export": "ok",  # within the timer noise floor
+        "scan_project": "new",
+        "frame_extractor": "skipped",
+    }
+
+
+def test_existing_project_is_benchmarked_on_a_copy(tmp_path: Path) -> None:
+    from benchmarks.run_benchmarks import main
+
+    config = SyntheticProjectConfig(routes=1, screenshot_scale=0.5, video_seconds=1.0, audio_seconds=1.0)
+    project_dir = generate_project(tmp_path / "project", config)
+    before = sorted(p.relative_to(project_dir) for p in project_dir.rglob("*"))
+
+    main([
+        "--project-dir", str(project_dir), "--only", "scan_project",
+        "--baselines", str(tmp_path / "baselines.json"), "--output", str(tmp_path / "latest.json"),
+    ])
+
+    assert sorted(p.relative_to(project_dir) for p in project_dir.rglob("*")) == before
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tests for cancellation tokens and cancellable subprocesses."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+
+import pytest
+
+from screenreview.core.cancellation import (
+    CancellationToken,
+    DeadlineExceeded,
+    TaskCancelled,
+    run_cancellable,
+)
+
+
+def test_token_cancel_runs_callbacks_once() -> None:
+    token = CancellationToken()
+    calls: list[str] = []
+    token.on_cancel(lambda: calls.append("a"))
+    unregister = token.on_cancel(lambda: calls.append("b"))
+    unregister()
+    token.cancel("re-recorded")
+    token.cancel("again")
+    assert calls == ["a"]
+    assert token.reason == "re-recorded"
+    with pytest.raises(TaskCancelled, match="re-recorded"):
+        token.raise_if_cancelled()
+
+
+def test_token_deadline_expires() -> None:
+    token = CancellationToken(deadline_seconds=0.02)
+    assert token.cancelled is False
+    assert token.wait(1.0) is True
+    with pytest.raises(DeadlineExceeded):
+        token.raise_if_cancelled()
+
+
+def test_run_cancellable_returns_output() -> None:
+    result = run_cancellable([sys.executable, "-c", "print('ok')"], token=CancellationToken())
+    assert result.returncode == 0
+    assert result.stdout.strip() == "ok"
+
+
+def test_run_cancellable_terminates_child_on_cancel() -> None:
+    token = CancellationToken()
+    threading.Timer(0.2, token.cancel, args=("superseded",)).start()
+    started = time.monotonic()
+    with pytest.raises(TaskCancelled, match="superseded"):
+        run_cancellable([sys.executable, "-c", "import time; time.sleep(30)"], token=token)
+    assert time.monotonic() - started < 5.0
@@ -33,6 +33,8 @@ def test_default_config_has_all_keys() -> None:
         "hotkeys",
         "export",
         "trigger_words",
+        "logging",
+        "pipeline",
     }
     assert expected_keys.issubset(config.keys())
 
@@ -88,6 +90,26 @@ def test_invalid_interval_rejected(default_config: dict) -> None:
         validate_config(default_config)
 
 
+def test_unknown_frame_extraction_method_rejected(default_config: dict) -> None:
+    default_config["frame_extraction"]["method"] = "trigger_based"
+    validate_config(default_config)
+    default_config["frame_extraction"]["method"] = "random"
+    with pytest.raises(ConfigError):
+        validate_config(default_config)
+
+
+def test_invalid_log_level_rejected(default_config: dict) -> None:
+    default_config["logging"]["subsystems"] = {"screenreview.pipeline.recorder": "LOUD"}
+    with pytest.raises(ConfigError):
+        validate_config(default_config)
+
+
+def test_invalid_pipeline_workers_rejected(default_config: dict) -> None:
+    default_config["pipeline"]["max_workers"] = 0
+    with pytest.raises(ConfigError):
+        validate_config(default_config)
+
+
 def test_budget_limit_saved(tmp_path: Path, default_config: dict) -> None:
     target = tmp_path / "settings.json"
     default_config["cost"]["budget_limit_euro"] = 2.5
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Tests for the application controller."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from screenreview.core.job_journal import JobJournal
+from screenreview.gui.controller import AppController
+from screenreview.gui.workers import get_pipeline_queue, shutdown_pipeline_executors
+
+
+def test_reloading_project_does_not_resume_jobs_again(
+    qt_app, default_config, tmp_project_dir: Path, monkeypatch
+) -> None:
+    controller = AppController(default_config)
+    started: list[str | None] = []
+    monkeypatch.setattr(
+        controller,
+        "_start_pipeline",
+        lambda screen, video, audio, segments, job_id=None: started.append(job_id),
+    )
+    controller.load_project(tmp_project_dir)
+    screen = controller.screens[0]
+    raw = screen.extraction_dir
+    job_id = JobJournal.for_project(tmp_project_dir).start_job(
+        screen.name, raw, raw / "raw_video.avi", raw / "raw_audio.wav", []
+    )
+    journal = controller.journal
+
+    # A settings change or viewport switch reloads the open project.
+    controller.load_project(tmp_project_dir)
+    assert started == []
+    assert controller.journal is journal
+
+    controller.project_dir = None
+    controller.load_project(tmp_project_dir)
+    assert started == [job_id]
+
+    # A job this session is already running is not started a second time.
+    worker = type("Worker", (), {"job_id": job_id})()
+    controller._pipeline_workers[str(screen.extraction_dir)] = worker
+    controller.project_dir = None
+    controller.load_project(tmp_project_dir)
+    assert started == [job_id]
+    controller._pipeline_workers.clear()
+    controller.shutdown_thumbnails()
+
+
+def test_failed_recording_start_releases_deferred_lanes(
+    qt_app, default_config, tmp_project_dir: Path, monkeypatch
+) -> None:
+    controller = AppController(default_config)
+    controller.load_project(tmp_project_dir)
+
+    def _fail(**_kwargs) -> None:
+        raise RuntimeError("camera busy")
+
+    monkeypatch.setattr(controller.recorder, "start", _fail)
+    with pytest.raises(RuntimeError, match="camera busy"):
+        controller.start_recording()
+
+    assert get_pipeline_queue(controller.settings).queue_depth()["held"] == []
+    assert controller.queue_depth()["deferred"] is False
+    controller.shutdown_thumbnails()
+
+
+def test_settings_change_while_recording_moves_held_lanes_to_new_queue(qt_app, default_config) -> None:
+    controller = AppController(default_config)
+    controller._defer_background_work(True)
+    old_queue = get_pipeline_queue(controller.settings)
+    parked = old_queue.add_task("screen1", [("ocr", lambda: "done", "cpu")])
+    assert not parked.done()
+
+    pipeline = dict(default_config["pipeline"], max_workers=default_config["pipeline"].get("max_workers", 2) + 1)
+    controller.apply_settings(dict(default_config, pipeline=pipeline))
+    new_queue = get_pipeline_queue(controller.settings)
+
+    assert new_queue is not old_queue
+    assert new_queue.queue_depth()["held"] == ["cpu", "model"]
+    # The replaced queue finishes its parked graph so its drain thread can exit.
+    parked.result(timeout=5)
+    assert old_queue.queue_depth()["held"] == []
+
+    controller._defer_background_work(False)
+    assert new_queue.queue_depth()["held"] == []
+    shutdown_pipeline_executors()
+    controller.shutdown_thumbnails()
+
+
+def test_viewed_screen_nodes_run_ahead_of_earlier_queued_ones(
+    qt_app, default_config, tmp_project_dir: Path
+) -> None:
+    settings = dict(default_config, pipeline=dict(default_config["pipeline"], max_workers=1))
+    controller = AppController(settings)
+    controller.load_project(tmp_project_dir)
+    first, second = controller.screens[0], controller.screens[1]
+    queue = get_pipeline_queue(settings)
+    queue.hold_resources(["cpu"])
+    order: list[str] = []
+    queue.add_task(first.name, [("ocr", lambda: order.append(first.name))])
+    queue.add_task(second.name, [("ocr", lambda: order.append(second.name))])
+
+    controller.go_next()
+    queue.release_resources()
+    queue.wait_for_all()
+
+    assert order == [second.name, first.name]
+    shutdown_pipeline_executors()
+    controller.shutdown_thumbnails()
+
+
+def test_apply_settings_updates_admission_caps(qt_app, default_config) -> None:
+    controller = AppController(default_config)
+    settings = dict(default_config, pipeline={**default_config["pipeline"], "max_active_pipelines": 5})
+
+    controller.apply_settings(settings)
+
+    assert controller.settings is settings
+    assert controller.admission.depth()["pipeline"]["limit"] == 5
+
+
+def test_screen_assets_never_decode_on_the_gui_thread(qt_app, default_config, tmp_project_dir: Path) -> None:
+    controller = AppController(default_config)
+    controller.load_project(tmp_project_dir)
+    screen = controller.screens[0]
+    controller.prefetcher.loader = lambda _screen: pytest.fail("decoded inline on a cache miss")
+
+    assert controller.screen_assets(screen) is None
+    controller.shutdown_thumbnails()
+
+
+def test_recovery_leaves_the_recording_in_progress_alone(
+    qt_app, default_config, tmp_project_dir: Path, monkeypatch
+) -> None:
+    from screenreview.gui import controller as controller_mod
+
+    recovered: list[Path] = []
+    monkeypatch.setattr(
+        controller_mod, "recover_recording", lambda directory, fps: recovered.append(Path(directory))
+    )
+    controller = AppController(default_config)
+    controller.load_project(tmp_project_dir)
+    active = controller.screens[0].extraction_dir
+    assert active in recovered
+
+    recovered.clear()
+    controller.load_project(tmp_project_dir)
+    assert recovered == []
+
+    controller.recorder.set_output_dir(active)
+    monkeypatch.setattr(controller.recorder, "is_recording", lambda: True)
+    assert controller._recover_interrupted_recordings() == 0
+    assert active not in recovered
+    controller.shutdown_thumbnails()
+
+
+def test_closed_segments_are_analysed_while_recording(
+    qt_app, default_config, tmp_project_dir: Path, monkeypatch
+) -> None:
+    from screenreview.pipeline.recorder import Recorder
+    from screenreview.pipeline.recording_segments import KIND_AUDIO
+    from screenreview.pipeline.segment_analysis import TRANSCRIPT_FILENAME, segment_output_dir
+
+    settings = dict(
+        default_config,
+        pipeline=dict(default_config["pipeline"], defer_while_recording=[]),
+        recording=dict(default_config["recording"], segment_seconds=2),
+    )
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    controller = AppController(settings)
+    controller.load_project(tmp_project_dir)
+    transcribed: list[str] = []
+
+    def _transcribe(path: Path, provider: str, language: str) -> dict:
+        transcribed.append(path.name)
+        return {"segments": [{"start": 0.5, "end": 1.5, "text": "Button fehlt"}]}
+
+    monkeypatch.setattr(controller.transcriber, "transcribe", _transcribe)
+    monkeypatch.setattr(controller, "_start_transcription", lambda *_args: None)
+    controller.start_recording()
+    recorder = controller.recorder
+    for frames in (32000, 32000):
+        with recorder._open_wave(recorder._stream_path(KIND_AUDIO)) as wav_file:
+            wav_file.writeframes(b"\x01\x00" * frames)
+        recorder._audio_frames_written += frames
+        recorder._segment_frames[KIND_AUDIO] = frames
+        recorder._close_segment(KIND_AUDIO)
+    transcripts = [
+        segment_output_dir(recorder.output_dir(), segment) / TRANSCRIPT_FILENAME
+        for segment in recorder.completed_segments(KIND_AUDIO)
+    ]
+
+    deadline = time.monotonic() + 5.0
+    while not all(path.exists() for path in transcripts) and time.monotonic() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.01)
+
+    assert recorder.is_recording()
+    assert sorted(transcribed) == ["raw_audio.part0000.wav", "raw_audio.part0001.wav"]
+    items = json.loads(transcripts[1].read_text(encoding="utf-8"))["segments"]
+    assert (items[0]["start"], items[0]["end"]) == (2.5, 3.5)
+
+    controller.stop_recording()
+    assert recorder.wait_for_join(timeout=5.0)
+    shutdown_pipeline_executors()
+    controller.shutdown_thumbnails()
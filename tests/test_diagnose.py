@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Tests for the diagnose profiling helpers."""
+
+from __future__ import annotations
+
+from screenreview.diagnose import (
+    profile_disk_throughput,
+    profile_import_times,
+    profile_process_spawn,
+)
+
+
+def test_profile_import_times_measures_each_module() -> None:
+    result = profile_import_times(["json", "definitely_not_a_module_xyz"])
+
+    assert result["json"]["available"] is True
+    assert result["json"]["seconds"] >= 0
+    assert result["definitely_not_a_module_xyz"] == {"available": False, "seconds": None}
+
+
+def test_profile_disk_throughput_cleans_up(tmp_path) -> None:
+    target = tmp_path / ".extraction"
+    result = profile_disk_throughput(target, size_mb=4, chunk_mb=1)
+
+    assert result["written_mb"] == 4
+    assert result["mb_per_second"] is None or result["mb_per_second"] > 0
+    assert list(target.iterdir()) == []
+
+
+def test_profile_process_spawn_reports_missing_tool() -> None:
+    result = profile_process_spawn(["definitely-not-a-binary-xyz"])
+
+    assert result["definitely-not-a-binary-xyz"] == {"found": False, "median_seconds": None}
+
+
+def test_profile_process_spawn_records_hung_tool(monkeypatch) -> None:
+    import subprocess
+
+    from screenreview import diagnose
+
+    def _hang(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs.get("timeout"))
+
+    monkeypatch.setattr(diagnose.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(diagnose.subprocess, "run", _hang)
+
+    result = profile_process_spawn(["ffmpeg"], timeout=0.1)
+
+    assert result["ffmpeg"]["found"] is True
+    assert result["ffmpeg"]["error"] == "timeout"
+    assert result["ffmpeg"]["median_seconds"] is None
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Tests for the pluggable execution backends."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from screenreview.core.execution_backend import (
+    ExecutionBackend,
+    ProcessBackend,
+    SharedArray,
+    attach_array,
+    create_backend,
+    using_worker_local,
+    worker_local,
+)
+
+
+def _sum_and_pid(item) -> tuple[int, int]:
+    with attach_array(item) as array:
+        return int(array.sum()), os.getpid()
+
+
+def _worker_marker() -> int:
+    return id(worker_local("marker", object))
+
+
+def test_thread_backend_runs_inline_and_passes_arrays_through() -> None:
+    backend = ExecutionBackend()
+    frame = np.ones((4, 4), dtype=np.uint8)
+    handle = backend.share(frame)
+    assert handle is frame
+    assert backend.run(_sum_and_pid, handle) == (16, os.getpid())
+    backend.release(handle)
+
+
+def test_shared_array_roundtrip() -> None:
+    frame = np.arange(24, dtype=np.uint16).reshape(2, 3, 4)
+    with SharedArray(frame) as shared:
+        with attach_array(shared.ref) as view:
+            assert view.dtype == np.uint16
+            assert np.array_equal(view, frame)
+
+
+def test_worker_local_creates_once_per_worker() -> None:
+    assert _worker_marker() == _worker_marker()
+
+
+def test_worker_local_is_shared_by_all_threads_of_a_process() -> None:
+    created: list[object] = []
+    in_use = threading.Lock()
+
+    def _factory() -> object:
+        created.append(object())
+        return created[-1]
+
+    def _use(_i: int) -> int:
+        with using_worker_local("threaded-engine", _factory) as engine:
+            # Exclusive: a second thread holding the engine would fail here.
+            assert in_use.acquire(blocking=False)
+            time.sleep(0.002)
+            in_use.release()
+            return id(engine)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = set(pool.map(_use, range(32)))
+
+    assert len(created) == 1
+    assert ids == {id(created[0])}
+
+
+def test_process_backend_uses_shared_memory_in_worker_process() -> None:
+    backend = ProcessBackend(max_workers=1)
+    try:
+        frame = np.full((100, 100, 3), 2, dtype=np.uint8)
+        handle = backend.share(frame)
+        total, pid = backend.run(_sum_and_pid, handle)
+        backend.release(handle)
+        assert total == 60000
+        assert pid != os.getpid()
+        # The worker keeps its cached objects between jobs.
+        assert backend.run(_worker_marker) == backend.run(_worker_marker)
+    finally:
+        backend.shutdown()
+
+
+def test_create_backend_from_settings() -> None:
+    assert create_backend({}).kind == "thread"
+    with pytest.raises(ValueError):
+        create_backend({"pipeline": {"backend": "gpu"}})
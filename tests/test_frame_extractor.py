@@ -5,7 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
-from screenreview.pipeline.frame_extractor import FrameExtractor
+from screenreview.pipeline.frame_extractor import SELECT_SCRIPT_FILENAME, FrameExtractor, trigger_frame_times
+from screenreview.pipeline.video_timeline import write_frame_times
 
 class TestFrameExtractor:
     def test_init(self):
@@ -71,3 +72,89 @@ class TestFrameExtractor:
         assert Path("frame_9.png") in selected
         assert len(selected) == 4
 
+
+    def test_extract_frames_selects_by_capture_timestamps(self, tmp_path):
+        video_path = tmp_path / "raw_video.avi"
+        video_path.write_bytes(b"0" * 2048)
+        # 20 fps nominal, but the camera stalled for a second after frame 10.
+        times = [i * 0.05 for i in range(10)] + [1.5 + i * 0.05 for i in range(20)]
+        write_frame_times(video_path, times)
+        output_dir = tmp_path / "frames"
+
+        scripts = []
+
+        def _fake_ffmpeg(cmd, **_kwargs):
+            scripts.append(Path(cmd[cmd.index("-filter_script:v") + 1]).read_text(encoding="utf-8"))
+            for i in range(1, 4):
+                (output_dir / f"frame_{i:04d}.png").write_bytes(b"png")
+            return Mock(returncode=0, stdout="", stderr="")
+
+        with patch("screenreview.pipeline.frame_extractor.run_cancellable", side_effect=_fake_ffmpeg):
+            frames = FrameExtractor(fps=1.0).extract_frames(video_path, output_dir)
+
+        assert scripts == ["select='eq(n\\,0)+eq(n\\,10)+eq(n\\,20)'"]
+        assert FrameExtractor.frame_times(frames) == [0.0, 1.5, 2.0]
+        assert not (output_dir / SELECT_SCRIPT_FILENAME).exists()
+
+    def test_extract_frames_keeps_long_selections_off_the_command_line(self, tmp_path):
+        video_path = tmp_path / "raw_video.avi"
+        video_path.write_bytes(b"0" * 2048)
+        # One hour at 20 fps, sampled once per second: 3600 selected frames.
+        write_frame_times(video_path, [i * 0.05 for i in range(72000)])
+        output_dir = tmp_path / "frames"
+        seen = {}
+
+        def _fake_ffmpeg(cmd, **_kwargs):
+            seen["cmd"] = cmd
+            seen["script"] = Path(cmd[cmd.index("-filter_script:v") + 1]).read_text(encoding="utf-8")
+            return Mock(returncode=0, stdout="", stderr="")
+
+        with patch("screenreview.pipeline.frame_extractor.run_cancellable", side_effect=_fake_ffmpeg):
+            FrameExtractor(fps=1.0).extract_frames(video_path, output_dir)
+
+        assert sum(len(arg) for arg in seen["cmd"]) < 1000
+        assert seen["script"].count("eq(n") == 3600
+        assert "eq(n\\,71980)" in seen["script"]
+
+    def test_frame_times_fall_back_to_extraction_rate(self, tmp_path):
+        frames = [tmp_path / f"frame_{i:04d}.png" for i in range(1, 4)]
+        assert FrameExtractor.frame_times(frames, fps=2.0) == [0.0, 0.5, 1.0]
+
+    def test_extract_frames_at_seeks_to_trigger_frames_only(self, tmp_path):
+        cv2 = pytest.importorskip("cv2")
+        np = pytest.importorskip("numpy")
+        video_path = tmp_path / "raw_video.avi"
+        writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*"MJPG"), 20.0, (64, 48))
+        for i in range(40):
+            writer.write(np.full((48, 64, 3), i * 6, dtype=np.uint8))
+        writer.release()
+        # Frames 20.. were captured after a one second stall.
+        write_frame_times(video_path, [i * 0.05 for i in range(20)] + [2.0 + i * 0.05 for i in range(20)])
+
+        frames = FrameExtractor().extract_frames_at(video_path, tmp_path / "frames", [0.5, 2.5, 2.52])
+
+        assert [p.name for p in frames] == ["frame_0001.png", "frame_0002.png"]
+        shades = [int(cv2.imread(str(p))[24, 32, 0]) for p in frames]
+        assert shades == pytest.approx([10 * 6, 30 * 6], abs=4)
+        assert FrameExtractor.frame_times(frames) == [0.5, 2.5]
+
+    def test_trigger_frame_times_spread_window_around_events(self):
+        events = [
+            {"time": 4.0, "word_time": 5.0, "type": "extract_frame"},
+            {"time": 0.2, "type": "extract_frame"},
+            {"time": 3.0, "type": "bug"},
+        ]
+
+        assert trigger_frame_times(events, window_seconds=1.0, frames_per_trigger=3) == [0.0, 0.2, 0.7, 4.5, 5.0, 5.5]
+        assert trigger_frame_times(events, frames_per_trigger=1, trigger_types=["bug"]) == [3.0]
+        assert len(trigger_frame_times(events, max_frames=2)) == 2
+
+    def test_trigger_frame_cap_is_shared_by_all_triggers(self):
+        events = [{"time": 10.0 * i + 5.0, "type": "extract_frame"} for i in range(8)]
+
+        times = trigger_frame_times(events, window_seconds=1.0, frames_per_trigger=3, max_frames=20)
+
+        assert len(times) == 20
+        for event in events:
+            assert event["time"] in times
+        assert trigger_frame_times(events, max_frames=4) == [5.0, 25.0, 45.0, 65.0]
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests for the triple-buffered preview frame slot."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from screenreview.pipeline.frame_slot import FrameSlot
+
+
+def _frame(width: int, height: int, value: int) -> np.ndarray:
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def test_publish_downscales_once_and_readers_get_read_only_views() -> None:
+    slot = FrameSlot(max_width=320)
+    camera_frame = _frame(1920, 1080, 7)
+
+    generation = slot.publish(camera_frame)
+    with slot.read() as (seen, view):
+        assert seen == generation == 1
+        assert view.shape == (180, 320, 3)
+        assert not np.shares_memory(view, camera_frame)
+        with pytest.raises(ValueError):
+            view[0, 0, 0] = 1
+    with slot.read(since=generation) as (_, unchanged):
+        assert unchanged is None
+
+
+def test_pinned_buffer_is_never_overwritten_by_the_writer() -> None:
+    slot = FrameSlot(max_width=64)
+    slot.publish(_frame(64, 32, 1))
+    with slot.read() as (_, pinned):
+        for value in range(2, 10):
+            assert slot.publish(_frame(64, 32, value)) > 0
+        assert int(pinned[0, 0, 0]) == 1
+    with slot.read() as (generation, latest):
+        assert generation == 9
+        assert int(latest[0, 0, 0]) == 9
+
+
+def test_buffers_are_reused_and_copy_is_independent() -> None:
+    slot = FrameSlot(max_width=64)
+    slot.publish(_frame(32, 16, 1))
+    buffers = [id(buf) for buf in slot._buffers if buf is not None]
+    for value in range(2, 8):
+        slot.publish(_frame(32, 16, value))
+    assert {id(buf) for buf in slot._buffers if buf is not None} >= set(buffers)
+    assert len({id(buf) for buf in slot._buffers}) == 3
+
+    copy = slot.latest_copy()
+    slot.publish(_frame(32, 16, 99))
+    assert int(copy[0, 0, 0]) == 7
+    slot.clear()
+    assert slot.latest_copy() is None
+    assert slot.generation == 8
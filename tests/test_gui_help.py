@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+
 import pytest
 
 pytest.importorskip("PyQt6")
@@ -15,6 +17,12 @@ from screenreview.gui.controls_widget import ControlsWidget
 from screenreview.gui.settings_dialog import SettingsDialog
 
 
+@contextmanager
+def _no_preview_frame(since: int = 0):
+    """Stand-in for ``FrameSlot.read`` when the camera has not delivered a frame."""
+    yield since, None
+
+
 def test_help_system_tooltip_lookup_and_fallback() -> None:
     assert HelpSystem.get_tooltip("main_window", "viewer_widget").startswith("Main screen preview")
     assert HelpSystem.get_tooltip("missing", "missing") == "No help available."
@@ -271,10 +279,10 @@ def test_settings_dialog_camera_probe_failure_updates_preview_message(
     monkeypatch,
 ) -> None:
     monkeypatch.setattr(SettingsDialog, "_schedule_api_validation", lambda self: None)
-    monkeypatch.setattr("screenreview.gui.settings_dialog.CameraPreviewMonitor.get_last_frame", lambda self: None)
     monkeypatch.setattr("screenreview.gui.settings_dialog.CameraPreviewMonitor.get_last_error", lambda self: "Camera not reachable")
     
     dialog = SettingsDialog(default_config)
+    monkeypatch.setattr(dialog._camera_preview_monitor.frame_slot, "read", _no_preview_frame)
 
     dialog._refresh_live_device_feedback()
     qt_app.processEvents()
@@ -315,7 +323,7 @@ def test_settings_dialog_continuous_monitor_feedback_updates_audio_bar(
     monkeypatch.setattr(SettingsDialog, "_schedule_api_validation", lambda self: None)
     dialog = SettingsDialog(default_config)
 
-    monkeypatch.setattr(dialog._camera_preview_monitor, "get_last_frame", lambda: None)
+    monkeypatch.setattr(dialog._camera_preview_monitor.frame_slot, "read", _no_preview_frame)
     monkeypatch.setattr(dialog._camera_preview_monitor, "get_last_error", lambda: "Camera monitor unavailable")
     monkeypatch.setattr(dialog._audio_level_monitor, "get_level", lambda: 0.33)
     monkeypatch.setattr(dialog._audio_level_monitor, "is_running", lambda: False)
@@ -329,3 +337,24 @@ def test_settings_dialog_continuous_monitor_feedback_updates_audio_bar(
     assert dialog._audio_feedback_label is not None
     assert "Mic monitor unavailable" in dialog._audio_feedback_label.text() or "idle" in dialog._audio_feedback_label.text()
     dialog.reject()
+
+
+def test_settings_dialog_camera_preview_reads_frame_slot_once_per_frame(qt_app, default_config, monkeypatch) -> None:
+    import numpy as np
+
+    monkeypatch.setattr(SettingsDialog, "_schedule_api_validation", lambda self: None)
+    dialog = SettingsDialog(default_config)
+    slot = dialog._camera_preview_monitor.frame_slot
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    frame[:, :, 2] = 255  # BGR red
+    slot.publish(frame)
+
+    dialog._refresh_live_device_feedback()
+    first = dialog._camera_preview_pixmap
+    assert first is not None
+    assert first.width() == slot.max_width
+    assert first.toImage().pixelColor(5, 5).red() == 255
+
+    dialog._refresh_live_device_feedback()
+    assert dialog._camera_preview_pixmap is first
+    dialog.reject()
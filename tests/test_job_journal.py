@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Tests for the durable pipeline job journal."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from screenreview.core.job_journal import JobJournal, decode_result, encode_result
+
+
+def _start(journal: JobJournal, tmp_path: Path, screen: str = "home") -> str:
+    return journal.start_job(
+        screen,
+        tmp_path / screen / ".extraction",
+        tmp_path / screen / "raw_video.mp4",
+        tmp_path / screen / "raw_audio.wav",
+        [{"start": 0.0, "end": 1.0, "text": "hier ist ein bug"}],
+    )
+
+
+def test_interrupted_job_is_replayed_after_restart(tmp_path: Path) -> None:
+    frame = tmp_path / "frame_0001.png"
+    frame.write_bytes(b"png")
+    journal = JobJournal.for_project(tmp_path)
+    job_id = _start(journal, tmp_path)
+    journal.record_stage(job_id, "frames", [frame], artifacts=[frame])
+    journal.record_stage(job_id, "triggers", [{"time": 1.0, "type": "bug"}])
+    finished_id = _start(journal, tmp_path, screen="login")
+    journal.finish_job(finished_id)
+
+    reopened = JobJournal.for_project(tmp_path)
+    jobs = reopened.interrupted_jobs()
+    assert [job.job_id for job in jobs] == [job_id]
+    assert jobs[0].segments[0]["text"] == "hier ist ein bug"
+    record = reopened.completed_stage(job_id, "frames")
+    assert record is not None and decode_result(record.result) == [frame]
+    assert reopened.completed_stage(job_id, "ocr") is None
+
+
+def test_stage_with_missing_artifacts_is_not_skipped(tmp_path: Path) -> None:
+    journal = JobJournal.for_project(tmp_path)
+    job_id = _start(journal, tmp_path)
+    missing = tmp_path / "frames" / "frame_0001.png"
+    journal.record_stage(job_id, "frames", [missing], artifacts=[missing])
+    assert journal.completed_stage(job_id, "frames") is None
+
+
+def test_torn_last_line_is_ignored(tmp_path: Path) -> None:
+    journal = JobJournal.for_project(tmp_path)
+    job_id = _start(journal, tmp_path)
+    with journal.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"event": "stage_done", "job": "')
+    assert [job.job_id for job in JobJournal.for_project(tmp_path).interrupted_jobs()] == [job_id]
+
+
+def test_compact_drops_finished_and_failed_jobs(tmp_path: Path) -> None:
+    journal = JobJournal.for_project(tmp_path)
+    done = _start(journal, tmp_path, "a")
+    journal.finish_job(done)
+    failed = _start(journal, tmp_path, "b")
+    journal.fail_job(failed, "boom")
+    running = _start(journal, tmp_path, "c")
+
+    journal.compact()
+    lines = journal.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 and running in lines[0]
+
+
+def test_result_encoding_round_trips_paths() -> None:
+    value = {"frames": [Path("a.png")], "pair": ([{"x": 1}], [])}
+    assert decode_result(encode_result(value)) == {"frames": [Path("a.png")], "pair": [[{"x": 1}], []]}
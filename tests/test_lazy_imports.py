@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests for lazy import helpers and startup timing."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from screenreview.utils.lazy_imports import (
+    LazyModule,
+    StartupTimer,
+    is_module_available,
+    lazy_import,
+)
+
+
+def test_is_module_available_does_not_import() -> None:
+    sys.modules.pop("colorsys", None)
+    assert is_module_available("colorsys") is True
+    assert "colorsys" not in sys.modules
+    assert is_module_available("definitely_not_a_module_xyz") is False
+    assert is_module_available("definitely_not_a_package_xyz.sub") is False
+
+
+def test_lazy_import_defers_until_attribute_access() -> None:
+    sys.modules.pop("colorsys", None)
+    module = lazy_import("colorsys")
+    assert isinstance(module, LazyModule)
+    assert not module.is_loaded
+    assert "colorsys" not in sys.modules
+
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0)[0] == 0.0
+    assert module.is_loaded
+    assert "colorsys" in sys.modules
+
+
+def test_lazy_import_returns_none_for_missing_module() -> None:
+    assert lazy_import("definitely_not_a_module_xyz") is None
+
+
+def test_startup_timer_writes_report(tmp_path) -> None:
+    timer = StartupTimer()
+    timer.mark("config")
+    timer.mark("window_shown")
+
+    report_path = timer.write_report(tmp_path / "logs" / "startup_timing.json")
+    data = json.loads(report_path.read_text(encoding="utf-8"))
+
+    assert [phase["phase"] for phase in data["phases"]] == ["config", "window_shown"]
+    assert data["total_seconds"] >= 0
+    assert "deferred_imports" in data
+
+
+def test_lazy_import_is_falsy_when_installed_module_fails_to_import(tmp_path, monkeypatch) -> None:
+    package = tmp_path / "broken_native_xyz"
+    package.mkdir()
+    (package / "__init__.py").write_text("raise ImportError('libGL.so.1: cannot open shared object file')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module = lazy_import("broken_native_xyz")
+
+    assert isinstance(module, LazyModule)
+    assert not module
+    assert not module.is_usable and not module.is_loaded
+    with pytest.raises(ImportError, match="libGL"):
+        module.anything
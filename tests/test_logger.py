@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests for settings-driven, queue-based logging."""
+
+from __future__ import annotations
+
+import logging
+import queue
+
+from screenreview.utils.logger import (
+    _DeferredQueueHandler,
+    apply_logging_settings,
+    parse_log_level,
+)
+
+
+def test_parse_log_level() -> None:
+    assert parse_log_level("debug") == logging.DEBUG
+    assert parse_log_level("WARNING") == logging.WARNING
+    assert parse_log_level("bogus", default=logging.ERROR) == logging.ERROR
+    assert parse_log_level(15) == 15
+
+
+def test_apply_logging_settings_sets_subsystem_levels(monkeypatch) -> None:
+    monkeypatch.delenv("SCREENREVIEW_LOG_LEVEL", raising=False)
+    root = logging.getLogger()
+    previous = root.level
+    try:
+        level = apply_logging_settings(
+            {"level": "WARNING", "subsystems": {"screenreview.pipeline.recorder": "DEBUG"}}
+        )
+        assert level == logging.WARNING
+        assert root.level == logging.WARNING
+        assert logging.getLogger("screenreview.pipeline.recorder").level == logging.DEBUG
+
+        apply_logging_settings({"level": "INFO", "subsystems": {}})
+        assert logging.getLogger("screenreview.pipeline.recorder").level == logging.NOTSET
+    finally:
+        root.setLevel(previous)
+
+
+def test_deferred_queue_handler_keeps_immutable_args_unformatted() -> None:
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(log_queue)
+
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "frame %s of %s", (3, 10), None)
+    handler.handle(record)
+    queued = log_queue.get_nowait()
+    assert queued.args == (3, 10)
+    assert queued.getMessage() == "frame 3 of 10"
+
+    values = [1, 2]
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "values %s", (values,), None)
+    handler.handle(record)
+    values.append(3)
+    queued = log_queue.get_nowait()
+    assert queued.args is None
+    assert queued.getMessage() == "values [1, 2]"
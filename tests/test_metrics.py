@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Tests for pipeline stage metrics."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from screenreview.pipeline.metrics import (
+    MetricsRecorder,
+    ProjectMetrics,
+    aggregate_metrics,
+    load_metrics,
+    write_project_metrics,
+)
+
+
+def test_stage_records_items_and_bytes(tmp_path: Path) -> None:
+    extraction_dir = tmp_path / ".extraction"
+    extraction_dir.mkdir()
+    recorder = MetricsRecorder("home", output_dir=extraction_dir)
+
+    with recorder.stage("frames") as stage:
+        (extraction_dir / "frame_0001.png").write_bytes(b"x" * 100)
+        stage.items = 1
+    with recorder.stage("ocr"):
+        pass
+
+    data = recorder.to_dict()
+    frames = data["stages"][0]
+    assert frames["name"] == "frames"
+    assert frames["items"] == 1
+    assert frames["bytes_written"] == 100
+    assert frames["wall_seconds"] >= 0
+    assert data["total_bytes_written"] == 100
+
+    path = recorder.save()
+    assert path == extraction_dir / "metrics.json"
+    assert load_metrics(extraction_dir)["screen"] == "home"
+
+
+def test_parallel_stages_report_critical_path() -> None:
+    recorder = MetricsRecorder("home")
+
+    def _stage(name: str) -> None:
+        with recorder.stage(name):
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=_stage, args=(name,)) for name in ("ocr", "markings", "triggers")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    data = recorder.to_dict()
+    assert len(data["stages"]) == 3
+    assert data["elapsed_seconds"] < data["total_wall_seconds"]
+    offsets = [stage["started_offset"] for stage in data["stages"]]
+    assert offsets == sorted(offsets)
+
+
+def test_aggregate_metrics_finds_project_bottleneck(tmp_path: Path) -> None:
+    for name, ocr_seconds in (("home", 2.0), ("login", 4.0)):
+        extraction_dir = tmp_path / name / ".extraction"
+        extraction_dir.mkdir(parents=True)
+        (extraction_dir / "metrics.json").write_text(
+            json.dumps(
+                {
+                    "screen": name,
+                    "total_wall_seconds": ocr_seconds + 1.0,
+                    "stages": [
+                        {"name": "frames", "wall_seconds": 1.0, "cpu_seconds": 0.5, "items": 3, "bytes_written": 10},
+                        {"name": "ocr", "wall_seconds": ocr_seconds, "cpu_seconds": 1.0, "items": 5, "bytes_written": 0},
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    summary = write_project_metrics(
+        tmp_path, [tmp_path / "home" / ".extraction", tmp_path / "login" / ".extraction", tmp_path / "missing"]
+    )
+
+    assert summary["screens"] == 2
+    assert summary["bottleneck"] == "ocr"
+    assert summary["stages"]["ocr"]["wall_seconds"] == 6.0
+    assert summary["stages"]["ocr"]["max_wall_seconds"] == 4.0
+    assert summary["stages"]["frames"]["items"] == 6
+    assert (tmp_path / "pipeline_metrics.json").exists()
+    assert aggregate_metrics([])["bottleneck"] is None
+
+
+def test_project_metrics_replace_a_screens_previous_run() -> None:
+    def _screen(ocr_seconds: float) -> dict:
+        return {
+            "total_wall_seconds": ocr_seconds,
+            "stages": [{"name": "ocr", "wall_seconds": ocr_seconds, "cpu_seconds": 0.1, "items": 1, "bytes_written": 5}],
+        }
+
+    project = ProjectMetrics()
+    project.update("home", _screen(9.0))
+    project.update("login", _screen(2.0))
+    project.update("home", _screen(3.0))
+
+    summary = project.summary()
+    assert summary["screens"] == 2
+    assert summary["stages"]["ocr"]["runs"] == 2
+    assert summary["stages"]["ocr"]["wall_seconds"] == 5.0
+    assert summary["stages"]["ocr"]["max_wall_seconds"] == 3.0
+    assert summary["stages"]["ocr"]["items"] == 2
+    assert summary == aggregate_metrics([_screen(3.0), _screen(2.0)])
+
+
+def test_stage_walks_output_dir_once(tmp_path: Path, monkeypatch) -> None:
+    from screenreview.pipeline import metrics as metrics_mod
+
+    walks: list[Path] = []
+    real_tree_size = metrics_mod.tree_size
+    monkeypatch.setattr(metrics_mod, "tree_size", lambda path: walks.append(path) or real_tree_size(path))
+    recorder = MetricsRecorder("home", output_dir=tmp_path)
+
+    for name in ("frames", "ocr", "export"):
+        with recorder.stage(name):
+            (tmp_path / f"{name}.bin").write_bytes(b"x" * 10)
+
+    assert len(walks) == 4  # one baseline, then one per stage
+    assert [s["bytes_written"] for s in recorder.to_dict()["stages"]] == [10, 10, 10]
+
+
+def test_peak_rss_falls_back_to_psutil_without_resource(monkeypatch) -> None:
+    import sys
+    import types
+
+    from screenreview.pipeline import metrics as metrics_mod
+
+    fake_psutil = types.SimpleNamespace(
+        Process=lambda: types.SimpleNamespace(memory_info=lambda: types.SimpleNamespace(peak_wset=256 * 1024 * 1024))
+    )
+    monkeypatch.setattr(metrics_mod, "resource", None)
+    monkeypatch.setitem(sys.modules, "psutil", fake_psutil)
+
+    assert metrics_mod.peak_rss_mb() == 256.0
@@ -141,3 +141,14 @@ def test_empty_navigator_raises_on_current() -> None:
     nav = Navigator([])
     with pytest.raises(IndexError):
         nav.current()
+
+
+def test_move_callback_reports_new_index(screens: list[ScreenItem]) -> None:
+    moves: list[int] = []
+    nav = Navigator(screens, move_callback=lambda _screens, index: moves.append(index))
+    nav.next()
+    nav.go_to(2)
+    nav.previous()
+    nav.next()
+    nav.next()  # already last: no move
+    assert moves == [1, 2, 1, 2]
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests for the OCR command line interface."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+typer_testing = pytest.importorskip("typer.testing")
+
+from screenreview.cli.ocr_cli import app
+
+
+def _make_routes(tmp_path: Path, slugs: list[str]) -> Path:
+    routes_dir = tmp_path / "routes"
+    for slug in slugs:
+        viewport_dir = routes_dir / slug / "mobile"
+        viewport_dir.mkdir(parents=True)
+        (viewport_dir / "screenshot.png").write_text("fake png")
+    return routes_dir
+
+
+@patch("screenreview.pipeline.ocr_engines.OcrEngineFactory.create_engine")
+def test_process_routes_writes_summary_with_timings(mock_create, tmp_path: Path) -> None:
+    engine = Mock()
+    engine.extract_text.return_value = [{"text": "Login", "bbox": [0, 0, 10, 10], "confidence": 0.9}]
+    mock_create.return_value = engine
+    routes_dir = _make_routes(tmp_path, ["home", "login"])
+
+    result = typer_testing.CliRunner().invoke(app, ["process-routes", str(routes_dir)])
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads((routes_dir / "ocr_summary.json").read_text(encoding="utf-8"))
+    assert summary["processed"] == 2
+    assert summary["skipped"] == 0
+    assert [image["route"] for image in summary["images"]] == ["home", "login"]
+    assert all("seconds" in image for image in summary["images"])
+    assert (routes_dir / "home" / "mobile" / ".extraction" / "screenshot_ocr.json").exists()
+
+
+@patch("screenreview.pipeline.ocr_engines.OcrEngineFactory.create_engine")
+def test_process_routes_resumes_and_skips_fresh_results(mock_create, tmp_path: Path) -> None:
+    engine = Mock()
+    engine.extract_text.return_value = []
+    mock_create.return_value = engine
+    routes_dir = _make_routes(tmp_path, ["home", "login"])
+    fresh = routes_dir / "home" / "mobile" / ".extraction" / "screenshot_ocr.json"
+    fresh.parent.mkdir()
+    fresh.write_text("[]", encoding="utf-8")
+    os.utime(routes_dir / "home" / "mobile" / "screenshot.png", (1000, 1000))
+
+    result = typer_testing.CliRunner().invoke(app, ["process-routes", str(routes_dir)])
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads((routes_dir / "ocr_summary.json").read_text(encoding="utf-8"))
+    assert summary["skipped"] == 1
+    assert summary["processed"] == 1
+    assert engine.extract_text.call_count == 1
@@ -115,3 +115,59 @@ class TestOcrProcessor:
             # adjusted bbox: [300, 200, 350, 250]
             assert results[0]["bbox"][0] == 300
             assert results[0]["bbox"][1] == 200
+
+    def test_is_ocr_up_to_date(self, tmp_path):
+        """OCR output newer than the screenshot counts as up to date."""
+        import os
+
+        screenshot = tmp_path / "screenshot.png"
+        screenshot.write_text("fake png")
+        assert OcrProcessor.is_ocr_up_to_date(screenshot) is False
+
+        ocr_path = tmp_path / ".extraction" / "screenshot_ocr.json"
+        ocr_path.parent.mkdir()
+        ocr_path.write_text("[]")
+        os.utime(screenshot, (1000, 1000))
+        os.utime(ocr_path, (2000, 2000))
+        assert OcrProcessor.is_ocr_up_to_date(screenshot) is True
+
+        os.utime(screenshot, (3000, 3000))
+        assert OcrProcessor.is_ocr_up_to_date(screenshot) is False
+
+    @patch('screenreview.pipeline.ocr_engines.OcrEngineFactory.create_engine')
+    def test_process_route_screenshots_skips_up_to_date(self, mock_create, tmp_path):
+        """Screenshots with fresh OCR results are not processed again."""
+        mock_engine = Mock()
+        mock_engine.extract_text.return_value = [
+            {"text": "Fresh", "bbox": [0, 0, 10, 10], "confidence": 0.9}
+        ]
+        mock_create.return_value = mock_engine
+
+        mobile_dir = tmp_path / "routes" / "test_route" / "mobile"
+        mobile_dir.mkdir(parents=True)
+        (mobile_dir / "screenshot.png").write_text("fake png")
+        extraction_dir = mobile_dir / ".extraction"
+        extraction_dir.mkdir()
+        (extraction_dir / "screenshot_ocr.json").write_text(json.dumps([{"text": "Cached"}]))
+
+        processor = OcrProcessor()
+        results = processor.process_route_screenshots(tmp_path / "routes", skip_up_to_date=True)
+
+        assert results["test_route"]["mobile"]["texts"] == ["Cached"]
+        mock_engine.extract_text.assert_not_called()
+
+    @patch('screenreview.pipeline.ocr_engines.OcrEngineFactory.create_engine')
+    def test_find_matching_transcript_prefers_containing_segment(self, mock_create):
+        """A timestamp inside a segment wins over a neighbour within tolerance."""
+        mock_create.return_value = Mock()
+        processor = OcrProcessor()
+        segments = [
+            {"start": 0.0, "end": 2.0, "text": "first"},
+            {"start": 2.5, "end": 4.0, "text": "second"},
+            {"start": 9.0, "end": 10.0, "text": "late"},
+        ]
+
+        assert processor._find_matching_transcript(2.6, segments) == "second"
+        assert processor._find_matching_transcript(2.2, segments) == "first"
+        assert processor._find_matching_transcript(8.5, segments) == "late"
+        assert processor._find_matching_transcript(6.0, segments) == ""
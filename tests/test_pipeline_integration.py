@@ -49,7 +49,7 @@ def test_pipeline_worker_full_run(tmp_path: Path, qt_app, monkeypatch):
     from screenreview.pipeline.exporter import Exporter
     from screenreview.pipeline.smart_selector import SmartSelector
 
-    monkeypatch.setattr(FrameExtractor, "extract_frames", lambda self, vp, od: [od / "frame_0001.png"])
+    monkeypatch.setattr(FrameExtractor, "extract_frames", lambda self, vp, od, **kw: [od / "frame_0001.png"])
     # Create the frame file because cv2.imread is called in PipelineWorker
     (slug_dir / ".extraction" / "frames").mkdir(parents=True, exist_ok=True)
     (slug_dir / ".extraction" / "frames" / "frame_0001.png").write_bytes(b"frame")
@@ -82,7 +82,9 @@ def test_pipeline_worker_full_run(tmp_path: Path, qt_app, monkeypatch):
     
     # Use lists to capture signals
     finished_screens = []
+    emitted_metrics = []
     worker.finished.connect(finished_screens.append)
+    worker.metrics.connect(emitted_metrics.append)
     
     # 4. Run
     worker.run()
@@ -91,3 +93,133 @@ def test_pipeline_worker_full_run(tmp_path: Path, qt_app, monkeypatch):
     assert len(finished_screens) == 1
     assert finished_screens[0].name == "home"
     assert (slug_dir / ".extraction" / "transcript.md").exists() or True # exporter might handle this
+
+    metrics = json.loads((slug_dir / ".extraction" / "metrics.json").read_text(encoding="utf-8"))
+    stages = {s["name"]: s for s in metrics["stages"]}
+    assert set(stages) == {
+        "structure", "frames", "gestures", "markings", "ocr",
+        "smart_select", "triggers", "annotations", "export",
+    }
+
+    def _end(name):
+        return stages[name]["started_offset"] + stages[name]["wall_seconds"]
+
+    # Dependencies finish before their dependents start; export runs last.
+    assert _end("structure") <= stages["frames"]["started_offset"]
+    assert _end("frames") <= stages["gestures"]["started_offset"]
+    assert max(_end(n) for n in ("gestures", "markings")) <= stages["annotations"]["started_offset"]
+    assert metrics["stages"][-1]["name"] == "export"
+    assert stages["frames"]["items"] == 1
+    assert metrics["bottleneck"] in {s["name"] for s in metrics["stages"]}
+    assert emitted_metrics and emitted_metrics[0]["screen"] == "home"
+
+
+def test_pipeline_worker_resumes_journaled_job(tmp_path: Path, qt_app, monkeypatch):
+    from PIL import Image
+    from screenreview.core.job_journal import JobJournal
+    from screenreview.pipeline.frame_extractor import FrameExtractor
+
+    slug_dir = tmp_path / "routes" / "home" / "mobile"
+    slug_dir.mkdir(parents=True)
+    Image.new("RGB", (390, 844), color="white").save(slug_dir / "screenshot.png")
+    screen = ScreenItem(
+        name="home", route="/home", viewport="mobile", viewport_size={"w": 390, "h": 844},
+        timestamp_utc="", git_branch="main", git_commit="abc", browser="chrome",
+        screenshot_path=slug_dir / "screenshot.png",
+        transcript_path=slug_dir / "transcript.md",
+        metadata_path=slug_dir / "meta.json",
+        extraction_dir=slug_dir / ".extraction"
+    )
+    frame = slug_dir / ".extraction" / "frames" / "frame_0001.png"
+    frame.parent.mkdir(parents=True)
+    Image.new("RGB", (64, 64), color="white").save(frame)
+
+    # A previous run finished frame extraction before the app went away.
+    journal = JobJournal.for_project(tmp_path)
+    job_id = journal.start_job(screen.name, screen.extraction_dir, slug_dir / "raw_video.mp4", slug_dir / "raw_audio.wav", [])
+    journal.record_stage(job_id, "frames", [frame], artifacts=[frame])
+
+    def _must_not_run(self, video_path, output_dir, **kwargs):
+        raise AssertionError("frames stage should have been skipped")
+
+    monkeypatch.setattr(FrameExtractor, "extract_frames", _must_not_run)
+
+    class MockTranscriber:
+        def detect_trigger_words(self, segments, settings): return []
+
+    exported = []
+
+    class MockExporter:
+        def export(self, ext, metadata, analysis_data): exported.append(ext)
+
+    worker = PipelineWorker(
+        screen=screen, video_path=slug_dir / "raw_video.mp4", audio_path=slug_dir / "raw_audio.wav",
+        segments=[], settings={}, transcriber=MockTranscriber(), exporter=MockExporter(),
+        journal=journal, job_id=job_id,
+    )
+    errors = []
+    worker.error.connect(errors.append)
+    worker.run()
+
+    assert errors == []
+    assert exported and exported[0].all_frames == [frame]
+    assert JobJournal.for_project(tmp_path).interrupted_jobs() == []
+
+
+def test_pipeline_worker_cancelled_before_run(tmp_path: Path, qt_app):
+    slug_dir = tmp_path / "routes" / "home" / "mobile"
+    slug_dir.mkdir(parents=True)
+    screen = ScreenItem(
+        name="home", route="/home", viewport="mobile", viewport_size={"w": 390, "h": 844},
+        timestamp_utc="", git_branch="main", git_commit="abc", browser="chrome",
+        screenshot_path=slug_dir / "screenshot.png",
+        transcript_path=slug_dir / "transcript.md",
+        metadata_path=slug_dir / "meta.json",
+        extraction_dir=slug_dir / ".extraction"
+    )
+
+    class MockExporter:
+        def export(self, ext, metadata, analysis_data): raise AssertionError("must not export")
+
+    worker = PipelineWorker(
+        screen=screen, video_path=slug_dir / "raw_video.mp4", audio_path=slug_dir / "raw_audio.wav",
+        segments=[], settings={}, transcriber=None, exporter=MockExporter(),
+    )
+    cancelled, errors = [], []
+    worker.cancelled.connect(cancelled.append)
+    worker.error.connect(errors.append)
+    worker.cancel("superseded by a new recording")
+    worker.run()
+
+    assert cancelled == ["superseded by a new recording"]
+    assert errors == []
+
+
+def test_trigger_based_frames_wait_for_triggers_and_extract_only_their_times(tmp_path: Path, qt_app, monkeypatch):
+    from screenreview.pipeline.frame_extractor import FrameExtractor
+    from screenreview.pipeline.metrics import MetricsRecorder
+
+    slug_dir = tmp_path / "home" / "mobile"
+    slug_dir.mkdir(parents=True)
+    screen = ScreenItem(
+        name="home", route="/home", viewport="mobile", viewport_size={"w": 390, "h": 844},
+        timestamp_utc="", git_branch="main", git_commit="abc", browser="chrome",
+        screenshot_path=slug_dir / "screenshot.png", transcript_path=slug_dir / "transcript.md",
+        metadata_path=slug_dir / "meta.json", extraction_dir=slug_dir / ".extraction",
+    )
+    requested = []
+    monkeypatch.setattr(
+        FrameExtractor, "extract_frames_at", lambda self, vp, od, times, **kw: requested.append(times) or []
+    )
+    monkeypatch.setattr(FrameExtractor, "extract_frames", lambda *a, **kw: (_ for _ in ()).throw(AssertionError))
+    settings = {"frame_extraction": {"method": "trigger_based", "trigger_window_seconds": 0.5, "frames_per_trigger": 2}}
+    worker = PipelineWorker(
+        screen=screen, video_path=slug_dir / "raw_video.avi", audio_path=slug_dir / "raw_audio.wav",
+        segments=[], settings=settings, transcriber=None, exporter=None,
+    )
+
+    nodes = {node.name: node for node in worker.build_graph(MetricsRecorder("home"))}
+    nodes["frames"].func({"triggers": [{"time": 3.0, "type": "extract_frame"}, {"time": 1.0, "type": "bug"}]})
+
+    assert "triggers" in nodes["frames"].deps
+    assert requested == [[2.75, 3.25]]
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for neighbour prefetching and the LRU cache behind it."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from screenreview.core.navigator import Navigator
+from screenreview.core.prefetch import LRUCache, ScreenAssets, ScreenPrefetcher, load_screen_assets
+from screenreview.models.screen_item import ScreenItem
+
+
+def _screen(tmp_path: Path, index: int) -> ScreenItem:
+    root = tmp_path / f"page_{index}"
+    (root / ".extraction").mkdir(parents=True)
+    screenshot = root / "screenshot.png"
+    screenshot.write_bytes(b"png")
+    (root / "meta.json").write_text(json.dumps({"route": f"/p{index}"}), encoding="utf-8")
+    return ScreenItem(
+        name=f"page_{index}",
+        route=f"/p{index}",
+        viewport="mobile",
+        viewport_size={"w": 390, "h": 844},
+        timestamp_utc="",
+        git_branch="",
+        git_commit="",
+        browser="",
+        screenshot_path=screenshot,
+        transcript_path=root / "transcript.md",
+        metadata_path=root / "meta.json",
+        extraction_dir=root / ".extraction",
+    )
+
+
+def test_lru_cache_evicts_by_count_and_bytes() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_entries=3, max_bytes=10, sizeof=lambda value: value)
+    cache.put("a", 2)
+    cache.put("b", 2)
+    cache.put("c", 2)
+    assert cache.get("a") == 2  # "b" is now least recently used
+    cache.put("d", 2)
+    assert "b" not in cache and len(cache) == 3
+    cache.put("e", 6)
+    assert "e" in cache and cache.total_bytes <= 10
+
+
+def test_navigation_prefetches_neighbours_in_background(tmp_path: Path) -> None:
+    screens = [_screen(tmp_path, i) for i in range(6)]
+    loaded: list[str] = []
+    threads: set[str] = set()
+
+    def _loader(screen: ScreenItem) -> ScreenAssets:
+        loaded.append(screen.name)
+        threads.add(threading.current_thread().name)
+        return load_screen_assets(screen)
+
+    prefetcher = ScreenPrefetcher(_loader, radius=2)
+    nav = Navigator(screens, move_callback=prefetcher.prefetch_around)
+    nav.go_to(2)
+    prefetcher.wait_idle(timeout=5)
+    assert loaded == ["page_3", "page_4", "page_1", "page_0"]
+    assert all(name.startswith("screen-prefetch") for name in threads)
+
+    assert prefetcher.get(screens[3]) is not None
+    nav.next()
+    prefetcher.wait_idle(timeout=5)
+    # page_3/4/1 are cached already; only the new neighbours are loaded.
+    assert loaded[4:] == ["page_5", "page_2"]
+    prefetcher.shutdown()
+
+
+def test_load_falls_back_to_inline_and_invalidate_reloads(tmp_path: Path) -> None:
+    screen = _screen(tmp_path, 0)
+    calls: list[str] = []
+
+    def _decode(path: Path, _width: int) -> tuple[bytes, None, int]:
+        calls.append(path.parent.name)
+        return path.read_bytes(), None, 3
+
+    prefetcher = ScreenPrefetcher(lambda item: load_screen_assets(item, decode=_decode), radius=1)
+    assert prefetcher.load(screen).image == b"png"
+    assert prefetcher.load(screen).image == b"png"  # cached
+    prefetcher.invalidate(screen)
+    assert prefetcher.load(screen).nbytes == 3
+    assert calls == ["page_0", "page_0"]
+    prefetcher.shutdown()
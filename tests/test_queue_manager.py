@@ -6,7 +6,8 @@ from __future__ import annotations
 import threading
 import time
 
-from screenreview.core.queue_manager import QueueManager
+from screenreview.core.cancellation import CancellationToken, DeadlineExceeded, TaskCancelled
+from screenreview.core.queue_manager import PipelineNode, QueueManager
 
 
 def test_add_task_to_queue() -> None:
@@ -183,3 +184,230 @@ def test_cost_callback_called() -> None:
     assert updates == [(0.1, {"x": 1})]
     qm.shutdown()
 
+
+
+def test_network_step_does_not_block_cpu_slot() -> None:
+    qm = QueueManager(max_workers=1)
+    release = threading.Event()
+    cpu_done = threading.Event()
+
+    qm.add_task("screen1", [("transcribe", lambda: release.wait(1.0), "network")])
+    qm.add_task("screen2", [("ocr", cpu_done.set, "cpu")])
+    assert cpu_done.wait(0.5) is True
+    release.set()
+    qm.wait_for_all()
+    qm.shutdown()
+
+
+def test_resource_limit_per_class_respected() -> None:
+    qm = QueueManager(max_workers=4, resource_limits={"model": 1})
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def _model_step():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.03)
+        with lock:
+            running.pop()
+
+    for i in range(4):
+        qm.add_task(f"screen{i}", [("gestures", _model_step, "model")])
+    qm.wait_for_all()
+    assert max(peak) == 1
+    qm.shutdown()
+
+
+def test_held_resource_class_waits_until_released() -> None:
+    qm = QueueManager(max_workers=2)
+    ran: list[str] = []
+    qm.hold_resources(["cpu"])
+
+    qm.add_task("screen1", [("ocr", lambda: ran.append("cpu"), "cpu")])
+    qm.add_task("screen2", [("save", lambda: ran.append("disk"), "disk")])
+    time.sleep(0.1)
+    assert ran == ["disk"]
+    assert qm.queue_depth()["queued_nodes"] == 1 and qm.queue_depth()["held"] == ["cpu"]
+
+    qm.release_resources()
+    qm.wait_for_all()
+    assert ran == ["disk", "cpu"]
+    qm.shutdown()
+
+
+def test_foreground_screen_runs_before_background() -> None:
+    qm = QueueManager(max_workers=1)
+    gate = threading.Event()
+    order: list[str] = []
+
+    qm.add_task("busy", [("a", lambda: gate.wait(1.0))])
+    qm.add_task("background", [("a", lambda: order.append("background"))])
+    qm.add_task("viewed", [("a", lambda: order.append("viewed"))], priority=0)
+    qm.add_task("later", [("a", lambda: order.append("later"))])
+    assert qm.promote_screen("later") == 1
+    gate.set()
+    qm.wait_for_all()
+    assert order == ["viewed", "later", "background"]
+    qm.shutdown()
+
+
+def test_unknown_resource_class_rejected() -> None:
+    import pytest
+
+    qm = QueueManager(max_workers=1)
+    with pytest.raises(ValueError):
+        qm.add_task("screen1", [("a", lambda: 1, "quantum")])
+    qm.shutdown()
+
+
+def test_independent_graph_nodes_run_concurrently() -> None:
+    qm = QueueManager(max_workers=2, resource_limits={"model": 2})
+    barrier = threading.Barrier(3, timeout=1.0)
+
+    def _branch(_inputs):
+        barrier.wait()
+        return True
+
+    nodes = [
+        PipelineNode("structure", lambda _inputs: "ok", resource="disk"),
+        PipelineNode("ocr", _branch, deps=("structure",), resource="model"),
+        PipelineNode("markings", _branch, deps=("structure",), resource="model"),
+        PipelineNode("triggers", _branch),
+        PipelineNode("export", lambda inputs: sorted(inputs), deps=("ocr", "markings", "triggers"), resource="disk"),
+    ]
+    results = qm.add_graph("screen1", nodes).result(timeout=2.0)
+    assert results["export"] == ["markings", "ocr", "triggers"]
+    assert qm.peak_active_workers() >= 3
+    qm.shutdown()
+
+
+def test_graph_node_receives_dependency_results() -> None:
+    qm = QueueManager(max_workers=2)
+    progress: list[tuple[int, int]] = []
+    nodes = [
+        PipelineNode("frames", lambda _inputs: [1, 2, 3]),
+        PipelineNode("count", lambda inputs: len(inputs["frames"]), deps=("frames",)),
+    ]
+    future = qm.add_graph("screen1", nodes, on_progress=lambda _s, done, total, _m: progress.append((done, total)))
+    assert future.result(timeout=1.0) == {"frames": [1, 2, 3], "count": 3}
+    assert progress[-1] == (2, 2)
+    qm.shutdown()
+
+
+def test_graph_failure_skips_dependents() -> None:
+    import pytest
+
+    qm = QueueManager(max_workers=2)
+    called: list[str] = []
+
+    def _fail(_inputs):
+        raise RuntimeError("frames broken")
+
+    nodes = [
+        PipelineNode("frames", _fail),
+        PipelineNode("gestures", lambda _inputs: called.append("gestures"), deps=("frames",)),
+        PipelineNode("triggers", lambda _inputs: called.append("triggers")),
+    ]
+    future = qm.add_graph("screen1", nodes)
+    with pytest.raises(RuntimeError, match="frames broken"):
+        future.result(timeout=1.0)
+    assert "gestures" not in called
+    assert qm.queue_empty() is True
+    qm.shutdown()
+
+
+def test_graph_cycle_and_unknown_dependency_rejected() -> None:
+    import pytest
+
+    qm = QueueManager(max_workers=1)
+    with pytest.raises(ValueError):
+        qm.add_graph("screen1", [PipelineNode("a", lambda _i: 1, deps=("b",)), PipelineNode("b", lambda _i: 1, deps=("a",))])
+    with pytest.raises(ValueError):
+        qm.add_graph("screen1", [PipelineNode("a", lambda _i: 1, deps=("missing",))])
+    qm.shutdown()
+
+
+def test_cancel_screen_stops_running_and_queued_nodes() -> None:
+    import pytest
+
+    qm = QueueManager(max_workers=1)
+    token = CancellationToken()
+    started = threading.Event()
+    ran: list[str] = []
+
+    def _poll(_inputs):
+        started.set()
+        while not token.wait(0.01):
+            pass
+        token.raise_if_cancelled()
+
+    nodes = [
+        PipelineNode("frames", _poll),
+        PipelineNode("gestures", lambda _inputs: ran.append("gestures"), deps=("frames",)),
+    ]
+    future = qm.add_graph("screen1", nodes, token=token)
+    queued = qm.add_task("screen1", [("a", lambda: ran.append("queued"))])
+    other = qm.add_task("screen2", [("a", lambda: "kept")])
+    assert started.wait(1.0)
+
+    assert qm.cancel_screen("screen1", reason="re-recorded") == 2
+    with pytest.raises(TaskCancelled, match="re-recorded"):
+        future.result(timeout=1.0)
+    assert queued.cancelled()
+    assert other.result(timeout=1.0) == "kept"
+    assert ran == []
+    qm.shutdown()
+
+
+def test_deadline_stops_pipeline_before_next_node() -> None:
+    import pytest
+
+    qm = QueueManager(max_workers=1)
+    ran: list[str] = []
+    future = qm.add_task(
+        "screen1",
+        [("slow", lambda: time.sleep(0.1)), ("next", lambda: ran.append("next"))],
+        deadline_seconds=0.05,
+    )
+    with pytest.raises(DeadlineExceeded):
+        future.result(timeout=1.0)
+    assert ran == []
+    qm.shutdown()
+
+
+def test_cancel_pending_does_not_poison_later_tasks() -> None:
+    qm = QueueManager(max_workers=1)
+    qm.add_task("screen1", [("a", lambda: time.sleep(0.05))])
+    qm.cancel_pending_tasks()
+    assert qm.add_task("screen2", [("a", lambda: "fresh")]).result(timeout=1.0) == "fresh"
+    qm.shutdown()
+
+
+def test_graph_fails_instead_of_hanging_when_queue_shuts_down() -> None:
+    import pytest
+
+    qm = QueueManager(max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+    called: list[str] = []
+
+    def _first(_inputs):
+        started.set()
+        release.wait(timeout=2.0)
+        return 1
+
+    nodes = [
+        PipelineNode("frames", _first),
+        PipelineNode("ocr", lambda _inputs: called.append("ocr"), deps=("frames",)),
+    ]
+    future = qm.add_graph("screen1", nodes)
+    assert started.wait(timeout=1.0)
+    qm.shutdown(wait_for_tasks=False)
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        future.result(timeout=2.0)
+    assert called == []
+    assert qm.queue_empty() is True
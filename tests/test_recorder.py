@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
+import pytest
+
 from screenreview.pipeline import recorder as recorder_mod
 from screenreview.pipeline.recorder import Recorder
 
@@ -78,3 +81,159 @@ def test_camera_resolution_probe_returns_defaults_without_opencv(monkeypatch) ->
 
 def test_resolution_parser_accepts_custom_wxh_string() -> None:
     assert recorder_mod._resolution_size("1600x900") == (1600, 900)
+
+
+class _FakeCamera:
+    """Delivers frames at a rate that depends on the requested size and format."""
+
+    def __init__(self, fps_by_size: dict[tuple[int, int], float], mjpg: bool = True) -> None:
+        self.fps_by_size = fps_by_size
+        self.mjpg = mjpg
+        self.props: dict[int, float] = {}
+
+    def set(self, prop: int, value: float) -> bool:
+        cv2 = recorder_mod.cv2
+        if prop == cv2.CAP_PROP_FOURCC and not self.mjpg:
+            return False
+        self.props[prop] = value
+        return True
+
+    def get(self, prop: int) -> float:
+        return self.props.get(prop, 0.0)
+
+    def read(self):
+        cv2 = recorder_mod.cv2
+        size = (int(self.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        time.sleep(1.0 / self.fps_by_size.get(size, 30.0))
+        return True, object()
+
+
+def test_capture_negotiation_requests_mjpg_and_falls_back_to_sustainable_size(monkeypatch) -> None:
+    cv2 = pytest.importorskip("cv2")
+    monkeypatch.setattr(Recorder, "_FPS_MEASURE_SECONDS", 0.2)
+    camera = _FakeCamera({(1920, 1080): 6.0, (1280, 720): 25.0})
+    rec = Recorder()
+
+    mode = rec._negotiate_capture_mode(camera, 1920, 1080)
+
+    assert mode.fourcc == "MJPG"
+    assert (mode.width, mode.height) == (1280, 720)
+    assert mode.measured_fps >= 15.0
+    assert "MJPG 1280x720" in mode.describe() and "requested 1920x1080" in mode.describe()
+    assert camera.get(cv2.CAP_PROP_FRAME_WIDTH) == 1280
+
+
+def test_capture_negotiation_keeps_fastest_mode_when_none_is_fast_enough(monkeypatch) -> None:
+    cv2 = pytest.importorskip("cv2")
+    monkeypatch.setattr(Recorder, "_FPS_MEASURE_SECONDS", 0.2)
+    camera = _FakeCamera({(1280, 720): 12.0, (640, 480): 8.0}, mjpg=False)
+    rec = Recorder()
+
+    mode = rec._negotiate_capture_mode(camera, 1280, 720)
+
+    assert (mode.width, mode.height) == (1280, 720)
+    assert mode.fourcc == "?"
+    # Re-applied after the slower 480p attempt.
+    assert camera.get(cv2.CAP_PROP_FRAME_WIDTH) == 1280
+
+
+def test_capture_negotiation_stops_when_smaller_sizes_are_not_faster(monkeypatch) -> None:
+    cv2 = pytest.importorskip("cv2")
+    monkeypatch.setattr(Recorder, "_FPS_MEASURE_SECONDS", 0.2)
+    # Exposure-limited: the same rate at every size.
+    camera = _FakeCamera({size: 10.0 for size in [(3840, 2160), (2560, 1440), (1920, 1080), (1280, 720)]})
+    widths: list[float] = []
+    original_set = camera.set
+
+    def _record_set(prop: int, value: float) -> bool:
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            widths.append(value)
+        return original_set(prop, value)
+
+    camera.set = _record_set
+    rec = Recorder()
+
+    started = time.monotonic()
+    mode = rec._negotiate_capture_mode(camera, 3840, 2160)
+
+    assert time.monotonic() - started < Recorder._NEGOTIATION_SECONDS + 1.0
+    assert (mode.width, mode.height) == (3840, 2160)
+    assert widths == [3840, 2560, 3840]
+
+
+def test_capture_negotiation_reuses_mode_found_for_the_same_source(monkeypatch) -> None:
+    pytest.importorskip("cv2")
+    monkeypatch.setattr(Recorder, "_FPS_MEASURE_SECONDS", 0.2)
+    rec = Recorder()
+    first = rec._negotiate_capture_mode(_FakeCamera({(1920, 1080): 6.0}), 1920, 1080, source=0)
+
+    measured: list[bool] = []
+    original = rec._measure_capture_fps
+
+    def _measure(capture, budget=None, measure=True) -> float:
+        measured.append(measure)
+        return original(capture, budget, measure)
+
+    monkeypatch.setattr(rec, "_measure_capture_fps", _measure)
+    again = rec._negotiate_capture_mode(_FakeCamera({(1920, 1080): 6.0}), 1920, 1080, source=0)
+
+    assert again == first and (again.width, again.height) == (1280, 720)
+    assert measured == [False]
+
+
+def test_stop_writes_frame_timestamp_sidecar(tmp_path: Path, monkeypatch) -> None:
+    from screenreview.pipeline.video_timeline import VideoTimeline, timestamps_path
+
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    rec = Recorder(output_dir=tmp_path)
+    rec.start(camera_index=0, mic_index=0, resolution="720p")
+    started = rec._started_at
+    rec._frame_times.extend(rec._media_time(started + t) for t in (0.0, 0.05, 0.4))
+    video_path, _audio_path = rec.stop()
+
+    timeline = VideoTimeline.for_video(video_path)
+    assert timeline.timestamps == pytest.approx([0.0, 0.05, 0.4])
+
+    rec.start(camera_index=0, mic_index=0, resolution="720p")
+    assert not timestamps_path(video_path).exists()
+    rec.stop()
+
+
+def test_recording_profiles_scale_to_even_analysis_size() -> None:
+    from screenreview.pipeline.recorder import RECORDING_PROFILES, resolve_recording_profile
+
+    assert RECORDING_PROFILES["full"].output_size(1920, 1080) == (1920, 1080)
+    assert RECORDING_PROFILES["analysis"].output_size(1920, 1080) == (960, 540)
+    assert RECORDING_PROFILES["compact"].output_size(1280, 721) == (640, 360)
+    assert RECORDING_PROFILES["compact"].output_size(320, 240) == (320, 240)
+    gray = resolve_recording_profile("balanced", grayscale=True)
+    assert gray.grayscale and gray.max_width == 1280 and not RECORDING_PROFILES["balanced"].grayscale
+    with pytest.raises(ValueError):
+        resolve_recording_profile("huge")
+
+
+def test_profile_downscales_written_video_and_measures_bitrate(tmp_path: Path, monkeypatch) -> None:
+    cv2 = pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    from screenreview.pipeline.recorder import resolve_recording_profile
+
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    rec = Recorder(output_dir=tmp_path, profile=resolve_recording_profile("compact", grayscale=True))
+    rec.start(camera_index=0, mic_index=0, resolution="1080p")
+    camera_frame = np.random.default_rng(0).integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+    for i in range(10):
+        frame = cv2.cvtColor(rec._prepare_frame(camera_frame), cv2.COLOR_BGR2GRAY)
+        rec._ensure_video_writer(frame)
+        rec._writer.write(frame)
+        rec._video_frames_written += 1
+        rec._frame_times.append(i * 0.05)
+    video_path, _audio_path = rec.stop()
+
+    capture = cv2.VideoCapture(str(video_path))
+    ok, frame = capture.read()
+    capture.release()
+    assert ok and frame.shape[:2] == (360, 640)
+    size_kbit = video_path.stat().st_size * 8 / 1000
+    assert rec.get_video_bitrate_kbps() == pytest.approx(size_kbit / 0.5)
+    assert any(note.startswith("Recording profile: compact") for note in rec.get_backend_notes())
+    assert any(note.startswith("Video bitrate:") for note in rec.get_backend_notes())
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Tests for segmented recordings and their finalization."""
+
+from __future__ import annotations
+
+import threading
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+from screenreview.pipeline.recorder import Recorder
+from screenreview.pipeline.recording_segments import (
+    INDEX_FILENAME,
+    KIND_AUDIO,
+    KIND_VIDEO,
+    RecordingIndex,
+    RecordingSegment,
+    concat_wav,
+    finalize_recording,
+    recover_recording,
+    segment_filename,
+)
+
+
+def _write_wav(path: Path, frames: int, value: int = 0) -> Path:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(value.to_bytes(2, "little", signed=True) * frames)
+    return path
+
+
+def _write_avi(path: Path, frames: int, shade: int) -> Path:
+    cv2 = pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 20.0, (64, 48))
+    for _ in range(frames):
+        writer.write(np.full((48, 64, 3), shade, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def _audio_segment(directory: Path, index: int, frames: int, start: float) -> RecordingSegment:
+    name = segment_filename(KIND_AUDIO, index)
+    _write_wav(directory / name, frames, value=index + 1)
+    return RecordingSegment(KIND_AUDIO, index, name, start, frames / 16000, frames)
+
+
+def test_index_round_trips_and_lists_segments_in_order(tmp_path: Path) -> None:
+    index = RecordingIndex(segment_seconds=10)
+    index.add(RecordingSegment(KIND_AUDIO, 1, segment_filename(KIND_AUDIO, 1), 10.0, 5.0, 80000))
+    index.add(RecordingSegment(KIND_AUDIO, 0, segment_filename(KIND_AUDIO, 0), 0.0, 10.0, 160000))
+    index.add(RecordingSegment(KIND_VIDEO, 0, segment_filename(KIND_VIDEO, 0), 0.0, 10.0, 200))
+    index.save(tmp_path)
+
+    loaded = RecordingIndex.load(tmp_path)
+
+    assert loaded is not None and not loaded.finalized
+    assert [s.index for s in loaded.of_kind(KIND_AUDIO)] == [0, 1]
+    assert loaded.of_kind(KIND_VIDEO)[0].file == "raw_video.part0000.avi"
+    (tmp_path / INDEX_FILENAME).write_text("{broken", encoding="utf-8")
+    assert RecordingIndex.load(tmp_path) is None
+
+
+def test_concat_wav_keeps_every_sample_in_order(tmp_path: Path) -> None:
+    parts = [_write_wav(tmp_path / f"p{i}.wav", 100 * (i + 1), value=i + 1) for i in range(3)]
+
+    total = concat_wav(parts, tmp_path / "out.wav")
+
+    assert total == 600
+    with wave.open(str(tmp_path / "out.wav"), "rb") as joined:
+        assert joined.getnframes() == 600
+        data = joined.readframes(600)
+    assert data[:2] == (1).to_bytes(2, "little") and data[-2:] == (3).to_bytes(2, "little")
+
+
+def test_finalize_joins_segments_and_removes_parts(tmp_path: Path) -> None:
+    index = RecordingIndex(segment_seconds=2)
+    index.add(_audio_segment(tmp_path, 0, 32000, 0.0))
+    index.add(_audio_segment(tmp_path, 1, 8000, 2.0))
+    for i, frames in enumerate((10, 6)):
+        name = segment_filename(KIND_VIDEO, i)
+        _write_avi(tmp_path / name, frames, shade=40 * (i + 1))
+        index.add(RecordingSegment(KIND_VIDEO, i, name, i * 0.5, frames / 20, frames))
+    index.save(tmp_path)
+
+    result = finalize_recording(tmp_path, tmp_path / "raw_video.avi", tmp_path / "raw_audio.wav")
+
+    assert result is not None and result.finalized
+    with wave.open(str(tmp_path / "raw_audio.wav"), "rb") as joined:
+        assert joined.getnframes() == 40000
+    cv2 = pytest.importorskip("cv2")
+    capture = cv2.VideoCapture(str(tmp_path / "raw_video.avi"))
+    assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == 16
+    capture.release()
+    assert not list(tmp_path.glob("raw_*.part*"))
+    # Finalizing again is a no-op.
+    assert finalize_recording(tmp_path, tmp_path / "raw_video.avi", tmp_path / "raw_audio.wav").finalized
+
+
+def test_recover_rebuilds_raw_files_of_interrupted_recording(tmp_path: Path) -> None:
+    index = RecordingIndex(segment_seconds=2)
+    index.add(_audio_segment(tmp_path, 0, 32000, 0.0))
+    index.save(tmp_path)
+    # The segment being written at crash time is not in the index.
+    _write_wav(tmp_path / segment_filename(KIND_AUDIO, 1), 500)
+
+    assert recover_recording(tmp_path) is True
+    with wave.open(str(tmp_path / "raw_audio.wav"), "rb") as joined:
+        assert joined.getnframes() == 32000
+    assert RecordingIndex.load(tmp_path).finalized
+    assert recover_recording(tmp_path) is False
+
+
+def test_recorder_reports_closed_segments_and_joins_them_on_stop(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    stale = _write_wav(tmp_path / segment_filename(KIND_AUDIO, 7), 10)
+    rec = Recorder(output_dir=tmp_path, segment_seconds=2)
+    closed: list[RecordingSegment] = []
+    rec.on_segment_complete = closed.append
+
+    rec.start(camera_index=0, mic_index=0, resolution="720p")
+    assert not stale.exists()
+    for frames in (32000, 12000):
+        with rec._open_wave(rec._stream_path(KIND_AUDIO)) as wav_file:
+            wav_file.writeframes(b"\x01\x00" * frames)
+        rec._audio_frames_written += frames
+        rec._segment_frames[KIND_AUDIO] = frames
+        rec._close_segment(KIND_AUDIO)
+
+    assert [s.file for s in rec.completed_segments(KIND_AUDIO)] == [
+        "raw_audio.part0000.wav",
+        "raw_audio.part0001.wav",
+    ]
+    assert closed[1].start_seconds == pytest.approx(2.0)
+    assert RecordingIndex.load(tmp_path).segments == closed
+
+    _video, audio = rec.stop()
+
+    with wave.open(str(audio), "rb") as joined:
+        assert joined.getnframes() == 44000
+    assert RecordingIndex.load(tmp_path).finalized
+
+
+def test_recorder_joins_segments_in_background_when_asked(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    rec = Recorder(output_dir=tmp_path, segment_seconds=2)
+    rec.start(camera_index=0, mic_index=0, resolution="720p")
+    with rec._open_wave(rec._stream_path(KIND_AUDIO)) as wav_file:
+        wav_file.writeframes(b"\x01\x00" * 8000)
+    rec._audio_frames_written = rec._segment_frames[KIND_AUDIO] = 8000
+
+    _video, audio = rec.stop(join_in_background=True)
+
+    assert rec.wait_for_join(tmp_path, timeout=5.0)
+    assert not rec.is_joining(tmp_path)
+    with wave.open(str(audio), "rb") as joined:
+        assert joined.getnframes() == 8000
+    assert RecordingIndex.load(tmp_path).finalized
+    assert (tmp_path / "raw_video.avi").exists()
+
+
+def test_video_segments_follow_capture_times_of_a_slow_camera(tmp_path: Path, monkeypatch) -> None:
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("cv2")
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    rec = Recorder(output_dir=tmp_path, segment_seconds=2)
+    rec.start(camera_index=0, mic_index=0, resolution="720p")
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    # The camera delivers 10 fps instead of the requested 20.
+    for i in range(45):
+        rec._write_frame(frame, i * 0.1)
+
+    closed = rec.completed_segments(KIND_VIDEO)
+    assert [s.frames for s in closed] == [20, 20]
+    assert [s.start_seconds for s in closed] == pytest.approx([0.0, 2.0])
+    assert [s.duration_seconds for s in closed] == pytest.approx([2.0, 2.0])
+
+    rec.stop()
+    last = RecordingIndex.load(tmp_path).of_kind(KIND_VIDEO)[-1]
+    assert last.frames == 5
+    assert last.start_seconds == pytest.approx(4.0)
+
+
+def test_audio_segments_roll_over_off_the_audio_callback(tmp_path: Path, monkeypatch) -> None:
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(Recorder, "_start_live_backends", lambda self: None)
+    rec = Recorder(output_dir=tmp_path, segment_seconds=2)
+    closed_on: list[str] = []
+    rec.on_segment_complete = lambda _segment: closed_on.append(threading.current_thread().name)
+    rec.start(camera_index=0, mic_index=0, resolution="720p")
+    rec._audio_wave = rec._open_wave(rec._stream_path(KIND_AUDIO))
+    one_second = np.ones((16000, 1), dtype=np.int16)
+
+    for _ in range(2):
+        rec._write_audio(one_second)
+    # The callback only flags the full segment; no file is closed on its thread.
+    assert rec.completed_segments(KIND_AUDIO) == []
+    assert rec._audio_rollover.is_set()
+
+    rec._start_audio_segment_thread()
+    deadline = time.monotonic() + 5.0
+    while not rec.completed_segments(KIND_AUDIO) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    rec._write_audio(one_second)
+    rec.stop()
+
+    assert closed_on[0] == "screenreview-audio-segments"
+    assert [s.frames for s in RecordingIndex.load(tmp_path).of_kind(KIND_AUDIO)] == [32000, 16000]
+    with wave.open(str(tmp_path / "raw_audio.wav"), "rb") as joined:
+        assert joined.getnframes() == 48000
+
+
+def test_segment_analysis_skips_parts_already_joined(tmp_path: Path) -> None:
+    from screenreview.pipeline.segment_analysis import extract_segment_frames, transcribe_segment
+
+    video = RecordingSegment(KIND_VIDEO, 0, segment_filename(KIND_VIDEO, 0), 0.0, 2.0, 40)
+    audio = RecordingSegment(KIND_AUDIO, 0, segment_filename(KIND_AUDIO, 0), 0.0, 2.0, 32000)
+
+    assert extract_segment_frames(tmp_path, video) == []
+    assert transcribe_segment(None, tmp_path, audio, "openai_4o_transcribe", "de") == []
+    assert not (tmp_path / "segments").exists()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for the project thumbnail cache."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+from screenreview.core.thumbnails import THUMBNAIL_DIRNAME, ThumbnailCache, thumbnail_key
+
+
+def _screenshot(path: Path, size: tuple[int, int] = (800, 4000), color: str = "red") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def test_thumbnail_is_small_cropped_and_reused(tmp_path: Path) -> None:
+    source = _screenshot(tmp_path / "home" / "mobile" / "screenshot.png")
+    cache = ThumbnailCache.for_project(tmp_path, width=100, fmt="jpeg")
+
+    assert cache.cached(source) is None
+    thumb = cache.generate(source)
+
+    assert thumb is not None and thumb.suffix == ".jpg"
+    assert thumb.is_relative_to(tmp_path / THUMBNAIL_DIRNAME)
+    with Image.open(thumb) as image:
+        # Scaled to the configured width, full-page height cropped to 2:1.
+        assert image.size == (100, 200)
+    mtime = thumb.stat().st_mtime_ns
+    assert cache.generate(source) == thumb
+    assert thumb.stat().st_mtime_ns == mtime
+
+
+def test_key_changes_when_screenshot_is_recaptured(tmp_path: Path) -> None:
+    source = _screenshot(tmp_path / "shot.png", size=(200, 200))
+    cache = ThumbnailCache(tmp_path / "cache", width=50, fmt="jpeg")
+    first = cache.generate(source)
+    key = thumbnail_key(source)
+
+    _screenshot(source, size=(300, 200), color="blue")
+    os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 1_000_000))
+
+    assert thumbnail_key(source) != key
+    assert cache.cached(source) is None
+    second = cache.generate(source)
+    assert second != first
+    assert thumbnail_key(tmp_path / "missing.png") is None
+
+
+def test_request_generates_in_background_and_reports(tmp_path: Path) -> None:
+    sources = [_screenshot(tmp_path / f"s{i}.png", size=(120, 90)) for i in range(3)]
+    cache = ThumbnailCache(tmp_path / "cache", width=60, fmt="webp")
+    done: list[tuple[Path, Path, str]] = []
+
+    for source in sources:
+        cache.request(source, lambda src, path: done.append((src, path, threading.current_thread().name)))
+    cache.wait_idle(timeout=10)
+    cache.shutdown()
+
+    assert sorted(src for src, _, _ in done) == sorted(sources)
+    assert all(path.exists() for _, path, _ in done)
+    assert all(name.startswith("thumbnails") for _, _, name in done)
+    # Already cached: reported immediately, nothing queued.
+    assert cache.request(sources[0], lambda *_args: None) is None
+
+
+def test_idle_only_after_callbacks_ran(tmp_path: Path) -> None:
+    source = _screenshot(tmp_path / "s.png", size=(120, 90))
+    cache = ThumbnailCache(tmp_path / "cache", width=60, fmt="jpeg")
+    release = threading.Event()
+    seen: list[bool] = []
+
+    def _callback(_src: Path, _path: Path) -> None:
+        release.wait(5)
+        seen.append(True)
+
+    future = cache.request(source, _callback)
+    assert future is not None and not cache.is_idle()
+    release.set()
+    future.result(timeout=10)
+
+    assert seen == [True]
+    assert cache.is_idle()
+    cache.shutdown()
@@ -197,3 +197,13 @@ def test_provider_whisper_replicate_called_correctly(sample_audio_5sec: Path, mo
     transcriber = Transcriber(replicate_provider=mock_replicate)
     transcriber.transcribe(sample_audio_5sec, provider="whisper_replicate", language="de")
     assert mock_replicate.calls == [(sample_audio_5sec, "de")]
+
+
+def test_trigger_event_estimates_word_time_within_segment(default_config: dict) -> None:
+    transcriber = Transcriber()
+    events = transcriber.detect_trigger_words(
+        [{"start": 10.0, "end": 14.0, "text": "Der Button oben ist hier"}],
+        {"extract_frame": ["hier"]},
+    )
+    assert events[0]["time"] == 10.0
+    assert 13.0 < events[0]["word_time"] < 14.0
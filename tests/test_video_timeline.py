@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Tests for per-frame capture timestamps."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from screenreview.pipeline.video_timeline import VideoTimeline, timestamps_path, write_frame_times
+
+
+def test_sidecar_round_trips_next_to_video(tmp_path: Path) -> None:
+    video = tmp_path / "raw_video.avi"
+    path = write_frame_times(video, [0.0, 0.05, 0.1, 0.3], nominal_fps=20)
+
+    assert path == timestamps_path(video) == tmp_path / "raw_video.timestamps.json"
+    timeline = VideoTimeline.for_video(video)
+    assert timeline.has_timestamps and timeline.frame_count == 4
+    assert timeline.time_of(3) == pytest.approx(0.3)
+    assert timeline.measured_fps == pytest.approx(10.0)
+
+
+def test_missing_or_broken_sidecar_assumes_constant_rate(tmp_path: Path) -> None:
+    video = tmp_path / "raw_video.avi"
+    assert not VideoTimeline.for_video(video, nominal_fps=25).has_timestamps
+    timestamps_path(video).write_text("not json", encoding="utf-8")
+
+    timeline = VideoTimeline.for_video(video, nominal_fps=25)
+
+    assert timeline.time_of(50) == pytest.approx(2.0)
+    assert timeline.frame_at(2.0) == 50
+
+
+def test_dropped_frames_do_not_shift_later_times() -> None:
+    # Frames 0-4 at 20 fps, then a one second stall.
+    timeline = VideoTimeline([0.0, 0.05, 0.1, 0.15, 0.2, 1.2, 1.25], nominal_fps=20)
+
+    assert timeline.time_of(5) == pytest.approx(1.2)  # constant rate would say 0.25
+    assert timeline.frame_at(0.6) == 4
+    assert timeline.frame_at(0.8) == 5
+    assert timeline.frame_at(-1.0) == 0 and timeline.frame_at(99.0) == 6
+    assert timeline.time_of(8) == pytest.approx(1.35)
+    assert timeline.sample_frames(0.5) == [0, 4, 5]
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Tests for threaded decoding and scaling in the screenshot viewer."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QPoint, QSize, Qt
+from PyQt6.QtGui import QColor, QImage, QPixmap
+
+from screenreview.core.prefetch import ScreenAssets
+from screenreview.gui.viewer_widget import ViewerWidget, decode_screenshot
+
+
+def _big_screenshot(tmp_path: Path) -> Path:
+    path = tmp_path / "screenshot.png"
+    image = QImage(1600, 4000, QImage.Format.Format_RGB32)
+    image.fill(Qt.GlobalColor.darkCyan)
+    image.save(str(path))
+    return path
+
+
+def _settle(viewer: ViewerWidget, qt_app, condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        viewer._pool.waitForDone(50)
+        qt_app.processEvents()
+    assert condition()
+
+
+def test_set_image_decodes_on_worker_and_keeps_canvas_size(qt_app, tmp_path: Path) -> None:
+    viewer = ViewerWidget()
+    viewer.resize(800, 600)
+    viewer.set_image(_big_screenshot(tmp_path))
+
+    # The canvas exists before decoding finishes, so overlays can be loaded at once.
+    assert viewer.image_label.get_drawing_buffer().width() == 1600
+    width = viewer.display_width()
+    _settle(viewer, qt_app, lambda: width in viewer._scaled_cache)
+    assert viewer.image_label.display_size().width() == width
+    assert viewer.image_label.get_drawing_buffer().width() == 1600
+
+
+def test_zoom_change_shows_fast_preview_then_caches_smooth_variant(qt_app, tmp_path: Path) -> None:
+    viewer = ViewerWidget()
+    viewer.resize(800, 600)
+    viewer.set_image(_big_screenshot(tmp_path))
+    first = viewer.display_width()
+    _settle(viewer, qt_app, lambda: first in viewer._scaled_cache)
+
+    viewer.scale_combo.setCurrentText("30%")
+    second = viewer.display_width()
+    assert second != first
+    assert viewer.image_label.display_size().width() == second  # preview shown immediately
+    viewer._request_smooth_scale()
+    _settle(viewer, qt_app, lambda: second in viewer._scaled_cache)
+
+    viewer.scale_combo.setCurrentText("80%")
+    viewer._smooth_timer.stop()
+    viewer.scale_combo.setCurrentText("30%")
+    assert viewer.image_label.display_size().width() == second
+    # Served from the per-zoom cache: the label gets the smooth variant itself.
+    assert viewer.image_label._screenshot_pixmap.width() == second
+    assert not viewer._smooth_timer.isActive()
+
+
+def test_prefetched_assets_are_used_without_decoding(qt_app, tmp_path: Path) -> None:
+    path = _big_screenshot(tmp_path)
+    viewer = ViewerWidget()
+    viewer.resize(800, 600)
+    width = viewer.display_width()
+    image, scaled, _ = decode_screenshot(path, width)
+
+    viewer.set_image(path, ScreenAssets(image=image, display_image=scaled, display_width=width))
+    assert viewer.image_label.display_size().width() == width
+    assert viewer._pool.activeThreadCount() == 0
+
+
+def test_brush_stroke_only_recomposites_dirty_tiles(qt_app, tmp_path: Path) -> None:
+    path = _big_screenshot(tmp_path)
+    viewer = ViewerWidget()
+    viewer.resize(800, 600)
+    image, scaled, _ = decode_screenshot(path, viewer.display_width())
+    viewer.set_image(path, ScreenAssets(image=image, display_image=scaled, display_width=viewer.display_width()))
+    label = viewer.image_label
+    label.set_pen_width(10)
+
+    label.grab()  # composites every tile once
+    tiles_before = set(label._tiles)
+    assert len(tiles_before) > 4
+    label._draw_line(QPoint(20, 20), QPoint(60, 40))
+    assert tiles_before - set(label._tiles) == {(0, 0)}
+
+    frame = label.grab().toImage()
+    stroke = QColor(frame.pixel(40, 30))
+    untouched = QColor(frame.pixel(300, 300))
+    assert stroke != untouched
+    assert label.get_drawing_buffer().width() == 1600
+
+
+def test_undo_keeps_only_touched_blocks_and_restores_them(qt_app, tmp_path: Path) -> None:
+    viewer = ViewerWidget()
+    viewer.resize(800, 600)
+    label = viewer.image_label
+    label.set_screenshot(QPixmap(400, 1000), 0.25, QSize(1600, 4000))
+    label.set_pen_width(10)
+    buffer_bytes = label.get_drawing_buffer().sizeInBytes()
+
+    label._begin_step()
+    label._draw_line(QPoint(10, 10), QPoint(40, 10))
+    label._draw_line(QPoint(40, 10), QPoint(40, 30))
+    label._current_step = None
+    assert 0 < label.undo_memory_bytes() < buffer_bytes // 50
+    assert QColor.fromRgba(label.get_drawing_buffer().pixel(100, 40)).alpha() > 0
+
+    label.clear_drawing()
+    assert QColor.fromRgba(label.get_drawing_buffer().pixel(100, 40)).alpha() == 0
+    label.undo()  # undoes the clear
+    assert QColor.fromRgba(label.get_drawing_buffer().pixel(100, 40)).alpha() > 0
+    label.undo()  # undoes the stroke
+    assert QColor.fromRgba(label.get_drawing_buffer().pixel(100, 40)).alpha() == 0
+    assert label.undo_memory_bytes() == 0
+
+
+def test_click_without_move_does_not_use_an_undo_level(qt_app) -> None:
+    from PyQt6.QtCore import QEvent, QPointF
+    from PyQt6.QtGui import QMouseEvent
+
+    viewer = ViewerWidget()
+    label = viewer.image_label
+    label.set_screenshot(QPixmap(400, 300), 1.0, QSize(400, 300))
+    label.set_drawing_enabled(True)
+
+    def _mouse(kind: QEvent.Type, x: float) -> QMouseEvent:
+        return QMouseEvent(kind, QPointF(x, 20), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+
+    label.mousePressEvent(_mouse(QEvent.Type.MouseButtonPress, 10))
+    label.mouseMoveEvent(_mouse(QEvent.Type.MouseMove, 60))
+    label.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, 60))
+    for _ in range(25):
+        label.mousePressEvent(_mouse(QEvent.Type.MouseButtonPress, 200))
+        label.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, 200))
+
+    assert len(label._undo_stack) == 1
+    label.undo()
+    assert QColor.fromRgba(label.get_drawing_buffer().pixel(30, 20)).alpha() == 0